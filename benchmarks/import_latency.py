@@ -0,0 +1,108 @@
+"""
+Import and first result latency of MiSTree+.
+
+Measures, each in a fresh python process, the time to import the package, to
+import the graph subpackage and to compute the first set of MST statistics, with
+an empty numba cache (cold) and with the cache filled by the previous run (warm),
+and the time of warmup() in both cases.
+
+Example
+-------
+    python benchmarks/import_latency.py --output import_latency.json
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+_CHILD = """
+import json, sys, time
+t0 = time.perf_counter()
+import mistreeplus
+t1 = time.perf_counter()
+mistreeplus.graph
+t2 = time.perf_counter()
+result = {"import": t1 - t0, "import_graph": t2 - t1}
+if sys.argv[1] == "warmup":
+    mistreeplus.warmup()
+    result["warmup"] = time.perf_counter() - t2
+else:
+    import numpy as np
+    rng = np.random.default_rng(0)
+    x, y = rng.random((2, int(sys.argv[2])))
+    mistreeplus.legacy.GetMST(x=x, y=y).get_stats()
+    result["first_result"] = time.perf_counter() - t2
+print(json.dumps(result))
+"""
+
+
+def _run_child(task: str, size: int, cache_dir: str) -> dict:
+    """Runs one measurement in a fresh python process."""
+    env = dict(os.environ, NUMBA_CACHE_DIR=cache_dir)
+    env["PYTHONPATH"] = os.pathsep.join([ROOT, env.get("PYTHONPATH", "")])
+    output = subprocess.run(
+        [sys.executable, "-c", _CHILD, task, str(size)],
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def measure_import_latency(size: int = 1000) -> dict:
+    """
+    Measures the import and first result latency with cold and warm numba caches.
+
+    Parameters
+    ----------
+    size : int, optional
+        Number of points of the first MST.
+
+    Returns
+    -------
+    latency : dict
+        For 'cold' and 'warm' caches, the seconds spent on 'import',
+        'import_graph' and 'first_result' of the pipeline, and on 'warmup'.
+    """
+    latency = {}
+    with tempfile.TemporaryDirectory() as cache_dir:
+        latency["cold"] = _run_child("pipeline", size, cache_dir)
+        latency["warm"] = _run_child("pipeline", size, cache_dir)
+    with tempfile.TemporaryDirectory() as cache_dir:
+        latency["cold"]["warmup"] = _run_child("warmup", size, cache_dir)["warmup"]
+        latency["warm"]["warmup"] = _run_child("warmup", size, cache_dir)["warmup"]
+    latency["size"] = size
+    return latency
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="MiSTree+ import latency.")
+    parser.add_argument("--size", type=int, default=1000, help="Points of the first MST.")
+    parser.add_argument("--output", help="JSON file the results are written to.")
+    args = parser.parse_args(argv)
+    latency = measure_import_latency(args.size)
+    for cache in ["cold", "warm"]:
+        print(
+            "%s cache: import %.3fs, graph %.3fs, first result %.3fs, warmup %.3fs"
+            % (
+                cache,
+                latency[cache]["import"],
+                latency[cache]["import_graph"],
+                latency[cache]["first_result"],
+                latency[cache]["warmup"],
+            )
+        )
+    if args.output is not None:
+        with open(args.output, "w") as f:
+            json.dump(latency, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
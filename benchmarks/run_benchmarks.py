@@ -0,0 +1,564 @@
+"""
+Scaling benchmarks for the MiSTree+ pipeline.
+
+Times and memory profiles every stage of the pipeline, from graph construction to
+the tree statistics, for increasing numbers of points, fits the scaling exponent of
+each stage and optionally compares the results to a stored baseline.
+
+Examples
+--------
+Run the default sizes and store the results:
+
+    python benchmarks/run_benchmarks.py --output benchmarks/results.json
+
+Compare a new run to a stored baseline, failing if a stage became slower:
+
+    python benchmarks/run_benchmarks.py --baseline benchmarks/results.json --fail-on-regression
+
+Measure the effect of reordering the points along a Hilbert curve, comparing to a
+run in the original random order:
+
+    python benchmarks/run_benchmarks.py --sizes 1e6 --output random.json
+    python benchmarks/run_benchmarks.py --sizes 1e6 --reorder hilbert --baseline random.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import mistreeplus as mist
+
+
+DATASETS = ["cart2d", "cart3d", "usphere", "levy2d"]
+
+STAGES = [
+    "construct_knn",
+    "construct_del",
+    "construct_mst",
+    "get_degree",
+    "find_branches",
+    "get_centrality",
+    "get_adjacents",
+    "adjacents2tree",
+    "get_spines",
+    "get_groups",
+    "perc_from_all_by_N",
+]
+
+# Largest size each stage is run at by default, the pure python tree stages are
+# too slow to reach 10^7 points. Use --no-caps to remove these.
+STAGE_MAX_SIZE = {
+    "construct_del": 1000000,
+    "find_branches": 1000000,
+    "get_centrality": 1000000,
+    "get_adjacents": 1000000,
+    "adjacents2tree": 100000,
+    "get_spines": 100000,
+    "get_groups": 1000000,
+    "perc_from_all_by_N": 100000,
+}
+
+DEFAULT_SIZES = [1000, 10000, 100000]
+
+
+def get_points(dataset: str, size: int, seed: int, reorder: str = None) -> dict:
+    """
+    Generates the points of a benchmark dataset.
+
+    Parameters
+    ----------
+    dataset : str
+        Name of the dataset, one of DATASETS.
+    size : int
+        Number of points.
+    seed : int
+        Random seed.
+    reorder : str, optional
+        Reorders the points along a space filling curve, 'hilbert' or 'morton'.
+
+    Returns
+    -------
+    points : dict
+        Cartesian coordinates 'x', 'y' (and 'z'), the number of points 'size' and
+        the geometry 'mode'.
+    """
+    if dataset == "cart2d":
+        x, y = mist.randoms.cart2d(size, rng=seed)
+        points = {"x": x, "y": y, "size": size, "mode": "2D"}
+    elif dataset == "cart3d":
+        x, y, z = mist.randoms.cart3d(size, rng=seed)
+        points = {"x": x, "y": y, "z": z, "size": size, "mode": "3D"}
+    elif dataset == "usphere":
+        phi, theta = mist.randoms.usphere_phitheta(size, rng=seed)
+        x, y, z = mist.coords.sphere2cart(np.ones(size), phi, theta)
+        points = {"x": x, "y": y, "z": z, "size": size, "mode": "usphere"}
+    elif dataset == "levy2d":
+        pos = mist.levy.generate_levy_flight(size, rng=seed)
+        points = {"x": pos[:, 0], "y": pos[:, 1], "size": size, "mode": "2D"}
+    else:
+        raise ValueError("Unknown dataset %s." % dataset)
+    if reorder is not None:
+        axes = [key for key in ["x", "y", "z"] if key in points]
+        vert = np.column_stack([points[key] for key in axes])
+        order = mist.index.sfc_order(vert, curve=reorder)
+        for key in axes:
+            points[key] = points[key][order]
+    return points
+
+
+def run_stage(stage: str, data: dict, k: int) -> None:
+    """
+    Runs one pipeline stage, reading its inputs from and writing its outputs to the
+    shared data dictionary.
+
+    Parameters
+    ----------
+    stage : str
+        Name of the stage, one of STAGES.
+    data : dict
+        Points and the outputs of the previous stages.
+    k : int
+        Number of nearest neighbours of the kNN graph.
+    """
+    mode, size = data["mode"], data["size"]
+    if stage == "construct_knn":
+        if mode == "2D":
+            data["graph"] = mist.graph.construct_knn2D(data["x"], data["y"], k)
+        elif mode == "3D":
+            data["graph"] = mist.graph.construct_knn3D(data["x"], data["y"], data["z"], k)
+        else:
+            data["graph"] = mist.graph.construct_knn_usphere_cart(
+                data["x"], data["y"], data["z"], k
+            )
+    elif stage == "construct_del":
+        if mode == "2D":
+            mist.graph.construct_del2D(data["x"], data["y"])
+        elif mode == "3D":
+            mist.graph.construct_del3D(data["x"], data["y"], data["z"])
+        else:
+            mist.graph.construct_del_usphere_cart(data["x"], data["y"], data["z"])
+    elif stage == "construct_mst":
+        mst_graph = mist.mst.construct_mst(data["graph"])
+        data["edge_idx"], data["edge_length"] = mist.graph.graph2data(mst_graph)
+    elif stage == "get_degree":
+        data["degree"] = mist.graph.get_degree(data["edge_idx"], size)
+    elif stage == "find_branches":
+        # the branch finder only divides the data along the first two axes
+        mist.legacy.find_branches(
+            data["edge_idx"], data["degree"], x=data["x"], y=data["y"]
+        )
+    elif stage == "get_centrality":
+        data["centrality"] = mist.tree.get_centrality(data["edge_idx"], size)
+    elif stage == "get_adjacents":
+        data["adjacents_idx"], _ = mist.tree.get_adjacents(
+            data["edge_idx"], data["edge_length"], size
+        )
+    elif stage == "adjacents2tree":
+        root = int(np.argmax(data["centrality"]))
+        data["tree"] = mist.tree.adjacents2tree(
+            data["adjacents_idx"], size, root=root, sanity=False
+        )
+    elif stage == "get_spines":
+        mist.tree.get_spines(data["tree"], data["centrality"])
+    elif stage == "get_groups":
+        mist.tree.get_groups(data["adjacents_idx"], size)
+    elif stage == "perc_from_all_by_N":
+        mist.tree.perc_from_all_by_N(data["adjacents_idx"], 3)
+    else:
+        raise ValueError("Unknown stage %s." % stage)
+
+
+def ensure_spanning(data: dict) -> bool:
+    """
+    Replaces a kNN MST that is a forest, as is common for clustered points, with the
+    MST of the Delaunay graph, so that the tree stages receive a spanning tree.
+
+    Parameters
+    ----------
+    data : dict
+        Points and the outputs of the previous stages.
+
+    Returns
+    -------
+    replaced : bool
+        Whether the MST was replaced.
+    """
+    if data["edge_idx"].shape[1] == data["size"] - 1:
+        return False
+    if data["mode"] == "2D":
+        del_graph = mist.graph.construct_del2D(data["x"], data["y"])
+    elif data["mode"] == "3D":
+        del_graph = mist.graph.construct_del3D(data["x"], data["y"], data["z"])
+    else:
+        del_graph = mist.graph.construct_del_usphere_cart(data["x"], data["y"], data["z"])
+    mst_graph = mist.mst.construct_mst(del_graph)
+    data["edge_idx"], data["edge_length"] = mist.graph.graph2data(mst_graph)
+    return True
+
+
+# stages whose outputs are needed by later stages, with the stages they require
+REQUIRES = {
+    "construct_mst": ["construct_knn"],
+    "get_degree": ["construct_mst"],
+    "find_branches": ["get_degree"],
+    "get_centrality": ["construct_mst"],
+    "get_adjacents": ["construct_mst"],
+    "adjacents2tree": ["get_centrality", "get_adjacents"],
+    "get_spines": ["adjacents2tree"],
+    "get_groups": ["get_adjacents"],
+    "perc_from_all_by_N": ["get_adjacents"],
+}
+
+
+def _measure(stage: str, data: dict, k: int, repeat: int, memory: bool) -> dict:
+    """
+    Times a stage, best of repeat, and measures its peak traced memory.
+
+    Parameters
+    ----------
+    stage : str
+        Name of the stage.
+    data : dict
+        Points and the outputs of the previous stages.
+    k : int
+        Number of nearest neighbours.
+    repeat : int
+        Number of timed runs.
+    memory : bool
+        Runs the stage once more under tracemalloc to measure its peak memory.
+
+    Returns
+    -------
+    result : dict
+        Wall time 'time' and CPU time 'cpu_time' in seconds and peak memory
+        'peak_memory' in bytes (None if not measured).
+    """
+    wall, cpu = np.inf, np.inf
+    for _ in range(repeat):
+        t0, c0 = time.perf_counter(), time.process_time()
+        run_stage(stage, data, k)
+        wall = min(wall, time.perf_counter() - t0)
+        cpu = min(cpu, time.process_time() - c0)
+    peak = None
+    if memory:
+        tracemalloc.start()
+        run_stage(stage, data, k)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return {"time": wall, "cpu_time": cpu, "peak_memory": peak}
+
+
+def fit_exponent(sizes: list, values: list, minvalue: float = 0.0):
+    """
+    Fits the power law exponent of values against sizes in log space.
+
+    Parameters
+    ----------
+    sizes : list
+        Input sizes.
+    values : list
+        Measured times or memory, None values are ignored.
+    minvalue : float, optional
+        Values below this are ignored, e.g. to exclude timings dominated by
+        overheads.
+
+    Returns
+    -------
+    exponent : float or None
+        Scaling exponent, None if fewer than two usable points.
+    """
+    usable = [
+        (n, v) for n, v in zip(sizes, values) if v is not None and v > max(minvalue, 0.0)
+    ]
+    if len(usable) < 2:
+        return None
+    n, v = np.array(usable, dtype=float).T
+    return float(np.polyfit(np.log(n), np.log(v), 1)[0])
+
+
+def run_benchmarks(
+    datasets: list,
+    stages: list,
+    sizes: list,
+    k: int = 20,
+    repeat: int = 1,
+    memory: bool = True,
+    caps: bool = True,
+    time_budget: float = 600.0,
+    seed: int = 0,
+    reorder: str = None,
+    verbose: bool = True,
+) -> dict:
+    """
+    Runs the benchmarks.
+
+    Parameters
+    ----------
+    datasets : list
+        Dataset names.
+    stages : list
+        Stage names, stages required by these are run untimed.
+    sizes : list
+        Numbers of points.
+    k : int, optional
+        Number of nearest neighbours.
+    repeat : int, optional
+        Number of timed runs per stage.
+    memory : bool, optional
+        Measures the peak traced memory of each stage.
+    caps : bool, optional
+        Applies the per stage maximum sizes of STAGE_MAX_SIZE.
+    time_budget : float, optional
+        A stage taking longer than this, in seconds, is skipped at larger sizes.
+    seed : int, optional
+        Random seed.
+    reorder : str, optional
+        Reorders the points along a space filling curve before the stages are
+        run, 'hilbert' or 'morton'.
+    verbose : bool, optional
+        Prints progress.
+
+    Returns
+    -------
+    results : dict
+        Metadata and, for each dataset and stage, the sizes, times, CPU times, peak
+        memory and fitted scaling exponents.
+    """
+    # compile the numba kernels before timing
+    for dataset in datasets:
+        data = get_points(dataset, 500, seed)
+        for stage in STAGES:
+            run_stage(stage, data, k)
+            if stage == "construct_mst":
+                ensure_spanning(data)
+    results = {
+        "meta": {
+            "date": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "processor": platform.processor(),
+            "cpu_count": os.cpu_count(),
+            "k": k,
+            "repeat": repeat,
+            "seed": seed,
+            "reorder": reorder,
+        },
+        "results": {},
+    }
+    for dataset in datasets:
+        dresults = {
+            stage: {"sizes": [], "time": [], "cpu_time": [], "peak_memory": []}
+            for stage in stages
+        }
+        over_budget = set()
+        delaunay_sizes = []
+        for size in sizes:
+            data = get_points(dataset, size, seed, reorder=reorder)
+            done = set()
+            for stage in STAGES:
+                if stage not in stages and not _needed(stage, stages, size, caps, over_budget):
+                    continue
+                if _skip(stage, size, caps, over_budget) or not all(
+                    req in done for req in REQUIRES.get(stage, [])
+                ):
+                    continue
+                if stage in stages:
+                    result = _measure(stage, data, k, repeat, memory)
+                    for key in result:
+                        dresults[stage][key].append(result[key])
+                    dresults[stage]["sizes"].append(size)
+                    if result["time"] > time_budget:
+                        over_budget.add(stage)
+                    if verbose:
+                        print(
+                            "%-8s %-20s N=%-9d time=%10.4fs peak=%s"
+                            % (dataset, stage, size, result["time"], _format_bytes(result["peak_memory"]))
+                        )
+                else:
+                    run_stage(stage, data, k)
+                if stage == "construct_mst" and ensure_spanning(data):
+                    delaunay_sizes.append(size)
+                done.add(stage)
+        for stage in stages:
+            sresults = dresults[stage]
+            sresults["time_exponent"] = fit_exponent(sresults["sizes"], sresults["time"], 1e-3)
+            sresults["memory_exponent"] = fit_exponent(
+                sresults["sizes"], sresults["peak_memory"], 1e5
+            )
+        results["results"][dataset] = dresults
+        # sizes at which the tree stages ran on the Delaunay MST, see ensure_spanning
+        results["meta"].setdefault("delaunay_mst_sizes", {})[dataset] = delaunay_sizes
+    return results
+
+
+def _skip(stage: str, size: int, caps: bool, over_budget: set) -> bool:
+    """Whether a stage is skipped at a given size."""
+    if stage in over_budget:
+        return True
+    return caps and size > STAGE_MAX_SIZE.get(stage, np.inf)
+
+
+def _needed(stage: str, stages: list, size: int, caps: bool, over_budget: set) -> bool:
+    """Whether an untimed stage is required by one of the benchmarked stages."""
+    for other in stages:
+        if _skip(other, size, caps, over_budget):
+            continue
+        required = list(REQUIRES.get(other, []))
+        while len(required) > 0:
+            req = required.pop()
+            if req == stage:
+                return True
+            required += REQUIRES.get(req, [])
+    return False
+
+
+def _format_bytes(nbytes) -> str:
+    """Formats a number of bytes."""
+    if nbytes is None:
+        return "-"
+    return "%.1fMB" % (nbytes / 1024.0**2)
+
+
+def compare_to_baseline(
+    results: dict, baseline: dict, tolerance: float = 0.25, exponent_tolerance: float = 0.2
+) -> list:
+    """
+    Compares benchmark results to a stored baseline.
+
+    Parameters
+    ----------
+    results : dict
+        New benchmark results.
+    baseline : dict
+        Baseline benchmark results.
+    tolerance : float, optional
+        Fractional time increase at a common size flagged as a regression.
+    exponent_tolerance : float, optional
+        Increase in the fitted time exponent flagged as a regression.
+
+    Returns
+    -------
+    regressions : list
+        Description of each regression.
+    """
+    regressions = []
+    for dataset, dresults in results["results"].items():
+        for stage, sresults in dresults.items():
+            bresults = baseline.get("results", {}).get(dataset, {}).get(stage)
+            if bresults is None:
+                continue
+            btime = dict(zip(bresults["sizes"], bresults["time"]))
+            for size, t in zip(sresults["sizes"], sresults["time"]):
+                if size in btime and t > (1.0 + tolerance) * btime[size] and t > 1e-3:
+                    regressions.append(
+                        "%s %s N=%d: %.4fs vs baseline %.4fs"
+                        % (dataset, stage, size, t, btime[size])
+                    )
+            exp, bexp = sresults["time_exponent"], bresults.get("time_exponent")
+            if exp is not None and bexp is not None and exp > bexp + exponent_tolerance:
+                regressions.append(
+                    "%s %s: time exponent %.2f vs baseline %.2f" % (dataset, stage, exp, bexp)
+                )
+    return regressions
+
+
+def print_summary(results: dict) -> None:
+    """Prints the fitted scaling exponents."""
+    print("\n%-8s %-20s %10s %10s" % ("dataset", "stage", "time_exp", "mem_exp"))
+    for dataset, dresults in results["results"].items():
+        for stage, sresults in dresults.items():
+            texp, mexp = sresults["time_exponent"], sresults["memory_exponent"]
+            print(
+                "%-8s %-20s %10s %10s"
+                % (
+                    dataset,
+                    stage,
+                    "-" if texp is None else "%.2f" % texp,
+                    "-" if mexp is None else "%.2f" % mexp,
+                )
+            )
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="MiSTree+ scaling benchmarks.")
+    parser.add_argument(
+        "--sizes", type=float, nargs="+", default=DEFAULT_SIZES,
+        help="Numbers of points, e.g. --sizes 1e3 1e4 1e5 1e6 1e7.",
+    )
+    parser.add_argument("--datasets", nargs="+", default=DATASETS, choices=DATASETS)
+    parser.add_argument("--stages", nargs="+", default=STAGES, choices=STAGES)
+    parser.add_argument("--k", type=int, default=20, help="Number of nearest neighbours.")
+    parser.add_argument("--repeat", type=int, default=1, help="Timed runs per stage.")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--reorder", choices=["hilbert", "morton"],
+        help="Reorder the points along a space filling curve.",
+    )
+    parser.add_argument("--no-memory", action="store_true", help="Skip memory profiling.")
+    parser.add_argument("--no-caps", action="store_true", help="Remove per stage size caps.")
+    parser.add_argument(
+        "--time-budget", type=float, default=600.0,
+        help="Seconds after which a stage is skipped at larger sizes.",
+    )
+    parser.add_argument(
+        "--import-latency", action="store_true",
+        help="Also measure the import and first result latency, see import_latency.py.",
+    )
+    parser.add_argument("--output", help="JSON file the results are written to.")
+    parser.add_argument("--baseline", help="JSON file of baseline results to compare to.")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument("--exponent-tolerance", type=float, default=0.2)
+    parser.add_argument("--fail-on-regression", action="store_true")
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(
+        args.datasets,
+        args.stages,
+        [int(size) for size in args.sizes],
+        k=args.k,
+        repeat=args.repeat,
+        memory=not args.no_memory,
+        caps=not args.no_caps,
+        time_budget=args.time_budget,
+        seed=args.seed,
+        reorder=args.reorder,
+    )
+    print_summary(results)
+    if args.import_latency:
+        from import_latency import measure_import_latency
+
+        results["import_latency"] = measure_import_latency()
+        for cache in ["cold", "warm"]:
+            print(
+                "%s cache: import %.3fs, first result %.3fs"
+                % (cache, results["import_latency"][cache]["import"], results["import_latency"][cache]["first_result"])
+            )
+    if args.output is not None:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+    if args.baseline is not None:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare_to_baseline(
+            results, baseline, args.tolerance, args.exponent_tolerance
+        )
+        print("\n%d regression(s) against %s" % (len(regressions), args.baseline))
+        for regression in regressions:
+            print("  " + regression)
+        if args.fail_on_regression and len(regressions) > 0:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,10 +1,33 @@
-from . import check
-from . import coords
-from . import graph
-from . import index
-from . import legacy
-from . import levy
-from . import mst
-from . import randoms
-from . import src
-from . import tree
+import importlib
+
+# Subpackages are imported on first access, so that importing mistreeplus does not
+# pull in scipy, scikit-learn and numba until they are needed.
+_submodules = [
+    "check",
+    "cluster",
+    "config",
+    "coords",
+    "graph",
+    "index",
+    "legacy",
+    "levy",
+    "mst",
+    "randoms",
+    "src",
+    "tracing",
+    "tree",
+]
+
+__all__ = _submodules + ["warmup"]
+
+
+def __getattr__(name: str):
+    if name in _submodules:
+        return importlib.import_module("." + name, __name__)
+    if name == "warmup":
+        return importlib.import_module(".src", __name__).warmup
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
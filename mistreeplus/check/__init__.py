@@ -6,6 +6,7 @@ from .coords import check_dec_in_range
 from .coords import check_r_unit_sphere
 
 from .general import check_isscalar
+from .general import get_check_values
 from .general import check_length
 from .general import check_positive
 from .general import check_finite
@@ -33,6 +33,9 @@ def check_phi_in_range(phi: Union[float, np.ndarray], units: str) -> None:
     units : str
         Angular units, either 'degs' for degrees or 'rads' for radians.
     """
+    phi = general.get_check_values(phi)
+    if phi is None:
+        return
     if general.check_isscalar(phi) == True:
         if units == "degs":
             if phi < 0.0 or phi > 360.0:
@@ -88,6 +91,9 @@ def check_theta_in_range(theta: Union[float, np.ndarray], units: str) -> None:
     units : str
         Angular units, either 'degs' for degrees or 'rads' for radians.
     """
+    theta = general.get_check_values(theta)
+    if theta is None:
+        return
     if general.check_isscalar(theta) == True:
         if units == "degs":
             if theta < 0.0 or theta > 180.0:
@@ -129,6 +135,9 @@ def check_dec_in_range(dec: Union[float, np.ndarray], units: str) -> None:
     units : str
         Angular units, either 'degs' for degrees or 'rads' for radians.
     """
+    dec = general.get_check_values(dec)
+    if dec is None:
+        return
     if general.check_isscalar(dec) == True:
         if units == "degs":
             if dec < -90.0 or dec > 90.0:
@@ -171,6 +180,9 @@ def check_r_unit_sphere(r: Union[float, np.ndarray], tol: float = 1e-6) -> None:
     r : float or array
         Radial distance.
     """
+    r = general.get_check_values(r)
+    if r is None:
+        return
     if general.check_isscalar(r) == True:
         if abs(r - 1.0) > tol:
             raise AssertionError(
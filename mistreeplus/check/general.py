@@ -1,5 +1,7 @@
 import numpy as np
-from typing import Union
+from typing import Optional, Union
+
+from .. import config
 
 
 def check_isscalar(x):
@@ -17,6 +19,32 @@ def check_isscalar(x):
         return np.isscalar(x)
 
 
+def get_check_values(
+    values: Optional[Union[float, np.ndarray]]
+) -> Optional[Union[float, np.ndarray]]:
+    """
+    Returns the values a range check has to inspect under the configured validation
+    level: all values for 'full', the minimum and maximum of an array for
+    'minmax' and None, i.e. skip the check, for 'off'.
+
+    Parameters
+    ----------
+    values : float or array
+        Values to be checked, None is passed through.
+
+    Returns
+    -------
+    values : float, array or None
+        Values to check.
+    """
+    validation = config.get_validation()
+    if values is None or validation == "off":
+        return None
+    if validation == "minmax" and check_isscalar(values) == False and len(values) > 2:
+        return np.array([np.min(values), np.max(values)])
+    return values
+
+
 def check_length(array: np.ndarray, length: int) -> None:
     """Checks array is of the desired length."""
     if len(array) == length:
@@ -29,6 +57,9 @@ def check_length(array: np.ndarray, length: int) -> None:
 
 def check_positive(values: Union[float, np.ndarray]) -> None:
     """Checks values is positive."""
+    values = get_check_values(values)
+    if values is None:
+        return
     if check_isscalar(values) == True:
         if values < 0:
             raise AssertionError("Values is negative.", values)
@@ -44,6 +75,9 @@ def check_positive(values: Union[float, np.ndarray]) -> None:
 
 def check_finite(values: Union[float, np.ndarray]) -> None:
     """Check values are finite."""
+    values = get_check_values(values)
+    if values is None:
+        return
     if check_isscalar(values) == True:
         if np.isfinite(values) == False:
             raise AssertionError("Values are not finite.", values)
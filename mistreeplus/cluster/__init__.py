@@ -0,0 +1,6 @@
+from .fof import get_fof_labels
+from .fof import get_linkage
+from .fof import get_group_catalogue
+from .fof import get_fof_groups
+
+from .percolation import get_percolation_curve
@@ -0,0 +1,187 @@
+import numpy as np
+from typing import List, Optional, Tuple
+
+from .. import src
+
+
+def _sort_edges(
+    edge_idx: np.ndarray, edge_length: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Sorts edges by increasing length.
+
+    Parameters
+    ----------
+    edge_idx : 2darray
+        Graph edge node indices.
+    edge_length : array
+        Length of each edge.
+
+    Returns
+    -------
+    idx1, idx2 : int array
+        Node indices at each end of the sorted edges.
+    edge_length : array
+        Sorted edge lengths.
+    """
+    order = np.argsort(edge_length, kind="stable")
+    idx1 = np.ascontiguousarray(edge_idx[0][order], dtype=np.int64)
+    idx2 = np.ascontiguousarray(edge_idx[1][order], dtype=np.int64)
+    return idx1, idx2, np.ascontiguousarray(edge_length[order], dtype=np.float64)
+
+
+def get_fof_labels(
+    edge_idx: np.ndarray,
+    edge_length: np.ndarray,
+    Nnodes: int,
+    linking_lengths: np.ndarray,
+) -> np.ndarray:
+    """
+    Finds the friends-of-friends groups for several linking lengths, by cutting the
+    MST edges longer than each linking length. The edges are sorted once and all
+    linking lengths are processed in a single union-find sweep.
+
+    Parameters
+    ----------
+    edge_idx : 2darray
+        Graph edge node indices of the MST.
+    edge_length : array
+        Length of each edge.
+    Nnodes : int
+        Number of nodes.
+    linking_lengths : array
+        Linking lengths.
+
+    Returns
+    -------
+    labels : 2darray
+        Group label of each node for each linking length, shape
+        (len(linking_lengths), Nnodes). Labels are numbered in order of the first
+        node of each group.
+    """
+    idx1, idx2, sorted_length = _sort_edges(edge_idx, edge_length)
+    linking_lengths = np.atleast_1d(linking_lengths)
+    order = np.argsort(linking_lengths, kind="stable")
+    cuts = np.searchsorted(sorted_length, linking_lengths[order], side="right")
+    labels = np.empty((len(linking_lengths), Nnodes), dtype=np.int64)
+    labels[order] = src.fof_sweep(idx1, idx2, Nnodes, cuts)
+    return labels
+
+
+def get_linkage(edge_idx: np.ndarray, edge_length: np.ndarray, Nnodes: int) -> np.ndarray:
+    """
+    Constructs the single-linkage dendrogram of the MST.
+
+    Parameters
+    ----------
+    edge_idx : 2darray
+        Graph edge node indices of the MST.
+    edge_length : array
+        Length of each edge.
+    Nnodes : int
+        Number of nodes.
+
+    Returns
+    -------
+    linkage : 2darray
+        Linkage matrix in the scipy.cluster.hierarchy format, so it can be used with
+        for example scipy.cluster.hierarchy.dendrogram or fcluster. If the MST is a
+        forest there are fewer than Nnodes-1 merges.
+    """
+    idx1, idx2, sorted_length = _sort_edges(edge_idx, edge_length)
+    linkage = src.linkage_sweep(idx1, idx2, sorted_length, Nnodes)
+    return linkage
+
+
+def get_group_catalogue(
+    labels: np.ndarray,
+    vert: Optional[np.ndarray] = None,
+    weights: Optional[np.ndarray] = None,
+    min_size: int = 1,
+) -> dict:
+    """
+    Constructs the catalogue of groups for one set of group labels.
+
+    Parameters
+    ----------
+    labels : int array
+        Group label of each node.
+    vert : 2darray, optional
+        Coordinates of the nodes in vertices format, used for group centroids.
+    weights : array, optional
+        Weights of the nodes, used for group weights and weighted centroids.
+    min_size : int, optional
+        Minimum number of members for a group to be included.
+
+    Returns
+    -------
+    catalogue : dict
+        Dictionary with:
+            - 'label' : label of each group.
+            - 'size' : number of members of each group.
+            - 'weight' : summed weights of each group, if weights are given.
+            - 'centroid' : (weighted) centroid of each group, if vert is given.
+    """
+    size = np.bincount(labels)
+    keep = np.where(size >= min_size)[0]
+    catalogue = {"label": keep, "size": size[keep]}
+    if weights is not None:
+        wg = np.bincount(labels, weights=weights, minlength=len(size))
+        catalogue["weight"] = wg[keep]
+    else:
+        wg = size.astype(float)
+    if vert is not None:
+        centroid = np.empty((len(keep), vert.shape[1]))
+        w = np.ones(len(labels)) if weights is None else weights
+        for i in range(vert.shape[1]):
+            centroid[:, i] = (
+                np.bincount(labels, weights=w * vert[:, i], minlength=len(size))[keep]
+                / wg[keep]
+            )
+        catalogue["centroid"] = centroid
+    return catalogue
+
+
+def get_fof_groups(
+    edge_idx: np.ndarray,
+    edge_length: np.ndarray,
+    Nnodes: int,
+    linking_lengths: np.ndarray,
+    vert: Optional[np.ndarray] = None,
+    weights: Optional[np.ndarray] = None,
+    min_size: int = 1,
+) -> Tuple[np.ndarray, List[dict]]:
+    """
+    Finds the friends-of-friends groups and group catalogues for several linking
+    lengths from the MST.
+
+    Parameters
+    ----------
+    edge_idx : 2darray
+        Graph edge node indices of the MST.
+    edge_length : array
+        Length of each edge.
+    Nnodes : int
+        Number of nodes.
+    linking_lengths : array
+        Linking lengths.
+    vert : 2darray, optional
+        Coordinates of the nodes in vertices format, used for group centroids.
+    weights : array, optional
+        Weights of the nodes.
+    min_size : int, optional
+        Minimum number of members for a group to be included in the catalogues.
+
+    Returns
+    -------
+    labels : 2darray
+        Group label of each node for each linking length.
+    catalogues : list
+        Group catalogue for each linking length, see get_group_catalogue.
+    """
+    labels = get_fof_labels(edge_idx, edge_length, Nnodes, linking_lengths)
+    catalogues = [
+        get_group_catalogue(_labels, vert=vert, weights=weights, min_size=min_size)
+        for _labels in labels
+    ]
+    return labels, catalogues
@@ -0,0 +1,73 @@
+import numpy as np
+from typing import Optional
+
+from . import fof
+
+from .. import src
+
+
+def get_percolation_curve(
+    edge_idx: np.ndarray,
+    edge_length: np.ndarray,
+    Nnodes: int,
+    thresholds: Optional[np.ndarray] = None,
+    maxdegree: int = 6,
+) -> dict:
+    """
+    Computes how the connectivity of the MST changes with an edge length cut, by
+    adding the edges in order of increasing length with union-find. All thresholds
+    are processed in one sweep.
+
+    Parameters
+    ----------
+    edge_idx : 2darray
+        Graph edge node indices of the MST.
+    edge_length : array
+        Length of each edge.
+    Nnodes : int
+        Number of nodes.
+    thresholds : array, optional
+        Edge length thresholds, edges with lengths less than or equal to a threshold
+        are kept. If None the curve is recorded at every edge length.
+    maxdegree : int, optional
+        Maximum degree recorded in the degree histograms, higher degrees are
+        counted in the last bin.
+
+    Returns
+    -------
+    curve : dict
+        Dictionary with, for each threshold:
+            - 'thresholds' : the edge length threshold.
+            - 'ngroups' : the number of groups.
+            - 'giant' : the size of the largest group.
+            - 'giant_fraction' : the fraction of nodes in the largest group.
+            - 'mean_size' : the mean group size, Nnodes / ngroups.
+            - 'susceptibility' : the mean size of the group a node belongs to,
+              excluding the largest group, sum(s^2) / sum(s) over the other groups.
+            - 'degree_hist' : the number of nodes with degree 0 to maxdegree.
+    """
+    idx1, idx2, sorted_length = fof._sort_edges(edge_idx, edge_length)
+    if thresholds is None:
+        thresholds = sorted_length
+    thresholds = np.atleast_1d(thresholds)
+    order = np.argsort(thresholds, kind="stable")
+    cuts = np.searchsorted(sorted_length, thresholds[order], side="right")
+    ngroups, giant, sum2, degree_hist = src.percolation_sweep(
+        idx1, idx2, Nnodes, cuts, maxdegree
+    )
+    curve = {"thresholds": thresholds}
+    curve["ngroups"] = np.empty(len(thresholds), dtype=np.int64)
+    curve["ngroups"][order] = ngroups
+    curve["giant"] = np.empty(len(thresholds), dtype=np.int64)
+    curve["giant"][order] = giant
+    curve["giant_fraction"] = curve["giant"] / Nnodes
+    curve["mean_size"] = Nnodes / curve["ngroups"]
+    susceptibility = np.zeros(len(thresholds))
+    rest = Nnodes - giant
+    cond = np.where(rest > 0)[0]
+    susceptibility[cond] = (sum2[cond] - giant[cond].astype(float) ** 2) / rest[cond]
+    curve["susceptibility"] = np.empty(len(thresholds))
+    curve["susceptibility"][order] = susceptibility
+    curve["degree_hist"] = np.empty((len(thresholds), maxdegree + 1), dtype=np.int64)
+    curve["degree_hist"][order] = degree_hist
+    return curve
@@ -0,0 +1,8 @@
+from .settings import set_config
+from .settings import get_config
+from .settings import reset_config
+from .settings import config_context
+from .settings import get_validation
+from .settings import get_float_dtype
+from .settings import get_int_dtype
+from .settings import get_nthreads
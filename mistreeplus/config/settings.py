@@ -0,0 +1,227 @@
+import numpy as np
+import os
+import sys
+from contextlib import contextmanager
+from typing import Optional, Union
+
+_VALIDATION_LEVELS = ["full", "minmax", "off"]
+_FLOAT_DTYPES = [np.float64, np.float32]
+_INT_DTYPES = [np.int64, np.int32]
+_INT32_LIMIT = 2**31
+
+_DEFAULTS = {
+    "validation": "full",
+    "float_dtype": np.float64,
+    "int_dtype": "auto",
+    "nthreads": None,
+}
+
+_config = dict(_DEFAULTS)
+
+
+def _check_dtype(dtype: type, allowed: list, name: str) -> type:
+    """Returns the numpy scalar type of dtype, raising an error if it is not allowed."""
+    try:
+        dtype = np.dtype(dtype).type
+    except TypeError:
+        raise ValueError("%s %r is not a numpy dtype." % (name, dtype))
+    if dtype not in allowed:
+        raise ValueError(
+            "%s must be one of %s." % (name, ", ".join(np.dtype(d).name for d in allowed)),
+            dtype,
+        )
+    return dtype
+
+
+def _check_nthreads(nthreads: int) -> int:
+    """Checks nthreads is a positive integer or -1."""
+    if isinstance(nthreads, bool) or not isinstance(nthreads, (int, np.integer)):
+        raise ValueError("nthreads must be an integer.", nthreads)
+    if nthreads < 1 and nthreads != -1:
+        raise ValueError("nthreads must be positive, or -1 for all cores.", nthreads)
+    return int(nthreads)
+
+
+def _set_numba_threads(nthreads: Optional[int]):
+    """Sets the number of threads of the parallel numba kernels."""
+    if nthreads is None and "numba" not in sys.modules:
+        # numba has not been imported, so it still has its own default
+        return
+    import numba
+
+    maxthreads = numba.config.NUMBA_NUM_THREADS
+    if nthreads is None or nthreads == -1:
+        numba.set_num_threads(maxthreads)
+    else:
+        numba.set_num_threads(min(nthreads, maxthreads))
+
+
+def set_config(
+    validation: Optional[str] = None,
+    float_dtype: Optional[type] = None,
+    int_dtype: Optional[Union[type, str]] = None,
+    nthreads: Optional[int] = None,
+):
+    """
+    Sets the global configuration, options left as None are unchanged.
+
+    Parameters
+    ----------
+    validation : str, optional
+        Input validation level of the check functions:
+            - 'full' : every element of an array is checked (default).
+            - 'minmax' : only the minimum and maximum of an array are checked,
+              two reductions with no full size temporaries.
+            - 'off' : array values are not checked, for trusted inputs.
+        Checks of option strings such as units and mode are always carried out.
+    float_dtype : type, optional
+        Either np.float64 (default) or np.float32, the data type of newly
+        allocated coordinate buffers.
+    int_dtype : type or str, optional
+        Either np.int64, np.int32 or 'auto' (default), the data type of newly
+        allocated node index arrays. With 'auto' indices are int32 whenever the
+        number of nodes is below 2^31.
+    nthreads : int, optional
+        Number of worker threads of KD-tree queries and of the parallel numba
+        kernels, -1 uses all cores. By default KD-tree queries use 1 thread and
+        numba its own default.
+    """
+    new = dict(_config)
+    if validation is not None:
+        if validation not in _VALIDATION_LEVELS:
+            raise ValueError(
+                "validation must be one of %s." % ", ".join(_VALIDATION_LEVELS), validation
+            )
+        new["validation"] = validation
+    if float_dtype is not None:
+        new["float_dtype"] = _check_dtype(float_dtype, _FLOAT_DTYPES, "float_dtype")
+    if isinstance(int_dtype, str) and int_dtype == "auto":
+        new["int_dtype"] = "auto"
+    elif int_dtype is not None:
+        new["int_dtype"] = _check_dtype(int_dtype, _INT_DTYPES, "int_dtype")
+    if nthreads is not None:
+        new["nthreads"] = _check_nthreads(nthreads)
+        _set_numba_threads(new["nthreads"])
+    _config.update(new)
+
+
+def get_config() -> dict:
+    """
+    Returns a copy of the global configuration.
+
+    Returns
+    -------
+    config : dict
+        Dictionary with 'validation', 'float_dtype', 'int_dtype' and 'nthreads'.
+    """
+    return dict(_config)
+
+
+def reset_config():
+    """Restores the default configuration."""
+    if _config["nthreads"] is not None:
+        _set_numba_threads(None)
+    _config.update(_DEFAULTS)
+
+
+@contextmanager
+def config_context(**kwargs):
+    """
+    Context manager setting the configuration for the enclosed code only, taking
+    the same options as set_config.
+
+    Example
+    -------
+        with mistreeplus.config.config_context(validation='off', float_dtype=np.float32):
+            vert = mistreeplus.coords.sphere2vert(r, phi, theta)
+    """
+    old = get_config()
+    set_config(**kwargs)
+    try:
+        yield get_config()
+    finally:
+        if old["nthreads"] != _config["nthreads"]:
+            _set_numba_threads(old["nthreads"])
+        _config.update(old)
+
+
+def get_validation() -> str:
+    """
+    Returns the configured validation level.
+
+    Returns
+    -------
+    validation : str
+        Either 'full', 'minmax' or 'off'.
+    """
+    return _config["validation"]
+
+
+def get_float_dtype(dtype: Optional[type] = None) -> type:
+    """
+    Returns the float dtype of a new coordinate buffer.
+
+    Parameters
+    ----------
+    dtype : type, optional
+        Explicitly requested dtype, which takes precedence over the configuration.
+
+    Returns
+    -------
+    dtype : type
+        Data type of the buffer.
+    """
+    if dtype is not None:
+        return dtype
+    return _config["float_dtype"]
+
+
+def get_int_dtype(dtype: Optional[type] = None, nnodes: Optional[int] = None) -> type:
+    """
+    Returns the int dtype of a new node index array.
+
+    Parameters
+    ----------
+    dtype : type, optional
+        Explicitly requested dtype, which takes precedence over the configuration.
+    nnodes : int, optional
+        Number of nodes the indices refer to, with int_dtype='auto' this gives
+        int32 if nnodes < 2^31. If None int64 is used.
+
+    Returns
+    -------
+    dtype : type
+        Data type of the array.
+    """
+    if dtype is not None:
+        return dtype
+    if _config["int_dtype"] != "auto":
+        return _config["int_dtype"]
+    if nnodes is not None and nnodes < _INT32_LIMIT:
+        return np.int32
+    return np.int64
+
+
+def get_nthreads(nthreads: Optional[int] = None) -> int:
+    """
+    Returns the number of worker threads.
+
+    Parameters
+    ----------
+    nthreads : int, optional
+        Explicitly requested number of threads, which takes precedence over the
+        configuration.
+
+    Returns
+    -------
+    nthreads : int
+        Number of threads, -1 is resolved to the number of cores and the default is
+        1.
+    """
+    if nthreads is None:
+        nthreads = _config["nthreads"]
+    if nthreads is None:
+        return 1
+    if nthreads == -1:
+        return os.cpu_count() or 1
+    return nthreads
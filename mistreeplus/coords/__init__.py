@@ -8,20 +8,33 @@ from .sphere import sphere2cart
 from .sphere import sphere2cart_radec
 from .sphere import cart2sphere
 from .sphere import cart2sphere_radec
+from .sphere import sphere2vert
+from .sphere import sphere2vert_radec
+from .sphere import vert2sphere
 
 from .usphere import usphere2cart
 from .usphere import usphere2cart_radec
 from .usphere import cart2usphere
 from .usphere import cart2usphere_radec
 from .usphere import usphere_dist2ang
+from .usphere import usphere_tiles
+from .usphere import usphere2vert
+from .usphere import usphere2vert_radec
 
 from .vertices import xy2vert
 from .vertices import vert2xy
 from .vertices import xyz2vert
 from .vertices import vert2xyz
+from .vertices import get_vert_buffer
 
-# # Grouping related functions
-# from .group import KDTree2D
-# from .group import KDTree3D
-# from .group import PinchGroup2D
-# from .group import PinchGroup3D
+from .points import PointSet
+
+# Grouping related functions
+from .group import KDTree2D
+from .group import KDTree3D
+from .group import PinchGroup2D
+from .group import PinchGroup3D
+from .group import PinchGroup
+from .group import SingleLinkGroup2D
+from .group import SingleLinkGroup3D
+from .group import SingleLinkGroup
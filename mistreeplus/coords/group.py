@@ -1,8 +1,16 @@
+import itertools
 import numpy as np
-from typing import Optional, Union
+from scipy.spatial import Delaunay as scDelaunay
 from scipy.spatial import KDTree as scKDTree
+from scipy.spatial import QhullError, cKDTree
+from typing import Optional, Tuple, Union
 
 from . import vertices
+from .points import PointSet
+from .. import src
+
+# number of nearest neighbours linked per point by the single-linkage grouping
+_LINK_K = 16
 
 
 class KDTree2D:
@@ -31,6 +39,18 @@ class KDTree2D:
         self.KD = scKDTree(self.points, boxsize=boxsize)
 
 
+    def build_tree_from_points(self, points):
+        """Uses the KD-tree of a point set, without copying the coordinates.
+
+        Parameters
+        ----------
+        points : PointSet
+            2D points.
+        """
+        self.points = points.vert
+        self.KD = points.tree
+
+
     def nearest(self, x, y, k=1):
         """Returns the nearest index (and distance) of a point from the KDTree
 
@@ -90,6 +110,18 @@ class KDTree3D:
         self.KD = scKDTree(self.points, boxsize=boxsize)
 
 
+    def build_tree_from_points(self, points):
+        """Uses the KD-tree of a point set, without copying the coordinates.
+
+        Parameters
+        ----------
+        points : PointSet
+            3D points.
+        """
+        self.points = points.vert
+        self.KD = points.tree
+
+
     def nearest(self, x, y, z, k=1):
         """Returns the nearest index (and distance) of a point from the KDTree
 
@@ -123,41 +155,43 @@ class KDTree3D:
         self.__init__()
 
 
-def PinchGroup2D(
-    x: np.ndarray, 
-    y: np.ndarray, 
-    mindist: float, 
-    w: Optional[np.ndarray] = None
-) -> Union[float, np.ndarray]:
+def _pinch_group(
+    vert: np.ndarray,
+    mindist: float,
+    w: Optional[np.ndarray] = None,
+    tree: Optional[cKDTree] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
     """
-    Uses the hierarchical pinching algorithm to filter out small scales.
+    Uses the hierarchical pinching algorithm on points in vertices format.
 
     Parameters
     ----------
-    x, y : array
-        2D coordinates.
+    vert : 2darray
+        Coordinates in vertices format, not modified.
     mindist : float
         Minimum distance between points.
     w : optional, array
         Weights for the points.
-    
+    tree : cKDTree, optional
+        KD-tree of vert, reused for the first pinching pass.
+
     Returns
     -------
-    xg, yg : array
-        2D coordinates of new group positions.
+    vertg : 2darray
+        Coordinates of new group positions.
     wg : array
         Group weights.
     """
-    xg, yg = np.copy(x), np.copy(y)
+    vertg = vert
     if w is None:
-        w = np.ones(len(x))
-    wg = np.copy(w)
+        w = np.ones(len(vert))
+    wg = w
     run = True
     while run:
-        mask = np.ones(len(xg))
-        kd = KDTree2D()
-        kd.build_tree(xg, yg)
-        _idx, _dist = kd.nearest(xg, yg, k=2)
+        if tree is None:
+            tree = scKDTree(vertg)
+        _dist, _idx = tree.query(vertg, k=2)
+        tree = None
         idx = np.arange(len(_idx))
         dist = np.zeros(len(_dist))
         cond = np.where(_idx[:,0] != idx)[0]
@@ -167,26 +201,56 @@ def PinchGroup2D(
         idx[cond] = _idx[cond,1]
         dist[cond] = _dist[cond,1]
         sidx = np.argsort(dist)
-        newx = []
-        newy = []
-        neww = []
+        mask = np.ones(len(vertg), dtype=bool)
+        pair1, pair2 = [], []
         for _id in sidx:
-            if mask[_id] == 1. and mask[idx[_id]] == 1.:
-                if dist[_id] <= mindist:
-                    newx.append((wg[_id]*xg[_id] + wg[idx[_id]]*xg[idx[_id]])/(wg[_id] + wg[idx[_id]]))
-                    newy.append((wg[_id]*yg[_id] + wg[idx[_id]]*yg[idx[_id]])/(wg[_id] + wg[idx[_id]]))
-                    neww.append(wg[_id] + wg[idx[_id]])
-                    mask[_id], mask[idx[_id]] = 0., 0.
-        newx = np.array(newx)
-        newy = np.array(newy)
-        neww = np.array(neww)
-        cond = np.where(mask == 1.)[0]
-        xg = np.concatenate([xg[cond], newx])
-        yg = np.concatenate([yg[cond], newy])
-        wg = np.concatenate([wg[cond], neww])
-        if len(cond) == len(xg):
+            if dist[_id] > mindist:
+                break
+            if mask[_id] and mask[idx[_id]]:
+                pair1.append(_id)
+                pair2.append(idx[_id])
+                mask[_id], mask[idx[_id]] = False, False
+        pair1 = np.array(pair1, dtype=np.int64)
+        pair2 = np.array(pair2, dtype=np.int64)
+        w1, w2 = wg[pair1], wg[pair2]
+        newvert = (
+            w1[:, np.newaxis] * vertg[pair1] + w2[:, np.newaxis] * vertg[pair2]
+        ) / (w1 + w2)[:, np.newaxis]
+        cond = np.where(mask)[0]
+        vertg = np.concatenate([vertg[cond], newvert])
+        wg = np.concatenate([wg[cond], w1 + w2])
+        if len(cond) == len(vertg):
             run = False
-    return xg, yg, wg
+    return vertg, wg
+
+
+def PinchGroup2D(
+    x: np.ndarray, 
+    y: np.ndarray, 
+    mindist: float, 
+    w: Optional[np.ndarray] = None
+) -> Union[float, np.ndarray]:
+    """
+    Uses the hierarchical pinching algorithm to filter out small scales.
+
+    Parameters
+    ----------
+    x, y : array
+        2D coordinates.
+    mindist : float
+        Minimum distance between points.
+    w : optional, array
+        Weights for the points.
+    
+    Returns
+    -------
+    xg, yg : array
+        2D coordinates of new group positions.
+    wg : array
+        Group weights.
+    """
+    vertg, wg = _pinch_group(vertices.xy2vert(x, y), mindist, w=w)
+    return vertg[:, 0], vertg[:, 1], wg
 
 
 def PinchGroup3D(
@@ -215,46 +279,382 @@ def PinchGroup3D(
     wg : array
         Group weights.
     """
-    xg, yg, zg = np.copy(x), np.copy(y), np.copy(z)
+    vertg, wg = _pinch_group(vertices.xyz2vert(x, y, z), mindist, w=w)
+    return vertg[:, 0], vertg[:, 1], vertg[:, 2], wg
+
+
+def PinchGroup(points: PointSet, mindist: float) -> PointSet:
+    """
+    Uses the hierarchical pinching algorithm to filter out small scales of a 2D or
+    3D point set, reusing its coordinate buffer and KD-tree.
+
+    Parameters
+    ----------
+    points : PointSet
+        2D or 3D points, with optional weights. Periodic boundaries are ignored.
+    mindist : float
+        Minimum distance between points.
+
+    Returns
+    -------
+    groups : PointSet
+        Group positions, with the group weights.
+    """
+    tree = points.tree if points.boxsize is None else None
+    vertg, wg = _pinch_group(points.vert, mindist, w=points.weights, tree=tree)
+    return PointSet.from_vert(vertg, weights=wg)
+
+
+def _periodic_images(
+    vert: np.ndarray, ids: np.ndarray, boxsize: float, width: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Adds the periodic images of points within width of the faces of the box,
+    including images across edges and corners.
+
+    Parameters
+    ----------
+    vert : 2darray
+        Coordinates in vertices format, between [0, boxsize).
+    ids : array
+        Node index of each point.
+    boxsize : float
+        Periodic boundary boxsize.
+    width : float
+        Width of the layer of points copied across each face.
+
+    Returns
+    -------
+    vert : 2darray
+        Coordinates of the points followed by their images.
+    ids : array
+        Node index of each point and image.
+    """
+    for i in range(vert.shape[1]):
+        low = np.flatnonzero(vert[:, i] < width)
+        high = np.flatnonzero(vert[:, i] >= boxsize - width)
+        vlow, vhigh = vert[low], vert[high]
+        vlow[:, i] += boxsize
+        vhigh[:, i] -= boxsize
+        vert = np.concatenate([vert, vlow, vhigh])
+        ids = np.concatenate([ids, ids[low], ids[high]])
+    return vert, ids
+
+
+def _delaunay_links(
+    vert: np.ndarray, mindist: float, boxsize: Optional[float] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the Delaunay edges of at most mindist, which contain the Euclidean MST
+    edges of at most mindist and so link the same groups as all pairs within
+    mindist.
+
+    Parameters
+    ----------
+    vert : 2darray
+        Coordinates in vertices format.
+    mindist : float
+        Linking distance.
+    boxsize : float, optional
+        Periodic boundary boxsize, handled by triangulating periodic images.
+
+    Returns
+    -------
+    idx1, idx2 : int array
+        Node indices of the linking edges.
+    """
+    ids = np.arange(len(vert))
+    if boxsize is not None:
+        vert, ids = _periodic_images(vert, ids, boxsize, mindist)
+    # coincident points are linked to their first copy and triangulated once
+    uvert, first, inverse = np.unique(vert, axis=0, return_index=True, return_inverse=True)
+    uids = ids[first]
+    idx1, idx2 = [ids], [uids[inverse.ravel()]]
+    ndim = vert.shape[1]
+    try:
+        tri = scDelaunay(uvert)
+        simplices, coplanar = tri.simplices, tri.coplanar
+        e1 = np.concatenate(
+            [simplices[:, i] for i in range(ndim + 1) for j in range(i + 1, ndim + 1)]
+            + [coplanar[:, 0]]
+        )
+        e2 = np.concatenate(
+            [simplices[:, j] for i in range(ndim + 1) for j in range(i + 1, ndim + 1)]
+            + [coplanar[:, 2]]
+        )
+    except (QhullError, ValueError):
+        # too few or degenerate points, e.g. all collinear
+        pairs = cKDTree(uvert).query_pairs(mindist, output_type="ndarray")
+        e1, e2 = pairs[:, 0], pairs[:, 1]
+    cond = np.sum((uvert[e1] - uvert[e2]) ** 2.0, axis=1) <= mindist**2.0
+    idx1.append(uids[e1[cond]])
+    idx2.append(uids[e2[cond]])
+    return np.concatenate(idx1), np.concatenate(idx2)
+
+
+def _group_boundary(
+    vert: np.ndarray, labels: np.ndarray, mindist: float, boxsize: Optional[float] = None
+) -> np.ndarray:
+    """
+    Returns the points which may be within mindist of a point in another group,
+    those whose grid cell or an adjacent cell contains another group. Cells are
+    wider than mindist, so points in non-adjacent cells are never linked.
+
+    Parameters
+    ----------
+    vert : 2darray
+        Coordinates in vertices format.
+    labels : int array
+        Group label of each point.
+    mindist : float
+        Linking distance.
+    boxsize : float, optional
+        Periodic boundary boxsize.
+
+    Returns
+    -------
+    boundary : int array
+        Indices of the points.
+    """
+    ndim = vert.shape[1]
+    width = mindist * (1.0 + 1e-6)
+    if boxsize is None:
+        lower = np.min(vert, axis=0)
+        ncell = np.floor((np.max(vert, axis=0) - lower) / width).astype(np.int64) + 1
+        # padded so the cells adjacent to the edge cells have valid keys
+        pad, dims = 1, ncell + 2
+    else:
+        lower = np.zeros(ndim)
+        ncell = np.full(ndim, max(int(boxsize // width), 1), dtype=np.int64)
+        width = boxsize / ncell[0]
+        pad, dims = 0, ncell
+    if np.prod(dims.astype(np.float64)) > 2.0**62:
+        return np.arange(len(vert))
+    cell = np.clip(np.floor((vert - lower) / width).astype(np.int64), 0, ncell - 1)
+    key = np.ravel_multi_index((cell + pad).T, dims)
+    order = np.argsort(key, kind="stable")
+    skey = key[order]
+    starts = np.flatnonzero(np.concatenate([[True], skey[1:] != skey[:-1]]))
+    ukey = skey[starts]
+    cmin = np.minimum.reduceat(labels[order], starts)
+    cmax = np.maximum.reduceat(labels[order], starts)
+    smin, smax = np.copy(cmin), np.copy(cmax)
+    ucell = np.array(np.unravel_index(ukey, dims)).T
+    for offset in itertools.product([-1, 0, 1], repeat=ndim):
+        ocell = ucell + np.array(offset)
+        if boxsize is not None:
+            ocell = np.mod(ocell, ncell)
+        okey = np.ravel_multi_index(ocell.T, dims)
+        pos = np.minimum(np.searchsorted(ukey, okey), len(ukey) - 1)
+        found = ukey[pos] == okey
+        smin[found] = np.minimum(smin[found], cmin[pos[found]])
+        smax[found] = np.maximum(smax[found], cmax[pos[found]])
+    mixed = smin != smax
+    return np.flatnonzero(mixed[np.searchsorted(ukey, key)])
+
+
+def _link_edges(
+    vert: np.ndarray,
+    mindist: float,
+    boxsize: Optional[float] = None,
+    tree: Optional[cKDTree] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Finds edges of at most mindist linking the same groups as all pairs within
+    mindist, using O(N k) memory rather than the number of pairs. Each point is
+    linked to its k nearest neighbours within mindist. A pair missed by this has
+    both points saturated, with k neighbours closer than mindist, and in different
+    groups, so the remaining links are found from the Delaunay edges of the
+    saturated points on group boundaries only.
+
+    Parameters
+    ----------
+    vert : 2darray
+        Coordinates in vertices format.
+    mindist : float
+        Linking distance.
+    boxsize : float, optional
+        Periodic boundary boxsize.
+    tree : cKDTree, optional
+        KD-tree of vert with the same boxsize.
+
+    Returns
+    -------
+    idx1, idx2 : int array
+        Node indices of the linking edges.
+    """
+    npts = len(vert)
+    k = min(_LINK_K, npts - 1)
+    if k < 1:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+    if tree is None:
+        tree = cKDTree(vert, boxsize=boxsize)
+    dist, ind = tree.query(vert, k=k + 1, distance_upper_bound=np.nextafter(mindist, np.inf))
+    linked = dist <= mindist
+    idx1 = np.repeat(np.arange(npts), k + 1)[linked.ravel()]
+    idx2 = ind[linked]
+    idx1, idx2 = idx1.astype(np.int64), idx2.astype(np.int64)
+    saturated = np.flatnonzero(np.all(linked, axis=1))
+    if k < npts - 1 and len(saturated) > 0:
+        labels = src.unionfind_labels(idx1, idx2, npts)
+        boundary = saturated[
+            _group_boundary(vert[saturated], labels[saturated], mindist, boxsize=boxsize)
+        ]
+        if len(boundary) > 0:
+            bnd1, bnd2 = _delaunay_links(vert[boundary], mindist, boxsize=boxsize)
+            idx1 = np.concatenate([idx1, boundary[bnd1]])
+            idx2 = np.concatenate([idx2, boundary[bnd2]])
+    return idx1, idx2
+
+
+def _single_link_group(
+    vert: np.ndarray,
+    mindist: float,
+    w: Optional[np.ndarray] = None,
+    boxsize: Optional[float] = None,
+    tree: Optional[cKDTree] = None,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Groups points linked by separations of at most mindist (single-linkage), from
+    the linking edges of _link_edges in one compiled union-find pass.
+
+    Parameters
+    ----------
+    vert : 2darray
+        Coordinates in vertices format.
+    mindist : float
+        Linking distance.
+    w : optional, array
+        Weights for the points.
+    boxsize : float, optional
+        Periodic boundary boxsize.
+    tree : cKDTree, optional
+        KD-tree of vert with the same boxsize.
+
+    Returns
+    -------
+    vertg : 2darray
+        Weighted centroids of the groups.
+    wg : array
+        Group weights.
+    labels : int array
+        Group label of each point.
+    """
+    npts, ndim = vert.shape
     if w is None:
-        w = np.ones(len(x))
-    wg = np.copy(w)
-    run = True
-    while run:
-        mask = np.ones(len(xg))
-        kd = KDTree3D()
-        kd.build_tree(xg, yg, zg)
-        _idx, _dist = kd.nearest(xg, yg, zg, k=2)
-        idx = np.arange(len(_idx))
-        dist = np.zeros(len(_dist))
-        cond = np.where(_idx[:,0] != idx)[0]
-        idx[cond] = _idx[cond,0]
-        dist[cond] = _dist[cond,0]
-        cond = np.where(_idx[:,1] != idx)[0]
-        idx[cond] = _idx[cond,1]
-        dist[cond] = _dist[cond,1]
-        sidx = np.argsort(dist)
-        newx = []
-        newy = []
-        newz = []
-        neww = []
-        for _id in sidx:
-            if mask[_id] == 1. and mask[idx[_id]] == 1.:
-                if dist[_id] <= mindist:
-                    newx.append((wg[_id]*xg[_id] + wg[idx[_id]]*xg[idx[_id]])/(wg[_id] + wg[idx[_id]]))
-                    newy.append((wg[_id]*yg[_id] + wg[idx[_id]]*yg[idx[_id]])/(wg[_id] + wg[idx[_id]]))
-                    newz.append((wg[_id]*zg[_id] + wg[idx[_id]]*zg[idx[_id]])/(wg[_id] + wg[idx[_id]]))
-                    neww.append(wg[_id] + wg[idx[_id]])
-                    mask[_id], mask[idx[_id]] = 0., 0.
-        newx = np.array(newx)
-        newy = np.array(newy)
-        newz = np.array(newz)
-        neww = np.array(neww)
-        cond = np.where(mask == 1.)[0]
-        xg = np.concatenate([xg[cond], newx])
-        yg = np.concatenate([yg[cond], newy])
-        zg = np.concatenate([zg[cond], newz])
-        wg = np.concatenate([wg[cond], neww])
-        if len(cond) == len(xg):
-            run = False
-    return xg, yg, zg, wg
\ No newline at end of file
+        w = np.ones(npts)
+    idx1, idx2 = _link_edges(vert, mindist, boxsize=boxsize, tree=tree)
+    labels = src.unionfind_labels(idx1, idx2, npts)
+    ngroups = np.max(labels) + 1 if npts > 0 else 0
+    wg = np.bincount(labels, weights=w, minlength=ngroups)
+    # offsets from the first member of each group, so groups straddling a periodic
+    # boundary get the correct centroid
+    anchor = np.zeros(ngroups, dtype=np.int64)
+    anchor[labels[::-1]] = np.arange(npts)[::-1]
+    vertg = np.empty((ngroups, ndim))
+    for i in range(ndim):
+        d = vert[:, i] - vert[anchor[labels], i]
+        if boxsize is not None:
+            d -= boxsize * np.round(d / boxsize)
+        vertg[:, i] = vert[anchor, i] + np.bincount(labels, weights=w * d, minlength=ngroups) / wg
+        if boxsize is not None:
+            vertg[:, i] = np.mod(vertg[:, i], boxsize)
+    return vertg, wg, labels
+
+
+def SingleLinkGroup2D(
+    x: np.ndarray,
+    y: np.ndarray,
+    mindist: float,
+    w: Optional[np.ndarray] = None,
+    boxsize: Optional[float] = None,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Groups all points linked by separations of at most mindist, a single pass
+    alternative to PinchGroup2D.
+
+    Parameters
+    ----------
+    x, y : array
+        2D coordinates.
+    mindist : float
+        Minimum distance between points.
+    w : optional, array
+        Weights for the points.
+    boxsize : float, optional
+        Periodic boundary boxsize.
+
+    Returns
+    -------
+    xg, yg : array
+        2D coordinates of new group positions.
+    wg : array
+        Group weights.
+    labels : int array
+        Group label of each point.
+    """
+    vertg, wg, labels = _single_link_group(vertices.xy2vert(x, y), mindist, w=w, boxsize=boxsize)
+    return vertg[:, 0], vertg[:, 1], wg, labels
+
+
+def SingleLinkGroup3D(
+    x: np.ndarray,
+    y: np.ndarray,
+    z: np.ndarray,
+    mindist: float,
+    w: Optional[np.ndarray] = None,
+    boxsize: Optional[float] = None,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Groups all points linked by separations of at most mindist, a single pass
+    alternative to PinchGroup3D.
+
+    Parameters
+    ----------
+    x, y, z : array
+        3D coordinates.
+    mindist : float
+        Minimum distance between points.
+    w : optional, array
+        Weights for the points.
+    boxsize : float, optional
+        Periodic boundary boxsize.
+
+    Returns
+    -------
+    xg, yg, zg : array
+        3D coordinates of new group positions.
+    wg : array
+        Group weights.
+    labels : int array
+        Group label of each point.
+    """
+    vertg, wg, labels = _single_link_group(
+        vertices.xyz2vert(x, y, z), mindist, w=w, boxsize=boxsize
+    )
+    return vertg[:, 0], vertg[:, 1], vertg[:, 2], wg, labels
+
+
+def SingleLinkGroup(points: PointSet, mindist: float) -> Tuple[PointSet, np.ndarray]:
+    """
+    Groups all points of a 2D or 3D point set linked by separations of at most
+    mindist, using the point set's weights and periodic boxsize.
+
+    Parameters
+    ----------
+    points : PointSet
+        2D or 3D points, with optional weights.
+    mindist : float
+        Minimum distance between points.
+
+    Returns
+    -------
+    groups : PointSet
+        Group positions, with the group weights.
+    labels : int array
+        Group label of each point.
+    """
+    vertg, wg, labels = _single_link_group(
+        points.vert, mindist, w=points.weights, boxsize=points.boxsize, tree=points.tree
+    )
+    return PointSet.from_vert(vertg, weights=wg, boxsize=points.boxsize), labels
@@ -0,0 +1,248 @@
+import numpy as np
+from scipy.sparse import csr_matrix
+from scipy.spatial import cKDTree
+from typing import Optional, Tuple
+
+from . import vertices
+from .. import config
+from .. import index
+
+
+class PointSet:
+
+    """
+    Point container owning a single C-contiguous (N, D) coordinate buffer, with
+    zero-copy x, y, (z) views, an optional weight column and a lazily built KD-tree,
+    so that a catalogue is stored once and indexed once.
+
+    The points can be reordered along a space filling curve on construction, so
+    that points close in space are close in memory and graph, MST and tree
+    operations gather from nearby memory. Node indices of everything computed from
+    the point set then refer to the reordered points, order[i] being the original
+    index of point i, and are mapped back with to_original, to_original_index and
+    to_original_graph.
+    """
+
+    def __init__(
+        self,
+        x: np.ndarray,
+        y: np.ndarray,
+        z: Optional[np.ndarray] = None,
+        weights: Optional[np.ndarray] = None,
+        boxsize: Optional[float] = None,
+        dtype: Optional[type] = None,
+        reorder: Optional[str] = None,
+    ):
+        """
+        Parameters
+        ----------
+        x, y, (z) : array
+            Cartesian 2D (3D) coordinates.
+        weights : array, optional
+            Weights for the points.
+        boxsize : float, optional
+            Periodic boundary boxsize used by the KD-tree.
+        dtype : type, optional
+            Data type of the coordinate buffer, by default the configured float
+            dtype.
+        reorder : str, optional
+            Reorders the points along a space filling curve, either 'hilbert' or
+            'morton', see index.sfc_order.
+        """
+        if z is None:
+            vert = vertices.get_vert_buffer(len(x), 2, dtype=dtype)
+            vertices.xy2vert(x, y, out=vert)
+        else:
+            vert = vertices.get_vert_buffer(len(x), 3, dtype=dtype)
+            vertices.xyz2vert(x, y, z, out=vert)
+        self._set(vert, weights, boxsize, reorder)
+
+    @classmethod
+    def from_vert(
+        cls,
+        vert: np.ndarray,
+        weights: Optional[np.ndarray] = None,
+        boxsize: Optional[float] = None,
+        copy: bool = False,
+        reorder: Optional[str] = None,
+    ) -> "PointSet":
+        """
+        Constructs a point set from coordinates in vertices format.
+
+        Parameters
+        ----------
+        vert : 2darray
+            Coordinates in vertices format, shape (N, D). This is used as the buffer
+            without a copy if it is already C-contiguous.
+        weights : array, optional
+            Weights for the points.
+        boxsize : float, optional
+            Periodic boundary boxsize used by the KD-tree.
+        copy : bool, optional
+            Forces a copy of the vertices.
+        reorder : str, optional
+            Reorders the points along a space filling curve, either 'hilbert' or
+            'morton', into a new buffer.
+
+        Returns
+        -------
+        points : PointSet
+            Point set.
+        """
+        if copy == True:
+            vert = np.array(vert, order="C")
+        else:
+            vert = np.ascontiguousarray(vert)
+        points = cls.__new__(cls)
+        points._set(vert, weights, boxsize, reorder)
+        return points
+
+    def _set(
+        self,
+        vert: np.ndarray,
+        weights: Optional[np.ndarray],
+        boxsize: Optional[float],
+        reorder: Optional[str] = None,
+    ):
+        """Sets the buffers of the point set."""
+        if vert.ndim != 2 or vert.shape[1] not in [2, 3]:
+            raise ValueError("vert must have shape (N, 2) or (N, 3).")
+        if weights is not None:
+            weights = np.asarray(weights)
+            if len(weights) != len(vert):
+                raise ValueError("weights must have the same length as the points.")
+        self.order = None
+        if reorder is not None:
+            self.order = index.sfc_order(vert, curve=reorder)
+            vert = vert[self.order]
+            if weights is not None:
+                weights = weights[self.order]
+        self.vert = vert
+        self.weights = weights
+        self.boxsize = boxsize
+        self._tree = None
+
+    def __len__(self) -> int:
+        return len(self.vert)
+
+    @property
+    def ndim(self) -> int:
+        """Number of dimensions."""
+        return self.vert.shape[1]
+
+    @property
+    def x(self) -> np.ndarray:
+        """View of the x coordinates."""
+        return self.vert[:, 0]
+
+    @property
+    def y(self) -> np.ndarray:
+        """View of the y coordinates."""
+        return self.vert[:, 1]
+
+    @property
+    def z(self) -> Optional[np.ndarray]:
+        """View of the z coordinates, None for 2D points."""
+        if self.ndim == 2:
+            return None
+        return self.vert[:, 2]
+
+    @property
+    def tree(self) -> cKDTree:
+        """KD-tree of the points, built on first access."""
+        if self._tree is None:
+            self._tree = cKDTree(self.vert, boxsize=self.boxsize)
+        return self._tree
+
+    def query(
+        self, vert: np.ndarray, k: int = 1, nthreads: Optional[int] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the nearest indices and distances of points from the KD-tree.
+
+        Parameters
+        ----------
+        vert : 2darray
+            Query coordinates in vertices format.
+        k : int, optional
+            Number of nearest points.
+        nthreads : int, optional
+            Number of threads used for the query, by default the configured number
+            of threads.
+
+        Returns
+        -------
+        nind : array
+            Index of the nearest points.
+        ndist : array
+            Distance to the nearest points.
+        """
+        ndist, nind = self.tree.query(vert, k=k, workers=config.get_nthreads(nthreads))
+        return nind, ndist
+
+    def to_original(self, values: np.ndarray) -> np.ndarray:
+        """
+        Maps per point values, e.g. degrees or densities, to the original order of
+        the points.
+
+        Parameters
+        ----------
+        values : array
+            Values of the reordered points, along the first axis.
+
+        Returns
+        -------
+        values : array
+            Values in the original order, the input if the points were not
+            reordered.
+        """
+        if self.order is None:
+            return values
+        out = np.empty_like(values)
+        out[self.order] = values
+        return out
+
+    def to_original_index(self, idx: np.ndarray) -> np.ndarray:
+        """
+        Maps node indices, e.g. edge or branch indices, to the original indices of
+        the points.
+
+        Parameters
+        ----------
+        idx : array
+            Node indices of the reordered points.
+
+        Returns
+        -------
+        idx : array
+            Original node indices, the input if the points were not reordered.
+        """
+        if self.order is None:
+            return idx
+        return self.order[idx]
+
+    def to_original_graph(self, graph: csr_matrix) -> csr_matrix:
+        """
+        Maps a graph, e.g. a kNN, Delaunay or MST graph, to the original indices of
+        the points.
+
+        Parameters
+        ----------
+        graph : csr_matrix
+            Graph of the reordered points.
+
+        Returns
+        -------
+        graph : csr_matrix
+            Graph of the original points, the input if the points were not
+            reordered.
+        """
+        if self.order is None:
+            return graph
+        graph = graph.tocoo()
+        row, col = self.order[graph.row], self.order[graph.col]
+        return csr_matrix((graph.data, (row, col)), shape=graph.shape)
+
+    def invalidate(self):
+        """Discards the KD-tree, required after modifying the coordinates in place."""
+        self._tree = None
@@ -1,7 +1,10 @@
 import numpy as np
-from typing import Union, Tuple
+from typing import Optional, Union, Tuple
 
+from . import vertices
 from .. import check
+from .. import config
+from .. import src
 
 
 def theta2dec(
@@ -76,8 +79,12 @@ def sphere2cart(
     check.check_angle_units(units)
     check.check_phi_in_range(phi, units)
     check.check_theta_in_range(theta, units)
-    phi = np.copy(phi)
-    theta = np.copy(theta)
+    return _sphere2cart(r, phi, theta, units)
+
+
+def _sphere2cart(r, phi, theta, units):
+    """Converts spherical polar coordinates into cartesian coordinates without checks."""
+    # the inputs are never modified in place, so no defensive copies are needed
     if units == "degs":
         phi, theta = np.deg2rad(phi), np.deg2rad(theta)
     x = r * np.cos(phi) * np.sin(theta)
@@ -114,9 +121,12 @@ def sphere2cart_radec(
     check.check_angle_units(units)
     check.check_ra_in_range(ra, units)
     check.check_dec_in_range(dec, units)
-    phi = np.copy(ra)
-    theta = dec2theta(np.copy(dec), units)
-    return sphere2cart(r, phi, theta, units=units)
+    # dec2theta and sphere2cart would repeat the range checks of ra and dec
+    if units == "degs":
+        theta = 90.0 - dec
+    else:
+        theta = np.pi / 2.0 - dec
+    return _sphere2cart(r, ra, theta, units)
 
 
 def cart2sphere(
@@ -201,3 +211,133 @@ def cart2sphere_radec(
     ra = phi
     dec = theta2dec(theta, units=units)
     return r, ra, dec
+
+
+def _minmax(values: np.ndarray) -> Optional[np.ndarray]:
+    """
+    Returns the minimum and maximum, so range checks need no full size temporaries,
+    or None, which skips the checks, if validation is turned off.
+    """
+    if config.get_validation() == "off":
+        return None
+    return np.array([np.min(values), np.max(values)])
+
+
+def sphere2vert(
+    r: np.ndarray,
+    phi: np.ndarray,
+    theta: np.ndarray,
+    units: str = "rads",
+    out: Optional[np.ndarray] = None,
+    dtype: Optional[type] = None,
+) -> np.ndarray:
+    """
+    Converts spherical polar coordinates into cartesian vertices in one fused pass,
+    without intermediate arrays.
+
+    Parameters
+    ----------
+    r : array
+        Radial distance.
+    phi : array
+        Longitude coordinates (radian range [0, 2pi], degree range [0, 360]).
+    theta : array
+        Latitude coordinates (radian range [0, pi], degree range [0, 180]).
+    units : str, optional
+        Angular units, either 'degs' for degrees or 'rads' for radians.
+    out : 2darray, optional
+        C-contiguous buffer of shape (N, 3) to write the vertices into.
+    dtype : type, optional
+        Either np.float64 or np.float32, the data type of a newly allocated buffer,
+        by default the configured float dtype.
+
+    Returns
+    -------
+    vert : 2darray
+        Coordinates in vertices format: [[x1, y1, z1], [x2, y2, z2], ...].
+    """
+    check.check_angle_units(units)
+    check.check_phi_in_range(_minmax(phi), units)
+    check.check_theta_in_range(_minmax(theta), units)
+    vert = vertices.get_vert_buffer(len(phi), 3, out=out, dtype=dtype)
+    degs = 1 if units == "degs" else 0
+    src.sphere2vert(np.asarray(r), np.asarray(phi), np.asarray(theta), 1, 0, degs, vert)
+    return vert
+
+
+def sphere2vert_radec(
+    r: np.ndarray,
+    ra: np.ndarray,
+    dec: np.ndarray,
+    units: str = "rads",
+    out: Optional[np.ndarray] = None,
+    dtype: Optional[type] = None,
+) -> np.ndarray:
+    """
+    Converts celestial RA and DEC into cartesian vertices in one fused pass,
+    without intermediate arrays.
+
+    Parameters
+    ----------
+    r : array
+        Radial distance.
+    ra : array
+        Longitude celestial coordinates.
+    dec : array
+        Latitude celestial coordinates.
+    units : str, optional
+        Angular units, either 'degs' for degrees or 'rads' for radians.
+    out : 2darray, optional
+        C-contiguous buffer of shape (N, 3) to write the vertices into.
+    dtype : type, optional
+        Either np.float64 or np.float32, the data type of a newly allocated buffer,
+        by default the configured float dtype.
+
+    Returns
+    -------
+    vert : 2darray
+        Coordinates in vertices format: [[x1, y1, z1], [x2, y2, z2], ...].
+    """
+    check.check_angle_units(units)
+    check.check_ra_in_range(_minmax(ra), units)
+    check.check_dec_in_range(_minmax(dec), units)
+    vert = vertices.get_vert_buffer(len(ra), 3, out=out, dtype=dtype)
+    degs = 1 if units == "degs" else 0
+    src.sphere2vert(np.asarray(r), np.asarray(ra), np.asarray(dec), 1, 1, degs, vert)
+    return vert
+
+
+def vert2sphere(
+    vert: np.ndarray,
+    units: str = "rads",
+    celestial: bool = False,
+    out: Optional[np.ndarray] = None,
+    dtype: Optional[type] = None,
+) -> np.ndarray:
+    """
+    Converts cartesian vertices into spherical polar coordinates in one fused pass.
+
+    Parameters
+    ----------
+    vert : 2darray
+        Coordinates in vertices format: [[x1, y1, z1], [x2, y2, z2], ...].
+    units : str, optional
+        Angular units, either 'degs' for degrees or 'rads' for radians.
+    celestial : bool, optional
+        If True outputs celestial coordinates [r, ra, dec].
+    out : 2darray, optional
+        C-contiguous buffer of shape (N, 3) to write the coordinates into.
+    dtype : type, optional
+        Either np.float64 or np.float32, the data type of a newly allocated buffer,
+        by default the configured float dtype.
+
+    Returns
+    -------
+    sph : 2darray
+        Spherical coordinates [r, phi, theta] (or [r, ra, dec]) of each point.
+    """
+    check.check_angle_units(units)
+    sph = vertices.get_vert_buffer(len(vert), 3, out=out, dtype=dtype)
+    degs = 1 if units == "degs" else 0
+    src.vert2sphere(vert, 1 if celestial == True else 0, degs, sph)
+    return sph
@@ -1,8 +1,10 @@
 import numpy as np
-from typing import Union
+from typing import Optional, Union
 
 from . import sphere
+from . import vertices
 from .. import check
+from .. import src
 
 
 def usphere2cart(
@@ -131,3 +133,115 @@ def usphere_dist2ang(dist: Union[float, np.ndarray]) -> Union[float, np.ndarray]
     """
     ang = 2.0 * np.arcsin(dist / 2.0)
     return ang
+
+
+def usphere_tiles(
+    phi: np.ndarray, theta: np.ndarray, nside: int, units: str = "rads"
+) -> np.ndarray:
+    """
+    Assigns points on a unit sphere to equal area tiles, formed from nside bands in
+    cos(theta) each split into 2*nside longitude cells.
+
+    Parameters
+    ----------
+    phi : array
+        Longitude coordinates (radian range [0, 2pi], degree range [0, 360]).
+    theta : array
+        Latitude coordinates (radian range [0, pi], degree range [0, 180]).
+    nside : int
+        Tiling resolution, giving 2*nside^2 tiles.
+    units : str, optional
+        Angular units, either 'degs' for degrees or 'rads' for radians.
+
+    Returns
+    -------
+    tile : int array
+        Tile index of each point.
+    """
+    check.check_positive(nside)
+    if units == "degs":
+        phi, theta = np.deg2rad(phi), np.deg2rad(theta)
+    band = np.floor(0.5 * (1.0 - np.cos(theta)) * nside).astype(np.int64)
+    cell = np.floor(np.mod(phi, 2.0 * np.pi) * nside / np.pi).astype(np.int64)
+    band = np.clip(band, 0, nside - 1)
+    cell = np.clip(cell, 0, 2 * nside - 1)
+    tile = band * 2 * nside + cell
+    return tile
+
+
+def usphere2vert(
+    phi: np.ndarray,
+    theta: np.ndarray,
+    units: str = "rads",
+    out: Optional[np.ndarray] = None,
+    dtype: Optional[type] = None,
+) -> np.ndarray:
+    """
+    Projects coordinates on a sphere into cartesian vertices on a unit sphere in one
+    fused pass, without intermediate arrays.
+
+    Parameters
+    ----------
+    phi : array
+        Longitude coordinates (radian range [0, 2pi], degree range [0, 360]).
+    theta : array
+        Latitude coordinates (radian range [0, pi], degree range [0, 180]).
+    units : str, optional
+        Angular units, either 'degs' for degrees or 'rads' for radians.
+    out : 2darray, optional
+        C-contiguous buffer of shape (N, 3) to write the vertices into.
+    dtype : type, optional
+        Either np.float64 or np.float32, the data type of a newly allocated buffer,
+        by default the configured float dtype.
+
+    Returns
+    -------
+    vert : 2darray
+        Coordinates in vertices format: [[x1, y1, z1], [x2, y2, z2], ...].
+    """
+    check.check_angle_units(units)
+    check.check_phi_in_range(sphere._minmax(phi), units)
+    check.check_theta_in_range(sphere._minmax(theta), units)
+    vert = vertices.get_vert_buffer(len(phi), 3, out=out, dtype=dtype)
+    degs = 1 if units == "degs" else 0
+    src.sphere2vert(np.zeros(0), np.asarray(phi), np.asarray(theta), 0, 0, degs, vert)
+    return vert
+
+
+def usphere2vert_radec(
+    ra: np.ndarray,
+    dec: np.ndarray,
+    units: str = "rads",
+    out: Optional[np.ndarray] = None,
+    dtype: Optional[type] = None,
+) -> np.ndarray:
+    """
+    Projects celestial coordinates into cartesian vertices on a unit sphere in one
+    fused pass, without intermediate arrays.
+
+    Parameters
+    ----------
+    ra : array
+        Longitude celestial coordinates.
+    dec : array
+        Latitude celestial coordinates.
+    units : str, optional
+        Angular units, either 'degs' for degrees or 'rads' for radians.
+    out : 2darray, optional
+        C-contiguous buffer of shape (N, 3) to write the vertices into.
+    dtype : type, optional
+        Either np.float64 or np.float32, the data type of a newly allocated buffer,
+        by default the configured float dtype.
+
+    Returns
+    -------
+    vert : 2darray
+        Coordinates in vertices format: [[x1, y1, z1], [x2, y2, z2], ...].
+    """
+    check.check_angle_units(units)
+    check.check_ra_in_range(sphere._minmax(ra), units)
+    check.check_dec_in_range(sphere._minmax(dec), units)
+    vert = vertices.get_vert_buffer(len(ra), 3, out=out, dtype=dtype)
+    degs = 1 if units == "degs" else 0
+    src.sphere2vert(np.zeros(0), np.asarray(ra), np.asarray(dec), 0, 1, degs, vert)
+    return vert
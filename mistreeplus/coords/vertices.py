@@ -1,8 +1,40 @@
 import numpy as np
-from typing import Tuple
+from typing import Optional, Tuple
 
+from .. import config
 
-def xy2vert(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+
+def get_vert_buffer(
+    size: int, ndim: int, out: Optional[np.ndarray] = None, dtype: Optional[type] = None
+) -> np.ndarray:
+    """
+    Returns a C-contiguous buffer for vertices, checking a user supplied buffer.
+
+    Parameters
+    ----------
+    size : int
+        Number of points.
+    ndim : int
+        Number of dimensions.
+    out : 2darray, optional
+        User supplied buffer, if None a new buffer is allocated.
+    dtype : type, optional
+        Data type of a newly allocated buffer, by default the configured float
+        dtype.
+
+    Returns
+    -------
+    vert : 2darray
+        Buffer of shape (size, ndim).
+    """
+    if out is None:
+        return np.empty((size, ndim), dtype=config.get_float_dtype(dtype))
+    if out.shape != (size, ndim) or not out.flags["C_CONTIGUOUS"]:
+        raise ValueError("out must be a C-contiguous array of shape (%i, %i)." % (size, ndim))
+    return out
+
+
+def xy2vert(x: np.ndarray, y: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
     """
     Converts coordinates x and y to vertices points.
 
@@ -10,13 +42,19 @@ def xy2vert(x: np.ndarray, y: np.ndarray) -> np.ndarray:
     ----------
     x, y : array
         Cartesian coordinates.
+    out : 2darray, optional
+        Buffer of shape (N, 2) to write the vertices into.
 
     Returns
     -------
     vert : 2darray
         Coordinates in vertices format: [[x1, y1], [x2, y2], ...].
     """
-    vert = np.column_stack((x, y))
+    if out is None:
+        return np.column_stack((x, y))
+    vert = get_vert_buffer(len(x), 2, out=out)
+    vert[:, 0] = x
+    vert[:, 1] = y
     return vert
 
 
@@ -38,7 +76,9 @@ def vert2xy(vert: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
     return x, y
 
 
-def xyz2vert(x: np.ndarray, y: np.ndarray, z: np.ndarray) -> np.ndarray:
+def xyz2vert(
+    x: np.ndarray, y: np.ndarray, z: np.ndarray, out: Optional[np.ndarray] = None
+) -> np.ndarray:
     """
     Converts coordinates x, y and z to vertices points.
 
@@ -46,13 +86,20 @@ def xyz2vert(x: np.ndarray, y: np.ndarray, z: np.ndarray) -> np.ndarray:
     ----------
     x, y, z : array
         Cartesian coordinates.
+    out : 2darray, optional
+        Buffer of shape (N, 3) to write the vertices into.
 
     Returns
     -------
     vert : 2darray
         Coordinates in vertices format: [[x1, y1, z1], [x2, y2, z2], ...].
     """
-    vert = np.column_stack((x, y, z))
+    if out is None:
+        return np.column_stack((x, y, z))
+    vert = get_vert_buffer(len(x), 3, out=out)
+    vert[:, 0] = x
+    vert[:, 1] = y
+    vert[:, 2] = z
     return vert
 
 
@@ -1,12 +1,26 @@
 from .convert import graph2data
 from .convert import data2graph
 
+from .delaunay import delaunay2graph
 from .delaunay import construct_del2D
 from .delaunay import construct_del3D
+from .delaunay import construct_del_usphere
+from .delaunay import construct_del_usphere_cart
+from .delaunay import construct_del
+
+from .tiled import construct_del_tiled
+
+from .triangulation import Triangulation
 
 from .knn import construct_knn2D
 from .knn import construct_knn3D
+from .knn import construct_knn
+
+from .usphere import construct_knn_usphere
+from .usphere import construct_knn_usphere_radec
+from .usphere import construct_knn_usphere_cart
 
 from .stats import get_edge_index
 from .stats import get_stat_index
+from .stats import compact_degree
 from .stats import get_degree
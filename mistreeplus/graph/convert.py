@@ -4,7 +4,19 @@ from typing import Tuple
 
 from . import stats
 
+from .. import config
+from .. import tracing
 
+
+def _as_weights(weights: np.ndarray) -> np.ndarray:
+    """Returns float edge weights in the configured float dtype, without a copy if possible."""
+    weights = np.asarray(weights)
+    if np.issubdtype(weights.dtype, np.floating):
+        return weights.astype(config.get_float_dtype(), copy=False)
+    return weights
+
+
+@tracing.traced(nodes="graph", edges="graph")
 def graph2data(graph: csr_matrix) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
     """
     Returns the index and data of a sparse csr_matrix
@@ -19,16 +31,18 @@ def graph2data(graph: csr_matrix) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
     edge_idx : array
         Graph edge node indices.
     weight : array
-        Weights for each edge.
+        Weights for each edge, float weights are given in the configured float
+        dtype.
     """
     graph = graph.tocoo()
-    weights = graph.data
+    weights = _as_weights(graph.data)
     idx1 = graph.row
     idx2 = graph.col
-    edge_idx = stats.get_edge_index(idx1, idx2)
+    edge_idx = stats.get_edge_index(idx1, idx2, Nnodes=graph.shape[0])
     return edge_idx, weights
 
 
+@tracing.traced(nodes="Nnodes", edges="edge_idx")
 def data2graph(
     edge_idx: np.ndarray, weights: np.ndarray, Nnodes: int
 ) -> csr_matrix:
@@ -47,7 +61,9 @@ def data2graph(
     Returns
     -------
     graph : csr_matrix
-        A sparse matrix of the edges in a graph and corresponding node indices.
+        A sparse matrix of the edges in a graph and corresponding node indices,
+        float weights are stored in the configured float dtype.
     """
+    weights = _as_weights(weights)
     graph = csr_matrix((weights, (edge_idx[0], edge_idx[1])), shape=(Nnodes, Nnodes))
     return graph
@@ -1,14 +1,64 @@
 import numpy as np
 from scipy.sparse import csr_matrix
+from scipy.spatial import ConvexHull
 from scipy.spatial import Delaunay as scDelaunay
+from typing import Tuple, Union
 
 from . import convert
 from . import stats
 
 from .. import coords
 from .. import index
+from .. import src
+from .. import tracing
 
 
+@tracing.traced()
+def delaunay2graph(
+    delaunay: scDelaunay, return_adjacency: bool = False
+) -> Union[csr_matrix, Tuple[csr_matrix, csr_matrix]]:
+    """
+    Constructs the Delaunay graph directly from the vertex_neighbor_vertices CSR
+    adjacency of a triangulation. The unique edges i < j and their lengths are
+    extracted in one compiled pass, without expanding the simplices into edge
+    pairs and sorting them.
+
+    Parameters
+    ----------
+    delaunay : scipy.spatial.Delaunay
+        Delaunay triangulation.
+    return_adjacency : bool, optional
+        Also returns the symmetric adjacency, with every edge stored in both
+        directions, from which tree.get_adjacents_csr gives the adjacency lists
+        without building the edge arrays.
+
+    Return
+    ------
+    del_graph : csr_matrix
+        Delaunay graph, each edge stored once as i < j.
+    adjacency : csr_matrix
+        Symmetric Delaunay graph, only if return_adjacency is True.
+    """
+    indptr, indices = delaunay.vertex_neighbor_vertices
+    vert = delaunay.points
+    npts = len(vert)
+    idx1, idx2, dist = src.csrupperedges(indptr, indices, vert)
+    # the edges come out grouped by idx1 in increasing order
+    upper_indptr = np.zeros(npts + 1, dtype=indptr.dtype)
+    np.cumsum(np.bincount(idx1, minlength=npts), out=upper_indptr[1:])
+    del_graph = csr_matrix(
+        (convert._as_weights(dist), idx2, upper_indptr), shape=(npts, npts)
+    )
+    if return_adjacency == False:
+        return del_graph
+    dist = src.csredgelengths(indptr, indices, vert)
+    adjacency = csr_matrix(
+        (convert._as_weights(dist), indices, indptr), shape=(npts, npts)
+    )
+    return del_graph, adjacency
+
+
+@tracing.traced(nodes="x")
 def construct_del2D(x: np.ndarray, y: np.ndarray) -> csr_matrix:
     """
     Constructs the Delaunay graph from 2D points.
@@ -25,20 +75,11 @@ def construct_del2D(x: np.ndarray, y: np.ndarray) -> csr_matrix:
     """
     vert = coords.xy2vert(x, y)
     # construct Delaunay triangulation
-    delaunay = scDelaunay(vert)
-    tri = delaunay.simplices
-    idx1 = np.concatenate([tri[:, 0], tri[:, 1], tri[:, 2]])
-    idx2 = np.concatenate([tri[:, 1], tri[:, 2], tri[:, 0]])
-    idx = index.cantor_pair(idx1, idx2)
-    idx = np.sort(idx)
-    idx = np.unique(idx)
-    idx1, idx2 = index.uncantor_pair(idx)
-    edge_idx = stats.get_edge_index(idx1, idx2)
-    dist = coords.dist2D(x[idx1], x[idx2], y[idx1], y[idx2])
-    del_graph = convert.data2graph(edge_idx, dist, len(x))
+    del_graph = delaunay2graph(scDelaunay(vert))
     return del_graph
 
 
+@tracing.traced(nodes="x")
 def construct_del3D(x: np.ndarray, y: np.ndarray, z: np.ndarray) -> csr_matrix:
     """
     Constructs the Delaunay graph from 3D points.
@@ -55,19 +96,107 @@ def construct_del3D(x: np.ndarray, y: np.ndarray, z: np.ndarray) -> csr_matrix:
     """
     vert = coords.xyz2vert(x, y, z)
     # construct Delaunay triangulation
-    delaunay = scDelaunay(vert)
-    tri = delaunay.simplices
-    idx1 = np.concatenate(
-        [tri[:, 0], tri[:, 0], tri[:, 0], tri[:, 1], tri[:, 1], tri[:, 2]]
-    )
-    idx2 = np.concatenate(
-        [tri[:, 1], tri[:, 2], tri[:, 3], tri[:, 2], tri[:, 3], tri[:, 3]]
-    )
+    del_graph = delaunay2graph(scDelaunay(vert))
+    return del_graph
+
+
+@tracing.traced(nodes="x")
+def construct_del_usphere_cart(
+    x: np.ndarray, y: np.ndarray, z: np.ndarray, partial: bool = False
+) -> csr_matrix:
+    """
+    Constructs the spherical Delaunay graph from Cartesian points on a unit sphere,
+    given by the convex hull of the points, with angular edge weights.
+
+    Parameters
+    ----------
+    x, y, z : array
+        Cartesian coordinates on the unit sphere.
+    partial : bool, optional
+        For catalogues covering only part of the sphere. A point is added at the
+        centre of the largest cap empty of points, so that no hull facet spans
+        across the gap in the footprint, and its edges are removed afterwards.
+
+    Return
+    ------
+    del_graph : csr_matrix
+        Delaunay graph.
+    """
+    vert = coords.xyz2vert(x, y, z)
+    npts = len(vert)
+    # the facets of the convex hull are the spherical Delaunay triangles
+    hull = ConvexHull(vert, incremental=partial)
+    if partial == True:
+        # each facet's plane bounds a cap empty of points, the largest is the one
+        # whose plane lies furthest along its outward normal from the origin
+        pole = hull.equations[np.argmax(hull.equations[:, -1]), :-1]
+        hull.add_points(pole[np.newaxis, :])
+        hull.close()
+    tri = hull.simplices
+    idx1 = np.concatenate([tri[:, 0], tri[:, 1], tri[:, 2]])
+    idx2 = np.concatenate([tri[:, 1], tri[:, 2], tri[:, 0]])
+    idx1, idx2 = np.minimum(idx1, idx2), np.maximum(idx1, idx2)
+    if partial == True:
+        cond = np.where(idx2 < npts)[0]
+        idx1, idx2 = idx1[cond], idx2[cond]
     idx = index.cantor_pair(idx1, idx2)
-    idx = np.sort(idx)
     idx = np.unique(idx)
     idx1, idx2 = index.uncantor_pair(idx)
-    edge_idx = stats.get_edge_index(idx1, idx2)
+    edge_idx = stats.get_edge_index(idx1, idx2, Nnodes=npts)
     dist = coords.dist3D(x[idx1], x[idx2], y[idx1], y[idx2], z[idx1], z[idx2])
-    del_graph = convert.data2graph(edge_idx, dist, len(x))
+    dist = coords.usphere_dist2ang(np.clip(dist, 0.0, 2.0))
+    del_graph = convert.data2graph(edge_idx, dist, npts)
     return del_graph
+
+
+@tracing.traced(nodes="phi")
+def construct_del_usphere(
+    phi: np.ndarray, theta: np.ndarray, units: str = "rads", partial: bool = False
+) -> csr_matrix:
+    """
+    Constructs the spherical Delaunay graph from points on a unit sphere, with
+    angular edge weights.
+
+    Parameters
+    ----------
+    phi : array
+        Longitude coordinates (radian range [0, 2pi], degree range [0, 360]).
+    theta : array
+        Latitude coordinates (radian range [0, pi], degree range [0, 180]).
+    units : str, optional
+        Angular units, either 'degs' for degrees or 'rads' for radians.
+    partial : bool, optional
+        Set to True for catalogues covering only part of the sphere.
+
+    Return
+    ------
+    del_graph : csr_matrix
+        Delaunay graph.
+    """
+    x, y, z = coords.usphere2cart(phi, theta, units=units)
+    del_graph = construct_del_usphere_cart(x, y, z, partial=partial)
+    return del_graph
+
+
+@tracing.traced(nodes="points")
+def construct_del(
+    points: coords.PointSet, return_adjacency: bool = False
+) -> Union[csr_matrix, Tuple[csr_matrix, csr_matrix]]:
+    """
+    Constructs the Delaunay graph of a 2D or 3D point set.
+
+    Parameters
+    ----------
+    points : PointSet
+        2D or 3D points.
+    return_adjacency : bool, optional
+        Also returns the symmetric adjacency, see delaunay2graph.
+
+    Return
+    ------
+    del_graph : csr_matrix
+        Delaunay graph.
+    adjacency : csr_matrix
+        Symmetric Delaunay graph, only if return_adjacency is True.
+    """
+    return delaunay2graph(scDelaunay(points.vert), return_adjacency=return_adjacency)
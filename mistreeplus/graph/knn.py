@@ -1,10 +1,13 @@
 import numpy as np
 from scipy.sparse import csr_matrix
-from sklearn.neighbors import kneighbors_graph
+from typing import Optional, Tuple
 
+from .. import config
 from .. import coords
+from .. import tracing
 
 
+@tracing.traced(nodes="x")
 def construct_knn2D(x: np.ndarray, y: np.ndarray, k: int) -> csr_matrix:
     """
     Constructs the k-Nearest Neighbour graph from 2D points.
@@ -22,11 +25,15 @@ def construct_knn2D(x: np.ndarray, y: np.ndarray, k: int) -> csr_matrix:
     knn_graph : csr_matrix
         k-Nearest Neighbour graph.
     """
+    # imported here as scikit-learn is slow to import
+    from sklearn.neighbors import kneighbors_graph
+
     vert = coords.xy2vert(x, y)
     knn_graph = kneighbors_graph(vert, n_neighbors=k, mode="distance")
     return knn_graph
 
 
+@tracing.traced(nodes="x")
 def construct_knn3D(x: np.ndarray, y: np.ndarray, z: np.ndarray, k: int) -> csr_matrix:
     """
     Constructs the k-Nearest Neighbour graph from 3D points.
@@ -44,6 +51,74 @@ def construct_knn3D(x: np.ndarray, y: np.ndarray, z: np.ndarray, k: int) -> csr_
     knn_graph : csr_matrix
         k-Nearest Neighbour graph.
     """
+    # imported here as scikit-learn is slow to import
+    from sklearn.neighbors import kneighbors_graph
+
     vert = coords.xyz2vert(x, y, z)
     knn_graph = kneighbors_graph(vert, n_neighbors=k, mode="distance")
     return knn_graph
+
+
+def _remove_self(
+    ind: np.ndarray, dist: np.ndarray, nodes: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Removes each node from its own k+1 nearest neighbour query, falling back to the
+    furthest neighbour when duplicate points hide the node itself.
+
+    Parameters
+    ----------
+    ind, dist : 2darray
+        Neighbour indices and distances of the query, shape (len(nodes), k+1).
+    nodes : array
+        Index of each queried node.
+
+    Returns
+    -------
+    ind, dist : 2darray
+        Neighbour indices and distances, shape (len(nodes), k).
+    """
+    notself = ind != nodes[:, np.newaxis]
+    notself[np.all(notself, axis=1), -1] = False
+    ncol = ind.shape[1] - 1
+    ind = ind[notself].reshape(len(nodes), ncol)
+    dist = dist[notself].reshape(len(nodes), ncol)
+    return ind, dist
+
+
+@tracing.traced(nodes="points")
+def construct_knn(
+    points: coords.PointSet, k: int, nthreads: Optional[int] = None
+) -> csr_matrix:
+    """
+    Constructs the k-Nearest Neighbour graph of a point set, reusing its KD-tree.
+
+    Parameters
+    ----------
+    points : PointSet
+        2D or 3D points.
+    k : int
+        The number of nearest neighbours to consider when creating the k-Nearest
+        neighbour graph.
+    nthreads : int, optional
+        Number of threads used for the query, by default the configured number of
+        threads.
+
+    Return
+    ------
+    knn_graph : csr_matrix
+        k-Nearest Neighbour graph.
+    """
+    npts = len(points)
+    k = min(k, npts - 1)
+    nind, ndist = points.query(points.vert, k=k + 1, nthreads=nthreads)
+    nodes = np.arange(npts, dtype=config.get_int_dtype(nnodes=npts))
+    nind, ndist = _remove_self(nind, ndist, nodes)
+    knn_graph = csr_matrix(
+        (
+            ndist.ravel().astype(config.get_float_dtype(), copy=False),
+            (np.repeat(nodes, k), nind.ravel().astype(nodes.dtype, copy=False)),
+        ),
+        shape=(npts, npts),
+    )
+    return knn_graph
@@ -1,9 +1,18 @@
 import numpy as np
+from typing import Optional
 
+from .. import config
 from .. import src
+from .. import tracing
 
+# signed so that differences of degrees cannot wrap around
+_DEGREE_DTYPES = [np.int8, np.int16, np.int32]
 
-def get_edge_index(idx1: np.ndarray, idx2: np.ndarray) -> np.ndarray:
+
+@tracing.traced(edges="idx1")
+def get_edge_index(
+    idx1: np.ndarray, idx2: np.ndarray, Nnodes: Optional[int] = None
+) -> np.ndarray:
     """
     Combines edge indices into one array.
 
@@ -11,16 +20,25 @@ def get_edge_index(idx1: np.ndarray, idx2: np.ndarray) -> np.ndarray:
     ----------
     idx1, idx2 : array
         Graph edge node idxices.
+    Nnodes : int, optional
+        Total number of nodes, which sets the integer type of the indices, see
+        config.get_int_dtype. If None this is inferred from the largest index.
 
     Returns
     -------
     edge_idx : 2darray
-        Graph edge node indices.
+        Graph edge node indices, int32 unless the number of nodes requires int64
+        or int_dtype is configured.
     """
-    edge_idx = np.array([idx1, idx2])
+    if Nnodes is None:
+        Nnodes = int(max(np.max(idx1), np.max(idx2))) + 1 if len(idx1) > 0 else 0
+    edge_idx = np.empty((2, len(idx1)), dtype=config.get_int_dtype(nnodes=Nnodes))
+    edge_idx[0] = idx1
+    edge_idx[1] = idx2
     return edge_idx
 
 
+@tracing.traced(nodes="stat", edges="edge_idx")
 def get_stat_index(edge_idx: np.ndarray, stat: np.ndarray) -> np.ndarray:
     """
     Assigns statistics of the nodes to the edge indexes.
@@ -41,7 +59,32 @@ def get_stat_index(edge_idx: np.ndarray, stat: np.ndarray) -> np.ndarray:
     return stat_idx
 
 
-def get_degree(edge_idx: np.ndarray, Nnodes: int) -> np.ndarray:
+def compact_degree(degree: np.ndarray) -> np.ndarray:
+    """
+    Converts degrees to the smallest signed integer type holding the maximum
+    degree, int8 for any MST or triangulation of a typical point set.
+
+    Parameters
+    ----------
+    degree : array
+        Node degrees.
+
+    Returns
+    -------
+    degree : array
+        Node degrees as int8, int16 or int32.
+    """
+    maxdegree = np.max(degree) if len(degree) > 0 else 0
+    for dtype in _DEGREE_DTYPES:
+        if maxdegree <= np.iinfo(dtype).max:
+            return degree.astype(dtype, copy=False)
+    return degree
+
+
+@tracing.traced(nodes="Nnodes", edges="edge_idx")
+def get_degree(
+    edge_idx: np.ndarray, Nnodes: int, dtype: type = np.float64, compact: bool = False
+) -> np.ndarray:
     """
     Returns the degrees for the nodes.
 
@@ -51,6 +94,12 @@ def get_degree(edge_idx: np.ndarray, Nnodes: int) -> np.ndarray:
         Graph edge node indices.
     Nnodes : int
         Total number of nodes.
+    dtype : type, optional
+        Data type of the degrees, float64 by default.
+    compact : bool, optional
+        If True the degrees are returned in the smallest signed integer type, see
+        compact_degree, and dtype is ignored. Arithmetic on such degrees can
+        overflow.
 
     Returns
     -------
@@ -59,4 +108,6 @@ def get_degree(edge_idx: np.ndarray, Nnodes: int) -> np.ndarray:
     """
     idx1, idx2 = edge_idx[0], edge_idx[1]
     degree = src.getgraphdegree(i1=idx1, i2=idx2, nnodes=Nnodes)
-    return degree
+    if compact:
+        return compact_degree(degree)
+    return degree.astype(dtype, copy=False)
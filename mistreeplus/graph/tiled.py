@@ -0,0 +1,391 @@
+import multiprocessing
+import numpy as np
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from contextlib import nullcontext
+from scipy.sparse import csr_matrix
+from scipy.spatial import ConvexHull, QhullError, cKDTree
+from scipy.spatial import Delaunay as scDelaunay
+from typing import Callable, Iterable, Iterator, Optional, Tuple
+
+from . import convert
+from . import stats
+
+from .. import config
+from .. import coords
+from .. import tracing
+
+# relative tolerance of the circumsphere and convex hull tests
+_TOL = 1e-8
+
+
+def _circumspheres(vert: np.ndarray, simplices: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Computes the circumcentre and circumradius of triangles (2D) or tetrahedra (3D)
+    with explicit formulae, degenerate simplices give non-finite values.
+
+    Parameters
+    ----------
+    vert : 2darray
+        Coordinates in vertices format.
+    simplices : 2darray
+        Node indices of the simplices.
+
+    Returns
+    -------
+    centre : 2darray
+        Circumcentres.
+    radius : array
+        Circumradii.
+    """
+    origin = vert[simplices[:, 0]]
+    a = vert[simplices[:, 1]] - origin
+    b = vert[simplices[:, 2]] - origin
+    a2 = np.sum(a**2.0, axis=1)
+    b2 = np.sum(b**2.0, axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if vert.shape[1] == 2:
+            det = 2.0 * (a[:, 0] * b[:, 1] - a[:, 1] * b[:, 0])
+            u = np.column_stack(
+                [a2 * b[:, 1] - b2 * a[:, 1], b2 * a[:, 0] - a2 * b[:, 0]]
+            ) / det[:, np.newaxis]
+        else:
+            c = vert[simplices[:, 3]] - origin
+            c2 = np.sum(c**2.0, axis=1)
+            bxc, cxa, axb = np.cross(b, c), np.cross(c, a), np.cross(a, b)
+            det = 2.0 * np.sum(a * bxc, axis=1)
+            u = (
+                a2[:, np.newaxis] * bxc + b2[:, np.newaxis] * cxa + c2[:, np.newaxis] * axb
+            ) / det[:, np.newaxis]
+    return origin + u, np.sqrt(np.sum(u**2.0, axis=1))
+
+
+def _facet_planes(
+    vert: np.ndarray, facets: np.ndarray, interior: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Computes the planes of convex hull facets, edges (2D) or triangles (3D), as
+    unit normals pointing away from an interior point and offsets.
+
+    Parameters
+    ----------
+    vert : 2darray
+        Coordinates in vertices format.
+    facets : 2darray
+        Node indices of the facets.
+    interior : array
+        A point inside the hull.
+
+    Returns
+    -------
+    normal : 2darray
+        Outward unit normals, non-finite for degenerate facets.
+    offset : array
+        Offsets, points x beyond a facet have normal.x > offset.
+    """
+    origin = vert[facets[:, 0]]
+    a = vert[facets[:, 1]] - origin
+    if vert.shape[1] == 2:
+        normal = np.column_stack([a[:, 1], -a[:, 0]])
+    else:
+        normal = np.cross(a, vert[facets[:, 2]] - origin)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        normal /= np.sqrt(np.sum(normal**2.0, axis=1))[:, np.newaxis]
+    offset = np.sum(normal * origin, axis=1)
+    flip = normal @ interior > offset
+    normal[flip], offset[flip] = -normal[flip], -offset[flip]
+    return normal, offset
+
+
+def _unique_edges(
+    idx1: np.ndarray, idx2: np.ndarray, npts: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Removes duplicate edges with exact int64 keys idx1*npts + idx2.
+
+    Parameters
+    ----------
+    idx1, idx2 : array
+        Node indices of the edges, with idx1 < idx2 < npts.
+    npts : int
+        Number of nodes.
+
+    Returns
+    -------
+    idx1, idx2 : array
+        Unique edges sorted by key.
+    """
+    keys = np.unique(idx1.astype(np.int64) * npts + idx2)
+    return (keys // npts).astype(idx1.dtype), (keys % npts).astype(idx2.dtype)
+
+
+def _triangulate_tile(
+    vert: np.ndarray,
+    ids: np.ndarray,
+    core: np.ndarray,
+    lower: np.ndarray,
+    upper: np.ndarray,
+    bound_lower: np.ndarray,
+    bound_upper: np.ndarray,
+) -> Tuple[
+    bool, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray
+]:
+    """
+    Triangulates the points of one tile, its halo and nearby global convex hull
+    vertices, and returns the edges of the simplices incident to the tile's core
+    points. A simplex whose circumsphere lies in the tile and halo box, or beyond
+    the bounding box of all points, is empty of all points and so is a global
+    Delaunay simplex. The circumspheres of the remaining simplices are returned to
+    be checked against all points. Facets of the tile's convex hull through core
+    points are returned to be checked against the global hull, as simplices
+    beyond them are missing.
+
+    Parameters
+    ----------
+    vert : 2darray
+        Coordinates of the tile, halo and hull points.
+    ids : array
+        Global node index of each point.
+    core : bool array
+        True for points in the tile's core.
+    lower, upper : array
+        Bounds of the tile and halo box.
+    bound_lower, bound_upper : array
+        Bounds of all the points.
+
+    Returns
+    -------
+    valid : bool
+        False if the triangulation failed or has degenerate simplices.
+    idx1, idx2 : array
+        Unique global node indices of the edges, with idx1 < idx2.
+    centre, radius : array
+        Circumspheres extending beyond the tile and halo box.
+    normal, offset : array
+        Planes of the tile's hull facets through core points, see _facet_planes.
+    """
+    ndim = vert.shape[1]
+    empty = np.zeros(0, dtype=ids.dtype)
+    nocentre = np.zeros((0, ndim))
+    invalid = (False, empty, empty, nocentre, np.zeros(0), nocentre, np.zeros(0))
+    if not np.any(core):
+        return (True,) + invalid[1:]
+    try:
+        delaunay = scDelaunay(vert)
+    except QhullError:
+        return invalid
+    simplices = delaunay.simplices[np.any(core[delaunay.simplices], axis=1)]
+    centre, radius = _circumspheres(vert, simplices)
+    facets = delaunay.convex_hull[np.any(core[delaunay.convex_hull], axis=1)]
+    normal, offset = _facet_planes(vert, facets, np.mean(vert, axis=0))
+    if not (np.all(np.isfinite(radius)) and np.all(np.isfinite(normal))):
+        return invalid
+    # faces of the halo box which are not on the bounding box have unknown points
+    # beyond them
+    margin = radius * (1.0 + _TOL) + _TOL * np.max(bound_upper - bound_lower)
+    inside = np.ones(len(simplices), dtype=bool)
+    for i in range(ndim):
+        if lower[i] > bound_lower[i]:
+            inside &= centre[:, i] - margin >= lower[i]
+        if upper[i] < bound_upper[i]:
+            inside &= centre[:, i] + margin <= upper[i]
+    idx1 = np.concatenate(
+        [simplices[:, i] for i in range(ndim + 1) for j in range(i + 1, ndim + 1)]
+    )
+    idx2 = np.concatenate(
+        [simplices[:, j] for i in range(ndim + 1) for j in range(i + 1, ndim + 1)]
+    )
+    idx1, idx2 = ids[idx1], ids[idx2]
+    idx1, idx2 = np.minimum(idx1, idx2), np.maximum(idx1, idx2)
+    idx1, idx2 = _unique_edges(idx1, idx2, int(np.max(ids)) + 1)
+    return True, idx1, idx2, centre[~inside], radius[~inside], normal, offset
+
+
+def _map_bounded(
+    executor: ProcessPoolExecutor,
+    func: Callable,
+    items: Iterable,
+    make_args: Callable,
+    nslots: int,
+) -> Iterator[tuple]:
+    """
+    Applies a function in an executor, building the arguments of each item only
+    when a slot is free so that at most nslots are held and pickled at once.
+
+    Parameters
+    ----------
+    executor : ProcessPoolExecutor
+        Executor running the function.
+    func : callable
+        Function to apply.
+    items : iterable
+        Items to process.
+    make_args : callable
+        Returns the arguments of func for an item.
+    nslots : int
+        Maximum number of items submitted at once.
+
+    Yields
+    ------
+    item, result
+        Each item with its result, in order of completion.
+    """
+    items = iter(items)
+    pending = {}
+
+    def _submit():
+        for item in items:
+            pending[executor.submit(func, *make_args(item))] = item
+            return
+
+    for _ in range(nslots):
+        _submit()
+    while len(pending) > 0:
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            item = pending.pop(future)
+            _submit()
+            yield item, future.result()
+
+
+@tracing.traced(nodes="points")
+def construct_del_tiled(
+    points: coords.PointSet,
+    ntiles: int = 2,
+    halo: Optional[float] = None,
+    nprocs: Optional[int] = None,
+    max_retries: int = 3,
+) -> csr_matrix:
+    """
+    Constructs the Delaunay graph of a 2D or 3D point set from overlapping tiles,
+    each triangulated separately, so that no single triangulation of all points
+    is held in memory. Each tile is extended by a halo and the global convex hull
+    vertices near it, and only edges of simplices with a vertex in the tile are
+    kept. Simplices whose circumsphere extends beyond the halo are checked to be
+    empty with the KD-tree of all points, and facets of the tile's hull through
+    tile points to have no global hull vertices beyond them. Tiles where one
+    check fails, typically thin simplices along the hull, are retriangulated with
+    the offending points added, and tiles whose triangulation fails with twice
+    the halo.
+    The merged edges are those of the global triangulation for points in general
+    position. Periodic boundaries of the point set are ignored.
+
+    Parameters
+    ----------
+    points : PointSet
+        2D or 3D points.
+    ntiles : int, optional
+        Number of tiles along each axis.
+    halo : float, optional
+        Initial halo width, by default four times the mean interparticle
+        separation in the bounding box. Points on a surface or thin shell are
+        closer than this, and a few times their nearest neighbour distance gives
+        smaller tiles.
+    nprocs : int, optional
+        Number of worker processes, -1 uses all cores. By default the number of
+        threads of the global configuration is used, with 1 the tiles are
+        triangulated in this process.
+    max_retries : int, optional
+        Maximum number of times a tile is retriangulated.
+
+    Return
+    ------
+    del_graph : csr_matrix
+        Delaunay graph.
+    """
+    if ntiles < 1:
+        raise ValueError("ntiles must be a positive integer.", ntiles)
+    vert = points.vert
+    npts, ndim = vert.shape
+    nprocs = config.get_nthreads(nprocs)
+    tree = points.tree if points.boxsize is None else cKDTree(vert)
+    bound_lower, bound_upper = np.min(vert, axis=0), np.max(vert, axis=0)
+    width = (bound_upper - bound_lower) / ntiles
+    if halo is None:
+        halo = 4.0 * (np.prod(bound_upper - bound_lower) / npts) ** (1.0 / ndim)
+    tile = np.floor((vert - bound_lower) / np.where(width > 0.0, width, 1.0)).astype(int)
+    tile = np.ravel_multi_index(np.clip(tile, 0, ntiles - 1).T, (ntiles,) * ndim)
+    hull = ConvexHull(vert).vertices
+    hull_vert = vert[hull]
+    hull_tol = _TOL * np.max(bound_upper - bound_lower)
+
+    def _tile_args(t, _halo, _extra):
+        core_lower = bound_lower + width * np.array(np.unravel_index(t, (ntiles,) * ndim))
+        lower = np.maximum(core_lower - _halo, bound_lower)
+        upper = np.minimum(core_lower + width + _halo, bound_upper)
+        sel = np.flatnonzero(np.all((vert >= lower) & (vert <= upper), axis=1))
+        # only hull vertices within a further halo of the box, the checks of the
+        # circumspheres and hull facets add those further out when needed
+        near = np.all((hull_vert >= lower - _halo) & (hull_vert <= upper + _halo), axis=1)
+        sel = np.union1d(np.union1d(sel, hull[near]), _extra)
+        return vert[sel], sel, tile[sel] == t, lower, upper, bound_lower, bound_upper
+
+    ntile = ntiles**ndim
+    todo = np.arange(ntile)
+    halos = np.full(ntile, halo)
+    extra = [np.zeros(0, dtype=int) for t in range(ntile)]
+    edges = []
+    if nprocs == 1:
+        pool = nullcontext()
+    else:
+        # spawned workers do not inherit locks held by threads of this process
+        pool = ProcessPoolExecutor(
+            max_workers=min(nprocs, ntile), mp_context=multiprocessing.get_context("spawn")
+        )
+    with pool as executor:
+        for _ in range(max_retries + 1):
+            if nprocs == 1:
+                results = (
+                    (t, _triangulate_tile(*_tile_args(t, halos[t], extra[t]))) for t in todo
+                )
+            else:
+                results = _map_bounded(
+                    executor,
+                    _triangulate_tile,
+                    todo,
+                    lambda t: _tile_args(t, halos[t], extra[t]),
+                    nprocs,
+                )
+            failed = []
+            for t, (valid, idx1, idx2, centre, radius, normal, offset) in results:
+                if not valid:
+                    halos[t] *= 2.0
+                    failed.append(t)
+                    continue
+                missing = []
+                if len(radius) > 0:
+                    # the nearest points of an empty circumsphere are its vertices
+                    ndist, _ = tree.query(centre, k=1, workers=nprocs)
+                    conflict = ndist < radius * (1.0 - _TOL)
+                    if np.any(conflict):
+                        # points inside the circumspheres are added to the tile
+                        inball = tree.query_ball_point(
+                            centre[conflict], radius[conflict] * (1.0 - _TOL), workers=nprocs
+                        )
+                        missing.append(np.concatenate(inball).astype(int))
+                if len(offset) > 0:
+                    # a facet bounds all points if no hull vertex lies beyond it, the
+                    # hull vertices beyond the others are added to the tile
+                    beyond = hull_vert @ normal.T > offset + hull_tol
+                    missing.append(hull[np.any(beyond, axis=1)])
+                missing = np.concatenate(missing) if len(missing) > 0 else hull[:0]
+                if len(missing) > 0:
+                    extra[t] = np.union1d(extra[t], missing)
+                    failed.append(t)
+                    continue
+                edges.append((idx1, idx2))
+            if len(failed) == 0:
+                break
+            todo = np.array(failed)
+        else:
+            raise ValueError(
+                "%i tiles are incomplete after %i retries, increase halo or max_retries."
+                % (len(todo), max_retries)
+            )
+    # edges between tiles are found by both
+    idx1 = np.concatenate([e[0] for e in edges])
+    idx2 = np.concatenate([e[1] for e in edges])
+    idx1, idx2 = _unique_edges(idx1, idx2, npts)
+    edge_idx = stats.get_edge_index(idx1, idx2, Nnodes=npts)
+    dist = np.sqrt(np.sum((vert[idx1].astype(float) - vert[idx2]) ** 2.0, axis=1))
+    del_graph = convert.data2graph(edge_idx, dist, npts)
+    return del_graph
@@ -0,0 +1,215 @@
+import numpy as np
+from scipy.sparse import csr_matrix
+from scipy.spatial import Delaunay as scDelaunay
+from typing import Optional, Tuple
+
+from . import convert
+
+from .. import coords
+from .. import src
+from .. import tracing
+
+# relative tolerance for points lying on the boundary of a Gabriel ball or RNG lune
+_TOL = 1e-10
+
+
+class Triangulation:
+
+    """
+    Delaunay triangulation of a 2D or 3D point set, computed once, from which the
+    Delaunay graph, the Gabriel graph, the relative neighbourhood graph (RNG), the
+    MST and the DTFE densities are derived. The graphs are nested,
+    MST <= RNG <= Gabriel <= Delaunay, so the MST can be found from the much
+    sparser RNG. Periodic boundaries of the point set are ignored.
+    """
+
+    def __init__(self, points: coords.PointSet):
+        """
+        Parameters
+        ----------
+        points : PointSet
+            2D or 3D points.
+        """
+        self.points = points
+        self.delaunay = scDelaunay(points.vert)
+        self._edges = None
+        self._gabriel = None
+        self._rng = None
+
+    def __len__(self) -> int:
+        return len(self.points)
+
+    @property
+    def simplices(self) -> np.ndarray:
+        """Node indices of the triangles (2D) or tetrahedra (3D)."""
+        return self.delaunay.simplices
+
+    def _graph(self, keep: np.ndarray) -> csr_matrix:
+        """Returns the graph of the Delaunay edges selected by a mask."""
+        idx1, idx2, dist = self.get_edges()
+        npts = len(self)
+        return csr_matrix(
+            (convert._as_weights(dist[keep]), (idx1[keep], idx2[keep])), shape=(npts, npts)
+        )
+
+    def get_edges(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Returns the unique Delaunay edges, extracted once from the triangulation.
+
+        Returns
+        -------
+        idx1, idx2 : array
+            Node indices of each edge, with idx1 < idx2.
+        dist : array
+            Length of each edge.
+        """
+        if self._edges is None:
+            indptr, indices = self.delaunay.vertex_neighbor_vertices
+            self._edges = src.csrupperedges(indptr, indices, self.delaunay.points)
+        return self._edges
+
+    @tracing.traced(nodes="self")
+    def get_delaunay_graph(self) -> csr_matrix:
+        """
+        Returns the Delaunay graph.
+
+        Returns
+        -------
+        del_graph : csr_matrix
+            Delaunay graph.
+        """
+        return self._graph(slice(None))
+
+    def _get_gabriel(self) -> np.ndarray:
+        """Returns the mask of Delaunay edges in the Gabriel graph."""
+        if self._gabriel is None:
+            idx1, idx2, _ = self.get_edges()
+            indptr, indices = self.delaunay.vertex_neighbor_vertices
+            self._gabriel = src.gabrieltest(
+                indptr, indices, self.delaunay.points, idx1, idx2, _TOL
+            )
+        return self._gabriel
+
+    @tracing.traced(nodes="self")
+    def get_gabriel_graph(self) -> csr_matrix:
+        """
+        Returns the Gabriel graph, the Delaunay edges whose diametral ball contains
+        no other point.
+
+        Returns
+        -------
+        gabriel_graph : csr_matrix
+            Gabriel graph.
+        """
+        return self._graph(self._get_gabriel())
+
+    def _get_rng(self) -> np.ndarray:
+        """Returns the mask of Delaunay edges in the relative neighbourhood graph."""
+        if self._rng is None:
+            idx1, idx2, _ = self.get_edges()
+            indptr, indices = self.delaunay.vertex_neighbor_vertices
+            # the RNG is a subgraph of the Gabriel graph
+            cand = np.flatnonzero(self._get_gabriel())
+            rng = src.rngtest(
+                indptr, indices, self.delaunay.points, idx1[cand], idx2[cand], _TOL
+            )
+            self._rng = np.zeros(len(idx1), dtype=bool)
+            self._rng[cand[rng]] = True
+        return self._rng
+
+    @tracing.traced(nodes="self")
+    def get_rng_graph(self) -> csr_matrix:
+        """
+        Returns the relative neighbourhood graph, the Delaunay edges ij with no
+        point k closer to both i and j than they are to each other.
+
+        Returns
+        -------
+        rng_graph : csr_matrix
+            Relative neighbourhood graph.
+        """
+        return self._graph(self._get_rng())
+
+    @tracing.traced(nodes="self")
+    def get_mst(self, graph: Optional[str] = None) -> csr_matrix:
+        """
+        Returns the Minimum Spanning Tree.
+
+        Parameters
+        ----------
+        graph : str, optional
+            The graph the MST is constructed from, either 'rng', 'gabriel' or
+            'delaunay'. All contain the MST and the RNG is the sparsest, so its MST
+            is the cheapest, but the RNG and Gabriel graphs cost more to derive than
+            they save. By default the sparsest graph already derived is used.
+
+        Returns
+        -------
+        mst_graph : csr_matrix
+            Minimum spanning tree graph.
+        """
+        # imported here, the mst subpackage imports graph
+        from .. import mst
+
+        if graph is None:
+            if self._rng is not None:
+                graph = "rng"
+            elif self._gabriel is not None:
+                graph = "gabriel"
+            else:
+                graph = "delaunay"
+        if graph == "rng":
+            _graph = self.get_rng_graph()
+        elif graph == "gabriel":
+            _graph = self.get_gabriel_graph()
+        elif graph == "delaunay":
+            _graph = self.get_delaunay_graph()
+        else:
+            raise ValueError("graph must be either 'rng', 'gabriel' or 'delaunay'.")
+        return mst.construct_mst(_graph)
+
+    def get_simplex_volumes(self) -> np.ndarray:
+        """
+        Returns the area (2D) or volume (3D) of each simplex.
+
+        Returns
+        -------
+        volume : array
+            Volume of each simplex.
+        """
+        vert = self.delaunay.points
+        simplices = self.simplices
+        origin = vert[simplices[:, 0]]
+        edge1 = vert[simplices[:, 1]] - origin
+        edge2 = vert[simplices[:, 2]] - origin
+        # explicit 2x2 and 3x3 determinants, much faster than np.linalg.det
+        if vert.shape[1] == 2:
+            det = edge1[:, 0] * edge2[:, 1] - edge1[:, 1] * edge2[:, 0]
+            return 0.5 * np.abs(det)
+        edge3 = vert[simplices[:, 3]] - origin
+        det = np.einsum("ij,ij->i", edge1, np.cross(edge2, edge3))
+        return np.abs(det) / 6.0
+
+    @tracing.traced(nodes="self")
+    def get_dtfe_density(self) -> np.ndarray:
+        """
+        Returns the Delaunay Tessellation Field Estimator density at each point,
+        (D+1) m_i / V_i, where V_i is the total volume of the simplices sharing
+        point i and m_i its weight, or 1 if the point set has no weights.
+
+        Returns
+        -------
+        density : array
+            DTFE density of each point, inf for points in no simplex, e.g.
+            duplicates.
+        """
+        simplices = self.simplices
+        ncorner = simplices.shape[1]
+        volume = self.get_simplex_volumes()
+        contiguous = np.bincount(
+            simplices.ravel(), weights=np.repeat(volume, ncorner), minlength=len(self)
+        )
+        mass = self.points.weights if self.points.weights is not None else 1.0
+        with np.errstate(divide="ignore"):
+            density = ncorner * mass / contiguous
+        return density
@@ -0,0 +1,218 @@
+import numpy as np
+from scipy.sparse import csr_matrix
+from scipy.spatial import cKDTree
+from typing import Optional
+
+from . import knn
+
+from .. import check
+from .. import config
+from .. import coords
+from .. import tracing
+
+
+def _query_knn_usphere(
+    vert: np.ndarray,
+    k: int,
+    method: str,
+    nside: Optional[int],
+    nthreads: Optional[int],
+) -> csr_matrix:
+    """
+    Queries the k nearest angular neighbours of points on a unit sphere, tile by
+    tile. The tiling only bounds the temporary arrays of each query, the tree and
+    the N*k graph edges are held in full. The graph is written straight into CSR
+    arrays, as each row holds exactly k edges.
+
+    Parameters
+    ----------
+    vert : 2darray
+        Cartesian unit vectors, shape (N, 3).
+    k : int
+        The number of nearest neighbours.
+    method : str
+        Either 'kdtree' or 'balltree'.
+    nside : int, optional
+        Tiling resolution used to chunk the queries, see coords.usphere_tiles. If
+        None all points are queried at once.
+    nthreads : int or None
+        Number of threads used by the kdtree queries, None for the configured
+        number of threads.
+
+    Returns
+    -------
+    knn_graph : csr_matrix
+        k-Nearest Neighbour graph with angular distance weights.
+    """
+    npts = len(vert)
+    k = min(k, npts - 1)
+    latlon = None
+    if method == "kdtree":
+        tree = cKDTree(vert)
+    elif method == "balltree":
+        from sklearn.neighbors import BallTree
+
+        latlon = np.column_stack(
+            [np.arcsin(np.clip(vert[:, 2], -1.0, 1.0)), np.arctan2(vert[:, 1], vert[:, 0])]
+        )
+        tree = BallTree(latlon, metric="haversine")
+    else:
+        raise ValueError("method must be either 'kdtree' or 'balltree'.")
+    if nside is None:
+        chunks = [np.arange(npts)]
+    else:
+        phi = np.mod(np.arctan2(vert[:, 1], vert[:, 0]), 2.0 * np.pi)
+        theta = np.arccos(np.clip(vert[:, 2], -1.0, 1.0))
+        tile = coords.usphere_tiles(phi, theta, nside)
+        order = np.argsort(tile, kind="stable")
+        splits = np.flatnonzero(np.diff(tile[order])) + 1
+        chunks = np.split(order, splits)
+    itype = config.get_int_dtype(nnodes=npts * k)
+    indptr = np.arange(0, npts * k + 1, k, dtype=itype)
+    cols = np.empty(npts * k, dtype=itype)
+    data = np.empty(npts * k, dtype=config.get_float_dtype())
+    _k = min(k + 1, npts)
+    for chunk in chunks:
+        if method == "kdtree":
+            dist, ind = tree.query(vert[chunk], k=_k, workers=config.get_nthreads(nthreads))
+            dist = coords.usphere_dist2ang(np.clip(dist, 0.0, 2.0))
+        else:
+            dist, ind = tree.query(latlon[chunk], k=_k)
+        ind, dist = knn._remove_self(ind, dist, chunk)
+        slots = (chunk[:, np.newaxis] * k + np.arange(_k - 1)).ravel()
+        cols[slots] = ind.ravel()
+        data[slots] = dist.ravel()
+    knn_graph = csr_matrix((data, cols, indptr), shape=(npts, npts))
+    return knn_graph
+
+
+@tracing.traced(nodes="phi")
+def construct_knn_usphere(
+    phi: np.ndarray,
+    theta: np.ndarray,
+    k: int,
+    units: str = "rads",
+    method: str = "kdtree",
+    nside: Optional[int] = None,
+    nthreads: Optional[int] = None,
+) -> csr_matrix:
+    """
+    Constructs the k-Nearest Neighbour graph of points on a unit sphere, weighted
+    by the angular (great circle) distance.
+
+    Parameters
+    ----------
+    phi : array
+        Longitude coordinates (radian range [0, 2pi], degree range [0, 360]).
+    theta : array
+        Latitude coordinates (radian range [0, pi], degree range [0, 180]).
+    k : int
+        The number of nearest neighbours to consider when creating the k-Nearest
+        neighbour graph.
+    units : str, optional
+        Angular units, either 'degs' for degrees or 'rads' for radians.
+    method : str, optional
+        Nearest neighbour search:
+            - 'kdtree' : chord distance kd-tree on Cartesian unit vectors.
+            - 'balltree' : sklearn BallTree with the haversine metric.
+    nside : int, optional
+        Queries are chunked over the 2*nside^2 equal area tiles of
+        coords.usphere_tiles, bounding the temporary memory of each query. The
+        KD-tree and the graph of all points are still held in memory.
+    nthreads : int, optional
+        Number of threads used by the kdtree queries, by default the configured
+        number of threads.
+
+    Return
+    ------
+    knn_graph : csr_matrix
+        k-Nearest Neighbour graph.
+    """
+    x, y, z = coords.usphere2cart(phi, theta, units=units)
+    knn_graph = construct_knn_usphere_cart(
+        x, y, z, k, method=method, nside=nside, nthreads=nthreads
+    )
+    return knn_graph
+
+
+@tracing.traced(nodes="ra")
+def construct_knn_usphere_radec(
+    ra: np.ndarray,
+    dec: np.ndarray,
+    k: int,
+    units: str = "rads",
+    method: str = "kdtree",
+    nside: Optional[int] = None,
+    nthreads: Optional[int] = None,
+) -> csr_matrix:
+    """
+    Constructs the k-Nearest Neighbour graph of celestial coordinates, weighted by
+    the angular (great circle) distance.
+
+    Parameters
+    ----------
+    ra, dec : array
+        Longitude and latitude celestial coordinates.
+    k : int
+        The number of nearest neighbours to consider when creating the k-Nearest
+        neighbour graph.
+    units : str, optional
+        Angular units, either 'degs' for degrees or 'rads' for radians.
+    method : str, optional
+        Either 'kdtree' or 'balltree', see construct_knn_usphere.
+    nside : int, optional
+        Tiling resolution used to chunk the queries.
+    nthreads : int, optional
+        Number of threads used by the kdtree queries, by default the configured
+        number of threads.
+
+    Return
+    ------
+    knn_graph : csr_matrix
+        k-Nearest Neighbour graph.
+    """
+    x, y, z = coords.usphere2cart_radec(ra, dec, units=units)
+    knn_graph = construct_knn_usphere_cart(
+        x, y, z, k, method=method, nside=nside, nthreads=nthreads
+    )
+    return knn_graph
+
+
+@tracing.traced(nodes="x")
+def construct_knn_usphere_cart(
+    x: np.ndarray,
+    y: np.ndarray,
+    z: np.ndarray,
+    k: int,
+    method: str = "kdtree",
+    nside: Optional[int] = None,
+    nthreads: Optional[int] = None,
+) -> csr_matrix:
+    """
+    Constructs the k-Nearest Neighbour graph of Cartesian points on a unit sphere,
+    weighted by the angular (great circle) distance.
+
+    Parameters
+    ----------
+    x, y, z : array
+        Cartesian coordinates on the unit sphere.
+    k : int
+        The number of nearest neighbours to consider when creating the k-Nearest
+        neighbour graph.
+    method : str, optional
+        Either 'kdtree' or 'balltree', see construct_knn_usphere.
+    nside : int, optional
+        Tiling resolution used to chunk the queries.
+    nthreads : int, optional
+        Number of threads used by the kdtree queries, by default the configured
+        number of threads.
+
+    Return
+    ------
+    knn_graph : csr_matrix
+        k-Nearest Neighbour graph.
+    """
+    check.check_positive(k)
+    vert = coords.xyz2vert(x, y, z)
+    knn_graph = _query_knn_usphere(vert, k, method, nside, nthreads)
+    return knn_graph
@@ -1,2 +1,6 @@
 from .cantor import cantor_pair
 from .cantor import uncantor_pair
+
+from .sfc import morton_index
+from .sfc import hilbert_index
+from .sfc import sfc_order
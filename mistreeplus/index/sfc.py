@@ -0,0 +1,113 @@
+import numpy as np
+from typing import Optional
+
+from .. import src
+
+_CURVES = ["morton", "hilbert"]
+
+
+def _quantize(vert: np.ndarray, bits: Optional[int]) -> np.ndarray:
+    """
+    Maps coordinates onto an integer grid of 2^bits cells per axis, with the same
+    cell size along every axis.
+
+    Parameters
+    ----------
+    vert : 2darray
+        Coordinates in vertices format.
+    bits : int, optional
+        Number of bits per axis, by default the most that fit a 63 bit key.
+
+    Returns
+    -------
+    ivert : 2darray
+        Integer coordinates.
+    bits : int
+        Number of bits per axis.
+    """
+    ndim = vert.shape[1]
+    if bits is None:
+        bits = 63 // ndim
+    if bits < 1 or bits * ndim > 63:
+        raise ValueError("bits x ndim must be between 1 and 63.", bits)
+    if len(vert) == 0:
+        return np.zeros((0, ndim), dtype=np.int64), bits
+    lower = np.min(vert, axis=0)
+    extent = float(np.max(np.max(vert, axis=0) - lower))
+    ncell = 2**bits
+    if extent == 0.0:
+        return np.zeros(vert.shape, dtype=np.int64), bits
+    # float64 resolves at most 2^52 cells
+    ivert = np.floor((vert - lower) * (min(ncell, 2**52) / extent)).astype(np.int64)
+    return np.clip(ivert, 0, ncell - 1), bits
+
+
+def morton_index(vert: np.ndarray, bits: Optional[int] = None) -> np.ndarray:
+    """
+    Returns the Morton (Z-order) curve index of each point.
+
+    Parameters
+    ----------
+    vert : 2darray
+        Coordinates in vertices format.
+    bits : int, optional
+        Number of bits per axis of the grid the points are placed on, by default
+        31 in 2D and 21 in 3D.
+
+    Returns
+    -------
+    keys : array
+        Morton index.
+    """
+    ivert, bits = _quantize(vert, bits)
+    return src.mortonkeys(ivert, bits)
+
+
+def hilbert_index(vert: np.ndarray, bits: Optional[int] = None) -> np.ndarray:
+    """
+    Returns the Hilbert curve index of each point. Unlike the Morton curve,
+    consecutive cells along the Hilbert curve are always adjacent.
+
+    Parameters
+    ----------
+    vert : 2darray
+        Coordinates in vertices format.
+    bits : int, optional
+        Number of bits per axis of the grid the points are placed on, by default
+        31 in 2D and 21 in 3D.
+
+    Returns
+    -------
+    keys : array
+        Hilbert index.
+    """
+    ivert, bits = _quantize(vert, bits)
+    return src.hilbertkeys(ivert, bits)
+
+
+def sfc_order(vert: np.ndarray, curve: str = "hilbert", bits: Optional[int] = None) -> np.ndarray:
+    """
+    Returns the permutation sorting points along a space filling curve, so that
+    points close in space are close in memory.
+
+    Parameters
+    ----------
+    vert : 2darray
+        Coordinates in vertices format.
+    curve : str, optional
+        Either 'hilbert' (default) or 'morton'.
+    bits : int, optional
+        Number of bits per axis, see hilbert_index.
+
+    Returns
+    -------
+    order : array
+        Indices of the points in curve order.
+    """
+    if curve == "hilbert":
+        keys = hilbert_index(vert, bits=bits)
+    elif curve == "morton":
+        keys = morton_index(vert, bits=bits)
+    else:
+        raise ValueError("curve must be one of %s." % ", ".join(_CURVES), curve)
+    return np.argsort(keys, kind="stable")
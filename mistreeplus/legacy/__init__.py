@@ -7,3 +7,11 @@ from .branches import get_branch_edge_count
 from .branches import get_branch_shape
 
 from .getmst import GetMST
+
+from .profiling import get_peak_rss
+from .profiling import StageProfiler
+
+from .jackknife import get_jackknife_cov
+from .jackknife import JackknifeMST
+
+from .tomographic import TomographicMST
@@ -2,6 +2,7 @@ import numpy as np
 from typing import Optional, Tuple, List
 
 from .. import coords
+from .. import tracing
 
 
 def _find_branches(
@@ -167,6 +168,7 @@ def _find_branches(
     return bind, bind_inc
 
 
+@tracing.traced(nodes="degree", edges="edge_ind")
 def find_branches(
     edge_ind: np.ndarray,
     degree: np.ndarray,
@@ -179,6 +181,7 @@ def find_branches(
     theta: Optional[np.ndarray] = None,
     bcutfreq: int = 1000,
     mode: str = "2D",
+    points: Optional[coords.PointSet] = None,
 ) -> Tuple[List[int], List[int]]:
     """
     Finds the length of branches for large sets of data where a rapid increase in speed is achieved by subdividing
@@ -211,6 +214,8 @@ def find_branches(
             - '2D' : 2 dimensions.
             - '3D' : 3 dimensions.
             - 'usphere' : On a unit sphere.
+    points : PointSet, optional
+        2D or 3D points used in place of x, y, (z), setting mode to '2D' or '3D'.
 
     Returns
     -------
@@ -220,6 +225,9 @@ def find_branches(
         Incomplete branch indices. This will occur only if a subset of the full
         tree is provided.
     """
+    if points is not None:
+        x, y, z = points.x, points.y, points.z
+        mode = "%iD" % points.ndim
     ind1 = edge_ind[0]
     ind2 = edge_ind[1]
     # Figure out how many divisions to use.
@@ -350,6 +358,7 @@ def find_branches(
     return branch_ind, branch_ind_inc
 
 
+@tracing.traced(edges="weight")
 def get_branch_weight(branch_ind: List[int], weight: np.ndarray) -> np.ndarray:
     """
     Returns branch weights from branch indexes.
@@ -370,6 +379,7 @@ def get_branch_weight(branch_ind: List[int], weight: np.ndarray) -> np.ndarray:
     return branch_weight
 
 
+@tracing.traced(edges="edge_ind")
 def get_branch_end_index(
     edge_ind: np.ndarray, edge_deg: np.ndarray, branch_ind: List[int]
 ) -> np.ndarray:
@@ -426,6 +436,7 @@ def get_branch_edge_count(branch_ind: List[int]) -> np.ndarray:
     return branch_edge_count
 
 
+@tracing.traced(edges="edge_ind")
 def get_branch_shape(
     edge_ind: np.ndarray,
     edge_deg: np.ndarray,
@@ -435,6 +446,7 @@ def get_branch_shape(
     x: Optional[np.ndarray] = None,
     y: Optional[np.ndarray] = None,
     z: Optional[np.ndarray] = None,
+    points: Optional[coords.PointSet] = None,
 ) -> np.ndarray:
     """
     Finds the shape of all branches. This is simply the straight line distance between the two ends divided by
@@ -458,12 +470,21 @@ def get_branch_shape(
             - 'usphere' : On a unit sphere.
     x, y, z : array
         Cartesian coordinates.
+    points : PointSet, optional
+        Points used in place of x, y, (z). Mode is set to '2D' for 2D points and
+        '3D' for 3D points unless mode is 'usphere'.
 
     Return
     ------
     branch_shape : array
         The shape of each branch.
     """
+    if points is not None:
+        x, y, z = points.x, points.y, points.z
+        if points.ndim == 2:
+            mode = "2D"
+        elif mode != "usphere":
+            mode = "3D"
     branch_index_end = get_branch_end_index(edge_ind, edge_deg, branch_ind)
     branch_index_end1, branch_index_end2 = branch_index_end[0], branch_index_end[1]
     if mode == "2D":
@@ -1,7 +1,9 @@
 import numpy as np
-from typing import Optional
+from contextlib import nullcontext
+from typing import Callable, Optional
 
 from . import branches
+from . import profiling
 
 from .. import mst
 from .. import coords
@@ -24,7 +26,8 @@ class GetMST:
         ra: Optional[np.ndarray] = None,
         dec: Optional[np.ndarray] = None,
         r: Optional[np.ndarray] = None,
-        units : str = 'deg'
+        units : str = 'deg',
+        points: Optional[coords.PointSet] = None
     ):
         """
         Parameters
@@ -37,6 +40,9 @@ class GetMST:
             Celestial tomographic (spherical) coordinates.
         units : {'deg', 'rad'}, optional
             The units of the celestial coordinates ra and dec.
+        points : PointSet, optional
+            Cartesian 2D or 3D points, used in place of x, y, (z) so that the
+            coordinates are not copied and the point set's KD-tree is reused.
 
         Notes
         -----
@@ -58,6 +64,9 @@ class GetMST:
         self.dec = dec
         self.r = r
         self.units = units
+        self.points = points
+        if self.points is not None:
+            self.x, self.y, self.z = self.points.x, self.points.y, self.points.z
         if self.x is not None and self.y is not None:
             if self.z is None:
                 self._mode = '2D'
@@ -66,26 +75,30 @@ class GetMST:
         elif self.phi is not None and self.theta is not None:
             if self.r is None:
                 self._mode = 'usphere'
-                self.x, self.y, self.z = coords.usphere2cart(
+                self.x, self.y, self.z = coords.vert2xyz(coords.usphere2vert(
                     self.phi, self.theta, units=self.units
-                )
+                ))
             else:
                 self._mode = 'sphere'
-                self.x, self.y, self.z = coords.sphere2cart(
+                self.points = coords.PointSet.from_vert(coords.sphere2vert(
                     self.r, self.phi, self.theta, units=self.units
-                )
+                ))
+                self.x, self.y, self.z = self.points.x, self.points.y, self.points.z
         elif self.ra is not None and self.dec is not None:
             if self.r is None:
                 self._mode = 'usphere'
-                self.x, self.y, self.z = coords.usphere2cart_radec(
+                self.x, self.y, self.z = coords.vert2xyz(coords.usphere2vert_radec(
                     self.ra, self.dec, units=self.units
-                )
+                ))
             else:
                 self._mode = 'sphere'
-                self.x, self.y, self.z = coords.sphere2cart_radec(
+                self.points = coords.PointSet.from_vert(coords.sphere2vert_radec(
                     self.r, self.ra, self.dec, units=self.units
-                )
+                ))
+                self.x, self.y, self.z = self.points.x, self.points.y, self.points.z
         self.k_neighbours = 20
+        self.graph_type = 'knn'
+        self.partial = False
         self.edge_length = None
         self.edge_index = None
         self.degree = None
@@ -94,6 +107,7 @@ class GetMST:
         self.branch_length = None
         self.branch_edge_count = None
         self.branch_shape = None
+        self.profiler = None
 
 
     def define_k_neighbours(self, k_neighbours: int):
@@ -108,22 +122,119 @@ class GetMST:
         self.k_neighbours = k_neighbours
 
 
+    def define_graph(self, graph_type: str = 'knn', partial: bool = False):
+        """
+        Sets the graph the minimum spanning tree is constructed from. This is
+        automatically set to 'knn' if this is not called.
+
+        Parameters
+        ----------
+        graph_type : {'knn', 'delaunay'}, optional
+            Either the k-nearest neighbour graph, or the Delaunay graph which always
+            contains the exact minimum spanning tree. For the 'usphere' mode the
+            Delaunay graph is the spherical Delaunay graph, with angular edges.
+        partial : bool, optional
+            For the 'usphere' Delaunay graph, set to True if the catalogue only
+            covers part of the sphere.
+        """
+        if graph_type not in ['knn', 'delaunay']:
+            raise ValueError("graph_type must be either 'knn' or 'delaunay'.")
+        self.graph_type = graph_type
+        self.partial = partial
+
+
+    def define_profiling(
+        self, profile: bool = True, memory: bool = True, callback: Optional[Callable] = None
+    ):
+        """
+        Turns on the recording of the wall time, CPU time, numba compile time and
+        peak memory of each stage, see get_profile. Profiling is off if this is not
+        called.
+
+        Parameters
+        ----------
+        profile : bool, optional
+            Turns profiling on or off.
+        memory : bool, optional
+            Traces the peak memory of each stage with tracemalloc, this adds an
+            overhead to python allocations.
+        callback : callable, optional
+            Function called with the record of each stage when it ends, e.g. to
+            forward the metrics to a monitoring system.
+        """
+        if profile == True:
+            self.profiler = profiling.StageProfiler(memory=memory, callback=callback)
+        else:
+            self.profiler = None
+
+
+    def _stage(self, name: str):
+        """Returns the profiling context of a stage, which does nothing if profiling is off."""
+        if self.profiler is None:
+            return nullcontext()
+        return self.profiler.stage(name)
+
+
+    def get_profile(self) -> dict:
+        """
+        Returns the profiling report of the stages run so far.
+
+        Returns
+        -------
+        report : dict
+            Dictionary with 'stages', the list of stage records, and 'total'. See
+            profiling.StageProfiler for the recorded metrics.
+        """
+        if self.profiler is None:
+            raise ValueError("Profiling is off, call define_profiling before running the stages.")
+        return self.profiler.report()
+
+
     def construct_mst(self):
         """Constructs the minimum spanning tree from the input data set."""
-        if self._mode == '2D':
-            knn_graph = graph.construct_knn2D(self.x, self.y, self.k_neighbours)
-        else:
-            knn_graph = graph.construct_knn3D(self.x, self.y, self.z, self.k_neighbours)
-        mst_graph = mst.construct_mst(knn_graph)
-        self.edge_index, self.edge_length = graph.graph2data(mst_graph)
-        if self._mode == 'usphere':
-            self.edge_length = coords.usphere_dist2ang(self.edge_length)
+        if self.graph_type == 'delaunay':
+            self._construct_del_mst()
+            return
+        with self._stage('knn'):
+            if self.points is not None:
+                knn_graph = graph.construct_knn(self.points, self.k_neighbours)
+            elif self._mode == '2D':
+                knn_graph = graph.construct_knn2D(self.x, self.y, self.k_neighbours)
+            elif self._mode == 'usphere':
+                # angular edge weights directly, no chord to angle conversion needed
+                knn_graph = graph.construct_knn_usphere_cart(
+                    self.x, self.y, self.z, self.k_neighbours
+                )
+            else:
+                knn_graph = graph.construct_knn3D(self.x, self.y, self.z, self.k_neighbours)
+        with self._stage('mst'):
+            mst_graph = mst.construct_mst(knn_graph)
+            self.edge_index, self.edge_length = graph.graph2data(mst_graph)
+
+
+    def _construct_del_mst(self):
+        """Constructs the minimum spanning tree from the Delaunay graph."""
+        with self._stage('delaunay'):
+            if self.points is not None:
+                del_graph = graph.construct_del(self.points)
+            elif self._mode == '2D':
+                del_graph = graph.construct_del2D(self.x, self.y)
+            elif self._mode == 'usphere':
+                del_graph = graph.construct_del_usphere_cart(
+                    self.x, self.y, self.z, partial=self.partial
+                )
+            else:
+                del_graph = graph.construct_del3D(self.x, self.y, self.z)
+        with self._stage('mst'):
+            mst_graph = mst.construct_mst(del_graph)
+            self.edge_index, self.edge_length = graph.graph2data(mst_graph)
 
 
     def get_degree(self):
         """Finds the degree of each node in the constructed MST."""
         if self.edge_index is not None:
-            self.degree = graph.get_degree(self.edge_index, len(self.x))
+            with self._stage('degree'):
+                self.degree = graph.get_degree(self.edge_index, len(self.x))
         else:
             raise ValueError("'edge_index' are undefined, meaning the minimum spanning tree has yet to be constructed.")
 
@@ -131,7 +242,8 @@ class GetMST:
     def get_degree_for_edges(self):
         """Gets the degree of the nodes at each end of all edge."""
         if self.degree is not None:
-            self.edge_degree = graph.get_stat_index(self.edge_index, self.degree)
+            with self._stage('edge_degree'):
+                self.edge_degree = graph.get_stat_index(self.edge_index, self.degree)
         else:
             raise ValueError("The degrees are undefined, meaning they have yet to be calculated.")
 
@@ -147,16 +259,17 @@ class GetMST:
             Used for speeding up the branch finding algorithm when using many
             points (> 100000).
         """
-        if self._mode == '2D':
-            branch_index, rejected_branch_index = branches.find_branches(
-                self.edge_index, self.degree, x=self.x, y=self.y, div=sub_divisions
-            )
-        else:
-            branch_index, rejected_branch_index = branches.find_branches(
-                self.edge_index, self.degree, x=self.x, y=self.y, z=self.z
-            )
-        self.branch_index = branch_index
-        self.branch_length = branches.get_branch_weight(self.branch_index, self.edge_length)
+        with self._stage('branches'):
+            if self._mode == '2D':
+                branch_index, rejected_branch_index = branches.find_branches(
+                    self.edge_index, self.degree, x=self.x, y=self.y, div=sub_divisions
+                )
+            else:
+                branch_index, rejected_branch_index = branches.find_branches(
+                    self.edge_index, self.degree, x=self.x, y=self.y, z=self.z
+                )
+            self.branch_index = branch_index
+            self.branch_length = branches.get_branch_weight(self.branch_index, self.edge_length)
 
     def get_branch_edge_count(self):
         """Finds the number of edges included in each branch."""
@@ -166,29 +279,31 @@ class GetMST:
     def get_branch_shape(self):
         """Finds the shape of all branches. This is simply the straight line distance between the two ends divided by
         the branch length."""
-        if self._mode == '2D':
-            self.branch_shape = branches.get_branch_shape(
-                edge_ind=self.edge_index, edge_deg=self.edge_degree,
-                branch_ind=self.branch_index, branch_weight=self.branch_length,
-                mode="2D", x=self.x, y=self.y
-            )
-        elif self._mode == '3D' or self._mode == 'sphere':
-            self.branch_shape = branches.get_branch_shape(
-                edge_ind=self.edge_index, edge_deg=self.edge_degree,
-                branch_ind=self.branch_index, branch_weight=self.branch_length,
-                mode="3D", x=self.x, y=self.y, z=self.z
-            )
-        elif self._mode == 'usphere':
-            self.branch_shape = branches.get_branch_shape(
-                edge_ind=self.edge_index, edge_deg=self.edge_degree,
-                branch_ind=self.branch_index, branch_weight=self.branch_length,
-                mode="usphere", x=self.x, y=self.y, z=self.z
-            )
-        else:
-            pass
+        with self._stage('branch_shape'):
+            if self._mode == '2D':
+                self.branch_shape = branches.get_branch_shape(
+                    edge_ind=self.edge_index, edge_deg=self.edge_degree,
+                    branch_ind=self.branch_index, branch_weight=self.branch_length,
+                    mode="2D", x=self.x, y=self.y
+                )
+            elif self._mode == '3D' or self._mode == 'sphere':
+                self.branch_shape = branches.get_branch_shape(
+                    edge_ind=self.edge_index, edge_deg=self.edge_degree,
+                    branch_ind=self.branch_index, branch_weight=self.branch_length,
+                    mode="3D", x=self.x, y=self.y, z=self.z
+                )
+            elif self._mode == 'usphere':
+                self.branch_shape = branches.get_branch_shape(
+                    edge_ind=self.edge_index, edge_deg=self.edge_degree,
+                    branch_ind=self.branch_index, branch_weight=self.branch_length,
+                    mode="usphere", x=self.x, y=self.y, z=self.z
+                )
+            else:
+                pass
 
     def output_stats(self, include_index: bool = False):
-        """Outputs the MST statistics.
+        """Outputs the MST statistics. For a PointSet reordered along a space filling
+        curve the degrees and edge indexes refer to the original order of the points.
 
         Parameters
         ----------
@@ -211,11 +326,16 @@ class GetMST:
         branch_index : list, optional
             A list of branches, where each branch is given as a list of the indexes of the member edges.
         """
+        degree, edge_index = self.degree, self.edge_index
+        if self.points is not None and self.points.order is not None:
+            # branch indexes are positions of edges, so are unchanged
+            degree = self.points.to_original(degree)
+            edge_index = self.points.to_original_index(edge_index)
         if include_index == True:
-            return self.degree, self.edge_length, self.branch_length, self.branch_shape, self.edge_index, \
+            return degree, self.edge_length, self.branch_length, self.branch_shape, edge_index, \
                    self.branch_index
         else:
-            return self.degree, self.edge_length, self.branch_length, self.branch_shape
+            return degree, self.edge_length, self.branch_length, self.branch_shape
 
     def _get_stats(
         self,
@@ -264,6 +384,8 @@ class GetMST:
         """
         if k_neighbours is not None:
             self.define_k_neighbours(k_neighbours)
+        if self.profiler is not None:
+            self.profiler.reset()
         self.construct_mst()
         self.get_degree()
         self.get_degree_for_edges()
@@ -314,8 +436,11 @@ class GetMST:
         self.dec = None
         self.r = None
         self.units = None
+        self.points = None
         self._mode = None
         self.k_neighbours = 20
+        self.graph_type = 'knn'
+        self.partial = False
         self.phi = None
         self.theta = None
         self.edge_length = None
@@ -326,3 +451,4 @@ class GetMST:
         self.branch_length = None
         self.branch_edge_count = None
         self.branch_shape = None
+        self.profiler = None
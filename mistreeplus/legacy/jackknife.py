@@ -0,0 +1,385 @@
+import multiprocessing
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from scipy.spatial import cKDTree
+from typing import Optional, Tuple
+
+from . import branches
+from . import getmst
+
+from .. import config
+from .. import coords
+from .. import graph
+from .. import mst
+from .. import src
+
+
+# parent catalogue arrays and bins held by each worker process
+_worker = {}
+
+
+def _init_worker(state: dict, bins: list):
+    """Stores the parent catalogue arrays and bins in a worker process, sent once per worker."""
+    _worker["state"] = state
+    _worker["bins"] = bins
+
+
+def _worker_hists(label) -> list:
+    """Constructs the histograms of one delete-one subsample in a worker process."""
+    return _subsample_hists(_worker["state"], label, _worker["bins"])
+
+
+def _subsample_tree(state: dict, keep: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Constructs the MST of a subsample from the parent MST. The parent tree edges
+    between kept nodes all remain, and the fragments left by the masked nodes are
+    reconnected by Kruskal's algorithm on their cached kNN edges. Fragments with
+    no kNN edge to the rest are joined with wider queries on a KD-tree of the
+    subsample.
+
+    Parameters
+    ----------
+    state : dict
+        Parent catalogue arrays, see JackknifeMST._state.
+    keep : array
+        Parent indices of the nodes in the subsample.
+
+    Returns
+    -------
+    edge_idx : 2darray
+        Graph edge node indices, in subsample indexing.
+    weights : array
+        Weights for each edge.
+    """
+    npts = len(state["regions"])
+    tree_idx, tree_weights = state["tree_idx"], state["tree_weights"]
+    inkeep = np.zeros(npts, dtype=bool)
+    inkeep[keep] = True
+    kept = inkeep[tree_idx[0]] & inkeep[tree_idx[1]]
+    idx1, idx2, weights = [tree_idx[0][kept]], [tree_idx[1][kept]], [tree_weights[kept]]
+    parent = np.arange(npts)
+    size = np.ones(npts, dtype=np.int64)
+    src.uf_kruskal(parent, size, idx1[0], idx2[0])
+    roots = src.uf_roots(parent, keep)
+    largest = roots[np.argmax(size[roots])]
+    nodes = keep[roots != largest]
+    # every edge between fragments has an end outside the largest fragment
+    sub_graph = state["knn_graph"][nodes].tocoo()
+    _idx1, _idx2, _weights = nodes[sub_graph.row], sub_graph.col, sub_graph.data
+    KD = None
+    k = 2 * state["k_neighbours"]
+    while len(nodes) > 0:
+        cond = np.where(inkeep[_idx2])[0]
+        order = cond[np.argsort(_weights[cond], kind="stable")]
+        _idx1, _idx2, _weights = _idx1[order], _idx2[order], _weights[order]
+        accepted = src.uf_kruskal(parent, size, _idx1, _idx2)
+        idx1.append(_idx1[accepted])
+        idx2.append(_idx2[accepted])
+        weights.append(_weights[accepted])
+        largest = src.uf_find(parent, largest)
+        nodes = nodes[src.uf_roots(parent, nodes) != largest]
+        if len(nodes) == 0 or k >= 2 * len(keep):
+            break
+        if KD is None:
+            KD = cKDTree(state["vert"][keep])
+        _k = min(k, len(keep))
+        ndist, nind = KD.query(state["vert"][nodes], k=_k)
+        _idx1, _idx2, _weights = np.repeat(nodes, _k), keep[nind.ravel()], ndist.ravel()
+        k *= 2
+    parent2sub = -np.ones(npts, dtype=int)
+    parent2sub[keep] = np.arange(len(keep))
+    edge_idx = graph.get_edge_index(
+        parent2sub[np.concatenate(idx1)], parent2sub[np.concatenate(idx2)], Nnodes=len(keep)
+    )
+    return edge_idx, np.concatenate(weights)
+
+
+def _subsample_stats(
+    state: dict, keep: np.ndarray, edge_idx: np.ndarray, edge_length: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Computes the MST statistics of a subsample.
+
+    Parameters
+    ----------
+    state : dict
+        Parent catalogue arrays, see JackknifeMST._state.
+    keep : array
+        Parent indices of the nodes in the subsample.
+    edge_idx : 2darray
+        Graph edge node indices, in subsample indexing.
+    edge_length : array
+        Length of each edge, as chord lengths for the unit sphere.
+
+    Returns
+    -------
+    degree, edge_length, branch_length, branch_shape : array
+        MST statistics of the subsample.
+    """
+    vert = state["vert"][keep]
+    x, y = vert[:, 0], vert[:, 1]
+    z = None if state["mode"] == "2D" else vert[:, 2]
+    if state["mode"] == "usphere":
+        edge_length = coords.usphere_dist2ang(edge_length)
+    degree = graph.get_degree(edge_idx, len(keep))
+    edge_degree = graph.get_stat_index(edge_idx, degree)
+    if state["mode"] == "2D":
+        branch_index, _ = branches.find_branches(edge_idx, degree, x=x, y=y)
+    else:
+        branch_index, _ = branches.find_branches(edge_idx, degree, x=x, y=y, z=z)
+    branch_length = branches.get_branch_weight(branch_index, edge_length)
+    if state["mode"] == "2D":
+        mode = "2D"
+    elif state["mode"] == "usphere":
+        mode = "usphere"
+    else:
+        mode = "3D"
+    branch_shape = branches.get_branch_shape(
+        edge_ind=edge_idx,
+        edge_deg=edge_degree,
+        branch_ind=branch_index,
+        branch_weight=branch_length,
+        mode=mode,
+        x=x,
+        y=y,
+        z=z,
+    )
+    return degree, edge_length, branch_length, branch_shape
+
+
+def _subsample_hists(state: dict, label, bins: list) -> list:
+    """
+    Constructs the histograms for one delete-one subsample.
+
+    Parameters
+    ----------
+    state : dict
+        Parent catalogue arrays, see JackknifeMST._state.
+    label : int
+        Region label to remove.
+    bins : list
+        Bin edges for the degree, edge length, branch length and branch shape.
+
+    Returns
+    -------
+    hists : list
+        Histogram counts for each statistic.
+    """
+    keep = np.where(state["regions"] != label)[0]
+    edge_idx, weights = _subsample_tree(state, keep)
+    stats = _subsample_stats(state, keep, edge_idx, weights)
+    return [np.histogram(stat, bins=_bins)[0] for stat, _bins in zip(stats, bins)]
+
+
+def get_jackknife_cov(hists: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Computes the jackknife mean and covariance from delete-one subsamples.
+
+    Parameters
+    ----------
+    hists : 2darray
+        Statistics measured on each delete-one subsample, shape (Nregions, Nbins).
+
+    Returns
+    -------
+    mean : array
+        Mean of the subsamples.
+    cov : 2darray
+        Jackknife covariance matrix.
+    """
+    nsub = len(hists)
+    mean = np.mean(hists, axis=0)
+    diff = hists - mean
+    cov = ((nsub - 1.0) / nsub) * np.dot(diff.T, diff)
+    return mean, cov
+
+
+class JackknifeMST:
+
+    """
+    Computes MST statistics on delete-one-region jackknife subsamples. The KD-tree,
+    kNN graph and MST of the parent catalogue are built once, and each subsample
+    MST is the parent MST with the region's nodes pruned and the fragments
+    reconnected locally.
+    """
+
+    def __init__(
+        self,
+        regions: np.ndarray,
+        x: Optional[np.ndarray] = None,
+        y: Optional[np.ndarray] = None,
+        z: Optional[np.ndarray] = None,
+        phi: Optional[np.ndarray] = None,
+        theta: Optional[np.ndarray] = None,
+        ra: Optional[np.ndarray] = None,
+        dec: Optional[np.ndarray] = None,
+        r: Optional[np.ndarray] = None,
+        units: str = "degs",
+        k_neighbours: int = 20,
+        nthreads: Optional[int] = None,
+    ):
+        """
+        Parameters
+        ----------
+        regions : array
+            Jackknife region label for each point.
+        x, y, (z) : array
+            Cartesian 2D (3D) coordinates.
+        phi, theta, (r) : array
+            Tomographic (spherical) coordinates.
+        ra, dec, (r) : array
+            Celestial tomographic (spherical) coordinates.
+        units : str, optional
+            Angular units, either 'degs' for degrees or 'rads' for radians.
+        k_neighbours : int, optional
+            The number of nearest neighbours to consider when creating the
+            k-nearest neighbour graph.
+        nthreads : int, optional
+            Number of worker processes the subsamples are distributed over, by
+            default the configured number of threads. With 1 the subsamples are
+            processed in this process.
+        """
+        self._parent = getmst.GetMST(
+            x=x, y=y, z=z, phi=phi, theta=theta, ra=ra, dec=dec, r=r, units=units
+        )
+        self._mode = self._parent._mode
+        self.x, self.y, self.z = self._parent.x, self._parent.y, self._parent.z
+        self.regions = np.asarray(regions)
+        self.labels = np.unique(self.regions)
+        self.k_neighbours = k_neighbours
+        self.nthreads = config.get_nthreads(nthreads)
+        self.points = None
+        self.knn_graph = None
+        self.KD = None
+        self.tree_idx = None
+        self.tree_weights = None
+
+    def _vert(self) -> np.ndarray:
+        """Returns the parent catalogue in vertices format."""
+        if self._mode == "2D":
+            return coords.xy2vert(self.x, self.y)
+        else:
+            return coords.xyz2vert(self.x, self.y, self.z)
+
+    def _state(self) -> dict:
+        """Returns the parent catalogue arrays needed to construct subsamples."""
+        return {
+            "mode": self._mode,
+            "vert": self.points.vert,
+            "regions": self.regions,
+            "knn_graph": self.knn_graph,
+            "tree_idx": self.tree_idx,
+            "tree_weights": self.tree_weights,
+            "k_neighbours": self.k_neighbours,
+        }
+
+    def build_knn(self):
+        """
+        Constructs the parent KD-tree, kNN graph and MST, done only once. The kNN
+        graph is symmetrised so that each row holds all the kNN edges of a node.
+        """
+        self.points = coords.PointSet.from_vert(self._vert())
+        self.KD = self.points.tree
+        knn_graph = graph.construct_knn(self.points, self.k_neighbours, nthreads=self.nthreads)
+        self.knn_graph = knn_graph.maximum(knn_graph.T).tocsr()
+        self.tree_idx, self.tree_weights = graph.graph2data(mst.construct_mst(self.knn_graph))
+        # the parent tree is reconnected if the kNN graph is not
+        keep = np.arange(len(self.regions))
+        self.tree_idx, self.tree_weights = _subsample_tree(self._state(), keep)
+
+    def get_subsample_mst(self, label) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Constructs the MST of the catalogue with one region removed, by pruning
+        the masked nodes from the parent MST and reconnecting its fragments.
+
+        Parameters
+        ----------
+        label : int
+            Region label to remove.
+
+        Returns
+        -------
+        keep : array
+            Parent indices of the nodes in the subsample.
+        edge_idx : 2darray
+            Graph edge node indices, in subsample indexing.
+        weights : array
+            Weights for each edge.
+        """
+        if self.knn_graph is None:
+            self.build_knn()
+        keep = np.where(self.regions != label)[0]
+        edge_idx, weights = _subsample_tree(self._state(), keep)
+        return keep, edge_idx, weights
+
+    def get_stats(
+        self,
+        degree_bins: Optional[np.ndarray] = None,
+        edge_bins: Optional[np.ndarray] = None,
+        branch_bins: Optional[np.ndarray] = None,
+        shape_bins: Optional[np.ndarray] = None,
+        nbins: int = 50,
+    ) -> dict:
+        """
+        Computes the MST histograms of every delete-one subsample and their jackknife
+        covariance.
+
+        Parameters
+        ----------
+        degree_bins, edge_bins, branch_bins, shape_bins : array, optional
+            Bin edges for the degree, edge length, branch length and branch shape
+            histograms. Edge and branch length bins default to nbins linear bins
+            spanning the MST of the full catalogue.
+        nbins : int, optional
+            Number of bins used for the default bin edges.
+
+        Returns
+        -------
+        results : dict
+            Dictionary with:
+                - 'degree', 'edge_length', 'branch_length', 'branch_shape' : 2darray
+                  of histograms for each subsample, shape (Nregions, Nbins).
+                - 'bins' : list of the bin edges used for each statistic.
+                - 'mean' : jackknife mean of the concatenated histograms.
+                - 'cov' : jackknife covariance of the concatenated histograms.
+                - 'regions' : the region label removed for each subsample.
+        """
+        if self.knn_graph is None:
+            self.build_knn()
+        state = self._state()
+        if edge_bins is None or branch_bins is None:
+            keep = np.arange(len(self.regions))
+            _, edge_length, branch_length, _ = _subsample_stats(
+                state, keep, self.tree_idx, self.tree_weights
+            )
+            if edge_bins is None:
+                edge_bins = np.linspace(0.0, 1.1 * np.max(edge_length), nbins + 1)
+            if branch_bins is None:
+                branch_bins = np.linspace(0.0, 1.1 * np.max(branch_length), nbins + 1)
+        if degree_bins is None:
+            degree_bins = np.arange(0.5, 6.5 + 1.0, 1.0)
+        if shape_bins is None:
+            shape_bins = np.linspace(0.0, 1.0, nbins + 1)
+        bins = [degree_bins, edge_bins, branch_bins, shape_bins]
+        if self.nthreads == 1 or len(self.labels) == 1:
+            hists = [_subsample_hists(state, label, bins) for label in self.labels]
+        else:
+            # the branch finding is pure python and holds the GIL, so subsamples
+            # are split over spawned processes, each sent the parent arrays once
+            with ProcessPoolExecutor(
+                max_workers=min(self.nthreads, len(self.labels)),
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(state, bins),
+            ) as executor:
+                hists = list(executor.map(_worker_hists, self.labels))
+        names = ["degree", "edge_length", "branch_length", "branch_shape"]
+        results = {}
+        for i, name in enumerate(names):
+            results[name] = np.array([hist[i] for hist in hists])
+        results["bins"] = bins
+        results["mean"], results["cov"] = get_jackknife_cov(
+            np.concatenate([results[name] for name in names], axis=1).astype(float)
+        )
+        results["regions"] = self.labels
+        return results
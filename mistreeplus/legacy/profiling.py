@@ -0,0 +1,169 @@
+import numpy as np
+import sys
+import time
+import tracemalloc
+from contextlib import ExitStack, contextmanager
+from typing import Callable, Optional
+
+from .. import tracing
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on windows
+    resource = None
+
+try:
+    from numba.core import event as _numba_event
+except ImportError:  # pragma: no cover - numba < 0.54
+    _numba_event = None
+
+
+def get_peak_rss() -> Optional[int]:
+    """
+    Returns the peak resident set size of the process.
+
+    Returns
+    -------
+    peak_rss : int or None
+        Peak resident set size in bytes, None where this is not available.
+    """
+    if resource is None:
+        return None
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # linux reports kilobytes, macOS bytes
+    if sys.platform != "darwin":
+        peak_rss *= 1024
+    return int(peak_rss)
+
+
+class StageProfiler:
+
+    """
+    Records the wall time, CPU time, numba compile time and peak memory of named
+    pipeline stages.
+
+    Each stage record is a dictionary with:
+        - 'stage' : the stage name.
+        - 'wall_time' : wall clock time in seconds.
+        - 'cpu_time' : process CPU time in seconds, summed over threads.
+        - 'compile_time' : time spent compiling numba functions in seconds.
+        - 'run_time' : wall time excluding numba compilation in seconds.
+        - 'peak_memory' : peak memory traced by tracemalloc during the stage in
+          bytes, see tracing.measure, None if memory tracing is off. Memory
+          allocated inside numba functions is not traced.
+        - 'peak_rss' : peak resident set size of the process at the end of the
+          stage in bytes, None where this is not available.
+    """
+
+    def __init__(self, memory: bool = True, callback: Optional[Callable] = None):
+        """
+        Parameters
+        ----------
+        memory : bool, optional
+            Traces the peak memory of each stage with tracemalloc. This slows down
+            python allocations during the stage.
+        callback : callable, optional
+            Function called with each stage record when the stage ends, for example
+            to forward the metrics to an external monitoring system.
+        """
+        self.memory = memory
+        self.callback = callback
+        self.records = []
+
+    @contextmanager
+    def stage(self, name: str):
+        """
+        Context manager profiling the enclosed code as one stage.
+
+        Parameters
+        ----------
+        name : str
+            Stage name.
+        """
+        compile_time = []
+        with ExitStack() as stack:
+            if _numba_event is not None:
+                stack.enter_context(
+                    _numba_event.install_timer("numba:compile", compile_time.append)
+                )
+            started = self.memory and not tracemalloc.is_tracing()
+            if started:
+                tracemalloc.start()
+            c0 = time.process_time()
+            try:
+                # timing and peak memory are shared with the tracer, so stages and
+                # traced calls nest without resetting each other's peaks
+                with tracing.measure(memory=self.memory) as result:
+                    yield
+            finally:
+                wall_time = result["elapsed"]
+                cpu_time = time.process_time() - c0
+                peak_memory = result["peak"]
+                if started:
+                    tracemalloc.stop()
+        # the compile timer reports once the listener is removed
+        compile_time = float(np.sum(compile_time))
+        record = {
+            "stage": name,
+            "wall_time": wall_time,
+            "cpu_time": cpu_time,
+            "compile_time": compile_time,
+            "run_time": max(wall_time - compile_time, 0.0),
+            "peak_memory": peak_memory,
+            "peak_rss": get_peak_rss(),
+        }
+        self.records.append(record)
+        if self.callback is not None:
+            self.callback(record)
+
+    def report(self) -> dict:
+        """
+        Returns the structured profiling report.
+
+        Returns
+        -------
+        report : dict
+            Dictionary with:
+                - 'stages' : list of the stage records, in order.
+                - 'total' : the summed 'wall_time', 'cpu_time', 'compile_time' and
+                  'run_time', the maximum 'peak_memory' and the final 'peak_rss'.
+        """
+        total = {}
+        for key in ["wall_time", "cpu_time", "compile_time", "run_time"]:
+            total[key] = float(np.sum([record[key] for record in self.records]))
+        peaks = [r["peak_memory"] for r in self.records if r["peak_memory"] is not None]
+        total["peak_memory"] = int(np.max(peaks)) if len(peaks) > 0 else None
+        total["peak_rss"] = self.records[-1]["peak_rss"] if len(self.records) > 0 else None
+        return {"stages": [dict(record) for record in self.records], "total": total}
+
+    def summary(self) -> str:
+        """
+        Returns the report as a human readable table.
+
+        Returns
+        -------
+        summary : str
+            Table of the stage records.
+        """
+        lines = [
+            "%-16s %10s %10s %10s %12s"
+            % ("stage", "wall [s]", "cpu [s]", "jit [s]", "peak [MB]")
+        ]
+        report = self.report()
+        for record in report["stages"] + [dict(report["total"], stage="total")]:
+            peak = record["peak_memory"]
+            lines.append(
+                "%-16s %10.4f %10.4f %10.4f %12s"
+                % (
+                    record["stage"],
+                    record["wall_time"],
+                    record["cpu_time"],
+                    record["compile_time"],
+                    "-" if peak is None else "%.2f" % (peak / 1024.0**2),
+                )
+            )
+        return "\n".join(lines)
+
+    def reset(self):
+        """Discards the stage records."""
+        self.records = []
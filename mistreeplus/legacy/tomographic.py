@@ -0,0 +1,256 @@
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from scipy.spatial import cKDTree
+from typing import Optional, Tuple
+
+from . import branches
+
+from .. import check
+from .. import config
+from .. import coords
+from .. import graph
+from .. import mst
+
+
+def _get_mst_stats(
+    edge_idx: np.ndarray,
+    edge_length: np.ndarray,
+    npts: int,
+    x: np.ndarray,
+    y: np.ndarray,
+    z: np.ndarray,
+    mode: str,
+) -> Tuple[np.ndarray, np.ndarray, list, np.ndarray, np.ndarray]:
+    """
+    Computes the MST statistics of a tree or forest.
+
+    Parameters
+    ----------
+    edge_idx : 2darray
+        Graph edge node indices.
+    edge_length : array
+        Length of each edge.
+    npts : int
+        Number of nodes.
+    x, y, z : array
+        Cartesian coordinates of the nodes.
+    mode : str
+        Either '3D' or 'usphere'.
+
+    Returns
+    -------
+    degree : array
+        The degree of each node.
+    edge_length : array
+        The length of each edge.
+    branch_index : list
+        The indexes of the member edges of each branch.
+    branch_length : array
+        The length of each branch.
+    branch_shape : array
+        The shape of each branch.
+    """
+    degree = graph.get_degree(edge_idx, npts)
+    edge_degree = graph.get_stat_index(edge_idx, degree)
+    branch_index, _ = branches.find_branches(edge_idx, degree, x=x, y=y, z=z)
+    branch_length = branches.get_branch_weight(branch_index, edge_length)
+    branch_shape = branches.get_branch_shape(
+        edge_ind=edge_idx,
+        edge_deg=edge_degree,
+        branch_ind=branch_index,
+        branch_weight=branch_length,
+        mode=mode,
+        x=x,
+        y=y,
+        z=z,
+    )
+    return degree, edge_length, branch_index, branch_length, branch_shape
+
+
+class TomographicMST:
+
+    """
+    Computes MST statistics of a spherical catalogue in radial shells, with the
+    angular MST of each shell and the 3D MST of the full catalogue.
+
+    The catalogue is sorted by r once so that each shell is a contiguous slice.
+    Two KD-trees are built, as the shell and 3D graphs use different metrics. All
+    shells share one: the unit vectors are offset by shell in a fourth dimension,
+    so nearest neighbour queries never cross shells, and a single MST of the
+    resulting graph gives the forest of per-shell MSTs. The 3D MST uses the
+    KD-tree of a PointSet of the Cartesian positions.
+    """
+
+    def __init__(
+        self,
+        r: np.ndarray,
+        shell_edges: np.ndarray,
+        phi: Optional[np.ndarray] = None,
+        theta: Optional[np.ndarray] = None,
+        ra: Optional[np.ndarray] = None,
+        dec: Optional[np.ndarray] = None,
+        units: str = "degs",
+        k_neighbours: int = 20,
+        nthreads: Optional[int] = None,
+    ):
+        """
+        Parameters
+        ----------
+        r : array
+            Radial distance.
+        shell_edges : array
+            Radial edges of the shells, points outside of these are ignored.
+        phi, theta : array
+            Spherical coordinates.
+        ra, dec : array
+            Celestial coordinates.
+        units : str, optional
+            Angular units, either 'degs' for degrees or 'rads' for radians.
+        k_neighbours : int, optional
+            The number of nearest neighbours to consider when creating the
+            k-nearest neighbour graphs.
+        nthreads : int, optional
+            Number of threads used for the neighbour queries and MST constructions,
+            by default the configured number of threads.
+        """
+        if (phi is None or theta is None) and (ra is None or dec is None):
+            raise ValueError("Either phi and theta or ra and dec must be given.")
+        r = np.asarray(r, dtype=np.float64)
+        self.shell_edges = np.asarray(shell_edges, dtype=np.float64)
+        check.check_positive(np.diff(self.shell_edges))
+        order = np.argsort(r, kind="stable")
+        start, end = np.searchsorted(
+            r[order], [self.shell_edges[0], self.shell_edges[-1]], side="left"
+        )
+        self.order = order[start:end]
+        self.r = r[self.order]
+        self.shell_index = np.searchsorted(self.r, self.shell_edges, side="left")
+        self.shell_index[-1] = len(self.r)
+        self.nshells = len(self.shell_edges) - 1
+        self.shell = np.repeat(np.arange(self.nshells), np.diff(self.shell_index))
+        # directions come from the angles so points at r = 0 keep a defined one
+        unit = np.ones(len(self.r))
+        if phi is not None and theta is not None:
+            self.uvert = coords.sphere2vert(
+                unit, np.asarray(phi)[self.order], np.asarray(theta)[self.order], units=units
+            )
+        else:
+            self.uvert = coords.sphere2vert_radec(
+                unit, np.asarray(ra)[self.order], np.asarray(dec)[self.order], units=units
+            )
+        self.vert = self.uvert * self.r[:, np.newaxis]
+        self.k_neighbours = k_neighbours
+        self.nthreads = config.get_nthreads(nthreads)
+
+    def get_shell(self, shell: int) -> slice:
+        """
+        Returns the slice of the sorted catalogue belonging to a shell, so that for
+        example self.uvert[self.get_shell(i)] is a view and not a copy.
+
+        Parameters
+        ----------
+        shell : int
+            Shell index.
+
+        Returns
+        -------
+        s : slice
+            Slice of the sorted catalogue.
+        """
+        return slice(self.shell_index[shell], self.shell_index[shell + 1])
+
+    def construct_shell_mst(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Constructs the angular MST of every shell.
+
+        Returns
+        -------
+        edge_idx : 2darray
+            Graph edge node indices, in sorted catalogue indexing.
+        edge_length : array
+            Angular length of each edge.
+        """
+        npts = len(self.r)
+        # chord distances are at most 2, so an offset of 4 between shells keeps
+        # every neighbour query within its own shell
+        vert4 = np.column_stack([self.uvert, 4.0 * self.shell])
+        k = min(self.k_neighbours + 1, npts)
+        dist, ind = cKDTree(vert4).query(vert4, k=k, workers=self.nthreads)
+        idx1 = np.repeat(np.arange(npts), k)
+        idx2 = ind.ravel()
+        dist = dist.ravel()
+        cond = np.where((idx1 != idx2) & (dist <= 2.0))[0]
+        edge_idx = graph.get_edge_index(idx1[cond], idx2[cond])
+        weights = coords.usphere_dist2ang(dist[cond])
+        mst_graph = mst.construct_mst(graph.data2graph(edge_idx, weights, npts))
+        edge_idx, edge_length = graph.graph2data(mst_graph)
+        return edge_idx, edge_length
+
+    def construct_3D_mst(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Constructs the 3D MST of the full catalogue.
+
+        Returns
+        -------
+        edge_idx : 2darray
+            Graph edge node indices, in sorted catalogue indexing.
+        edge_length : array
+            Length of each edge.
+        """
+        points = coords.PointSet.from_vert(self.vert)
+        knn_graph = graph.construct_knn(points, self.k_neighbours, nthreads=self.nthreads)
+        edge_idx, edge_length = graph.graph2data(mst.construct_mst(knn_graph))
+        return edge_idx, edge_length
+
+    def get_stats(self) -> dict:
+        """
+        Computes the per shell angular MST statistics and the 3D MST statistics.
+
+        Returns
+        -------
+        results : dict
+            Dictionary with:
+                - 'degree', 'edge_length', 'branch_length', 'branch_shape' : the
+                  stacked angular MST statistics of all shells.
+                - 'degree_shell', 'edge_shell', 'branch_shell' : the shell index of
+                  each node, edge and branch.
+                - '3D' : dictionary of 'degree', 'edge_length', 'branch_length' and
+                  'branch_shape' for the 3D MST.
+                - 'shell_edges' : the radial edges of the shells.
+                - 'order' : the input index of each node, the nodes are given in
+                  order of increasing r.
+        """
+        with ThreadPoolExecutor(max_workers=min(2, self.nthreads)) as executor:
+            future_shell = executor.submit(self.construct_shell_mst)
+            future_3D = executor.submit(self.construct_3D_mst)
+            shell_edge_idx, shell_edge_length = future_shell.result()
+            edge_idx, edge_length = future_3D.result()
+        npts = len(self.r)
+        ux, uy, uz = self.uvert[:, 0], self.uvert[:, 1], self.uvert[:, 2]
+        degree, shell_edge_length, branch_index, branch_length, branch_shape = _get_mst_stats(
+            shell_edge_idx, shell_edge_length, npts, ux, uy, uz, "usphere"
+        )
+        edge_shell = self.shell[shell_edge_idx[0]]
+        branch_shell = np.array(
+            [edge_shell[branch[0]] for branch in branch_index], dtype=int
+        )
+        results = {
+            "degree": degree,
+            "edge_length": shell_edge_length,
+            "branch_length": branch_length,
+            "branch_shape": branch_shape,
+            "degree_shell": self.shell,
+            "edge_shell": edge_shell,
+            "branch_shell": branch_shell,
+        }
+        x, y, z = self.vert[:, 0], self.vert[:, 1], self.vert[:, 2]
+        stats3D = _get_mst_stats(edge_idx, edge_length, npts, x, y, z, "3D")
+        results["3D"] = {
+            "degree": stats3D[0],
+            "edge_length": stats3D[1],
+            "branch_length": stats3D[3],
+            "branch_shape": stats3D[4],
+        }
+        results["shell_edges"] = self.shell_edges
+        results["order"] = self.order
+        return results
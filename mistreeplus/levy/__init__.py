@@ -4,3 +4,7 @@ from .flight import generate_adj_levy_flight
 
 from .levysteps import generate_levy_steps
 from .levysteps import generate_adj_levy_steps
+
+from .batch import generate_user_flights
+from .batch import generate_levy_flights
+from .batch import generate_adj_levy_flights
@@ -0,0 +1,252 @@
+import numpy as np
+from typing import Optional, List, Union
+
+from . import levysteps
+
+from .. import check
+from .. import randoms
+from .. import src
+
+
+def _uniform_per_walker(rngs: List[np.random.Generator], size: int) -> np.ndarray:
+    """
+    Draws uniform randoms, each row from its walker's own generator.
+
+    Parameters
+    ----------
+    rngs : list
+        Random number generators, one per walker.
+    size : int
+        Number of randoms per walker.
+
+    Returns
+    -------
+    u : 2darray
+        Uniform randoms between [0, 1], shape (nwalkers, size).
+    """
+    u = np.empty((len(rngs), size))
+    for j, rng in enumerate(rngs):
+        rng.random(out=u[j])
+    return u
+
+
+def generate_user_flights(
+    steps: np.ndarray,
+    starts: Optional[np.ndarray] = None,
+    mode: str = "2D",
+    boxsize: float = 75.0,
+    periodic: bool = True,
+    seed: Optional[Union[int, np.random.SeedSequence]] = None,
+) -> np.ndarray:
+    """
+    Generates many user defined flight simulations in one call.
+
+    Parameters
+    ----------
+    steps : 2darray
+        Random walk steps for each walker, shape (nwalkers, nsteps).
+    starts : 2darray, optional
+        Coordinates of the start position of each walker, shape (nwalkers, D). If
+        None these will be random points.
+    mode : str, optional
+        Determines the dimensions of the space that the Levy flight simulation is
+        run on.
+            - '2D' : 2 dimensions.
+            - '3D' : 3 dimensions.
+            - 'usphere' : On a unit sphere.
+    boxsize : float, optional
+        Box size. Ignored if periodic=False or mode='usphere'.
+    periodic : bool, optional
+        Enforces periodic boundary conditions for 2D and 3D.
+    seed : int or SeedSequence, optional
+        Seed from which each walker's independent random stream is spawned, see
+        randoms.spawn_generators.
+
+    Returns
+    -------
+    pos : 3darray
+        Coordinates of the flight simulations, shape (nwalkers, nsteps+1, D). The
+        last axis represents:
+            - mode='2D': [x, y]
+            - mode='3D': [x, y, z]
+            - mode='usphere': [phi, theta]
+    """
+    check.check_levy_mode(mode)
+    steps = np.atleast_2d(steps)
+    rngs = randoms.spawn_generators(len(steps), seed=seed)
+    check.check_finite(steps)
+    pos = _walk_flights(steps, starts, mode, boxsize, periodic, rngs)
+    return pos
+
+
+def _walk_flights(
+    steps: np.ndarray,
+    starts: Optional[np.ndarray],
+    mode: str,
+    boxsize: float,
+    periodic: bool,
+    rngs: List[np.random.Generator],
+) -> np.ndarray:
+    """
+    Runs the batched random walk kernels, drawing the start points and step
+    directions of each walker from its own generator.
+
+    Parameters
+    ----------
+    steps : 2darray
+        Random walk steps for each walker, shape (nwalkers, nsteps).
+    starts : 2darray
+        Coordinates of the start position of each walker, or None for random points.
+    mode : str
+        Either '2D', '3D' or 'usphere'.
+    boxsize : float
+        Box size.
+    periodic : bool
+        Enforces periodic boundary conditions for 2D and 3D.
+    rngs : list
+        Random number generators, one per walker.
+
+    Returns
+    -------
+    pos : 3darray
+        Coordinates of the flight simulations, shape (nwalkers, nsteps+1, D).
+    """
+    nwalkers, nsteps = steps.shape
+    if mode == "3D":
+        ndim = 3
+    else:
+        ndim = 2
+    if starts is None:
+        starts = _uniform_per_walker(rngs, ndim)
+        if mode == "usphere":
+            starts[:, 0] = 2.0 * np.pi * starts[:, 0]
+            starts[:, 1] = np.arccos(1.0 - 2.0 * starts[:, 1])
+        elif periodic == True:
+            starts *= boxsize
+    else:
+        starts = np.asarray(starts, dtype=np.float64).reshape(nwalkers, -1)
+        check.check_length(starts[0], ndim)
+        if mode == "usphere":
+            check.check_phi_in_range(starts[:, 0], "rads")
+            check.check_theta_in_range(starts[:, 1], "rads")
+    if periodic == True:
+        useperiodic = 1
+    else:
+        useperiodic = 0
+    steps = np.ascontiguousarray(steps, dtype=np.float64)
+    prand = 2.0 * np.pi * _uniform_per_walker(rngs, nsteps)
+    if mode == "2D":
+        pos = src.randwalkcart2d_batch(steps, prand, boxsize, starts, useperiodic)
+    elif mode == "3D":
+        trand = np.arccos(1.0 - 2.0 * _uniform_per_walker(rngs, nsteps))
+        pos = src.randwalkcart3d_batch(steps, prand, trand, boxsize, starts, useperiodic)
+    elif mode == "usphere":
+        pos = src.randwalkusphere_batch(steps, prand, starts)
+    return pos
+
+
+def generate_levy_flights(
+    nwalkers: int,
+    size: int,
+    t0: float = 0.2,
+    alpha: float = 1.5,
+    starts: Optional[np.ndarray] = None,
+    mode: str = "2D",
+    boxsize: float = 75.0,
+    periodic: bool = True,
+    seed: Optional[Union[int, np.random.SeedSequence]] = None,
+) -> np.ndarray:
+    """
+    Generates many Levy flight simulations in one call.
+
+    Parameters
+    ----------
+    nwalkers : int
+        Number of independent walkers.
+    size : int
+        Size of each output sample.
+    t0, alpha : float
+        Parameters of the Levy flight model.
+    starts : 2darray, optional
+        Coordinates of the start position of each walker, shape (nwalkers, D). If
+        None these will be random points.
+    mode : str, optional
+        Determines the dimensions of the space that the Levy flight simulation is
+        run on.
+            - '2D' : 2 dimensions.
+            - '3D' : 3 dimensions.
+            - 'usphere' : On a unit sphere.
+    boxsize : float, optional
+        Box size. Ignored if periodic=False or mode='usphere'.
+    periodic : bool, optional
+        Enforces periodic boundary conditions for 2D and 3D.
+    seed : int or SeedSequence, optional
+        Seed from which each walker's independent random stream is spawned, see
+        randoms.spawn_generators.
+
+    Returns
+    -------
+    pos : 3darray
+        Coordinates of the flight simulations, shape (nwalkers, size, D).
+    """
+    check.check_levy_mode(mode)
+    rngs = randoms.spawn_generators(nwalkers, seed=seed)
+    u = _uniform_per_walker(rngs, size - 1)
+    steps = levysteps._levy_steps(u, t0, alpha)
+    pos = _walk_flights(steps, starts, mode, boxsize, periodic, rngs)
+    return pos
+
+
+def generate_adj_levy_flights(
+    nwalkers: int,
+    size: int,
+    t0: float = 0.325,
+    ts: float = 0.015,
+    alpha: float = 1.5,
+    beta: float = 0.45,
+    gamma: float = 1.3,
+    starts: Optional[np.ndarray] = None,
+    mode: str = "2D",
+    boxsize: float = 75.0,
+    periodic: bool = True,
+    seed: Optional[Union[int, np.random.SeedSequence]] = None,
+) -> np.ndarray:
+    """
+    Generates many adjusted Levy flight simulations in one call.
+
+    Parameters
+    ----------
+    nwalkers : int
+        Number of independent walkers.
+    size : int
+        Size of each output sample.
+    t0, ts, alpha, beta, gamma : float
+        Parameters of the adjusted Levy flight model.
+    starts : 2darray, optional
+        Coordinates of the start position of each walker, shape (nwalkers, D). If
+        None these will be random points.
+    mode : str, optional
+        Determines the dimensions of the space that the Levy flight simulation is
+        run on.
+            - '2D' : 2 dimensions.
+            - '3D' : 3 dimensions.
+            - 'usphere' : On a unit sphere.
+    boxsize : float, optional
+        Box size. Ignored if periodic=False or mode='usphere'.
+    periodic : bool, optional
+        Enforces periodic boundary conditions for 2D and 3D.
+    seed : int or SeedSequence, optional
+        Seed from which each walker's independent random stream is spawned, see
+        randoms.spawn_generators.
+
+    Returns
+    -------
+    pos : 3darray
+        Coordinates of the flight simulations, shape (nwalkers, size, D).
+    """
+    check.check_levy_mode(mode)
+    rngs = randoms.spawn_generators(nwalkers, seed=seed)
+    u = _uniform_per_walker(rngs, size - 1)
+    steps = levysteps._adj_levy_steps(u, t0, ts, alpha, beta, gamma)
+    pos = _walk_flights(steps, starts, mode, boxsize, periodic, rngs)
+    return pos
@@ -1,5 +1,5 @@
 import numpy as np
-from typing import Union, Optional
+from typing import Callable, Union, Optional
 
 from . import levysteps
 
@@ -9,12 +9,99 @@ from .. import randoms
 from .. import src
 
 
+# number of steps whose uniform randoms are drawn from the generator at once
+_CHUNK = 65536
+
+
+def _chunked_walk(
+    pos: np.ndarray, nrand: int, rng: Optional[np.random.Generator], walk: Callable
+):
+    """
+    Runs a walk kernel over blocks of steps, drawing the uniform randoms of each
+    block from the random number generator, so that only one block of randoms is
+    held at once.
+
+    Parameters
+    ----------
+    pos : 2darray
+        Output buffer of the walk, where pos[0] holds the starting coordinates.
+    nrand : int
+        Number of uniform randoms per step.
+    rng : Generator, optional
+        Random number generator. If None the legacy global numpy random state is
+        used.
+    walk : callable
+        Kernel call walk(pos, i0, i1, u) filling pos[1:] from pos[0] for steps i0
+        to i1, with the uniform randoms u of shape (i1-i0, nrand).
+    """
+    nsteps = len(pos) - 1
+    u = np.empty(min(nsteps, _CHUNK) * nrand)
+    for i0 in range(0, nsteps, _CHUNK):
+        i1 = min(i0 + _CHUNK, nsteps)
+        _u = randoms.uniform((i1 - i0) * nrand, rng=rng, out=u[: (i1 - i0) * nrand])
+        walk(pos[i0 : i1 + 1], i0, i1, _u.reshape(i1 - i0, nrand))
+
+
+def _init_flight(
+    length: int,
+    start: Optional[np.ndarray],
+    mode: str,
+    boxsize: float,
+    periodic: bool,
+    rng: Optional[np.random.Generator],
+) -> np.ndarray:
+    """
+    Allocates the output buffer of a flight simulation and sets its start position.
+
+    Parameters
+    ----------
+    length : int
+        Number of positions in the flight, including the start.
+    start : array
+        Coordinates of start position. If None this will be a random point.
+    mode : str
+        Either '2D', '3D' or 'usphere'.
+    boxsize : float
+        Box size.
+    periodic : bool
+        Random start points are placed inside the box if True.
+    rng : Generator, optional
+        Random number generator.
+
+    Returns
+    -------
+    pos : ndarray
+        Buffer of shape (length, D) with pos[0] set to the start position.
+    """
+    if mode == "3D":
+        ndim = 3
+    else:
+        ndim = 2
+    pos = np.empty((length, ndim), dtype=np.float64)
+    if start is None:
+        if mode == "usphere":
+            phi0, theta0 = randoms.usphere_phitheta(1, rng=rng)
+            pos[0] = phi0[0], theta0[0]
+        else:
+            pos[0] = randoms.cart1d(ndim, rng=rng)
+            if periodic == True:
+                pos[0] *= boxsize
+    else:
+        check.check_length(start, ndim)
+        if mode == "usphere":
+            check.check_phi_in_range(start[0], "rads")
+            check.check_theta_in_range(start[1], "rads")
+        pos[0] = start
+    return pos
+
+
 def generate_user_flight(
     steps: np.ndarray,
     start: Optional[np.ndarray] = None,
     mode: str = "2D",
     boxsize: float = 75.0,
     periodic: bool = True,
+    rng: Optional[Union[int, np.random.Generator]] = None,
 ) -> np.ndarray:
     """
     Generates user defined flight simulation.
@@ -35,6 +122,9 @@ def generate_user_flight(
         Box size. Ignored if periodic=False or mode='usphere'.
     periodic : bool, optional
         Enforces periodic boundary conditions for 2D and 3D.
+    rng : int or Generator, optional
+        Random number generator or seed. If None the legacy global numpy random
+        state is used.
 
     Returns
     -------
@@ -46,65 +136,121 @@ def generate_user_flight(
             - mode='usphere': [phi, theta]
     """
     check.check_levy_mode(mode)
-    if start is None:
-        if mode == "2D":
-            x0, y0 = randoms.cart2d(1)
-            x0, y0 = x0[0], y0[0]
-            if periodic == True:
-                x0 *= boxsize
-                y0 *= boxsize
-        elif mode == "3D":
-            x0, y0, z0 = randoms.cart3d(1)
-            x0, y0, z0 = x0[0], y0[0], z0[0]
-            if periodic == True:
-                x0 *= boxsize
-                y0 *= boxsize
-                z0 *= boxsize
-        elif mode == "usphere":
-            phi0, theta0 = randoms.usphere_phitheta(1)
-            phi0, theta0 = phi0[0], theta0[0]
-    else:
-        if mode == "2D" or mode == "usphere":
-            check.check_length(start, 2)
-        elif mode == "3D":
-            check.check_length(start, 3)
+    if rng is not None:
+        rng = randoms.get_generator(rng)
+    steps = np.ascontiguousarray(steps, dtype=np.float64)
+    check.check_finite(steps)
+    return _user_flight(steps, start, mode, boxsize, periodic, rng)
+
+
+def _user_flight(
+    steps: np.ndarray,
+    start: Optional[np.ndarray],
+    mode: str,
+    boxsize: float,
+    periodic: bool,
+    rng: Optional[np.random.Generator],
+) -> np.ndarray:
+    """
+    Runs a flight simulation of given steps, which are assumed to be finite.
+
+    Parameters
+    ----------
+    steps : array
+        Random walk steps.
+    start : array
+        Coordinates of start position. If None this will be a random point.
+    mode : str
+        Either '2D', '3D' or 'usphere'.
+    boxsize : float
+        Box size.
+    periodic : bool
+        Enforces periodic boundary conditions for 2D and 3D.
+    rng : Generator
+        Random number generator, if None the legacy global numpy random state is
+        used.
+
+    Returns
+    -------
+    pos : ndarray
+        Coordinates of the flight simulation.
+    """
+    pos = _init_flight(len(steps) + 1, start, mode, boxsize, periodic, rng)
     if periodic == True:
         useperiodic = 1
     else:
         useperiodic = 0
-    if mode == "2D":
-        size = len(steps)
-        prand = randoms.polar_phi(size)
-        x, y = src.randwalkcart2d(
-            steps=steps,
-            prand=prand,
-            boxsize=boxsize,
-            x0=x0,
-            y0=y0,
-            useperiodic=useperiodic,
+    steps = np.ascontiguousarray(steps, dtype=np.float64)
+    if mode == "2D" or mode == "3D":
+        _chunked_walk(
+            pos,
+            pos.shape[1] - 1,
+            rng,
+            lambda _pos, i0, i1, u: src.randwalkcart_inplace(
+                _pos, steps[i0:i1], boxsize, useperiodic, u
+            ),
         )
-        pos = np.column_stack((x, y))
-    elif mode == "3D":
-        size = len(steps)
-        prand, trand = randoms.usphere_phitheta(size)
-        x, y, z = src.randwalkcart3d(
-            steps=steps,
-            prand=prand,
-            trand=trand,
-            boxsize=boxsize,
-            x0=x0,
-            y0=y0,
-            z0=z0,
-            useperiodic=useperiodic,
-        )
-        pos = np.column_stack((x, y, z))
     elif mode == "usphere":
-        size = len(steps)
-        prand = randoms.polar_phi(size)
-        phi, theta = src.randwalkusphere(
-            steps=steps, prand=prand, phi0=phi0, theta0=theta0
-        )
-        pos = np.column_stack((phi, theta))
+        prand = randoms.polar_phi(len(steps), rng=rng)
+        src.randwalkusphere_inplace(pos, steps, prand)
+    return pos
+
+
+def _levy_flight_cart(
+    size: int,
+    params: list,
+    adjusted: int,
+    start: Optional[np.ndarray],
+    mode: str,
+    boxsize: float,
+    periodic: bool,
+    rng: Optional[np.random.Generator],
+) -> np.ndarray:
+    """
+    Runs a 2D or 3D (adjusted) Levy flight with the step sizes and directions
+    transformed from uniform randoms inside the compiled kernel.
+
+    Parameters
+    ----------
+    size : int
+        Size of the output sample.
+    params : list
+        Levy flight parameters [t0, ts, alpha, beta, gamma].
+    adjusted : int
+        0 = standard Levy flight model.
+        1 = adjusted Levy flight model.
+    start : array
+        Coordinates of start position. If None this will be a random point.
+    mode : str
+        Either '2D' or '3D'.
+    boxsize : float
+        Box size.
+    periodic : bool
+        Enforces periodic boundary conditions.
+    rng : Generator, optional
+        Random number generator.
+
+    Returns
+    -------
+    pos : ndarray
+        Coordinates of the flight simulation of length=size.
+    """
+    pos = _init_flight(size, start, mode, boxsize, periodic, rng)
+    if periodic == True:
+        useperiodic = 1
+    else:
+        useperiodic = 0
+    t0, ts, alpha, beta, gamma = params
+    if adjusted == 1 and gamma is None:
+        gamma = alpha * ((1.0 - beta) / beta) * ((t0 - ts) / t0)
+    _chunked_walk(
+        pos,
+        pos.shape[1],
+        rng,
+        lambda _pos, i0, i1, u: src.levywalkcart_inplace(
+            _pos, t0, ts, alpha, beta, gamma, adjusted, boxsize, useperiodic, u
+        ),
+    )
     return pos
 
 
@@ -116,6 +262,7 @@ def generate_levy_flight(
     mode: str = "2D",
     boxsize: float = 75.0,
     periodic: bool = True,
+    rng: Optional[Union[int, np.random.Generator]] = None,
 ) -> np.ndarray:
     """
     Generates Levy flight simulation.
@@ -138,6 +285,9 @@ def generate_levy_flight(
         Box size. Ignored if periodic=False or mode='usphere'.
     periodic : bool, optional
         Enforces periodic boundary conditions for 2D and 3D.
+    rng : int or Generator, optional
+        Random number generator or seed. If None the legacy global numpy random
+        state is used.
 
     Returns
     -------
@@ -148,11 +298,15 @@ def generate_levy_flight(
             - mode='3D': [x, y, z]
             - mode='usphere': [phi, theta]
     """
-    steps = levysteps.generate_levy_steps(size - 1, t0, alpha)
-    pos = generate_user_flight(
-        steps, start=start, mode=mode, periodic=periodic, boxsize=boxsize
-    )
-    return pos
+    check.check_levy_mode(mode)
+    if rng is not None:
+        rng = randoms.get_generator(rng)
+    if mode == "2D" or mode == "3D":
+        return _levy_flight_cart(
+            size, [t0, 0.0, alpha, 0.0, 0.0], 0, start, mode, boxsize, periodic, rng
+        )
+    steps = levysteps.generate_levy_steps(size - 1, t0, alpha, rng=rng)
+    return _user_flight(steps, start, mode, boxsize, periodic, rng)
 
 
 def generate_adj_levy_flight(
@@ -166,6 +320,7 @@ def generate_adj_levy_flight(
     mode: str = "2D",
     boxsize: float = 75.0,
     periodic: bool = True,
+    rng: Optional[Union[int, np.random.Generator]] = None,
 ) -> np.ndarray:
     """
     Generates Levy flight simulation.
@@ -188,6 +343,9 @@ def generate_adj_levy_flight(
         Box size. Ignored if periodic=False or mode='usphere'.
     periodic : bool, optional
         Enforces periodic boundary conditions for 2D and 3D.
+    rng : int or Generator, optional
+        Random number generator or seed. If None the legacy global numpy random
+        state is used.
 
     Returns
     -------
@@ -198,8 +356,14 @@ def generate_adj_levy_flight(
             - mode='3D': [x, y, z]
             - mode='usphere': [phi, theta]
     """
-    steps = levysteps.generate_adj_levy_steps(size - 1, t0, ts, alpha, beta, gamma)
-    pos = generate_user_flight(
-        steps, start=start, mode=mode, periodic=periodic, boxsize=boxsize
+    check.check_levy_mode(mode)
+    if rng is not None:
+        rng = randoms.get_generator(rng)
+    if mode == "2D" or mode == "3D":
+        return _levy_flight_cart(
+            size, [t0, ts, alpha, beta, gamma], 1, start, mode, boxsize, periodic, rng
+        )
+    steps = levysteps.generate_adj_levy_steps(
+        size - 1, t0, ts, alpha, beta, gamma, rng=rng
     )
-    return pos
+    return _user_flight(steps, start, mode, boxsize, periodic, rng)
@@ -1,9 +1,68 @@
 import numpy as np
+from typing import Optional, Union
 
 from .. import randoms
 
 
-def generate_levy_steps(size: int, t0: float, alpha: float) -> np.ndarray:
+def _levy_steps(u: np.ndarray, t0: float, alpha: float) -> np.ndarray:
+    """
+    Transforms uniform randoms into standard Levy flight steps, in place.
+
+    Parameters
+    ----------
+    u : array
+        Uniform randoms between [0, 1], overwritten by the steps.
+    t0, alpha : float
+        Parameters of the Levy flight model.
+
+    Returns
+    -------
+    steps : array
+        Random walk steps.
+    """
+    steps = np.subtract(1.0, u, out=u)
+    steps **= -1.0 / alpha
+    steps *= t0
+    return steps
+
+
+def _adj_levy_steps(
+    u: np.ndarray, t0: float, ts: float, alpha: float, beta: float, gamma: float
+) -> np.ndarray:
+    """
+    Transforms uniform randoms into adjusted Levy flight steps, in place.
+
+    Parameters
+    ----------
+    u : array
+        Uniform randoms between [0, 1], overwritten by the steps.
+    t0, ts, alpha, beta, gamma : float
+        Parameters of the adjusted Levy flight model.
+
+    Returns
+    -------
+    steps : array
+        Random walk steps.
+    """
+    if gamma is None:
+        # If gamma is not given then it is calculated by requiring a smooth transition
+        # across t0
+        gamma = alpha * ((1.0 - beta) / beta) * ((t0 - ts) / t0)
+    cond = u >= beta
+    below = ~cond
+    upper = u[cond]
+    u[below] = (t0 - ts) * ((u[below] / beta) ** (1.0 / gamma)) + ts
+    u[cond] = t0 * (1.0 + ((beta - upper) / (1.0 - beta))) ** (-1.0 / alpha)
+    return u
+
+
+def generate_levy_steps(
+    size: int,
+    t0: float,
+    alpha: float,
+    rng: Optional[Union[int, np.random.Generator]] = None,
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
     """
     Generates standard Levy flight steps to be used for random walk simulations.
 
@@ -13,19 +72,31 @@ def generate_levy_steps(size: int, t0: float, alpha: float) -> np.ndarray:
         Size of the output sample.
     t0, alpha : float
         Parameters of the Levy flight model.
+    rng : int or Generator, optional
+        Random number generator or seed. If None the legacy global numpy random
+        state is used.
+    out : array, optional
+        Float64 buffer of length size to write the steps into.
 
     Returns
     -------
     steps : array
         Random walk steps.
     """
-    u = randoms.cart1d(size)
-    steps = t0 / ((1.0 - u) ** (1.0 / alpha))
+    u = randoms.cart1d(size, rng=rng, out=out)
+    steps = _levy_steps(u, t0, alpha)
     return steps
 
 
 def generate_adj_levy_steps(
-    size: int, t0: float, ts: float, alpha: float, beta: float, gamma: float
+    size: int,
+    t0: float,
+    ts: float,
+    alpha: float,
+    beta: float,
+    gamma: float,
+    rng: Optional[Union[int, np.random.Generator]] = None,
+    out: Optional[np.ndarray] = None,
 ) -> np.ndarray:
     """
     Generates the adjusted Levy flight steps to be used for random walk simulations.
@@ -37,20 +108,17 @@ def generate_adj_levy_steps(
         Size of the output sample.
     t0, ts, alpha, beta, gamma : float
         Parameters of the adjusted Levy flight model.
+    rng : int or Generator, optional
+        Random number generator or seed. If None the legacy global numpy random
+        state is used.
+    out : array, optional
+        Float64 buffer of length size to write the steps into.
 
     Returns
     -------
     steps : array
         Random walk steps.
     """
-    if gamma is None:
-        # If gamma is not given then it is calculated by requiring a smooth transition
-        # across t0
-        gamma = alpha * ((1.0 - beta) / beta) * ((t0 - ts) / t0)
-    else:
-        None
-    u = randoms.cart1d(size)
-    steps = (t0 - ts) * ((u / beta) ** (1.0 / gamma)) + ts
-    cond = np.where(u >= beta)[0]
-    steps[cond] = t0 * (1.0 +((beta-u[cond])/(1.-beta)))**(-1./alpha)
+    u = randoms.cart1d(size, rng=rng, out=out)
+    steps = _adj_levy_steps(u, t0, ts, alpha, beta, gamma)
     return steps
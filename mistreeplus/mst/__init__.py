@@ -1,2 +1,6 @@
 
 from .construct import construct_mst
+from .construct import construct_mst_usphere
+
+from .dynamic import DynamicMST
+from .dynamic import find_changed_branches
@@ -1,8 +1,13 @@
 import numpy as np
 from scipy.sparse import csr_matrix
 from scipy.sparse.csgraph import minimum_spanning_tree
+from typing import Optional
 
+from .. import graph as _graph
+from .. import tracing
 
+
+@tracing.traced(nodes="graph", edges="graph")
 def construct_mst(graph: csr_matrix) -> csr_matrix:
     """Constructs the Minimum Spanning Tree graph from an input graph.
 
@@ -18,3 +23,47 @@ def construct_mst(graph: csr_matrix) -> csr_matrix:
     """
     mst_graph = minimum_spanning_tree(graph, overwrite=True)
     return mst_graph
+
+
+@tracing.traced(nodes="phi")
+def construct_mst_usphere(
+    phi: np.ndarray,
+    theta: np.ndarray,
+    k: int = 20,
+    units: str = "rads",
+    method: str = "kdtree",
+    nside: Optional[int] = None,
+    nthreads: Optional[int] = None,
+) -> csr_matrix:
+    """Constructs the Minimum Spanning Tree graph of points on a unit sphere, with
+    angular (great circle) edge weights.
+
+    Parameters
+    ----------
+    phi : array
+        Longitude coordinates (radian range [0, 2pi], degree range [0, 360]).
+    theta : array
+        Latitude coordinates (radian range [0, pi], degree range [0, 180]).
+    k : int, optional
+        The number of nearest neighbours to consider when creating the k-Nearest
+        neighbour graph.
+    units : str, optional
+        Angular units, either 'degs' for degrees or 'rads' for radians.
+    method : str, optional
+        Either 'kdtree' or 'balltree', see graph.construct_knn_usphere.
+    nside : int, optional
+        Tiling resolution used to chunk the nearest neighbour queries.
+    nthreads : int, optional
+        Number of threads used by the kdtree queries, by default the configured
+        number of threads.
+
+    Returns
+    -------
+    mst_graph : csr_matrix
+        Minimum spanning tree graph.
+    """
+    knn_graph = _graph.construct_knn_usphere(
+        phi, theta, k, units=units, method=method, nside=nside, nthreads=nthreads
+    )
+    mst_graph = construct_mst(knn_graph)
+    return mst_graph
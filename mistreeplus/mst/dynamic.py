@@ -0,0 +1,486 @@
+import numpy as np
+from scipy.spatial import cKDTree
+from typing import Optional, Tuple, List
+
+from .. import config
+from .. import coords
+from .. import graph
+from .. import src
+
+# the KD-tree of all points is rebuilt once the points inserted since it was built
+# exceed this fraction of it, until then they have a KD-tree of their own
+_REBUILD_FRACTION = 0.25
+
+
+def _edge_keys(edge_idx: np.ndarray, Nnodes: int) -> np.ndarray:
+    """
+    Returns a unique integer key for each undirected edge.
+
+    Parameters
+    ----------
+    edge_idx : 2darray
+        Graph edge node indices.
+    Nnodes : int
+        Total number of nodes.
+
+    Returns
+    -------
+    keys : array
+        Edge keys, independent of the order of the edge ends.
+    """
+    idx1 = np.minimum(edge_idx[0], edge_idx[1]).astype(np.int64)
+    idx2 = np.maximum(edge_idx[0], edge_idx[1]).astype(np.int64)
+    keys = idx1 * np.int64(Nnodes) + idx2
+    return keys
+
+
+def find_changed_branches(branch_ind: List[int], stale_edges: np.ndarray) -> np.ndarray:
+    """
+    Finds the branches that contain stale edges and need to be recomputed.
+
+    Parameters
+    ----------
+    branch_ind : list
+        Branch indices, each branch is a list of member edges.
+    stale_edges : array
+        Edge positions (in the edge array used to build branch_ind) which were
+        removed or are attached to a node whose degree has changed.
+
+    Returns
+    -------
+    changed : array
+        Index of the branches which need to be recomputed.
+    """
+    if len(branch_ind) == 0:
+        return np.array([], dtype=int)
+    branch_len = np.array([len(branch) for branch in branch_ind])
+    members = np.concatenate([np.asarray(branch, dtype=int) for branch in branch_ind])
+    label = np.repeat(np.arange(len(branch_ind)), branch_len)
+    cond = np.isin(members, stale_edges)
+    changed = np.unique(label[cond])
+    return changed
+
+
+def _stale_to_old(old2new: np.ndarray, stale: np.ndarray) -> np.ndarray:
+    """
+    Maps a stale flag on the updated edges back onto the previous edge array.
+
+    Parameters
+    ----------
+    old2new : array
+        Position of each previous edge in the updated edge array, -1 if removed.
+    stale : array
+        Boolean flag for each edge in the updated edge array.
+
+    Returns
+    -------
+    old_stale : array
+        Boolean flag for each edge in the previous edge array.
+    """
+    old_stale = np.zeros(len(old2new), dtype=bool)
+    cond = np.where(old2new >= 0)[0]
+    old_stale[cond] = stale[old2new[cond]]
+    return old_stale
+
+
+class DynamicMST:
+
+    """
+    Minimum spanning tree which can be updated as points are inserted or removed,
+    without reconstructing the tree from scratch.
+
+    Node indices are stable: inserted points are appended to the end and removed
+    points are flagged as inactive (their degree becomes zero) rather than
+    reindexed. The KD-tree is kept through removals, which are masked out of its
+    queries, and inserted points go into a second small KD-tree.
+
+    Removing nodes splits the tree into fragments, which are joined by the exact
+    shortest edges between them, found with Boruvka steps: every fragment but the
+    largest searches for its nearest active point outside it. Inserted points are
+    joined by their k nearest neighbours, with Kruskal's algorithm run only on
+    these and the subtree spanning the existing nodes they reach.
+    """
+
+    def __init__(
+        self,
+        edge_idx: np.ndarray,
+        weights: np.ndarray,
+        x: np.ndarray,
+        y: np.ndarray,
+        z: Optional[np.ndarray] = None,
+        k_neighbours: int = 20,
+    ):
+        """
+        Parameters
+        ----------
+        edge_idx : 2darray
+            Graph edge node indices of an existing minimum spanning tree.
+        weights : array
+            Weights for each edge.
+        x, y, (z) : array
+            Cartesian 2D (3D) coordinates of the tree nodes.
+        k_neighbours : int, optional
+            The number of nearest neighbours queried around inserted points, and
+            at first around nodes of the fragments left by a deletion.
+        """
+        if z is None:
+            self._mode = "2D"
+            self.vert = coords.xy2vert(x, y)
+        else:
+            self._mode = "3D"
+            self.vert = coords.xyz2vert(x, y, z)
+        self.k_neighbours = k_neighbours
+        self.edge_idx = np.array(edge_idx, dtype=int).reshape(2, -1)
+        self.weights = np.array(weights, dtype=float)
+        self.active = np.ones(len(self.vert), dtype=bool)
+        self._build_tree()
+
+    @property
+    def Nnodes(self) -> int:
+        """Total number of nodes, including removed ones."""
+        return len(self.vert)
+
+    def _build_tree(self):
+        """Builds the KD-tree on all points, including removed ones."""
+        self._tree = cKDTree(self.vert)
+        self._nmain = len(self.vert)
+        self._buffer = None
+
+    def _add_to_tree(self):
+        """Adds the points appended since the KD-tree was built to the search."""
+        if self.Nnodes - self._nmain > _REBUILD_FRACTION * self._nmain:
+            self._build_tree()
+        elif self.Nnodes > self._nmain:
+            self._buffer = cKDTree(self.vert[self._nmain:])
+
+    def _nearest(self, vert: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the k nearest points of all points, including removed ones.
+
+        Parameters
+        ----------
+        vert : 2darray
+            Coordinates to query around.
+        k : int
+            Number of nearest points, at most Nnodes.
+
+        Returns
+        -------
+        nind : 2darray
+            Node indices of the nearest points, sorted by distance.
+        ndist : 2darray
+            Distances to the nearest points.
+        """
+        trees = [(self._tree, 0)]
+        if self._buffer is not None:
+            trees.append((self._buffer, self._nmain))
+        nind, ndist = [], []
+        for tree, offset in trees:
+            # a list of k always gives 2D outputs
+            _ndist, _nind = tree.query(
+                vert, k=list(range(1, min(k, tree.n) + 1)), workers=config.get_nthreads()
+            )
+            nind.append(_nind + offset)
+            ndist.append(_ndist)
+        if len(trees) == 1:
+            return nind[0], ndist[0]
+        nind, ndist = np.concatenate(nind, axis=1), np.concatenate(ndist, axis=1)
+        order = np.argsort(ndist, axis=1, kind="stable")[:, :k]
+        return np.take_along_axis(nind, order, 1), np.take_along_axis(ndist, order, 1)
+
+    def _query(
+        self, nodes: np.ndarray, k: int
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Returns the edges between the input nodes and their k nearest active
+        neighbours, widening the search where removed points are in the way.
+
+        Parameters
+        ----------
+        nodes : array
+            Node indices to query around.
+        k : int
+            Number of nearest neighbours.
+
+        Returns
+        -------
+        idx1, idx2 : array
+            Candidate edge node indices, idx1 are the input nodes.
+        weights : array
+            Weights for each candidate edge.
+        """
+        idx1, idx2, weights = [np.zeros(0, dtype=int)], [np.zeros(0, dtype=int)], [np.zeros(0)]
+        kq = min(k + 1, self.Nnodes)
+        todo = np.asarray(nodes, dtype=int)
+        while len(todo) > 0:
+            nind, ndist = self._nearest(self.vert[todo], kq)
+            valid = self.active[nind] & (nind != todo[:, np.newaxis])
+            done = (np.sum(valid, axis=1) >= k) | (kq == self.Nnodes)
+            take = valid & (np.cumsum(valid, axis=1) <= k) & done[:, np.newaxis]
+            rows, cols = np.nonzero(take)
+            idx1.append(todo[rows])
+            idx2.append(nind[rows, cols])
+            weights.append(ndist[rows, cols])
+            todo = todo[~done]
+            kq = min(2 * kq, self.Nnodes)
+        return np.concatenate(idx1), np.concatenate(idx2), np.concatenate(weights)
+
+    def _nearest_outside(
+        self, parent: np.ndarray, nodes: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Finds the shortest edge from each fragment to an active node outside it.
+        The search around a node is widened until it finds an outside node, or
+        until its neighbours are further than the shortest edge of its fragment.
+
+        Parameters
+        ----------
+        parent : int array
+            Union-find forest of the fragments.
+        nodes : array
+            Active nodes of the fragments searched from.
+
+        Returns
+        -------
+        idx1, idx2 : array
+            Edge node indices, idx1 are in the fragments.
+        weights : array
+            Weights for each edge.
+        """
+        roots = src.uf_roots(parent, nodes)
+        fragments, frag = np.unique(roots, return_inverse=True)
+        best = np.full(len(fragments), np.inf)
+        found1, found2, foundw = [], [], []
+        kq = min(self.k_neighbours + 1, self.Nnodes)
+        todo = np.arange(len(nodes))
+        while len(todo) > 0:
+            nind, ndist = self._nearest(self.vert[nodes[todo]], kq)
+            nroots = src.uf_roots(parent, nind.ravel()).reshape(nind.shape)
+            outside = self.active[nind] & (nroots != roots[todo, np.newaxis])
+            found = np.any(outside, axis=1)
+            first = np.argmax(outside, axis=1)
+            rows = np.where(found)[0]
+            dist = ndist[rows, first[rows]]
+            np.minimum.at(best, frag[todo[rows]], dist)
+            found1.append(todo[rows])
+            found2.append(nind[rows, first[rows]])
+            foundw.append(dist)
+            # beyond the queried neighbours, outside nodes are at least as far as
+            # the last of them
+            widen = ~found & (ndist[:, -1] < best[frag[todo]])
+            todo = todo[widen] if kq < self.Nnodes else todo[:0]
+            kq = min(2 * kq, self.Nnodes)
+        found1 = np.concatenate(found1)
+        found2, foundw = np.concatenate(found2), np.concatenate(foundw)
+        # the shortest edge of each fragment
+        order = np.lexsort((foundw, frag[found1]))
+        first = np.ones(len(order), dtype=bool)
+        first[1:] = frag[found1[order[1:]]] != frag[found1[order[:-1]]]
+        order = order[first]
+        return nodes[found1[order]], found2[order], foundw[order]
+
+    def _reconnect(
+        self,
+        keep: np.ndarray,
+        replace: np.ndarray,
+        idx1: np.ndarray,
+        idx2: np.ndarray,
+        weights: np.ndarray,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Joins the kept tree edges into a minimum spanning tree of the active nodes.
+        Tree edges which may be replaced compete with the candidate edges in
+        Kruskal's algorithm, then the remaining fragments are joined by their
+        shortest edges to other fragments.
+
+        Parameters
+        ----------
+        keep : bool array
+            Tree edges which are kept.
+        replace : bool array
+            Tree edges which may be replaced by candidate edges, all others are
+            removed.
+        idx1, idx2 : array
+            Candidate edge node indices.
+        weights : array
+            Weights for each candidate edge.
+
+        Returns
+        -------
+        removed : bool array
+            Tree edges which are removed.
+        edge_idx : 2darray
+            Edge node indices of the new edges.
+        weights : array
+            Weights of the new edges.
+        """
+        parent = np.arange(self.Nnodes)
+        size = np.ones(self.Nnodes, dtype=np.int64)
+        src.uf_kruskal(parent, size, self.edge_idx[0][keep], self.edge_idx[1][keep])
+        pos = np.where(replace)[0]
+        idx1 = np.concatenate([self.edge_idx[0][pos], idx1])
+        idx2 = np.concatenate([self.edge_idx[1][pos], idx2])
+        weights = np.concatenate([self.weights[pos], weights])
+        order = np.argsort(weights, kind="stable")
+        accepted = np.zeros(len(weights), dtype=bool)
+        accepted[order] = src.uf_kruskal(parent, size, idx1[order], idx2[order])
+        removed = ~keep
+        removed[pos[accepted[: len(pos)]]] = False
+        added = np.where(accepted[len(pos):])[0] + len(pos)
+        new1, new2, neww = [idx1[added]], [idx2[added]], [weights[added]]
+        nodes = np.where(self.active)[0]
+        roots = src.uf_roots(parent, nodes)
+        if len(nodes) > 0:
+            largest = roots[np.argmax(size[roots])]
+            nodes = nodes[roots != largest]
+        while len(nodes) > 0:
+            _idx1, _idx2, _weights = self._nearest_outside(parent, nodes)
+            order = np.argsort(_weights, kind="stable")
+            _idx1, _idx2, _weights = _idx1[order], _idx2[order], _weights[order]
+            accepted = src.uf_kruskal(parent, size, _idx1, _idx2)
+            new1.append(_idx1[accepted])
+            new2.append(_idx2[accepted])
+            neww.append(_weights[accepted])
+            largest = src.uf_find(parent, largest)
+            nodes = nodes[src.uf_roots(parent, nodes) != largest]
+        edge_idx = graph.get_edge_index(np.concatenate(new1), np.concatenate(new2))
+        return removed, edge_idx.astype(int), np.concatenate(neww)
+
+    def _update(self, removed: np.ndarray, edge_idx: np.ndarray, weights: np.ndarray) -> dict:
+        """
+        Removes and appends tree edges and reports what changed.
+
+        Parameters
+        ----------
+        removed : bool array
+            Tree edges which are removed.
+        edge_idx : 2darray
+            Edge node indices of the new edges.
+        weights : array
+            Weights of the new edges.
+
+        Returns
+        -------
+        report : dict
+            Summary of the changes, see insert.
+        """
+        kept = ~removed
+        nkept = int(np.sum(kept))
+        # Keep surviving edges in their original order and append the new ones so
+        # that edge positions remain meaningful to the caller.
+        old2new = -np.ones(len(kept), dtype=int)
+        old2new[kept] = np.arange(nkept)
+        change = np.zeros(self.Nnodes, dtype=int)
+        np.add.at(change, self.edge_idx[:, removed].ravel(), -1)
+        np.add.at(change, edge_idx.ravel(), 1)
+        degree_changed = np.where(change != 0)[0]
+        self.edge_idx = np.concatenate([self.edge_idx[:, kept], edge_idx], axis=1)
+        self.weights = np.concatenate([self.weights[kept], weights])
+        changed = change != 0
+        stale = changed[self.edge_idx[0]] | changed[self.edge_idx[1]]
+        stale[nkept:] = True
+        old_stale = removed | _stale_to_old(old2new, stale)
+        report = {
+            "added_edges": np.arange(nkept, len(self.weights)),
+            "removed_edges": np.where(removed)[0],
+            "degree_changed": degree_changed,
+            "affected_edges": np.where(stale)[0],
+            "stale_edges": np.where(old_stale)[0],
+            "old2new": old2new,
+        }
+        return report
+
+    def insert(
+        self, x: np.ndarray, y: np.ndarray, z: Optional[np.ndarray] = None
+    ) -> Tuple[np.ndarray, dict]:
+        """
+        Inserts a batch of points and updates the tree.
+
+        Parameters
+        ----------
+        x, y, (z) : array
+            Cartesian 2D (3D) coordinates of the new points.
+
+        Returns
+        -------
+        new_idx : array
+            Node indices assigned to the inserted points.
+        report : dict
+            Summary of the changes:
+                - 'added_edges' : positions of new edges in the updated edge array.
+                - 'removed_edges' : positions of dropped edges in the previous edge array.
+                - 'degree_changed' : nodes whose degree has changed.
+                - 'affected_edges' : positions of edges in the updated edge array which
+                  are new or attached to a node whose degree changed, i.e. the edges
+                  of branches that need to be recomputed.
+                - 'stale_edges' : the same as 'affected_edges' but for the previous
+                  edge array, see find_changed_branches.
+                - 'old2new' : position of each previous edge in the updated edge
+                  array, -1 if it has been removed.
+        """
+        if self._mode == "2D":
+            vert = coords.xy2vert(x, y)
+        else:
+            vert = coords.xyz2vert(x, y, z)
+        Nold = self.Nnodes
+        new_idx = np.arange(Nold, Nold + len(vert))
+        self.vert = np.concatenate([self.vert, vert])
+        self.active = np.concatenate([self.active, np.ones(len(vert), dtype=bool)])
+        self._add_to_tree()
+        idx1, idx2, weights = self._query(new_idx, self.k_neighbours)
+        # only tree edges on paths between the existing nodes reached by the new
+        # edges can be replaced by them
+        terminal = np.zeros(self.Nnodes, dtype=bool)
+        terminal[idx2[idx2 < Nold]] = True
+        replace = src.steinermask(self.edge_idx[0], self.edge_idx[1], self.Nnodes, terminal)
+        removed, edge_idx, weights = self._reconnect(~replace, replace, idx1, idx2, weights)
+        report = self._update(removed, edge_idx, weights)
+        return new_idx, report
+
+    def remove(self, idx: np.ndarray) -> dict:
+        """
+        Removes a batch of nodes and reconnects the tree with replacement edges.
+
+        Parameters
+        ----------
+        idx : array
+            Node indices to remove.
+
+        Returns
+        -------
+        report : dict
+            Summary of the changes, see insert.
+        """
+        idx = np.unique(np.asarray(idx, dtype=int))
+        self.active[idx] = False
+        keep = self.active[self.edge_idx[0]] & self.active[self.edge_idx[1]]
+        none = np.zeros(0, dtype=int)
+        removed, edge_idx, weights = self._reconnect(
+            keep, np.zeros(len(keep), dtype=bool), none, none, np.zeros(0)
+        )
+        report = self._update(removed, edge_idx, weights)
+        return report
+
+    def get_degree(self) -> np.ndarray:
+        """
+        Returns the degrees for all nodes, removed nodes have degree zero.
+
+        Returns
+        -------
+        degree : array
+            The degree of a node, i.e. the number of edges connecting to each node.
+        """
+        return graph.get_degree(self.edge_idx, self.Nnodes)
+
+    def output(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the current tree.
+
+        Returns
+        -------
+        edge_idx : 2darray
+            Graph edge node indices.
+        weights : array
+            Weights for each edge.
+        """
+        return self.edge_idx, self.weights
@@ -14,3 +14,7 @@ from .sphere import sphere_r
 from .sphere import sphere_phi
 from .sphere import sphere_theta
 from .sphere import sphere_rphitheta
+
+from .rng import get_generator
+from .rng import spawn_generators
+from .rng import uniform
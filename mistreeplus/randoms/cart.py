@@ -1,8 +1,16 @@
 import numpy as np
-from typing import List
+from typing import List, Optional, Tuple, Union
 
+from . import rng as _rng
 
-def cart1d(size: int, xmin: float = 0.0, xmax: float = 1.0) -> np.ndarray:
+
+def cart1d(
+    size: int,
+    xmin: float = 0.0,
+    xmax: float = 1.0,
+    rng: Optional[Union[int, np.random.Generator]] = None,
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
     """
     Generates a uniform set of random numbers between [xmin, xmax].
 
@@ -14,18 +22,29 @@ def cart1d(size: int, xmin: float = 0.0, xmax: float = 1.0) -> np.ndarray:
         Minimum value.
     xmax : float, optional
         Maximum value.
+    rng : int or Generator, optional
+        Random number generator or seed. If None the legacy global numpy random
+        state is used.
+    out : array, optional
+        Float64 buffer of length size to write the output into.
 
     Returns
     -------
     xrand : array
         Random cartesian numbers.
     """
-    xrand = (xmax - xmin) * np.random.random_sample(size) + xmin
+    xrand = _rng.uniform(size, rng=rng, out=out)
+    xrand *= xmax - xmin
+    xrand += xmin
     return xrand
 
 
 def cart2d(
-    size: int, mins: List[float] = [0.0, 0.0], maxs: List[float] = [1.0, 1.0]
+    size: int,
+    mins: List[float] = [0.0, 0.0],
+    maxs: List[float] = [1.0, 1.0],
+    rng: Optional[Union[int, np.random.Generator]] = None,
+    out: Optional[Tuple[np.ndarray, np.ndarray]] = None,
 ) -> np.ndarray:
     """
     Generates a uniform set of random numbers in 2D.
@@ -38,6 +57,11 @@ def cart2d(
         Minimum values in each axis.
     maxs : float/list
         Maximum values in each axis.
+    rng : int or Generator, optional
+        Random number generator or seed. If None the legacy global numpy random
+        state is used.
+    out : tuple of arrays, optional
+        Buffers to write xrand and yrand into.
 
     Returns
     -------
@@ -48,13 +72,21 @@ def cart2d(
         mins = [mins, mins]
     if np.isscalar(maxs) == True:
         maxs = [maxs, maxs]
-    xrand = cart1d(size, xmin=mins[0], xmax=maxs[0])
-    yrand = cart1d(size, xmin=mins[1], xmax=maxs[1])
+    if rng is not None:
+        rng = _rng.get_generator(rng)
+    if out is None:
+        out = (None, None)
+    xrand = cart1d(size, xmin=mins[0], xmax=maxs[0], rng=rng, out=out[0])
+    yrand = cart1d(size, xmin=mins[1], xmax=maxs[1], rng=rng, out=out[1])
     return xrand, yrand
 
 
 def cart3d(
-    size: int, mins: List[float] = [0.0, 0.0, 0.0], maxs: List[float] = [1.0, 1.0, 1.0]
+    size: int,
+    mins: List[float] = [0.0, 0.0, 0.0],
+    maxs: List[float] = [1.0, 1.0, 1.0],
+    rng: Optional[Union[int, np.random.Generator]] = None,
+    out: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None,
 ) -> np.ndarray:
     """
     Generates a uniform set of random numbers in 3D.
@@ -67,6 +99,11 @@ def cart3d(
         Minimum values in each axis.
     maxs : float/list
         Maximum values in each axis.
+    rng : int or Generator, optional
+        Random number generator or seed. If None the legacy global numpy random
+        state is used.
+    out : tuple of arrays, optional
+        Buffers to write xrand, yrand and zrand into.
 
     Returns
     -------
@@ -77,7 +114,11 @@ def cart3d(
         mins = [mins, mins, mins]
     if np.isscalar(maxs) == True:
         maxs = [maxs, maxs, maxs]
-    xrand = cart1d(size, xmin=mins[0], xmax=maxs[0])
-    yrand = cart1d(size, xmin=mins[1], xmax=maxs[1])
-    zrand = cart1d(size, xmin=mins[2], xmax=maxs[2])
+    if rng is not None:
+        rng = _rng.get_generator(rng)
+    if out is None:
+        out = (None, None, None)
+    xrand = cart1d(size, xmin=mins[0], xmax=maxs[0], rng=rng, out=out[0])
+    yrand = cart1d(size, xmin=mins[1], xmax=maxs[1], rng=rng, out=out[1])
+    zrand = cart1d(size, xmin=mins[2], xmax=maxs[2], rng=rng, out=out[2])
     return xrand, yrand, zrand
@@ -1,12 +1,19 @@
 import numpy as np
-from typing import Tuple, List
+from typing import Tuple, List, Optional, Union
 
 from . import cart
+from . import rng as _rng
 
 from .. import check
 
 
-def polar_r(size: int, rmin: float = 0.0, rmax: float = 1.0) -> np.ndarray:
+def polar_r(
+    size: int,
+    rmin: float = 0.0,
+    rmax: float = 1.0,
+    rng: Optional[Union[int, np.random.Generator]] = None,
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
     """
     Generates random radial values in a disc segment with inner radius rmin
     and outer radius rmax.
@@ -19,6 +26,11 @@ def polar_r(size: int, rmin: float = 0.0, rmax: float = 1.0) -> np.ndarray:
         Minimum radial distance.
     rmax : float, optional
         Maximum radial distance.
+    rng : int or Generator, optional
+        Random number generator or seed. If None the legacy global numpy random
+        state is used.
+    out : array, optional
+        Float64 buffer of length size to write the output into.
 
     Returns
     -------
@@ -27,13 +39,20 @@ def polar_r(size: int, rmin: float = 0.0, rmax: float = 1.0) -> np.ndarray:
     """
     check.check_positive(rmin)
     check.check_positive(rmax)
-    u = cart.cart1d(size)
-    rrand = np.sqrt((rmax**2.0 - rmin**2.0) * u + rmin**2.0)
+    u = cart.cart1d(size, rng=rng, out=out)
+    u *= rmax**2.0 - rmin**2.0
+    u += rmin**2.0
+    rrand = np.sqrt(u, out=u)
     return rrand
 
 
 def polar_phi(
-    size: int, phimin: float = 0.0, phimax: float = 2.0 * np.pi, units: str = "rads"
+    size: int,
+    phimin: float = 0.0,
+    phimax: float = 2.0 * np.pi,
+    units: str = "rads",
+    rng: Optional[Union[int, np.random.Generator]] = None,
+    out: Optional[np.ndarray] = None,
 ) -> np.ndarray:
     """
     Generates random angles in polar coordinates.
@@ -48,6 +67,11 @@ def polar_phi(
         Maximum phi angle.
     units : str, optional
         Angular units, either 'degs' for degrees or 'rads' for radians.
+    rng : int or Generator, optional
+        Random number generator or seed. If None the legacy global numpy random
+        state is used.
+    out : array, optional
+        Float64 buffer of length size to write the output into.
 
     Returns
     -------
@@ -57,7 +81,7 @@ def polar_phi(
     check.check_angle_units(units)
     check.check_phi_in_range(phimin, units)
     check.check_phi_in_range(phimax, units)
-    prand = cart.cart1d(size, xmin=phimin, xmax=phimax)
+    prand = cart.cart1d(size, xmin=phimin, xmax=phimax, rng=rng, out=out)
     return prand
 
 
@@ -66,6 +90,8 @@ def polar_rphi(
     mins: List[float] = [0.0, 0.0],
     maxs: List[float] = [1.0, 2.0 * np.pi],
     units: str = "rads",
+    rng: Optional[Union[int, np.random.Generator]] = None,
+    out: Optional[Tuple[np.ndarray, np.ndarray]] = None,
 ) -> Tuple[np.ndarray, np.ndarray]:
     """
     Generates randoms in polar coordinates.
@@ -80,12 +106,23 @@ def polar_rphi(
         Maximum values in each axis, i.e. [rmax, pmax].
     units : str, optional
         Angular units, either 'degs' for degrees or 'rads' for radians.
+    rng : int or Generator, optional
+        Random number generator or seed. If None the legacy global numpy random
+        state is used.
+    out : tuple of arrays, optional
+        Buffers to write rrand and prand into.
 
     Returns
     -------
     rrand, prand : array
         Randoms in polar coordinates.
     """
-    rrand = polar_r(size, rmin=mins[0], rmax=maxs[0])
-    prand = polar_phi(size, phimin=mins[1], phimax=maxs[1], units=units)
+    if rng is not None:
+        rng = _rng.get_generator(rng)
+    if out is None:
+        out = (None, None)
+    rrand = polar_r(size, rmin=mins[0], rmax=maxs[0], rng=rng, out=out[0])
+    prand = polar_phi(
+        size, phimin=mins[1], phimax=maxs[1], units=units, rng=rng, out=out[1]
+    )
     return rrand, prand
@@ -0,0 +1,82 @@
+import numpy as np
+from typing import List, Optional, Union
+
+
+def get_generator(
+    seed: Optional[Union[int, np.random.SeedSequence, np.random.Generator]] = None
+) -> np.random.Generator:
+    """
+    Returns a random number generator using the PCG64 bit generator.
+
+    Parameters
+    ----------
+    seed : int, SeedSequence or Generator, optional
+        Seed for the generator. If a Generator is supplied it is returned as is,
+        if None fresh entropy is used.
+
+    Returns
+    -------
+    rng : Generator
+        Random number generator.
+    """
+    if isinstance(seed, np.random.Generator):
+        return seed
+    rng = np.random.Generator(np.random.PCG64(seed))
+    return rng
+
+
+def spawn_generators(
+    nstreams: int, seed: Optional[Union[int, np.random.SeedSequence]] = None
+) -> List[np.random.Generator]:
+    """
+    Returns independent and reproducible random number generators, for example one
+    per worker in a pool or one per walker.
+
+    Parameters
+    ----------
+    nstreams : int
+        Number of independent streams.
+    seed : int or SeedSequence, optional
+        Seed for the parent seed sequence. If None fresh entropy is used.
+
+    Returns
+    -------
+    rngs : list
+        Independent random number generators.
+    """
+    if not isinstance(seed, np.random.SeedSequence):
+        seed = np.random.SeedSequence(seed)
+    rngs = [get_generator(child) for child in seed.spawn(nstreams)]
+    return rngs
+
+
+def uniform(
+    size: int,
+    rng: Optional[Union[int, np.random.Generator]] = None,
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Generates uniform randoms between [0, 1].
+
+    Parameters
+    ----------
+    size : int
+        Size of the output sample.
+    rng : int or Generator, optional
+        Random number generator or seed. If None the legacy global numpy random
+        state is used, so that np.random.seed continues to work.
+    out : array, optional
+        Float64 buffer of length size to write the randoms into.
+
+    Returns
+    -------
+    u : array
+        Uniform randoms.
+    """
+    if rng is None:
+        if out is None:
+            return np.random.random_sample(size)
+        out[:] = np.random.random_sample(size)
+        return out
+    u = get_generator(rng).random(size, out=out)
+    return u
@@ -1,14 +1,20 @@
 import numpy as np
-from typing import Tuple, List
+from typing import Tuple, List, Optional, Union
 
 from . import cart
 from . import usphere
+from . import rng as _rng
 
 from .. import check
 
 
 def sphere_r(
-    size: int, rmin: float = 0.0, rmax: float = 1.0, units: str = "rads"
+    size: int,
+    rmin: float = 0.0,
+    rmax: float = 1.0,
+    units: str = "rads",
+    rng: Optional[Union[int, np.random.Generator]] = None,
+    out: Optional[np.ndarray] = None,
 ) -> np.ndarray:
     """
     Generates random radial values in spherical polar coordinates.
@@ -23,6 +29,11 @@ def sphere_r(
         Maximum radial distance.
     units : str
         Angular units, either 'degs' for degrees or 'rads' for radians.
+    rng : int or Generator, optional
+        Random number generator or seed. If None the legacy global numpy random
+        state is used.
+    out : array, optional
+        Float64 buffer of length size to write the output into.
 
     Returns
     -------
@@ -31,13 +42,20 @@ def sphere_r(
     """
     check.check_positive(rmin)
     check.check_positive(rmax)
-    u = cart.cart1d(size)
-    rrand = ((rmax**3.0 - rmin**3.0) * u + rmin**3.0) ** (1.0 / 3.0)
+    u = cart.cart1d(size, rng=rng, out=out)
+    u *= rmax**3.0 - rmin**3.0
+    u += rmin**3.0
+    rrand = np.cbrt(u, out=u)
     return rrand
 
 
 def sphere_phi(
-    size: int, phimin: float = 0.0, phimax: float = 2.0 * np.pi, units: str = "rads"
+    size: int,
+    phimin: float = 0.0,
+    phimax: float = 2.0 * np.pi,
+    units: str = "rads",
+    rng: Optional[Union[int, np.random.Generator]] = None,
+    out: Optional[np.ndarray] = None,
 ) -> np.ndarray:
     """
     Generates random phi values in spherical polar coordinates.
@@ -52,18 +70,30 @@ def sphere_phi(
         Maximum values in each axis.
     units : str
         Angular units, either 'degs' for degrees or 'rads' for radians.
+    rng : int or Generator, optional
+        Random number generator or seed. If None the legacy global numpy random
+        state is used.
+    out : array, optional
+        Float64 buffer of length size to write the output into.
 
     Returns
     -------
     prand : array
         Randoms phi values in spherical polar coordinates.
     """
-    prand = usphere.usphere_phi(size, phimin=phimin, phimax=phimax, units=units)
+    prand = usphere.usphere_phi(
+        size, phimin=phimin, phimax=phimax, units=units, rng=rng, out=out
+    )
     return prand
 
 
 def sphere_theta(
-    size: int, thetamin: float = 0.0, thetamax: float = np.pi, units: str = "rads"
+    size: int,
+    thetamin: float = 0.0,
+    thetamax: float = np.pi,
+    units: str = "rads",
+    rng: Optional[Union[int, np.random.Generator]] = None,
+    out: Optional[np.ndarray] = None,
 ) -> np.ndarray:
     """
     Generates random theta values in spherical polar coordinates.
@@ -78,6 +108,11 @@ def sphere_theta(
         Maximum theta angle.
     units : str
         Angular units, either 'degs' for degrees or 'rads' for radians.
+    rng : int or Generator, optional
+        Random number generator or seed. If None the legacy global numpy random
+        state is used.
+    out : array, optional
+        Float64 buffer of length size to write the output into.
 
     Returns
     -------
@@ -85,7 +120,7 @@ def sphere_theta(
         Randoms theta values in spherical polar coordinates.
     """
     trand = usphere.usphere_theta(
-        size, thetamin=thetamin, thetamax=thetamax, units=units
+        size, thetamin=thetamin, thetamax=thetamax, units=units, rng=rng, out=out
     )
     return trand
 
@@ -95,6 +130,8 @@ def sphere_rphitheta(
     mins: List[float] = [0.0, 0.0, 0.0],
     maxs: List[float] = [1.0, 2.0 * np.pi, np.pi],
     units: str = "rads",
+    rng: Optional[Union[int, np.random.Generator]] = None,
+    out: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None,
 ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
     """
     Generates randoms in spherical polar coordinates.
@@ -109,13 +146,26 @@ def sphere_rphitheta(
         Maximum values in each axis, i.e. maxs=[rmax, phimax, thetamax].
     units : str
         Angular units, either 'degs' for degrees or 'rads' for radians.
+    rng : int or Generator, optional
+        Random number generator or seed. If None the legacy global numpy random
+        state is used.
+    out : tuple of arrays, optional
+        Buffers to write rrand, prand and trand into.
 
     Returns
     -------
     rrand, prand, trand : array
         Randoms in spherical polar coordinates.
     """
-    rrand = sphere_r(size, rmin=mins[0], rmax=maxs[0])
-    prand = sphere_phi(size, phimin=mins[1], phimax=maxs[1], units=units)
-    trand = sphere_theta(size, thetamin=mins[2], thetamax=maxs[2], units=units)
+    if rng is not None:
+        rng = _rng.get_generator(rng)
+    if out is None:
+        out = (None, None, None)
+    rrand = sphere_r(size, rmin=mins[0], rmax=maxs[0], rng=rng, out=out[0])
+    prand = sphere_phi(
+        size, phimin=mins[1], phimax=maxs[1], units=units, rng=rng, out=out[1]
+    )
+    trand = sphere_theta(
+        size, thetamin=mins[2], thetamax=maxs[2], units=units, rng=rng, out=out[2]
+    )
     return rrand, prand, trand
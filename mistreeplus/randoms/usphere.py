@@ -1,14 +1,20 @@
 import numpy as np
-from typing import Tuple, List
+from typing import Tuple, List, Optional, Union
 
 from . import cart
 from . import polar
+from . import rng as _rng
 
 from .. import check
 
 
 def usphere_phi(
-    size: int, phimin: float = 0.0, phimax: float = 2.0 * np.pi, units: str = "rads"
+    size: int,
+    phimin: float = 0.0,
+    phimax: float = 2.0 * np.pi,
+    units: str = "rads",
+    rng: Optional[Union[int, np.random.Generator]] = None,
+    out: Optional[np.ndarray] = None,
 ) -> np.ndarray:
     """
     Generates random phis on a unit sphere.
@@ -23,18 +29,30 @@ def usphere_phi(
         Maximum phi angle.
     units : str, optional
         Angular units, either 'degs' for degrees or 'rads' for radians.
+    rng : int or Generator, optional
+        Random number generator or seed. If None the legacy global numpy random
+        state is used.
+    out : array, optional
+        Float64 buffer of length size to write the output into.
 
     Returns
     -------
     prand : array
         Random phis on a unit sphere.
     """
-    prand = polar.polar_phi(size, phimin=phimin, phimax=phimax, units=units)
+    prand = polar.polar_phi(
+        size, phimin=phimin, phimax=phimax, units=units, rng=rng, out=out
+    )
     return prand
 
 
 def usphere_theta(
-    size: int, thetamin: float = 0.0, thetamax: float = np.pi, units: str = "rads"
+    size: int,
+    thetamin: float = 0.0,
+    thetamax: float = np.pi,
+    units: str = "rads",
+    rng: Optional[Union[int, np.random.Generator]] = None,
+    out: Optional[np.ndarray] = None,
 ) -> np.ndarray:
     """
     Generates random theta values from a unit sphere.
@@ -49,6 +67,11 @@ def usphere_theta(
         Maximum theta angle.
     units : str
         Angular units, either 'degs' for degrees or 'rads' for radians.
+    rng : int or Generator, optional
+        Random number generator or seed. If None the legacy global numpy random
+        state is used.
+    out : array, optional
+        Float64 buffer of length size to write the output into.
 
     Returns
     -------
@@ -61,8 +84,10 @@ def usphere_theta(
     if units == "degs":
         thetamin = np.deg2rad(thetamin)
         thetamax = np.deg2rad(thetamax)
-    u = cart.cart1d(size)
-    trand = np.arccos(np.cos(thetamin) - (np.cos(thetamin) - np.cos(thetamax)) * u)
+    u = cart.cart1d(size, rng=rng, out=out)
+    u *= -(np.cos(thetamin) - np.cos(thetamax))
+    u += np.cos(thetamin)
+    trand = np.arccos(u, out=u)
     return trand
 
 
@@ -71,6 +96,8 @@ def usphere_phitheta(
     mins: List[float] = [0.0, 0.0],
     maxs: List[float] = [2.0 * np.pi, np.pi],
     units: str = "rads",
+    rng: Optional[Union[int, np.random.Generator]] = None,
+    out: Optional[Tuple[np.ndarray, np.ndarray]] = None,
 ) -> Tuple[np.ndarray, np.ndarray]:
     """
     Generates randoms on a unit sphere.
@@ -85,12 +112,25 @@ def usphere_phitheta(
         Maximum values in each axis, i.e. maxs=[rmin, phimax].
     units : str
         Angular units, either 'degs' for degrees or 'rads' for radians.
+    rng : int or Generator, optional
+        Random number generator or seed. If None the legacy global numpy random
+        state is used.
+    out : tuple of arrays, optional
+        Buffers to write prand and trand into.
 
     Returns
     -------
     prand, trand : array
         Randoms on a unit sphere.
     """
-    prand = usphere_phi(size, phimin=mins[0], phimax=maxs[0], units=units)
-    trand = usphere_theta(size, thetamin=mins[1], thetamax=maxs[1], units=units)
+    if rng is not None:
+        rng = _rng.get_generator(rng)
+    if out is None:
+        out = (None, None)
+    prand = usphere_phi(
+        size, phimin=mins[0], phimax=maxs[0], units=units, rng=rng, out=out[0]
+    )
+    trand = usphere_theta(
+        size, thetamin=mins[1], thetamax=maxs[1], units=units, rng=rng, out=out[1]
+    )
     return prand, trand
@@ -1,3 +1,11 @@
+from .coordconv import sphere2vert
+from .coordconv import vert2sphere
+
+from .delaunayutils import csrupperedges
+from .delaunayutils import csredgelengths
+from .delaunayutils import gabrieltest
+from .delaunayutils import rngtest
+
 from .linalg import dotvector3
 from .linalg import dot3by3mat3vec
 from .linalg import crossvector3
@@ -9,8 +17,34 @@ from .mststats import getgraphdegree
 from .randwalkcart import periodicboundary
 from .randwalkcart import randwalkcart2d
 from .randwalkcart import randwalkcart3d
+from .randwalkcart import levystep
+from .randwalkcart import randwalkcart_inplace
+from .randwalkcart import levywalkcart_inplace
 
 from .randwalkusphere import usphererotate
 from .randwalkusphere import randwalkusphere
+from .randwalkusphere import uspherestep
+from .randwalkusphere import randwalkusphere_inplace
+from .randwalkusphere import randwalkusphere_rodrigues
+
+from .sfcurve import mortonkeys
+from .sfcurve import hilbertkeys
 
 from .treeutils import add2centrality
+from .treeutils import steinermask
+
+from .unionfind import uf_find
+from .unionfind import uf_union
+from .unionfind import uf_labels
+from .unionfind import uf_roots
+from .unionfind import uf_kruskal
+from .unionfind import unionfind_labels
+from .unionfind import fof_sweep
+from .unionfind import linkage_sweep
+from .unionfind import percolation_sweep
+
+from .randwalkbatch import randwalkcart2d_batch
+from .randwalkbatch import randwalkcart3d_batch
+from .randwalkbatch import randwalkusphere_batch
+
+from .warmup import warmup
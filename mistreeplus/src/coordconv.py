@@ -0,0 +1,105 @@
+import numpy as np
+from numba import njit, prange
+
+
+@njit(parallel=True, cache=True)
+def sphere2vert(
+    r: np.ndarray,
+    phi: np.ndarray,
+    theta: np.ndarray,
+    useradius: int,
+    celestial: int,
+    degs: int,
+    out: np.ndarray,
+) -> np.ndarray:
+    """
+    Converts spherical coordinates into cartesian vertices, writing directly into a
+    preallocated buffer.
+
+    Parameters
+    ----------
+    r : array
+        Radial distance, ignored if useradius = 0.
+    phi, theta : array
+        Longitude and latitude coordinates, or ra and dec if celestial = 1.
+    useradius : int
+        0 = points lie on the unit sphere.
+        1 = points are placed at distance r.
+    celestial : int
+        0 = theta is the colatitude.
+        1 = theta is the declination.
+    degs : int
+        0 = angles are given in radians.
+        1 = angles are given in degrees.
+    out : 2darray
+        Output buffer of shape (N, 3), either float32 or float64.
+
+    Returns
+    -------
+    out : 2darray
+        Coordinates in vertices format: [[x1, y1, z1], [x2, y2, z2], ...].
+    """
+    for i in prange(len(phi)):
+        p = phi[i]
+        t = theta[i]
+        if degs == 1:
+            p = np.deg2rad(p)
+            t = np.deg2rad(t)
+        if celestial == 1:
+            t = 0.5 * np.pi - t
+        sint = np.sin(t)
+        rad = 1.0
+        if useradius == 1:
+            rad = r[i]
+        out[i, 0] = rad * np.cos(p) * sint
+        out[i, 1] = rad * np.sin(p) * sint
+        out[i, 2] = rad * np.cos(t)
+    return out
+
+
+@njit(parallel=True, cache=True)
+def vert2sphere(
+    vert: np.ndarray, celestial: int, degs: int, out: np.ndarray
+) -> np.ndarray:
+    """
+    Converts cartesian vertices into spherical coordinates, writing directly into a
+    preallocated buffer.
+
+    Parameters
+    ----------
+    vert : 2darray
+        Coordinates in vertices format: [[x1, y1, z1], [x2, y2, z2], ...].
+    celestial : int
+        0 = output the colatitude theta.
+        1 = output the declination.
+    degs : int
+        0 = angles are given in radians.
+        1 = angles are given in degrees.
+    out : 2darray
+        Output buffer of shape (N, 3) for [r, phi, theta], either float32 or float64.
+
+    Returns
+    -------
+    out : 2darray
+        Spherical coordinates [r, phi, theta] (or [r, ra, dec]) of each point.
+    """
+    for i in prange(len(vert)):
+        x = vert[i, 0]
+        y = vert[i, 1]
+        z = vert[i, 2]
+        r = np.sqrt(x * x + y * y + z * z)
+        p = np.arctan2(y, x)
+        if p < 0.0:
+            p += 2.0 * np.pi
+        t = 0.0
+        if r > 0.0:
+            t = np.arccos(min(max(z / r, -1.0), 1.0))
+        if celestial == 1:
+            t = 0.5 * np.pi - t
+        if degs == 1:
+            p = np.rad2deg(p)
+            t = np.rad2deg(t)
+        out[i, 0] = r
+        out[i, 1] = p
+        out[i, 2] = t
+    return out
@@ -0,0 +1,210 @@
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def csrupperedges(indptr: np.ndarray, indices: np.ndarray, vert: np.ndarray):
+    """
+    Extracts the unique edges i < j of a symmetric CSR adjacency, e.g. the
+    vertex_neighbor_vertices of a scipy Delaunay triangulation, and their lengths
+    in a single pass.
+
+    Parameters
+    ----------
+    indptr, indices : array
+        CSR adjacency, the neighbours of node i are indices[indptr[i]:indptr[i+1]].
+    vert : 2darray
+        Coordinates in vertices format.
+
+    Returns
+    -------
+    idx1, idx2 : array
+        Node indices of each edge, with idx1 < idx2.
+    dist : array
+        Euclidean length of each edge.
+    """
+    nnodes = len(indptr) - 1
+    ndim = vert.shape[1]
+    nedges = 0
+    for i in range(nnodes):
+        for p in range(indptr[i], indptr[i + 1]):
+            if indices[p] > i:
+                nedges += 1
+    idx1 = np.empty(nedges, dtype=indices.dtype)
+    idx2 = np.empty(nedges, dtype=indices.dtype)
+    dist = np.empty(nedges, dtype=np.float64)
+    e = 0
+    for i in range(nnodes):
+        for p in range(indptr[i], indptr[i + 1]):
+            j = indices[p]
+            if j > i:
+                d2 = 0.0
+                for k in range(ndim):
+                    dx = float(vert[i, k]) - float(vert[j, k])
+                    d2 += dx * dx
+                idx1[e] = i
+                idx2[e] = j
+                dist[e] = np.sqrt(d2)
+                e += 1
+    return idx1, idx2, dist
+
+
+@njit(cache=True)
+def csredgelengths(indptr: np.ndarray, indices: np.ndarray, vert: np.ndarray) -> np.ndarray:
+    """
+    Computes the Euclidean length of every entry of a CSR adjacency.
+
+    Parameters
+    ----------
+    indptr, indices : array
+        CSR adjacency, the neighbours of node i are indices[indptr[i]:indptr[i+1]].
+    vert : 2darray
+        Coordinates in vertices format.
+
+    Returns
+    -------
+    dist : array
+        Length of the edge of each entry of indices.
+    """
+    nnodes = len(indptr) - 1
+    ndim = vert.shape[1]
+    dist = np.empty(len(indices), dtype=np.float64)
+    for i in range(nnodes):
+        for p in range(indptr[i], indptr[i + 1]):
+            j = indices[p]
+            d2 = 0.0
+            for k in range(ndim):
+                dx = float(vert[i, k]) - float(vert[j, k])
+                d2 += dx * dx
+            dist[p] = np.sqrt(d2)
+    return dist
+
+
+@njit(cache=True)
+def gabrieltest(
+    indptr: np.ndarray,
+    indices: np.ndarray,
+    vert: np.ndarray,
+    idx1: np.ndarray,
+    idx2: np.ndarray,
+    tol: float,
+) -> np.ndarray:
+    """
+    Tests whether Delaunay edges belong to the Gabriel graph, i.e. whether the ball
+    with the edge as diameter is empty. If it is not, walking from idx1 towards the
+    edge midpoint leaves its Voronoi cell into that of a Delaunay neighbour lying
+    inside the ball, so only the neighbours of idx1 need to be checked.
+
+    Parameters
+    ----------
+    indptr, indices : array
+        Symmetric CSR adjacency of the Delaunay triangulation.
+    vert : 2darray
+        Coordinates in vertices format.
+    idx1, idx2 : array
+        Node indices of the edges.
+    tol : float
+        Relative tolerance for points on the surface of the ball.
+
+    Returns
+    -------
+    gabriel : bool array
+        True for Gabriel edges.
+    """
+    ndim = vert.shape[1]
+    gabriel = np.ones(len(idx1), dtype=np.bool_)
+    mid = np.empty(ndim, dtype=np.float64)
+    for e in range(len(idx1)):
+        i, j = idx1[e], idx2[e]
+        r2 = 0.0
+        for k in range(ndim):
+            mid[k] = 0.5 * (float(vert[i, k]) + float(vert[j, k]))
+            dx = float(vert[i, k]) - mid[k]
+            r2 += dx * dx
+        r2 *= 1.0 - tol
+        for p in range(indptr[i], indptr[i + 1]):
+            n = indices[p]
+            if n == j:
+                continue
+            d2 = 0.0
+            for k in range(ndim):
+                dx = float(vert[n, k]) - mid[k]
+                d2 += dx * dx
+            if d2 < r2:
+                gabriel[e] = False
+                break
+    return gabriel
+
+
+@njit(cache=True)
+def rngtest(
+    indptr: np.ndarray,
+    indices: np.ndarray,
+    vert: np.ndarray,
+    idx1: np.ndarray,
+    idx2: np.ndarray,
+    tol: float,
+) -> np.ndarray:
+    """
+    Tests whether Delaunay edges belong to the relative neighbourhood graph, i.e.
+    whether the lune of the edge, the points closer to both ends than they are to
+    each other, is empty. The lune lies in the ball of radius |ij| around idx1, and
+    greedy routing towards idx1 links every point in this ball to idx1 through
+    Delaunay neighbours inside the ball, so a search from idx1 restricted to the
+    ball finds every point that could block the edge.
+
+    Parameters
+    ----------
+    indptr, indices : array
+        Symmetric CSR adjacency of the Delaunay triangulation.
+    vert : 2darray
+        Coordinates in vertices format.
+    idx1, idx2 : array
+        Node indices of the edges.
+    tol : float
+        Relative tolerance for points on the boundary of the lune.
+
+    Returns
+    -------
+    rng : bool array
+        True for edges of the relative neighbourhood graph.
+    """
+    nnodes = len(indptr) - 1
+    ndim = vert.shape[1]
+    rng = np.ones(len(idx1), dtype=np.bool_)
+    # visited[n] == e + 1 marks nodes reached in the search of edge e
+    visited = np.zeros(nnodes, dtype=np.int64)
+    stack = np.empty(nnodes, dtype=np.int64)
+    for e in range(len(idx1)):
+        i, j = idx1[e], idx2[e]
+        dij = 0.0
+        for k in range(ndim):
+            dx = float(vert[i, k]) - float(vert[j, k])
+            dij += dx * dx
+        inner = dij * (1.0 - tol)
+        outer = dij * (1.0 + tol)
+        visited[i] = e + 1
+        visited[j] = e + 1
+        stack[0] = i
+        nstack = 1
+        while nstack > 0 and rng[e]:
+            nstack -= 1
+            c = stack[nstack]
+            for p in range(indptr[c], indptr[c + 1]):
+                n = indices[p]
+                if visited[n] == e + 1:
+                    continue
+                visited[n] = e + 1
+                din, djn = 0.0, 0.0
+                for k in range(ndim):
+                    dx = float(vert[n, k]) - float(vert[i, k])
+                    dy = float(vert[n, k]) - float(vert[j, k])
+                    din += dx * dx
+                    djn += dy * dy
+                if din < inner and djn < inner:
+                    rng[e] = False
+                    break
+                if din <= outer:
+                    stack[nstack] = n
+                    nstack += 1
+    return rng
@@ -2,7 +2,7 @@ import numpy as np
 from numba import njit
 
 
-@njit
+@njit(cache=True)
 def dotvector3(a: np.ndarray, b: np.ndarray) -> float:
     """
     Calculates the dot product of two vectors of length 3.
@@ -22,7 +22,7 @@ def dotvector3(a: np.ndarray, b: np.ndarray) -> float:
     return a[0] * b[0] + a[1] * b[1] + a[2] * b[2]
 
 
-@njit
+@njit(cache=True)
 def dot3by3mat3vec(a: np.ndarray, b: np.ndarray) -> float:
     """
     Calculates the dot product of a 3x3 matrix and a vector of length 3.
@@ -46,7 +46,7 @@ def dot3by3mat3vec(a: np.ndarray, b: np.ndarray) -> float:
     return c
 
 
-@njit
+@njit(cache=True)
 def crossvector3(a: np.ndarray, b: np.ndarray) -> float:
     """
     Calculates the cross product of two vectors of length 3.
@@ -70,7 +70,7 @@ def crossvector3(a: np.ndarray, b: np.ndarray) -> float:
     return c
 
 
-@njit
+@njit(cache=True)
 def normalisevector(vecin: np.ndarray) -> np.ndarray:
     """
     Normalises an input vector.
@@ -95,7 +95,7 @@ def normalisevector(vecin: np.ndarray) -> np.ndarray:
     return vecout
 
 
-@njit
+@njit(cache=True)
 def inv3by3(m: np.ndarray) -> float:
     """
     Inverts a 3x3 matrix.
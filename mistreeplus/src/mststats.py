@@ -2,7 +2,7 @@ import numpy as np
 from numba import njit
 
 
-@njit
+@njit(cache=True)
 def getgraphdegree(
     i1: np.ndarray, i2: np.ndarray, nnodes: int
 ) -> np.ndarray:
@@ -19,11 +19,12 @@ def getgraphdegree(
     Returns
     -------
     degree : ndarray
-        The degree of each node, i.e., the number of edges connecting to each node.
+        The degree of each node, i.e., the number of edges connecting to each node,
+        as int32.
     """
-    degree = np.zeros(nnodes, dtype=np.float64)
+    degree = np.zeros(nnodes, dtype=np.int32)
     nedges = len(i1)
     for i in range(nedges):
-        degree[i1[i]] += 1.0
-        degree[i2[i]] += 1.0
+        degree[i1[i]] += 1
+        degree[i2[i]] += 1
     return degree
@@ -0,0 +1,139 @@
+import numpy as np
+from numba import njit, prange
+
+from .randwalkcart import periodicboundary
+from .randwalkusphere import randwalkusphere_inplace
+
+
+@njit(parallel=True, cache=True)
+def randwalkcart2d_batch(
+    steps: np.ndarray,
+    prand: np.ndarray,
+    boxsize: float,
+    start: np.ndarray,
+    useperiodic: int,
+) -> np.ndarray:
+    """
+    Generates many independent random walks on a 2D grid, in parallel over walkers.
+
+    Parameters
+    ----------
+    steps : 2darray
+        Step sizes for each walker, shape (nwalkers, nsteps).
+    prand : 2darray
+        Random angles for each walker, shape (nwalkers, nsteps).
+    boxsize : float
+        Box size.
+    start : 2darray
+        Starting x and y coordinates of each walker, shape (nwalkers, 2).
+    useperiodic : int
+        0 = does not enforce periodic boundary conditions.
+        1 = enforces periodic boundary conditions.
+
+    Returns
+    -------
+    pos : 3darray
+        Coordinates of the random walks, shape (nwalkers, nsteps+1, 2).
+    """
+    nwalkers, length = steps.shape
+    pos = np.zeros((nwalkers, length + 1, 2), dtype=np.float64)
+    for j in prange(nwalkers):
+        xnow = start[j, 0]
+        ynow = start[j, 1]
+        pos[j, 0, 0] = xnow
+        pos[j, 0, 1] = ynow
+        for i in range(0, length):
+            xnow += steps[j, i] * np.cos(prand[j, i])
+            ynow += steps[j, i] * np.sin(prand[j, i])
+            if useperiodic == 1:
+                xnow = periodicboundary(xnow, boxsize)
+                ynow = periodicboundary(ynow, boxsize)
+            pos[j, i + 1, 0] = xnow
+            pos[j, i + 1, 1] = ynow
+    return pos
+
+
+@njit(parallel=True, cache=True)
+def randwalkcart3d_batch(
+    steps: np.ndarray,
+    prand: np.ndarray,
+    trand: np.ndarray,
+    boxsize: float,
+    start: np.ndarray,
+    useperiodic: int,
+) -> np.ndarray:
+    """
+    Generates many independent random walks on a 3D grid, in parallel over walkers.
+
+    Parameters
+    ----------
+    steps : 2darray
+        Step sizes for each walker, shape (nwalkers, nsteps).
+    prand, trand : 2darray
+        Random angles phi (longitude) and theta (latitude) for each walker, shape
+        (nwalkers, nsteps).
+    boxsize : float
+        Box size.
+    start : 2darray
+        Starting x, y and z coordinates of each walker, shape (nwalkers, 3).
+    useperiodic : int
+        0 = does not enforce periodic boundary conditions.
+        1 = enforces periodic boundary conditions.
+
+    Returns
+    -------
+    pos : 3darray
+        Coordinates of the random walks, shape (nwalkers, nsteps+1, 3).
+    """
+    nwalkers, length = steps.shape
+    pos = np.zeros((nwalkers, length + 1, 3), dtype=np.float64)
+    for j in prange(nwalkers):
+        xnow = start[j, 0]
+        ynow = start[j, 1]
+        znow = start[j, 2]
+        pos[j, 0, 0] = xnow
+        pos[j, 0, 1] = ynow
+        pos[j, 0, 2] = znow
+        for i in range(0, length):
+            sint = np.sin(trand[j, i])
+            xnow += steps[j, i] * np.cos(prand[j, i]) * sint
+            ynow += steps[j, i] * np.sin(prand[j, i]) * sint
+            znow += steps[j, i] * np.cos(trand[j, i])
+            if useperiodic == 1:
+                xnow = periodicboundary(xnow, boxsize)
+                ynow = periodicboundary(ynow, boxsize)
+                znow = periodicboundary(znow, boxsize)
+            pos[j, i + 1, 0] = xnow
+            pos[j, i + 1, 1] = ynow
+            pos[j, i + 1, 2] = znow
+    return pos
+
+
+@njit(parallel=True, cache=True)
+def randwalkusphere_batch(
+    steps: np.ndarray, prand: np.ndarray, start: np.ndarray
+) -> np.ndarray:
+    """
+    Generates many independent random walks on a unit sphere, in parallel over walkers.
+
+    Parameters
+    ----------
+    steps : 2darray
+        Angular step sizes for each walker, shape (nwalkers, nsteps).
+    prand : 2darray
+        Random step directions for each walker, shape (nwalkers, nsteps).
+    start : 2darray
+        Starting phi and theta coordinates of each walker, shape (nwalkers, 2).
+
+    Returns
+    -------
+    pos : 3darray
+        Coordinates [phi, theta] of the random walks, shape (nwalkers, nsteps+1, 2).
+    """
+    nwalkers, length = steps.shape
+    pos = np.zeros((nwalkers, length + 1, 2), dtype=np.float64)
+    for j in prange(nwalkers):
+        pos[j, 0, 0] = start[j, 0]
+        pos[j, 0, 1] = start[j, 1]
+        randwalkusphere_inplace(pos[j], steps[j], prand[j])
+    return pos
@@ -3,7 +3,7 @@ from numba import njit
 from typing import Tuple
 
 
-@njit
+@njit(cache=True)
 def periodicboundary(x: float, boxsize: float) -> float:
     """
     Ensures particles remain within a periodic box.
@@ -20,15 +20,12 @@ def periodicboundary(x: float, boxsize: float) -> float:
     x : float
         Adjusted position value.
     """
-    while x < 0.0 or x > boxsize:
-        if x < 0.0:
-            x += boxsize
-        elif x > boxsize:
-            x -= boxsize
+    if x < 0.0 or x > boxsize:
+        x -= boxsize * np.floor(x / boxsize)
     return x
 
 
-@njit
+@njit(cache=True)
 def randwalkcart2d(
     steps: np.ndarray,
     prand: np.ndarray,
@@ -86,7 +83,7 @@ def randwalkcart2d(
     return x, y
 
 
-@njit
+@njit(cache=True)
 def randwalkcart3d(
     steps: np.ndarray,
     prand: np.ndarray,
@@ -151,3 +148,164 @@ def randwalkcart3d(
         z[i+1] = znow
 
     return x, y, z
+
+
+@njit(cache=True)
+def levystep(
+    u: float, t0: float, ts: float, alpha: float, beta: float, gamma: float, adjusted: int
+) -> float:
+    """
+    Transforms a uniform random into a Levy flight step.
+
+    Parameters
+    ----------
+    u : float
+        Uniform random between [0, 1].
+    t0, ts, alpha, beta, gamma : float
+        Parameters of the (adjusted) Levy flight model, ts, beta and gamma are
+        ignored for the standard model.
+    adjusted : int
+        0 = standard Levy flight model.
+        1 = adjusted Levy flight model.
+
+    Returns
+    -------
+    step : float
+        Random walk step.
+    """
+    if adjusted == 0:
+        return t0 * (1.0 - u) ** (-1.0 / alpha)
+    if u < beta:
+        return (t0 - ts) * ((u / beta) ** (1.0 / gamma)) + ts
+    return t0 * (1.0 + ((beta - u) / (1.0 - beta))) ** (-1.0 / alpha)
+
+
+@njit(cache=True)
+def _walkcart(
+    pos: np.ndarray,
+    steps: np.ndarray,
+    params: np.ndarray,
+    adjusted: int,
+    boxsize: float,
+    useperiodic: int,
+    u: np.ndarray,
+) -> np.ndarray:
+    """
+    Fills pos[1:] with a 2D or 3D random walk starting from pos[0]. Step
+    directions are transformed from the uniform randoms, as are the step sizes
+    when steps is empty.
+    """
+    ndim = pos.shape[1]
+    length = pos.shape[0] - 1
+    usesteps = len(steps) > 0
+    col = 0
+    if not usesteps:
+        col = 1
+    t0, ts, alpha, beta, gamma = params[0], params[1], params[2], params[3], params[4]
+    xnow = pos[0, 0]
+    ynow = pos[0, 1]
+    znow = 0.0
+    if ndim == 3:
+        znow = pos[0, 2]
+    for i in range(0, length):
+        if usesteps:
+            step = steps[i]
+        else:
+            step = levystep(u[i, 0], t0, ts, alpha, beta, gamma, adjusted)
+        phi = 2.0 * np.pi * u[i, col]
+        if ndim == 2:
+            xnow += step * np.cos(phi)
+            ynow += step * np.sin(phi)
+        else:
+            cost = 1.0 - 2.0 * u[i, col + 1]
+            sint = np.sqrt(1.0 - cost * cost)
+            xnow += step * np.cos(phi) * sint
+            ynow += step * np.sin(phi) * sint
+            znow += step * cost
+        if useperiodic == 1:
+            xnow = periodicboundary(xnow, boxsize)
+            ynow = periodicboundary(ynow, boxsize)
+            znow = periodicboundary(znow, boxsize)
+        pos[i + 1, 0] = xnow
+        pos[i + 1, 1] = ynow
+        if ndim == 3:
+            pos[i + 1, 2] = znow
+    return pos
+
+
+@njit(cache=True)
+def randwalkcart_inplace(
+    pos: np.ndarray, steps: np.ndarray, boxsize: float, useperiodic: int, u: np.ndarray
+) -> np.ndarray:
+    """
+    Generates a random walk on a 2D or 3D grid for given step sizes, writing
+    directly into a preallocated buffer.
+
+    Parameters
+    ----------
+    pos : 2darray
+        Output buffer of shape (size+1, D) with D=2 or 3, where pos[0] holds the
+        starting coordinates.
+    steps : ndarray
+        Array of step sizes, of length size.
+    boxsize : float
+        Box size.
+    useperiodic : int
+        0 = does not enforce periodic boundary conditions.
+        1 = enforces periodic boundary conditions.
+    u : 2darray
+        Uniform randoms of shape (size, D-1) giving the step directions.
+
+    Returns
+    -------
+    pos : 2darray
+        Coordinates of the random walk simulation.
+    """
+    params = np.zeros(5)
+    return _walkcart(pos, steps, params, 0, boxsize, useperiodic, u)
+
+
+@njit(cache=True)
+def levywalkcart_inplace(
+    pos: np.ndarray,
+    t0: float,
+    ts: float,
+    alpha: float,
+    beta: float,
+    gamma: float,
+    adjusted: int,
+    boxsize: float,
+    useperiodic: int,
+    u: np.ndarray,
+) -> np.ndarray:
+    """
+    Generates a Levy flight on a 2D or 3D grid, writing directly into a
+    preallocated buffer. The step sizes are transformed from the uniform randoms
+    inside the kernel, so they are not stored.
+
+    Parameters
+    ----------
+    pos : 2darray
+        Output buffer of shape (size+1, D) with D=2 or 3, where pos[0] holds the
+        starting coordinates.
+    t0, ts, alpha, beta, gamma : float
+        Parameters of the (adjusted) Levy flight model.
+    adjusted : int
+        0 = standard Levy flight model.
+        1 = adjusted Levy flight model.
+    boxsize : float
+        Box size.
+    useperiodic : int
+        0 = does not enforce periodic boundary conditions.
+        1 = enforces periodic boundary conditions.
+    u : 2darray
+        Uniform randoms of shape (size, D), giving the step size and directions.
+
+    Returns
+    -------
+    pos : 2darray
+        Coordinates of the Levy flight simulation.
+    """
+    steps = np.zeros(0)
+    params = np.array([t0, ts, alpha, beta, gamma])
+    return _walkcart(pos, steps, params, adjusted, boxsize, useperiodic, u)
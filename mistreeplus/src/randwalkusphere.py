@@ -5,7 +5,7 @@ from typing import Tuple
 from . import linalg
 
 
-@njit
+@njit(cache=True)
 def usphererotate(
     phi: float,
     theta: float,
@@ -92,7 +92,7 @@ def usphererotate(
         return phi_new, theta_new
 
 
-@njit
+@njit(cache=True)
 def randwalkusphere(
     steps: int, prand: np.ndarray, phi0: float, theta0: float
 ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
@@ -141,3 +141,110 @@ def randwalkusphere(
         theta[i+1] = thetanow
 
     return phi, theta
+
+
+@njit(cache=True)
+def uspherestep(
+    px: float, py: float, pz: float, dphi: float, dtheta: float
+) -> Tuple[float, float, float]:
+    """
+    Advances a Cartesian unit vector by one random walk step on the unit sphere,
+    using a Rodrigues rotation that takes the north pole onto the current position.
+
+    Parameters
+    ----------
+    px, py, pz : float
+        Current position as a Cartesian unit vector.
+    dphi : float
+        Direction of the step.
+    dtheta : float
+        Angular size of the step.
+
+    Returns
+    -------
+    px, py, pz : float
+        New position as a Cartesian unit vector.
+    """
+    sint = np.sin(dtheta)
+    qx = np.cos(dphi) * sint
+    qy = np.sin(dphi) * sint
+    qz = np.cos(dtheta)
+    s = np.sqrt(px * px + py * py)
+    if s == 0.0:
+        if pz > 0.0:
+            return qx, qy, qz
+        return -qx, qy, -qz
+    # Rotation axis n = z x p / |z x p| lies in the xy-plane, and the rotation angle
+    # has cos = pz and sin = s.
+    nx = -py / s
+    ny = px / s
+    ndotq = (nx * qx + ny * qy) * (1.0 - pz)
+    xnew = qx * pz + ny * qz * s + nx * ndotq
+    ynew = qy * pz - nx * qz * s + ny * ndotq
+    znew = qz * pz + (nx * qy - ny * qx) * s
+    r = np.sqrt(xnew * xnew + ynew * ynew + znew * znew)
+    return xnew / r, ynew / r, znew / r
+
+
+@njit(cache=True)
+def randwalkusphere_inplace(pos: np.ndarray, steps: np.ndarray, prand: np.ndarray) -> np.ndarray:
+    """
+    Generates a random walk on a unit sphere, writing directly into a preallocated
+    buffer. The position is kept as a Cartesian unit vector and is only converted to
+    spherical coordinates when written to the output.
+
+    Parameters
+    ----------
+    pos : 2darray
+        Output buffer of shape (size+1, 2), where pos[0] holds the starting phi and
+        theta coordinates.
+    steps : ndarray
+        Array of angular step sizes, of length size.
+    prand : ndarray
+        Random step directions, of length size.
+
+    Returns
+    -------
+    pos : 2darray
+        Coordinates [phi, theta] of the random walk simulation.
+    """
+    sint = np.sin(pos[0, 1])
+    px = np.cos(pos[0, 0]) * sint
+    py = np.sin(pos[0, 0]) * sint
+    pz = np.cos(pos[0, 1])
+    for i in range(0, len(steps)):
+        px, py, pz = uspherestep(px, py, pz, prand[i], steps[i])
+        phinew = np.arctan2(py, px)
+        if phinew < 0.0:
+            phinew += 2.0 * np.pi
+        pos[i + 1, 0] = phinew
+        pos[i + 1, 1] = np.arccos(min(max(pz, -1.0), 1.0))
+    return pos
+
+
+@njit(cache=True)
+def randwalkusphere_rodrigues(
+    steps: np.ndarray, prand: np.ndarray, phi0: float, theta0: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Generates a random walk on a unit sphere, a faster equivalent of randwalkusphere.
+
+    Parameters
+    ----------
+    steps : ndarray
+        Array of angular step sizes.
+    prand : ndarray
+        Random step directions.
+    phi0, theta0 : float
+        Starting phi and theta coordinates.
+
+    Returns
+    -------
+    phi, theta : ndarray
+        Coordinates of the random walk simulation.
+    """
+    pos = np.zeros((len(steps) + 1, 2))
+    pos[0, 0] = phi0
+    pos[0, 1] = theta0
+    randwalkusphere_inplace(pos, steps, prand)
+    return pos[:, 0].copy(), pos[:, 1].copy()
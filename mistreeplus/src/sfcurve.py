@@ -0,0 +1,88 @@
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def mortonkeys(ivert: np.ndarray, bits: int) -> np.ndarray:
+    """
+    Computes the Morton (Z-order) key of integer coordinates by interleaving their
+    bits, the first axis giving the most significant bit of each level.
+
+    Parameters
+    ----------
+    ivert : 2darray
+        Non-negative integer coordinates in vertices format, below 2^bits.
+    bits : int
+        Number of bits per axis, with bits x ndim <= 63.
+
+    Returns
+    -------
+    keys : array
+        Morton keys.
+    """
+    npts, ndim = ivert.shape
+    keys = np.zeros(npts, dtype=np.int64)
+    for p in range(npts):
+        key = 0
+        for b in range(bits - 1, -1, -1):
+            for i in range(ndim):
+                key = (key << 1) | ((ivert[p, i] >> b) & 1)
+        keys[p] = key
+    return keys
+
+
+@njit(cache=True)
+def hilbertkeys(ivert: np.ndarray, bits: int) -> np.ndarray:
+    """
+    Computes the Hilbert curve key of integer coordinates, using Skilling's
+    transform of the axes to the transposed Hilbert index, whose bits are then
+    interleaved as for a Morton key.
+
+    Parameters
+    ----------
+    ivert : 2darray
+        Non-negative integer coordinates in vertices format, below 2^bits.
+    bits : int
+        Number of bits per axis, with bits x ndim <= 63.
+
+    Returns
+    -------
+    keys : array
+        Hilbert keys.
+    """
+    npts, ndim = ivert.shape
+    keys = np.zeros(npts, dtype=np.int64)
+    x = np.zeros(ndim, dtype=np.int64)
+    top = 1 << (bits - 1)
+    for p in range(npts):
+        for i in range(ndim):
+            x[i] = ivert[p, i]
+        # inverse undo
+        q = top
+        while q > 1:
+            mask = q - 1
+            for i in range(ndim):
+                if x[i] & q:
+                    x[0] ^= mask
+                else:
+                    t = (x[0] ^ x[i]) & mask
+                    x[0] ^= t
+                    x[i] ^= t
+            q >>= 1
+        # Gray encode
+        for i in range(1, ndim):
+            x[i] ^= x[i - 1]
+        t = 0
+        q = top
+        while q > 1:
+            if x[ndim - 1] & q:
+                t ^= q - 1
+            q >>= 1
+        for i in range(ndim):
+            x[i] ^= t
+        key = 0
+        for b in range(bits - 1, -1, -1):
+            for i in range(ndim):
+                key = (key << 1) | ((x[i] >> b) & 1)
+        keys[p] = key
+    return keys
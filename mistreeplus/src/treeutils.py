@@ -2,7 +2,7 @@ import numpy as np
 from numba import njit
 
 
-@njit
+@njit(cache=True)
 def add2centrality(centrality: np.ndarray, idx1: int, idx2: int) -> np.ndarray:
     """
     Add to centrality array in place.
@@ -19,4 +19,65 @@ def add2centrality(centrality: np.ndarray, idx1: int, idx2: int) -> np.ndarray:
     """
     for i in range(len(idx1)):
         centrality[idx1[i]] += centrality[idx2[i]]
-    return centrality
\ No newline at end of file
+    return centrality
+
+
+@njit(cache=True)
+def steinermask(
+    idx1: np.ndarray, idx2: np.ndarray, nnodes: int, terminal: np.ndarray
+) -> np.ndarray:
+    """
+    Finds the edges of a tree on the paths between terminal nodes, by pruning
+    leaves which are not terminals until none are left.
+
+    Parameters
+    ----------
+    idx1, idx2 : int array
+        Node indices at each end of the tree edges.
+    nnodes : int
+        Number of nodes.
+    terminal : bool array
+        True for terminal nodes.
+
+    Returns
+    -------
+    mask : bool array
+        True for edges of the subtree spanning the terminals.
+    """
+    nedges = len(idx1)
+    degree = np.zeros(nnodes, dtype=np.int64)
+    for i in range(nedges):
+        degree[idx1[i]] += 1
+        degree[idx2[i]] += 1
+    indptr = np.zeros(nnodes + 1, dtype=np.int64)
+    for i in range(nnodes):
+        indptr[i + 1] = indptr[i] + degree[i]
+    fill = indptr[:-1].copy()
+    incident = np.empty(2 * nedges, dtype=np.int64)
+    for i in range(nedges):
+        incident[fill[idx1[i]]] = i
+        fill[idx1[i]] += 1
+        incident[fill[idx2[i]]] = i
+        fill[idx2[i]] += 1
+    mask = np.ones(nedges, dtype=np.bool_)
+    stack = np.empty(nnodes, dtype=np.int64)
+    nstack = 0
+    for i in range(nnodes):
+        if degree[i] == 1 and not terminal[i]:
+            stack[nstack] = i
+            nstack += 1
+    while nstack > 0:
+        nstack -= 1
+        node = stack[nstack]
+        for j in range(indptr[node], indptr[node + 1]):
+            edge = incident[j]
+            if mask[edge]:
+                mask[edge] = False
+                other = idx1[edge] + idx2[edge] - node
+                degree[node] -= 1
+                degree[other] -= 1
+                if degree[other] == 1 and not terminal[other]:
+                    stack[nstack] = other
+                    nstack += 1
+                break
+    return mask
@@ -0,0 +1,303 @@
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def uf_find(parent: np.ndarray, i: int) -> int:
+    """
+    Finds the root of a node in a union-find forest, halving the path on the way.
+
+    Parameters
+    ----------
+    parent : int array
+        Parent of each node.
+    i : int
+        Node index.
+
+    Returns
+    -------
+    root : int
+        Root of the node's set.
+    """
+    while parent[i] != i:
+        parent[i] = parent[parent[i]]
+        i = parent[i]
+    return i
+
+
+@njit(cache=True)
+def uf_union(parent: np.ndarray, size: np.ndarray, i: int, j: int) -> int:
+    """
+    Merges the sets of two nodes, attaching the smaller set to the larger.
+
+    Parameters
+    ----------
+    parent : int array
+        Parent of each node.
+    size : int array
+        Size of the set of each root.
+    i, j : int
+        Node indices.
+
+    Returns
+    -------
+    root : int
+        Root of the merged set, or -1 if the nodes were already in the same set.
+    """
+    ri = uf_find(parent, i)
+    rj = uf_find(parent, j)
+    if ri == rj:
+        return -1
+    if size[ri] < size[rj]:
+        ri, rj = rj, ri
+    parent[rj] = ri
+    size[ri] += size[rj]
+    return ri
+
+
+@njit(cache=True)
+def uf_labels(parent: np.ndarray) -> np.ndarray:
+    """
+    Returns compact set labels, numbered in order of first appearance.
+
+    Parameters
+    ----------
+    parent : int array
+        Parent of each node.
+
+    Returns
+    -------
+    labels : int array
+        Set label of each node.
+    """
+    nnodes = len(parent)
+    rootlabel = -np.ones(nnodes, dtype=np.int64)
+    labels = np.empty(nnodes, dtype=np.int64)
+    nlabels = 0
+    for i in range(nnodes):
+        root = uf_find(parent, i)
+        if rootlabel[root] == -1:
+            rootlabel[root] = nlabels
+            nlabels += 1
+        labels[i] = rootlabel[root]
+    return labels
+
+
+@njit(cache=True)
+def uf_roots(parent: np.ndarray, nodes: np.ndarray) -> np.ndarray:
+    """
+    Finds the roots of several nodes in a union-find forest.
+
+    Parameters
+    ----------
+    parent : int array
+        Parent of each node.
+    nodes : int array
+        Node indices.
+
+    Returns
+    -------
+    roots : int array
+        Root of each node's set.
+    """
+    roots = np.empty(len(nodes), dtype=np.int64)
+    for i in range(len(nodes)):
+        roots[i] = uf_find(parent, nodes[i])
+    return roots
+
+
+@njit(cache=True)
+def uf_kruskal(
+    parent: np.ndarray, size: np.ndarray, idx1: np.ndarray, idx2: np.ndarray
+) -> np.ndarray:
+    """
+    Merges the sets joined by edges in turn, as in Kruskal's algorithm when the
+    edges are sorted by increasing weight.
+
+    Parameters
+    ----------
+    parent : int array
+        Parent of each node.
+    size : int array
+        Size of the set of each root.
+    idx1, idx2 : int array
+        Node indices at each end of the edges.
+
+    Returns
+    -------
+    accepted : bool array
+        True for edges which joined two different sets.
+    """
+    accepted = np.zeros(len(idx1), dtype=np.bool_)
+    for i in range(len(idx1)):
+        accepted[i] = uf_union(parent, size, idx1[i], idx2[i]) != -1
+    return accepted
+
+
+@njit(cache=True)
+def unionfind_labels(idx1: np.ndarray, idx2: np.ndarray, nnodes: int) -> np.ndarray:
+    """
+    Finds the connected components of a graph with union-find.
+
+    Parameters
+    ----------
+    idx1, idx2 : int array
+        Node indices at each end of the edges.
+    nnodes : int
+        Number of nodes.
+
+    Returns
+    -------
+    labels : int array
+        Component label of each node, numbered in order of first appearance.
+    """
+    parent = np.arange(nnodes)
+    size = np.ones(nnodes, dtype=np.int64)
+    for i in range(len(idx1)):
+        uf_union(parent, size, idx1[i], idx2[i])
+    return uf_labels(parent)
+
+
+@njit(cache=True)
+def fof_sweep(idx1: np.ndarray, idx2: np.ndarray, nnodes: int, cuts: np.ndarray) -> np.ndarray:
+    """
+    Finds group labels for several linking lengths in one sweep over edges sorted
+    by increasing length.
+
+    Parameters
+    ----------
+    idx1, idx2 : int array
+        Node indices at each end of the edges, sorted by increasing edge length.
+    nnodes : int
+        Number of nodes.
+    cuts : int array
+        For each linking length, in increasing order, the number of edges shorter
+        than or equal to it.
+
+    Returns
+    -------
+    labels : 2darray
+        Group label of each node for each linking length, shape (len(cuts), nnodes).
+    """
+    parent = np.arange(nnodes)
+    size = np.ones(nnodes, dtype=np.int64)
+    labels = np.empty((len(cuts), nnodes), dtype=np.int64)
+    j = 0
+    for i in range(len(cuts)):
+        while j < cuts[i]:
+            uf_union(parent, size, idx1[j], idx2[j])
+            j += 1
+        labels[i] = uf_labels(parent)
+    return labels
+
+
+@njit(cache=True)
+def linkage_sweep(
+    idx1: np.ndarray, idx2: np.ndarray, weights: np.ndarray, nnodes: int
+) -> np.ndarray:
+    """
+    Constructs the single-linkage dendrogram from edges sorted by increasing length.
+
+    Parameters
+    ----------
+    idx1, idx2 : int array
+        Node indices at each end of the edges, sorted by increasing edge length.
+    weights : array
+        Sorted edge lengths.
+    nnodes : int
+        Number of nodes.
+
+    Returns
+    -------
+    linkage : 2darray
+        Linkage matrix in the scipy.cluster.hierarchy format, one row per merge with
+        the two merged cluster indices, the merge distance and the new cluster size.
+    """
+    parent = np.arange(nnodes)
+    size = np.ones(nnodes, dtype=np.int64)
+    clusterid = np.arange(nnodes)
+    linkage = np.empty((min(len(idx1), nnodes - 1), 4))
+    nmerge = 0
+    for i in range(len(idx1)):
+        ri = uf_find(parent, idx1[i])
+        rj = uf_find(parent, idx2[i])
+        if ri == rj:
+            continue
+        ci = clusterid[ri]
+        cj = clusterid[rj]
+        root = uf_union(parent, size, ri, rj)
+        linkage[nmerge, 0] = min(ci, cj)
+        linkage[nmerge, 1] = max(ci, cj)
+        linkage[nmerge, 2] = weights[i]
+        linkage[nmerge, 3] = size[root]
+        clusterid[root] = nnodes + nmerge
+        nmerge += 1
+    return linkage[:nmerge]
+
+
+@njit(cache=True)
+def percolation_sweep(
+    idx1: np.ndarray, idx2: np.ndarray, nnodes: int, cuts: np.ndarray, maxdegree: int
+) -> tuple:
+    """
+    Records percolation statistics for increasing edge length thresholds in one
+    sweep over edges sorted by increasing length.
+
+    Parameters
+    ----------
+    idx1, idx2 : int array
+        Node indices at each end of the edges, sorted by increasing edge length.
+    nnodes : int
+        Number of nodes.
+    cuts : int array
+        For each threshold, in increasing order, the number of edges included.
+    maxdegree : int
+        Maximum degree recorded in the degree histograms, higher degrees are
+        counted in the last bin.
+
+    Returns
+    -------
+    ngroups : int array
+        Number of groups at each threshold.
+    giant : int array
+        Size of the largest group at each threshold.
+    sum2 : float array
+        Sum of the squared group sizes at each threshold.
+    degree_hist : 2darray
+        Number of nodes with degree 0 to maxdegree at each threshold.
+    """
+    parent = np.arange(nnodes)
+    size = np.ones(nnodes, dtype=np.int64)
+    degree = np.zeros(nnodes, dtype=np.int64)
+    hist = np.zeros(maxdegree + 1, dtype=np.int64)
+    hist[0] = nnodes
+    ngroups = np.empty(len(cuts), dtype=np.int64)
+    giant = np.empty(len(cuts), dtype=np.int64)
+    sum2 = np.empty(len(cuts), dtype=np.float64)
+    degree_hist = np.empty((len(cuts), maxdegree + 1), dtype=np.int64)
+    _ngroups = nnodes
+    _giant = min(nnodes, 1)
+    _sum2 = float(nnodes)
+    j = 0
+    for i in range(len(cuts)):
+        while j < cuts[i]:
+            for node in (idx1[j], idx2[j]):
+                hist[min(degree[node], maxdegree)] -= 1
+                degree[node] += 1
+                hist[min(degree[node], maxdegree)] += 1
+            ri = uf_find(parent, idx1[j])
+            rj = uf_find(parent, idx2[j])
+            if ri != rj:
+                si = float(size[ri])
+                sj = float(size[rj])
+                root = uf_union(parent, size, ri, rj)
+                _sum2 += 2.0 * si * sj
+                _ngroups -= 1
+                if size[root] > _giant:
+                    _giant = size[root]
+            j += 1
+        ngroups[i] = _ngroups
+        giant[i] = _giant
+        sum2[i] = _sum2
+        degree_hist[i] = hist
+    return ngroups, giant, sum2, degree_hist
@@ -0,0 +1,188 @@
+import numpy as np
+import time
+from typing import List, Tuple
+
+from . import coordconv
+from . import delaunayutils
+from . import mststats
+from . import randwalkbatch
+from . import randwalkcart
+from . import sfcurve
+from . import treeutils
+from . import unionfind
+
+# the randwalkusphere module is shadowed by its function of the same name in src
+from .randwalkusphere import randwalkusphere, randwalkusphere_inplace
+from .randwalkusphere import randwalkusphere_rodrigues
+
+
+def _float_kernel_calls(dtype: type) -> List[Tuple[str, callable, tuple]]:
+    """
+    Returns the kernel calls whose coordinates can be given in a float dtype.
+
+    Parameters
+    ----------
+    dtype : type
+        Float dtype of the coordinates and output buffers.
+
+    Returns
+    -------
+    calls : list
+        List of (name, kernel, arguments).
+    """
+    x = np.linspace(0.1, 1.0, 4).astype(dtype)
+    calls = []
+    for celestial in [0, 1]:
+        for degs in [0, 1]:
+            out = np.empty((4, 3), dtype=dtype)
+            calls.append(("sphere2vert", coordconv.sphere2vert, (x, x, x, 1, celestial, degs, out)))
+            calls.append(
+                ("sphere2vert", coordconv.sphere2vert, (np.zeros(0), x, x, 0, celestial, degs, out))
+            )
+            calls.append(
+                ("vert2sphere", coordconv.vert2sphere, (out, celestial, degs, np.empty_like(out)))
+            )
+    return calls
+
+
+def _index_kernel_calls(itype: type) -> List[Tuple[str, callable, tuple]]:
+    """
+    Returns the kernel calls taking node index arrays of an integer dtype.
+
+    Parameters
+    ----------
+    itype : type
+        Integer dtype of the node index arrays.
+
+    Returns
+    -------
+    calls : list
+        List of (name, kernel, arguments).
+    """
+    idx1 = np.array([0, 1, 2], dtype=itype)
+    idx2 = np.array([1, 2, 3], dtype=itype)
+    cuts = np.array([1, 3], dtype=np.int64)
+    indptr = np.array([0, 1, 3, 5, 6], dtype=itype)
+    indices = np.array([1, 0, 2, 1, 3, 2], dtype=itype)
+    vert = np.zeros((4, 3))
+    return [
+        ("csrupperedges", delaunayutils.csrupperedges, (indptr, indices, vert)),
+        ("csredgelengths", delaunayutils.csredgelengths, (indptr, indices, vert)),
+        (
+            "gabrieltest",
+            delaunayutils.gabrieltest,
+            (indptr, indices, vert, idx1, idx2, 1e-10),
+        ),
+        ("rngtest", delaunayutils.rngtest, (indptr, indices, vert, idx1, idx2, 1e-10)),
+        ("getgraphdegree", mststats.getgraphdegree, (idx1, idx2, 4)),
+        ("add2centrality", treeutils.add2centrality, (np.ones(4), idx1, idx2)),
+        ("steinermask", treeutils.steinermask, (idx1, idx2, 4, np.ones(4, dtype=bool))),
+        ("uf_roots", unionfind.uf_roots, (np.arange(4), idx1)),
+        ("uf_kruskal", unionfind.uf_kruskal, (np.arange(4), np.ones(4, dtype=np.int64), idx1, idx2)),
+        ("unionfind_labels", unionfind.unionfind_labels, (idx1, idx2, 4)),
+        ("fof_sweep", unionfind.fof_sweep, (idx1, idx2, 4, cuts)),
+        ("linkage_sweep", unionfind.linkage_sweep, (idx1, idx2, np.ones(3), 4)),
+        ("percolation_sweep", unionfind.percolation_sweep, (idx1, idx2, 4, cuts, 6)),
+    ]
+
+
+def _sfc_kernel_calls() -> List[Tuple[str, callable, tuple]]:
+    """
+    Returns the space filling curve kernel calls, these always take int64
+    coordinates.
+
+    Returns
+    -------
+    calls : list
+        List of (name, kernel, arguments).
+    """
+    calls = []
+    for ndim in [2, 3]:
+        ivert = np.zeros((4, ndim), dtype=np.int64)
+        calls.append(("mortonkeys", sfcurve.mortonkeys, (ivert, 4)))
+        calls.append(("hilbertkeys", sfcurve.hilbertkeys, (ivert, 4)))
+    return calls
+
+
+def _walk_kernel_calls() -> List[Tuple[str, callable, tuple]]:
+    """
+    Returns the random walk kernel calls, these always work in float64.
+
+    Returns
+    -------
+    calls : list
+        List of (name, kernel, arguments).
+    """
+    steps = np.full(3, 0.1)
+    prand = np.full(3, 0.5)
+    start2 = np.zeros((2, 2))
+    start3 = np.zeros((2, 3))
+    bsteps = np.full((2, 3), 0.1)
+    bprand = np.full((2, 3), 0.5)
+    u = np.full((3, 3), 0.5)
+    return [
+        ("randwalkcart2d", randwalkcart.randwalkcart2d, (steps, prand, 1.0, 0.0, 0.0, True)),
+        ("randwalkcart3d", randwalkcart.randwalkcart3d, (steps, prand, prand, 1.0, 0.0, 0.0, 0.0, True)),
+        ("randwalkcart_inplace", randwalkcart.randwalkcart_inplace, (np.zeros((4, 2)), steps, 1.0, 1, u)),
+        ("randwalkcart_inplace", randwalkcart.randwalkcart_inplace, (np.zeros((4, 3)), steps, 1.0, 1, u)),
+        (
+            "levywalkcart_inplace",
+            randwalkcart.levywalkcart_inplace,
+            (np.zeros((4, 2)), 0.2, 0.1, 1.5, 0.5, 1.0, 0, 1.0, 1, u),
+        ),
+        (
+            "levywalkcart_inplace",
+            randwalkcart.levywalkcart_inplace,
+            (np.zeros((4, 3)), 0.2, 0.1, 1.5, 0.5, 1.0, 0, 1.0, 1, u),
+        ),
+        ("randwalkusphere", randwalkusphere, (steps, prand, 0.5, 0.5)),
+        ("randwalkusphere_inplace", randwalkusphere_inplace, (np.full((4, 2), 0.5), steps, prand)),
+        ("randwalkusphere_rodrigues", randwalkusphere_rodrigues, (steps, prand, 0.5, 0.5)),
+        ("randwalkcart2d_batch", randwalkbatch.randwalkcart2d_batch, (bsteps, bprand, 1.0, start2, 1)),
+        ("randwalkcart3d_batch", randwalkbatch.randwalkcart3d_batch, (bsteps, bprand, bprand, 1.0, start3, 1)),
+        ("randwalkusphere_batch", randwalkbatch.randwalkusphere_batch, (bsteps, bprand, start2 + 0.5)),
+    ]
+
+
+def warmup(
+    float_dtypes: Tuple[type, ...] = (np.float64, np.float32),
+    index_dtypes: Tuple[type, ...] = (np.int32, np.int64),
+    verbose: bool = False,
+) -> dict:
+    """
+    Compiles all numba kernels ahead of time, for the coordinate and node index
+    dtypes used by the package, so that the first call of a pipeline does not pay
+    for compilation. The kernels are cached on disk, so in a later process this
+    only loads them from the cache.
+
+    Parameters
+    ----------
+    float_dtypes : tuple, optional
+        Float dtypes of the coordinate conversion kernels, all other kernels work in
+        float64.
+    index_dtypes : tuple, optional
+        Integer dtypes of the node index arrays, sparse graphs give int32 indices.
+    verbose : bool, optional
+        Prints the time spent on each kernel.
+
+    Returns
+    -------
+    timings : dict
+        Time in seconds spent compiling or loading each kernel.
+    """
+    calls = []
+    for dtype in float_dtypes:
+        calls += _float_kernel_calls(dtype)
+    for itype in index_dtypes:
+        calls += _index_kernel_calls(itype)
+    calls += _sfc_kernel_calls()
+    calls += _walk_kernel_calls()
+    timings = {}
+    for name, kernel, args in calls:
+        t0 = time.perf_counter()
+        kernel(*args)
+        timings[name] = timings.get(name, 0.0) + time.perf_counter() - t0
+    if verbose:
+        for name in timings:
+            print("%-28s %8.3fs" % (name, timings[name]))
+    return timings
@@ -0,0 +1,10 @@
+from .tracer import register_callback
+from .tracer import unregister_callback
+from .tracer import enable_tracing
+from .tracer import disable_tracing
+from .tracer import is_tracing
+from .tracer import tracing
+from .tracer import traced
+from .tracer import measure
+from .tracer import get_traced_memory
+from .tracer import folded_stacks
@@ -0,0 +1,368 @@
+import functools
+import inspect
+import numpy as np
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Callable, List, Optional, Tuple, Union
+
+# tracemalloc.reset_peak was added in python 3.9
+_HAS_RESET_PEAK = hasattr(tracemalloc, "reset_peak")
+
+
+class _TraceState:
+    """Global tracing state, the enabled flag is the only thing read when tracing is off."""
+
+    def __init__(self):
+        self.enabled = False
+        self.memory = False
+        self.started_tracemalloc = False
+        self.callbacks = []
+        self.local = threading.local()
+        # largest tracemalloc peak cleared by measured blocks, see get_traced_memory
+        self.peak = 0
+
+
+_state = _TraceState()
+
+
+def register_callback(callback: Callable) -> Callable:
+    """
+    Registers a function to be called with the record of every traced call while
+    tracing is on.
+
+    Parameters
+    ----------
+    callback : callable
+        Function taking a single record dictionary, see traced.
+
+    Returns
+    -------
+    callback : callable
+        The registered function, so this can be used as a decorator.
+    """
+    if callback not in _state.callbacks:
+        _state.callbacks.append(callback)
+    return callback
+
+
+def unregister_callback(callback: Callable):
+    """
+    Removes a registered callback.
+
+    Parameters
+    ----------
+    callback : callable
+        Registered function.
+    """
+    if callback in _state.callbacks:
+        _state.callbacks.remove(callback)
+
+
+def enable_tracing(memory: bool = False):
+    """
+    Turns tracing on globally.
+
+    Parameters
+    ----------
+    memory : bool, optional
+        Records the bytes allocated by each call with tracemalloc, which slows down
+        python allocations.
+    """
+    if memory == True and not tracemalloc.is_tracing():
+        tracemalloc.start()
+        _state.started_tracemalloc = True
+        _state.peak = 0
+    _state.memory = memory
+    _state.enabled = True
+
+
+def disable_tracing():
+    """Turns tracing off globally."""
+    _state.enabled = False
+    _state.memory = False
+    if _state.started_tracemalloc:
+        tracemalloc.stop()
+        _state.started_tracemalloc = False
+
+
+def is_tracing() -> bool:
+    """
+    Returns whether tracing is on.
+
+    Returns
+    -------
+    enabled : bool
+        True if tracing is on.
+    """
+    return _state.enabled
+
+
+@contextmanager
+def tracing(callback: Optional[Callable] = None, memory: bool = False):
+    """
+    Context manager turning tracing on for the enclosed code and collecting the
+    records of all traced calls.
+
+    Parameters
+    ----------
+    callback : callable, optional
+        Function called with each record, registered for the duration of the
+        context only.
+    memory : bool, optional
+        Records the bytes allocated by each call with tracemalloc.
+
+    Yields
+    ------
+    records : list
+        List the records are appended to, in the order the calls end.
+    """
+    records = []
+    was_enabled, was_memory = _state.enabled, _state.memory
+    register_callback(records.append)
+    if callback is not None:
+        register_callback(callback)
+    enable_tracing(memory=memory or was_memory)
+    try:
+        yield records
+    finally:
+        unregister_callback(records.append)
+        if callback is not None:
+            unregister_callback(callback)
+        if not was_enabled:
+            disable_tracing()
+        elif not was_memory:
+            disable_tracing()
+            enable_tracing(memory=False)
+
+
+def _get_size(value, edges: bool = False) -> Optional[int]:
+    """
+    Returns the number of nodes or edges represented by an argument.
+
+    Parameters
+    ----------
+    value : object
+        Argument, an int, an array, a list, a PointSet, a sparse graph or an edge
+        index array of shape (2, N).
+    edges : bool, optional
+        Interprets the argument as edges.
+
+    Returns
+    -------
+    size : int or None
+        Number of nodes or edges, None if this cannot be determined.
+    """
+    if value is None:
+        return None
+    if isinstance(value, (int, np.integer)):
+        return int(value)
+    if hasattr(value, "nnz"):
+        return int(value.nnz) if edges else int(value.shape[0])
+    shape = getattr(value, "shape", None)
+    if shape is not None:
+        if len(shape) == 2 and shape[0] == 2 and edges:
+            return int(shape[1])
+        return int(shape[0]) if len(shape) > 0 else None
+    try:
+        return len(value)
+    except TypeError:
+        return None
+
+
+def _get_argument(signature, args, kwargs, name):
+    """
+    Returns the value of a named argument of a call, None if it is not given. For
+    a tuple of names the first argument given is returned.
+    """
+    if name is None:
+        return None
+    try:
+        bound = signature.bind_partial(*args, **kwargs)
+    except TypeError:
+        return None
+    if isinstance(name, tuple):
+        return next(
+            (bound.arguments[n] for n in name if bound.arguments.get(n) is not None), None
+        )
+    return bound.arguments.get(name)
+
+
+def traced(
+    nodes: Optional[Union[str, Tuple[str, ...]]] = None, edges: Optional[str] = None
+) -> Callable:
+    """
+    Decorator reporting calls of a function to the registered callbacks while
+    tracing is on. When tracing is off the only cost is a check of a global flag.
+
+    Each record is a dictionary with:
+        - 'function' : the module and name of the function, e.g.
+          'mistreeplus.mst.construct.construct_mst'.
+        - 'nnodes', 'nedges' : the input sizes, None if not known.
+        - 'elapsed' : the wall time of the call in seconds.
+        - 'allocated' : the peak bytes allocated during the call, None unless
+          tracing with memory=True.
+        - 'net_allocated' : the bytes still allocated when the call ends, None
+          unless tracing with memory=True.
+        - 'stack' : the names of the enclosing traced calls and of this call, from
+          outermost to innermost, for flame graph style breakdowns.
+
+    Parameters
+    ----------
+    nodes : str or tuple of str, optional
+        Name of the argument giving the number of nodes, either directly as an int
+        or as the length of an array, list, PointSet or sparse graph. For a tuple
+        of names the first argument given is used.
+    edges : str, optional
+        Name of the argument giving the number of edges, either an edge index array
+        of shape (2, N), an edge length array or a sparse graph.
+
+    Returns
+    -------
+    decorator : callable
+        Function decorator.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        name = func.__module__ + "." + func.__qualname__
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _state.enabled:
+                return func(*args, **kwargs)
+            return _traced_call(func, name, signature, nodes, edges, args, kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def get_traced_memory() -> Tuple[int, int]:
+    """
+    Returns the current and peak memory traced by tracemalloc. Measured blocks
+    reset the tracemalloc peak to find their own, use this in place of
+    tracemalloc.get_traced_memory to get the peak including those blocks.
+
+    Returns
+    -------
+    current, peak : int
+        Traced bytes now and at the peak.
+    """
+    current, peak = tracemalloc.get_traced_memory()
+    return current, max(peak, _state.peak)
+
+
+@contextmanager
+def measure(memory: bool = False):
+    """
+    Context manager timing the enclosed code and measuring the peak memory traced
+    by tracemalloc during it. Measured blocks nest, the peak of an inner block is
+    included in the enclosing one, and the peak tracemalloc reports outside all
+    measured blocks is kept, see get_traced_memory. On python < 3.9 the peak of a
+    block also includes allocations made before it.
+
+    Parameters
+    ----------
+    memory : bool, optional
+        Measures the peak memory, if tracemalloc is tracing.
+
+    Yields
+    ------
+    result : dict
+        Dictionary filled in when the block ends, with:
+            - 'elapsed' : the wall time in seconds.
+            - 'start', 'current' : the traced bytes at the start and end of the
+              block, None unless measuring memory.
+            - 'peak' : the peak traced bytes during the block, None unless
+              measuring memory.
+    """
+    result = {"elapsed": None, "start": None, "current": None, "peak": None}
+    memory = memory and tracemalloc.is_tracing()
+    if memory:
+        frames = getattr(_state.local, "frames", None)
+        if frames is None:
+            frames = _state.local.frames = []
+        start, outer = tracemalloc.get_traced_memory()
+        frame = {"peak": 0}
+        if _HAS_RESET_PEAK:
+            # the peak is reset below, keep the enclosing block's peak so far
+            if len(frames) > 0:
+                frames[-1]["peak"] = max(frames[-1]["peak"], outer)
+            tracemalloc.reset_peak()
+        frames.append(frame)
+    t0 = time.perf_counter()
+    try:
+        yield result
+    finally:
+        result["elapsed"] = time.perf_counter() - t0
+        if memory:
+            frames.pop()
+            current, peak = tracemalloc.get_traced_memory()
+            peak = max(peak, frame["peak"])
+            if _HAS_RESET_PEAK:
+                if len(frames) > 0:
+                    frames[-1]["peak"] = max(frames[-1]["peak"], peak)
+                else:
+                    _state.peak = max(_state.peak, outer, peak)
+            result["start"], result["current"], result["peak"] = start, current, peak
+
+
+def _traced_call(func, name, signature, nodes, edges, args, kwargs):
+    """Calls a function and reports the call record to the registered callbacks."""
+    stack = getattr(_state.local, "stack", None)
+    if stack is None:
+        stack = _state.local.stack = []
+    stack.append(name)
+    try:
+        with measure(memory=_state.memory) as result:
+            return func(*args, **kwargs)
+    finally:
+        stack.pop()
+        allocated, net_allocated = None, None
+        if result["peak"] is not None:
+            allocated = result["peak"] - result["start"]
+            net_allocated = result["current"] - result["start"]
+        record = {
+            "function": name,
+            "nnodes": _get_size(_get_argument(signature, args, kwargs, nodes)),
+            "nedges": _get_size(_get_argument(signature, args, kwargs, edges), edges=True),
+            "elapsed": result["elapsed"],
+            "allocated": allocated,
+            "net_allocated": net_allocated,
+            "stack": tuple(stack) + (name,),
+        }
+        for callback in list(_state.callbacks):
+            callback(record)
+
+
+def folded_stacks(records: List[dict], scale: float = 1e6) -> List[str]:
+    """
+    Converts trace records into the folded stack format used by flame graph tools,
+    one line per call stack with its self time, i.e. excluding traced sub calls.
+
+    Parameters
+    ----------
+    records : list
+        Trace records.
+    scale : float, optional
+        Multiplies the times in seconds, by default giving microseconds.
+
+    Returns
+    -------
+    lines : list
+        Lines of 'outer;inner self_time', sorted by stack.
+    """
+    total = {}
+    for record in records:
+        stack = record["stack"]
+        total[stack] = total.get(stack, 0.0) + record["elapsed"]
+    selftime = dict(total)
+    for stack, elapsed in total.items():
+        if len(stack) > 1 and stack[:-1] in selftime:
+            selftime[stack[:-1]] -= elapsed
+    lines = []
+    for stack in sorted(total):
+        lines.append(";".join(stack) + " %d" % round(max(selftime[stack], 0.0) * scale))
+    return lines
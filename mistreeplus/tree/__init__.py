@@ -1,4 +1,5 @@
 from .adjacents import get_adjacents
+from .adjacents import get_adjacents_csr
 from .adjacents import smooth_stat_with_graph
 
 from .edges import get_edge_dict
@@ -12,11 +13,20 @@ from .percolate import percpath2weight
 from .percolate import percpath2percends
 from .percolate import percend_dist2D
 from .percolate import percend_dist3D
+from .percolate import percend_dist
 
 from .tree import adjacents2tree
+from .tree import get_tree_parents
 from .tree import findpath2root
 from .tree import findpath
 from .tree import get_path_weight
 from .tree import get_centrality
 from .tree import get_spine
 from .tree import get_spines
+
+from .spines import flatten_spines
+from .spines import get_spine_weight
+from .spines import get_spine_end_dist
+from .spines import get_spine_shape
+from .spines import get_spine_hierarchy
+from .spines import get_spine_level_hist
@@ -1,7 +1,11 @@
 import numpy as np
+from scipy.sparse import csr_matrix
 from typing import Tuple, List
 
+from .. import tracing
 
+
+@tracing.traced(nodes="Nnodes", edges="edge_idx")
 def get_adjacents(
     edge_idx: np.ndarray, wei: np.ndarray, Nnodes: int
 ) -> Tuple[List[int], List[float]]:
@@ -40,6 +44,38 @@ def get_adjacents(
     return adjacents_idx, adjacents_wei
 
 
+@tracing.traced(nodes="graph", edges="graph")
+def get_adjacents_csr(graph: csr_matrix) -> Tuple[List[int], List[float]]:
+    """
+    Returns the adjacency list directly from a sparse graph, e.g. the symmetric
+    adjacency given by graph.construct_del(points, return_adjacency=True), without
+    building the edge arrays first.
+
+    Parameters
+    ----------
+    graph : csr_matrix
+        A sparse matrix of the edges in a graph. Edges stored in only one direction
+        are symmetrised.
+
+    Returns
+    -------
+    adjacents_idx : list
+        List containing each adjacent node index in the graph or neighbours.
+    adjacents_wei : list
+        List containing each adjacent node weight in the graph or neighbours.
+    """
+    graph = csr_matrix(graph)
+    if (graph != graph.T).nnz > 0:
+        graph = graph.maximum(graph.T).tocsr()
+    graph.sum_duplicates()
+    graph.sort_indices()
+    splits = graph.indptr[1:-1]
+    adjacents_idx = [idx.tolist() for idx in np.split(graph.indices, splits)]
+    adjacents_wei = [wei.tolist() for wei in np.split(graph.data, splits)]
+    return adjacents_idx, adjacents_wei
+
+
+@tracing.traced(nodes="adj_idx")
 def smooth_stat_with_graph(adj_idx: List[int], stat: np.ndarray, iterations: int) -> np.ndarray:
     """
     Smooths a statistic iteratively by average across adjacent nodes.
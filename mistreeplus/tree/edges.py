@@ -1,6 +1,9 @@
 import numpy as np
 
+from .. import tracing
 
+
+@tracing.traced(edges="edge_idx")
 def get_edge_dict(
     edge_idx: np.ndarray, wei: np.ndarray, directed: bool = False
 ) -> dict:
@@ -1,8 +1,19 @@
 import numpy as np
-from typing import List
+from typing import List, Optional
 
+from .. import config
+from .. import coords
+from .. import tracing
 
-def get_groups(adjacents_idx: List[int], Nnodes: int, root: int = 0):
+
+@tracing.traced(nodes=("Nnodes", "points"))
+def get_groups(
+    adjacents_idx: List[int],
+    Nnodes: Optional[int] = None,
+    root: int = 0,
+    points: Optional[coords.PointSet] = None,
+    dtype: type = np.float64,
+):
     """
     Groups connecting parts of a graph as single entities.
 
@@ -10,20 +21,29 @@ def get_groups(adjacents_idx: List[int], Nnodes: int, root: int = 0):
     ----------
     adjacents_idx : list
         List containing each adjacent node idx in the graph or neighbours.
-    Nnodes : int
-        Number of nodes.
+    Nnodes : int, optional
+        Number of nodes, required unless points is given.
     root : int, optional
         The root of the tree, by default set to the first node.
+    points : PointSet, optional
+        Point set of the nodes, used in place of Nnodes.
+    dtype : type, optional
+        Data type of the group IDs, float64 by default. The IDs are computed in
+        the smallest integer type holding Nnodes, see config.get_int_dtype.
 
     Returns
     -------
     groupid : array
         Group IDs.
     """
+    if points is not None:
+        Nnodes = len(points)
+    elif Nnodes is None:
+        raise ValueError("Either Nnodes or points must be given.")
 
     Nvisited = 0
-    visited = np.zeros(Nnodes)
-    groupid = np.zeros(Nnodes)
+    visited = np.zeros(Nnodes, dtype=bool)
+    groupid = np.zeros(Nnodes, dtype=config.get_int_dtype(nnodes=Nnodes))
     currentid = 1
 
     tovisitnext = []
@@ -34,35 +54,35 @@ def get_groups(adjacents_idx: List[int], Nnodes: int, root: int = 0):
 
         if invoked_root == False:
             Nvisited += 1
-            visited[root] = 1.0
+            visited[root] = True
             groupid[root] = currentid
             _adjacents_idx = np.unique(np.array(adjacents_idx[root]))
             _visited = visited[_adjacents_idx]
-            cond = np.where(_visited != 1.0)[0]
+            cond = np.where(_visited == False)[0]
             tovisitnext = _adjacents_idx[cond]
             invoked_root = True
 
         elif len(tovisitnext) == 0:
-            cond = np.where(visited == 0.0)[0]
+            cond = np.where(visited == False)[0]
             _root = cond[0]
             currentid += 1
             Nvisited += 1
-            visited[_root] = 1.0
+            visited[_root] = True
             groupid[_root] = currentid
             _adjacents_idx = np.unique(np.array(adjacents_idx[_root]))
             _visited = visited[_adjacents_idx]
-            cond = np.where(_visited != 1.0)[0]
+            cond = np.where(_visited == False)[0]
             tovisitnext = _adjacents_idx[cond]
 
         while len(tovisitnext) > 0:
             Nvisited += len(tovisitnext)
-            visited[tovisitnext] = 1.0
+            visited[tovisitnext] = True
             groupid[tovisitnext] = currentid
             _adjacents_idx = np.unique(
                 np.concatenate([adjacents_idx[i] for i in tovisitnext])
             )
             _visited = visited[_adjacents_idx]
-            cond = np.where(_visited != 1.0)[0]
+            cond = np.where(_visited == False)[0]
             tovisitnext = _adjacents_idx[cond]
 
-    return groupid
+    return groupid.astype(dtype, copy=False)
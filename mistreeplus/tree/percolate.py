@@ -2,7 +2,9 @@ import numpy as np
 from typing import List, Optional
 
 from .. import coords
+from .. import tracing
 
+@tracing.traced(nodes="adjacents_idx")
 def perc_from_root_by_N(
     adjacents_idx: List[int], Npoint: int, root: int, percpaths: Optional[List[int]] = None
 ) -> List[int]:
@@ -69,6 +71,7 @@ def _structure_percpaths(percpaths: np.ndarray) -> List[int]:
     return _percpaths
 
 
+@tracing.traced(nodes="adjacents_idx")
 def perc_from_all_by_N(adjacents_idx: List[int], Npoint: int, percpaths: Optional[List[int]] = None) -> np.ndarray:
     """
     Finds the percolation paths for points N-points away in the graph from all nodes.
@@ -104,6 +107,7 @@ def perc_from_all_by_N(adjacents_idx: List[int], Npoint: int, percpaths: Optiona
     return percpaths
 
 
+@tracing.traced()
 def percpath2weight(percpaths: np.ndarray, edge_dict: dict) -> np.ndarray:
     """
     Get path weight for adjacent paths in a graph.
@@ -195,4 +199,24 @@ def percend_dist3D(x: np.ndarray, y: np.ndarray, z: np.ndarray, percends: np.nda
         Distance between pathends.
     """
     percend_dist = coords.dist3D(x[percends[0]], x[percends[1]], y[percends[0]], y[percends[1]], z[percends[0]], z[percends[1]])
-    return percend_dist
\ No newline at end of file
+    return percend_dist
+
+def percend_dist(points: coords.PointSet, percends: np.ndarray) -> np.ndarray:
+    """
+    Get the distance between path ends of a 2D or 3D point set.
+
+    Parameters
+    ----------
+    points : PointSet
+        2D or 3D points.
+    pathends : array
+        Nodes of the ends for each path.
+
+    Returns
+    -------
+    pathend_dist : array
+        Distance between pathends.
+    """
+    diff = points.vert[percends[0]] - points.vert[percends[1]]
+    percend_dist = np.sqrt(np.sum(diff**2.0, axis=1))
+    return percend_dist
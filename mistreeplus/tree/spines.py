@@ -0,0 +1,270 @@
+import numpy as np
+from typing import List, Optional, Tuple
+
+from .. import config
+from .. import coords
+from .. import tracing
+
+
+def flatten_spines(spines: List[list]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Flattens a list of spines into one node array with offsets, so that per spine
+    quantities can be computed with segmented reductions.
+
+    Parameters
+    ----------
+    spines : list
+        A list of spines, each a list of node indices.
+
+    Returns
+    -------
+    spine_nodes : int array
+        Concatenated node indices of all spines.
+    spine_offsets : int array
+        Start of each spine in spine_nodes, with the total number of nodes appended,
+        so spine i is spine_nodes[spine_offsets[i]:spine_offsets[i+1]].
+    """
+    spine_size = np.array([len(spine) for spine in spines], dtype=np.int64)
+    if len(spines) == 0:
+        itype = config.get_int_dtype(nnodes=1)
+        return np.zeros(0, dtype=itype), np.zeros(1, dtype=itype)
+    spine_nodes = np.concatenate([np.asarray(spine, dtype=np.int64) for spine in spines])
+    itype = config.get_int_dtype(nnodes=max(np.max(spine_nodes), len(spine_nodes)) + 1)
+    spine_offsets = np.zeros(len(spines) + 1, dtype=itype)
+    spine_offsets[1:] = np.cumsum(spine_size)
+    return spine_nodes.astype(itype, copy=False), spine_offsets
+
+
+def _segment_sum(
+    values: np.ndarray, spine_offsets: np.ndarray, shift: int = 0
+) -> np.ndarray:
+    """
+    Sums values over each spine segment, spines are shortened by shift elements.
+
+    Parameters
+    ----------
+    values : array
+        Values to be summed, aligned with the flattened spine nodes.
+    spine_offsets : int array
+        Spine offsets, see flatten_spines.
+    shift : int, optional
+        Number of elements removed from the end of each spine, e.g. 1 for per step
+        values of which there is one fewer than the number of nodes.
+
+    Returns
+    -------
+    total : array
+        Sum for each spine.
+    """
+    nspines = len(spine_offsets) - 1
+    start = spine_offsets[:-1] - shift * np.arange(nspines)
+    size = np.diff(spine_offsets) - shift
+    total = np.zeros(nspines)
+    cond = np.where(size > 0)[0]
+    if len(cond) > 0:
+        # empty segments are skipped, reduceat then sums each non-empty segment up
+        # to the start of the next one
+        total[cond] = np.add.reduceat(values, start[cond])
+    return total
+
+
+def _pair_key(idx1: np.ndarray, idx2: np.ndarray, nnodes: int) -> np.ndarray:
+    """
+    Returns an exact int64 key of undirected node pairs, min * nnodes + max.
+
+    Parameters
+    ----------
+    idx1, idx2 : int array
+        Node indices of the pairs.
+    nnodes : int
+        Number of nodes, larger than every node index.
+
+    Returns
+    -------
+    key : int64 array
+        Pair keys.
+    """
+    idx1, idx2 = np.asarray(idx1, dtype=np.int64), np.asarray(idx2, dtype=np.int64)
+    return np.minimum(idx1, idx2) * nnodes + np.maximum(idx1, idx2)
+
+
+@tracing.traced(edges="edge_idx")
+def get_spine_weight(
+    spines: List[list], edge_idx: np.ndarray, edge_weight: np.ndarray
+) -> np.ndarray:
+    """
+    Computes the total edge weight along each spine.
+
+    Parameters
+    ----------
+    spines : list
+        A list of spines, each a list of node indices.
+    edge_idx : 2darray
+        Graph edge node indices.
+    edge_weight : array
+        Weight of each edge.
+
+    Returns
+    -------
+    spine_weight : array
+        Summed edge weight along each spine, zero for single node spines.
+    """
+    spine_nodes, spine_offsets = flatten_spines(spines)
+    nnodes = int(max(np.max(edge_idx, initial=0), np.max(spine_nodes, initial=0))) + 1
+    edge_key = _pair_key(edge_idx[0], edge_idx[1], nnodes)
+    order = np.argsort(edge_key)
+    # consecutive nodes of the same spine form the spine steps
+    step = np.ones(len(spine_nodes), dtype=bool)
+    step[spine_offsets[1:] - 1] = False
+    step = np.where(step)[0]
+    step_key = _pair_key(spine_nodes[step], spine_nodes[step + 1], nnodes)
+    pos = np.searchsorted(edge_key, step_key, sorter=order)
+    pos = np.minimum(pos, len(order) - 1)
+    if np.any(edge_key[order[pos]] != step_key):
+        raise ValueError("Spine steps must be edges of the graph.")
+    step_weight = edge_weight[order[pos]]
+    return _segment_sum(step_weight, spine_offsets, shift=1)
+
+
+@tracing.traced(nodes="x")
+def get_spine_end_dist(
+    spines: List[list],
+    mode: str = "2D",
+    x: Optional[np.ndarray] = None,
+    y: Optional[np.ndarray] = None,
+    z: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Computes the straight line distance between the two ends of each spine.
+
+    Parameters
+    ----------
+    spines : list
+        A list of spines, each a list of node indices.
+    mode : str, optional
+        Geometry of the points.
+            - '2D' : 2 dimensions.
+            - '3D' : 3 dimensions.
+            - 'usphere' : On a unit sphere, distances are angular.
+    x, y, z : array
+        Cartesian coordinates.
+
+    Returns
+    -------
+    spine_end_dist : array
+        Distance between the ends of each spine.
+    """
+    spine_nodes, spine_offsets = flatten_spines(spines)
+    end1 = spine_nodes[spine_offsets[:-1]]
+    end2 = spine_nodes[spine_offsets[1:] - 1]
+    if mode == "2D":
+        spine_end_dist = coords.dist2D(x[end1], x[end2], y[end1], y[end2])
+    elif mode == "3D" or mode == "usphere":
+        spine_end_dist = coords.dist3D(
+            x[end1], x[end2], y[end1], y[end2], z[end1], z[end2]
+        )
+        if mode == "usphere":
+            spine_end_dist = coords.usphere_dist2ang(spine_end_dist)
+    else:
+        raise ValueError("mode must be '2D', '3D' or 'usphere'.")
+    return spine_end_dist
+
+
+def get_spine_shape(
+    spine_weight: np.ndarray, spine_end_dist: np.ndarray
+) -> np.ndarray:
+    """
+    Computes the shape of each spine, the distance between its ends divided by its
+    length, as for branches. Single node spines are given a shape of zero.
+
+    Parameters
+    ----------
+    spine_weight : array
+        Summed edge weight along each spine.
+    spine_end_dist : array
+        Distance between the ends of each spine.
+
+    Returns
+    -------
+    spine_shape : array
+        The shape of each spine.
+    """
+    spine_shape = np.zeros(len(spine_weight))
+    cond = np.where(spine_weight > 0.0)[0]
+    spine_shape[cond] = spine_end_dist[cond] / spine_weight[cond]
+    return spine_shape
+
+
+@tracing.traced(nodes="parents")
+def get_spine_hierarchy(spines: List[list], parents: np.ndarray) -> np.ndarray:
+    """
+    Computes the hierarchy level of each spine, 1 for the main spine and one more
+    than the level of the spine it branches from otherwise.
+
+    Parameters
+    ----------
+    spines : list
+        A list of spines, as given by get_spines.
+    parents : int array
+        Parent of each node in the tree rooted on the main spine, e.g. from
+        get_tree_parents with the most central node as root.
+
+    Returns
+    -------
+    spine_level : int array
+        Hierarchy level of each spine.
+    """
+    spine_nodes, spine_offsets = flatten_spines(spines)
+    nspines = len(spines)
+    itype = spine_nodes.dtype
+    node_spine = np.zeros(np.max(spine_nodes) + 1, dtype=itype)
+    node_spine[spine_nodes] = np.repeat(np.arange(nspines), np.diff(spine_offsets))
+    # the first node of a sub spine is its closest node to the tree root, so its
+    # parent lies on the spine it branches from
+    parent_spine = np.zeros(nspines, dtype=itype)
+    parent_spine[1:] = node_spine[parents[spine_nodes[spine_offsets[1:-1]]]]
+    spine_level = np.ones(nspines, dtype=itype)
+    # each pass propagates the levels one step further down the hierarchy
+    for _ in range(nspines):
+        _spine_level = spine_level[parent_spine] + 1
+        _spine_level[0] = 1
+        if np.array_equal(_spine_level, spine_level):
+            break
+        spine_level = _spine_level
+    return spine_level
+
+
+def get_spine_level_hist(
+    spine_level: np.ndarray,
+    spine_stat: np.ndarray,
+    bins: np.ndarray,
+    maxlevel: Optional[int] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Histograms a spine statistic separately for each hierarchy level.
+
+    Parameters
+    ----------
+    spine_level : int array
+        Level of each spine.
+    spine_stat : array
+        Statistic of each spine, e.g. spine weights or shapes.
+    bins : array
+        Bin edges of the statistic.
+    maxlevel : int, optional
+        Highest level histogrammed, by default the highest level present.
+
+    Returns
+    -------
+    levels : int array
+        The levels, from 1 to maxlevel.
+    hist : 2darray
+        Number of spines in each statistic bin for each level, shape
+        (maxlevel, len(bins)-1).
+    """
+    if maxlevel is None:
+        maxlevel = int(np.max(spine_level))
+    levels = np.arange(1, maxlevel + 1)
+    level_edges = np.arange(0.5, maxlevel + 1.0)
+    hist, _, _ = np.histogram2d(spine_level, spine_stat, bins=[level_edges, bins])
+    return levels, hist
@@ -1,10 +1,16 @@
 import numpy as np
-from typing import Tuple, List
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import breadth_first_order
+from typing import Tuple, List, Optional
 
 from . import groups
+from .. import config
+from .. import coords
 from .. import src
+from .. import tracing
 
 
+@tracing.traced(nodes="Nnodes")
 def adjacents2tree(
     adjacents_idx: List[int], Nnodes: int, root: int = 0, sanity: bool = True
 ) -> dict:
@@ -29,16 +35,18 @@ def adjacents2tree(
         Graph structured in a tree.
     """
     if sanity:
-        groupid = groups.get_groups(adjacents_idx, Nnodes, root=root)
+        groupid = groups.get_groups(
+            adjacents_idx, Nnodes, root=root, dtype=config.get_int_dtype(nnodes=Nnodes)
+        )
         assert (
             len(np.unique(groupid)) == 1
         ), "Graph is not spanning, since it produces more than one group."
 
     tree = {}
-    visited = np.zeros(Nnodes)
+    visited = np.zeros(Nnodes, dtype=bool)
 
     tree[root] = {"parent": None, "children": adjacents_idx[root]}
-    visited[root] = 1.0
+    visited[root] = True
 
     visitparent = []
     visitchild = []
@@ -58,10 +66,10 @@ def adjacents2tree(
 
             for child in children:
 
-                visited[child] = 1.0
+                visited[child] = True
                 _adjacents_idx = np.array(adjacents_idx[child])
                 _visited = visited[_adjacents_idx]
-                cond = np.where(_visited == 0.0)[0]
+                cond = np.where(_visited == False)[0]
 
                 if len(cond) == 0:
                     tree[child] = {"parent": parent, "children": None}
@@ -81,6 +89,36 @@ def adjacents2tree(
     return tree
 
 
+@tracing.traced(nodes="Nnodes", edges="edge_idx")
+def get_tree_parents(edge_idx: np.ndarray, Nnodes: int, root: int = 0) -> np.ndarray:
+    """
+    Finds the parent of each node of a tree, the array counterpart of the parents
+    stored by adjacents2tree.
+
+    Parameters
+    ----------
+    edge_idx : 2darray
+        Graph edge node indices of a spanning tree.
+    Nnodes : int
+        Number of nodes.
+    root : int, optional
+        The root of the tree, by default set to the first node.
+
+    Returns
+    -------
+    parents : int array
+        Parent of each node, -1 for the root.
+    """
+    graph = csr_matrix(
+        (np.ones(edge_idx.shape[1]), (edge_idx[0], edge_idx[1])), shape=(Nnodes, Nnodes)
+    )
+    order, parents = breadth_first_order(graph, root, directed=False)
+    if len(order) != Nnodes:
+        raise ValueError("Graph is not spanning, since it produces more than one group.")
+    parents[root] = -1
+    return parents.astype(config.get_int_dtype(nnodes=Nnodes + 1), copy=False)
+
+
 def findpath2root(id: int, tree: dict) -> list:
     """
     Finds the path along a tree from point 1 to 2 by finding the path to the root index and removing
@@ -160,7 +198,12 @@ def get_path_weight(path: list, edge_dict: dict) -> float:
     return sum(edge_dict[(path[i], path[i + 1])] for i in range(len(path) - 1))
 
 
-def get_centrality(edge_idx: np.ndarray, Nnodes: int) -> np.ndarray:
+@tracing.traced(nodes=("Nnodes", "points"), edges="edge_idx")
+def get_centrality(
+    edge_idx: np.ndarray,
+    Nnodes: Optional[int] = None,
+    points: Optional[coords.PointSet] = None,
+) -> np.ndarray:
     """
     Determines the nodes centrality in the graph.
 
@@ -168,8 +211,11 @@ def get_centrality(edge_idx: np.ndarray, Nnodes: int) -> np.ndarray:
     ----------
     edge_idx : 2darray
         Graph edge node indices.
-    Nnodes : int
-        Number of nodes.
+    Nnodes : int, optional
+        Number of nodes, required unless points is given.
+    points : PointSet, optional
+        Point set of the nodes, used in place of Nnodes. Each node contributes its
+        weight rather than one to the centrality.
 
     Returns
     -------
@@ -180,7 +226,16 @@ def get_centrality(edge_idx: np.ndarray, Nnodes: int) -> np.ndarray:
     _id1 = np.copy(edge_idx[0])
     _id2 = np.copy(edge_idx[1])
 
-    centrality = np.ones(Nnodes)
+    if points is not None:
+        Nnodes = len(points)
+        if points.weights is not None:
+            centrality = np.array(points.weights, dtype=np.float64)
+        else:
+            centrality = np.ones(Nnodes)
+    elif Nnodes is None:
+        raise ValueError("Either Nnodes or points must be given.")
+    else:
+        centrality = np.ones(Nnodes)
 
     while len(_id1) > 1:
         degree = src.getgraphdegree(i1=_id1, i2=_id2, nnodes=Nnodes)
@@ -233,6 +288,7 @@ def get_spine(root: int, tree: dict, centrality: np.ndarray) -> list:
     return spine
 
 
+@tracing.traced(nodes="centrality")
 def get_spines(tree: dict, centrality: np.ndarray) -> Tuple[list, np.ndarray]:
     """
     Returns spines the spines of a graph tree structure. Ordered in spine hierarchy,
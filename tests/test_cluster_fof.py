@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+from scipy.cluster.hierarchy import fcluster, linkage as sclinkage
+from mistreeplus.cluster import get_fof_labels, get_linkage, get_group_catalogue, get_fof_groups
+from mistreeplus.coords import SingleLinkGroup2D
+from mistreeplus.graph import construct_knn2D, graph2data
+from mistreeplus.mst import construct_mst
+
+
+def _mst(size, seed):
+    rng = np.random.default_rng(seed)
+    x, y = rng.random((2, size))
+    edge_idx, edge_length = graph2data(construct_mst(construct_knn2D(x, y, 20)))
+    return x, y, edge_idx, edge_length
+
+
+def _same_partition(labels1, labels2):
+    n1, n2 = len(np.unique(labels1)), len(np.unique(labels2))
+    pairs = np.unique(np.column_stack((labels1, labels2)), axis=0)
+    return n1 == n2 and len(pairs) == n1
+
+
+def test_get_fof_labels_matches_single_linkage():
+    x, y, edge_idx, edge_length = _mst(1000, 1)
+    linking_lengths = np.array([0.03, 0.01, 0.02])
+    labels = get_fof_labels(edge_idx, edge_length, 1000, linking_lengths)
+    assert labels.shape == (3, 1000)
+    for b, _labels in zip(linking_lengths, labels):
+        assert _same_partition(_labels, SingleLinkGroup2D(x, y, b)[3])
+
+
+def test_get_linkage_matches_scipy():
+    x, y, edge_idx, edge_length = _mst(200, 2)
+    linkage = get_linkage(edge_idx, edge_length, 200)
+    assert linkage.shape == (199, 4)
+    assert np.all(np.diff(linkage[:, 2]) >= 0.0)
+    assert linkage[-1, 3] == 200
+    ref = sclinkage(np.column_stack((x, y)), method="single")
+    assert np.allclose(linkage[:, 2], ref[:, 2])
+    assert _same_partition(
+        fcluster(linkage, 0.05, criterion="distance"), fcluster(ref, 0.05, criterion="distance")
+    )
+
+
+def test_get_group_catalogue():
+    labels = np.array([0, 0, 1, 2, 2, 2])
+    vert = np.column_stack((np.arange(6.0), np.zeros(6)))
+    catalogue = get_group_catalogue(labels, vert=vert, weights=np.array([1.0, 3.0, 1.0, 1.0, 1.0, 1.0]))
+    assert np.array_equal(catalogue["size"], [2, 1, 3])
+    assert np.allclose(catalogue["weight"], [4.0, 1.0, 3.0])
+    assert np.allclose(catalogue["centroid"][:, 0], [0.75, 2.0, 4.0])
+    catalogue = get_group_catalogue(labels, vert=vert, min_size=2)
+    assert np.array_equal(catalogue["label"], [0, 2])
+    assert np.allclose(catalogue["centroid"][:, 0], [0.5, 4.0])
+
+
+def test_get_fof_groups():
+    x, y, edge_idx, edge_length = _mst(500, 3)
+    labels, catalogues = get_fof_groups(
+        edge_idx, edge_length, 500, [0.0, 0.02, 10.0], vert=np.column_stack((x, y))
+    )
+    assert len(catalogues) == 3
+    assert len(catalogues[0]["size"]) == 500
+    assert np.sum(catalogues[1]["size"]) == 500
+    assert np.array_equal(catalogues[2]["size"], [500])
+    assert np.allclose(catalogues[2]["centroid"], [[np.mean(x), np.mean(y)]])
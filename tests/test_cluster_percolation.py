@@ -0,0 +1,41 @@
+import numpy as np
+import pytest
+from mistreeplus.cluster import get_fof_labels, get_percolation_curve
+from mistreeplus.graph import construct_knn2D, graph2data
+from mistreeplus.mst import construct_mst
+
+
+def _mst(size, seed):
+    rng = np.random.default_rng(seed)
+    x, y = rng.random((2, size))
+    edge_idx, edge_length = graph2data(construct_mst(construct_knn2D(x, y, 20)))
+    return edge_idx, edge_length
+
+
+def test_get_percolation_curve_matches_labels():
+    edge_idx, edge_length = _mst(800, 1)
+    thresholds = np.array([0.04, 0.0, 0.02, 1.0])
+    curve = get_percolation_curve(edge_idx, edge_length, 800, thresholds=thresholds)
+    labels = get_fof_labels(edge_idx, edge_length, 800, thresholds)
+    for i, _labels in enumerate(labels):
+        sizes = np.bincount(_labels)
+        assert curve["ngroups"][i] == len(sizes)
+        assert curve["giant"][i] == np.max(sizes)
+        rest = np.sort(sizes)[:-1]
+        if len(rest) > 0:
+            assert np.isclose(curve["susceptibility"][i], np.sum(rest**2) / np.sum(rest))
+        cond = np.where(edge_length <= thresholds[i])[0]
+        degree = np.bincount(edge_idx[:, cond].ravel(), minlength=800)
+        assert np.array_equal(curve["degree_hist"][i], np.bincount(np.minimum(degree, 6), minlength=7))
+    assert curve["ngroups"][1] == 800 and curve["ngroups"][3] == 1
+    assert curve["giant_fraction"][3] == 1.0
+    assert np.allclose(curve["mean_size"], 800 / curve["ngroups"])
+
+
+def test_get_percolation_curve_every_edge():
+    edge_idx, edge_length = _mst(300, 2)
+    curve = get_percolation_curve(edge_idx, edge_length, 300)
+    assert len(curve["ngroups"]) == 299
+    assert np.array_equal(curve["ngroups"], np.arange(299, 0, -1))
+    assert np.all(np.diff(curve["giant"]) >= 0)
+    assert np.all(np.diff(curve["thresholds"]) >= 0)
@@ -0,0 +1,116 @@
+import pytest
+import numpy as np
+import mistreeplus as mist
+from mistreeplus.config import (
+    set_config,
+    get_config,
+    reset_config,
+    config_context,
+    get_nthreads,
+)
+
+
+@pytest.fixture(autouse=True)
+def _reset():
+    yield
+    reset_config()
+
+
+def test_config_defaults():
+    config = get_config()
+    assert config["validation"] == "full"
+    assert config["float_dtype"] is np.float64
+    assert config["int_dtype"] == "auto"
+    assert config["nthreads"] is None
+    assert get_nthreads() == 1 and get_nthreads(3) == 3
+
+
+def test_set_config_invalid():
+    with pytest.raises(ValueError):
+        set_config(validation="cheap")
+    with pytest.raises(ValueError):
+        set_config(float_dtype=np.float16)
+    with pytest.raises(ValueError):
+        set_config(int_dtype=np.int16)
+    with pytest.raises(ValueError):
+        set_config(nthreads=0)
+    with pytest.raises(ValueError):
+        set_config(nthreads=1.5)
+    assert get_config()["validation"] == "full"
+
+
+def test_config_context_restores():
+    with config_context(validation="off", float_dtype="float32", nthreads=2) as config:
+        assert config["validation"] == "off"
+        assert config["float_dtype"] is np.float32
+        assert get_nthreads() == 2
+        with config_context(validation="minmax"):
+            assert get_config()["validation"] == "minmax"
+            assert get_config()["float_dtype"] is np.float32
+        assert get_config()["validation"] == "off"
+    assert get_config() == {
+        "validation": "full",
+        "float_dtype": np.float64,
+        "int_dtype": "auto",
+        "nthreads": None,
+    }
+    with pytest.raises(RuntimeError):
+        with config_context(validation="off"):
+            raise RuntimeError
+    assert get_config()["validation"] == "full"
+
+
+def test_config_validation_levels():
+    phi = np.array([10.0, 370.0, 20.0, 30.0])
+    with pytest.raises(AssertionError):
+        mist.check.check_phi_in_range(phi, "degs")
+    with config_context(validation="minmax"):
+        with pytest.raises(AssertionError):
+            mist.check.check_phi_in_range(phi, "degs")
+        with pytest.raises(AssertionError):
+            mist.check.check_finite(np.array([1.0, np.nan, 2.0, 3.0]))
+    with config_context(validation="off"):
+        mist.check.check_phi_in_range(phi, "degs")
+        mist.check.check_positive(-phi)
+        x, y, z = mist.coords.sphere2cart(1.0, phi, phi / 4.0, units="degs")
+        assert len(x) == 4
+        with pytest.raises(AssertionError):
+            mist.check.check_angle_units("deg")
+
+
+def test_config_sphere2cart_no_copy():
+    rng = np.random.default_rng(0)
+    ra, dec = 360.0 * rng.random(10), 180.0 * rng.random(10) - 90.0
+    _ra, _dec = np.copy(ra), np.copy(dec)
+    x, y, z = mist.coords.sphere2cart_radec(1.0, ra, dec, units="degs")
+    assert np.array_equal(ra, _ra) and np.array_equal(dec, _dec)
+    x2, y2, z2 = mist.coords.sphere2cart(
+        1.0, ra, mist.coords.dec2theta(dec, units="degs"), units="degs"
+    )
+    assert np.allclose(x, x2) and np.allclose(y, y2) and np.allclose(z, z2)
+
+
+def test_config_dtypes():
+    rng = np.random.default_rng(1)
+    x, y = rng.random((2, 50))
+    with config_context(float_dtype=np.float32, int_dtype=np.int64):
+        points = mist.coords.PointSet(x, y)
+        assert points.vert.dtype == np.float32
+        vert = mist.coords.sphere2vert(np.ones(5), np.ones(5), np.ones(5))
+        assert vert.dtype == np.float32
+        assert mist.coords.PointSet(x, y, dtype=np.float64).vert.dtype == np.float64
+        spine_nodes, spine_offsets = mist.tree.flatten_spines([[0, 1, 2], [2, 3]])
+        assert spine_nodes.dtype == np.int64 and spine_offsets.dtype == np.int64
+    assert mist.coords.PointSet(x, y).vert.dtype == np.float64
+    spine_nodes, spine_offsets = mist.tree.flatten_spines([[0, 1, 2], [2, 3]])
+    assert spine_nodes.dtype == np.int32 and spine_offsets.dtype == np.int32
+
+
+def test_config_nthreads():
+    rng = np.random.default_rng(2)
+    points = mist.coords.PointSet(*rng.random((2, 200)))
+    knn = mist.graph.construct_knn(points, 5)
+    with config_context(nthreads=-1):
+        assert get_nthreads() >= 1
+        knn_threads = mist.graph.construct_knn(points, 5)
+    assert np.allclose(knn.toarray(), knn_threads.toarray())
@@ -0,0 +1,84 @@
+import pytest
+import numpy as np
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
+from scipy.spatial import cKDTree
+from mistreeplus.coords import PointSet, PinchGroup, PinchGroup2D, PinchGroup3D
+from mistreeplus.coords import SingleLinkGroup, SingleLinkGroup2D, SingleLinkGroup3D
+
+
+def test_singlelinkgroup2D_simple():
+    x = np.array([0.0, 0.1, 0.2, 5.0, 5.05, 9.0])
+    y = np.zeros(6)
+    xg, yg, wg, labels = SingleLinkGroup2D(x, y, 0.15)
+    assert np.array_equal(labels, [0, 0, 0, 1, 1, 2])
+    assert np.allclose(xg, [0.1, 5.025, 9.0])
+    assert np.allclose(wg, [3.0, 2.0, 1.0])
+    xg, yg, wg, labels = SingleLinkGroup2D(x, y, 0.15, w=np.array([1.0, 1.0, 2.0, 1.0, 3.0, 1.0]))
+    assert np.allclose(xg, [0.125, 5.0375, 9.0])
+    assert np.isclose(np.sum(wg), 9.0)
+
+
+def test_singlelinkgroup3D_matches_connected_components():
+    rng = np.random.default_rng(1)
+    x, y, z = rng.random((3, 2000))
+    xg, yg, zg, wg, labels = SingleLinkGroup3D(x, y, z, 0.03)
+    pairs = cKDTree(np.column_stack((x, y, z))).query_pairs(0.03, output_type="ndarray")
+    adj = coo_matrix((np.ones(len(pairs)), (pairs[:, 0], pairs[:, 1])), shape=(2000, 2000))
+    ncomp, ref = connected_components(adj, directed=False)
+    assert len(wg) == ncomp
+    # same partition up to relabelling
+    assert len(np.unique(labels * ncomp + ref)) == ncomp
+    assert np.allclose(xg, np.bincount(labels, weights=x) / wg)
+
+
+def test_singlelinkgroup_periodic():
+    x = np.array([0.05, 9.95, 5.0])
+    y = np.array([1.0, 1.0, 5.0])
+    xg, yg, wg, labels = SingleLinkGroup2D(x, y, 0.2, boxsize=10.0)
+    assert np.array_equal(labels, [0, 0, 1])
+    assert np.isclose(xg[0], 0.0) or np.isclose(xg[0], 10.0)
+    xg, yg, wg, labels = SingleLinkGroup2D(x, y, 0.2)
+    assert len(wg) == 3
+
+
+def test_pinchgroup_pointset():
+    rng = np.random.default_rng(2)
+    x, y, z = rng.random((3, 1000))
+    w = rng.random(1000) + 0.5
+    groups = PinchGroup(PointSet(x, y, weights=w), 0.02)
+    xg, yg, wg = PinchGroup2D(x, y, 0.02, w=w)
+    assert np.allclose(groups.x, xg) and np.allclose(groups.y, yg)
+    assert np.allclose(groups.weights, wg) and np.isclose(np.sum(wg), np.sum(w))
+    groups = PinchGroup(PointSet(x, y, z), 0.05)
+    xg, yg, zg, wg = PinchGroup3D(x, y, z, 0.05)
+    assert np.allclose(groups.z, zg) and np.allclose(groups.weights, wg)
+
+
+def test_singlelinkgroup_pointset():
+    x = np.array([0.05, 9.95, 5.0, 5.1])
+    y = np.array([1.0, 1.0, 5.0, 5.0])
+    w = np.array([1.0, 3.0, 2.0, 2.0])
+    groups, labels = SingleLinkGroup(PointSet(x, y, weights=w, boxsize=10.0), 0.2)
+    xg, yg, wg, _labels = SingleLinkGroup2D(x, y, 0.2, w=w, boxsize=10.0)
+    assert np.array_equal(labels, _labels)
+    assert np.allclose(groups.vert, np.column_stack([xg, yg]))
+    assert np.allclose(groups.weights, [4.0, 4.0]) and groups.boxsize == 10.0
+
+
+@pytest.mark.parametrize("boxsize", [None, 1.0])
+def test_singlelinkgroup_dense_clumps(boxsize):
+    # clumps denser than the number of neighbours linked per point, with duplicates
+    rng = np.random.default_rng(3)
+    vert = np.concatenate(
+        [0.03 * rng.normal(size=(600, 3)) + centre for centre in [0.2, 0.3, 0.95]]
+    )
+    vert[:50] = vert[50:100]
+    vert = np.mod(vert, 1.0)
+    for mindist in [0.01, 0.04]:
+        xg, yg, zg, wg, labels = SingleLinkGroup3D(*vert.T, mindist, boxsize=boxsize)
+        pairs = cKDTree(vert, boxsize=boxsize).query_pairs(mindist, output_type="ndarray")
+        adj = coo_matrix((np.ones(len(pairs)), (pairs[:, 0], pairs[:, 1])), shape=(1800, 1800))
+        ncomp, ref = connected_components(adj, directed=False)
+        assert len(wg) == ncomp
+        assert len(np.unique(labels * ncomp + ref)) == ncomp
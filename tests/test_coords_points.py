@@ -0,0 +1,116 @@
+import pytest
+import numpy as np
+from mistreeplus.coords import PointSet
+from mistreeplus.coords.group import KDTree2D
+
+
+def test_pointset_views():
+    rng = np.random.default_rng(1)
+    x, y, z = rng.random((3, 100))
+    points = PointSet(x, y, z, weights=np.ones(100))
+    assert len(points) == 100 and points.ndim == 3
+    assert points.vert.flags["C_CONTIGUOUS"]
+    assert np.array_equal(points.x, x) and np.array_equal(points.z, z)
+    assert np.shares_memory(points.x, points.vert)
+    assert np.shares_memory(points.z, points.vert)
+    points = PointSet(x, y, dtype=np.float32)
+    assert points.vert.dtype == np.float32 and points.z is None
+
+
+def test_pointset_from_vert():
+    vert = np.random.default_rng(2).random((50, 2))
+    points = PointSet.from_vert(vert)
+    assert points.vert is vert
+    assert PointSet.from_vert(vert, copy=True).vert is not vert
+    with pytest.raises(ValueError):
+        PointSet.from_vert(np.zeros((10, 4)))
+    with pytest.raises(ValueError):
+        PointSet.from_vert(vert, weights=np.ones(3))
+
+
+def test_pointset_tree_is_lazy():
+    rng = np.random.default_rng(3)
+    points = PointSet(*rng.random((2, 200)), boxsize=1.0)
+    assert points._tree is None
+    tree = points.tree
+    assert points.tree is tree
+    nind, ndist = points.query(points.vert[:5], k=2)
+    assert np.array_equal(nind[:, 0], np.arange(5))
+    assert np.allclose(ndist[:, 0], 0.0)
+    points.invalidate()
+    assert points._tree is None
+
+
+def test_kdtree_build_tree_from_points():
+    rng = np.random.default_rng(4)
+    points = PointSet(*rng.random((2, 100)))
+    KD = KDTree2D()
+    KD.build_tree_from_points(points)
+    assert KD.KD is points.tree
+    nind, _ = KD.nearest(points.x[:3], points.y[:3])
+    assert np.array_equal(nind, np.arange(3))
+
+
+@pytest.mark.parametrize("reorder", ["hilbert", "morton"])
+def test_pointset_reorder(reorder):
+    rng = np.random.default_rng(4)
+    x, y, z = rng.random((3, 500))
+    weights = rng.random(500)
+    points = PointSet(x, y, z, weights=weights, reorder=reorder)
+    assert np.array_equal(np.sort(points.order), np.arange(500))
+    assert np.array_equal(points.x, x[points.order])
+    assert np.array_equal(points.to_original(points.vert)[:, 2], z)
+    assert np.array_equal(points.to_original(points.weights), weights)
+    # consecutive points are much closer than in the random input order
+    step = np.linalg.norm(np.diff(points.vert, axis=0), axis=1)
+    assert np.mean(step) < 0.5 * np.mean(np.linalg.norm(np.diff(points.to_original(points.vert), axis=0), axis=1))
+    idx = np.array([[0, 1], [2, 3]])
+    assert np.array_equal(points.to_original_index(idx), points.order[idx])
+    vert = PointSet.from_vert(np.column_stack([x, y, z]), reorder=reorder).vert
+    assert np.array_equal(vert, points.vert)
+
+
+def test_pointset_reorder_graphs():
+    from mistreeplus.graph import construct_knn
+    from mistreeplus.mst import construct_mst
+
+    rng = np.random.default_rng(5)
+    x, y = rng.random((2, 400))
+    points = PointSet(x, y, reorder="hilbert")
+    mst = points.to_original_graph(construct_mst(construct_knn(points, 10)))
+    expected = construct_mst(construct_knn(PointSet(x, y), 10))
+    assert np.allclose((mst + mst.T).toarray(), (expected + expected.T).toarray())
+    plain = PointSet(x, y)
+    assert plain.order is None and plain.to_original_graph(expected) is expected
+    with pytest.raises(ValueError):
+        PointSet(x, y, reorder="peano")
+
+
+def test_pointset_tree_nodes():
+    from mistreeplus.tree import get_centrality, get_groups
+
+    x = np.array([0.0, 1.0, 2.0, 3.0, 1.0])
+    y = np.array([0.0, 0.0, 0.0, 0.0, 1.0])
+    edge_idx = np.array([[0, 1, 2, 1], [1, 2, 3, 4]])
+    points = PointSet(x, y)
+    assert np.array_equal(get_centrality(edge_idx, points=points), get_centrality(edge_idx, 5))
+    points = PointSet(x, y, weights=np.array([1.0, 2.0, 1.0, 1.0, 0.5]))
+    centrality = get_centrality(edge_idx, points=points)
+    # the root of the weighted tree holds the total weight
+    assert np.isclose(np.max(centrality), 5.5)
+    adjacents = [[1], [0, 2, 4], [1, 3], [2], [1]]
+    assert np.array_equal(get_groups(adjacents, points=points), get_groups(adjacents, 5))
+    with pytest.raises(ValueError):
+        get_groups(adjacents)
+    with pytest.raises(ValueError):
+        get_centrality(edge_idx)
+
+
+def test_get_groups_dtype():
+    from mistreeplus.tree import get_groups
+
+    adjacents = [[1], [0], [3, 4], [2], [2]]
+    groupid = get_groups(adjacents, 5)
+    assert groupid.dtype == np.float64
+    assert np.array_equal(groupid, [1.0, 1.0, 2.0, 2.0, 2.0])
+    assert get_groups(adjacents, 5, dtype=np.int32).dtype == np.int32
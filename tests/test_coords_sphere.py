@@ -7,6 +7,9 @@ from mistreeplus.coords import (
     sphere2cart_radec,
     cart2sphere,
     cart2sphere_radec,
+    sphere2vert,
+    sphere2vert_radec,
+    vert2sphere,
 )
 
 def test_theta2dec():
@@ -113,3 +116,39 @@ def test_cart2sphere_radec():
     np.testing.assert_array_almost_equal(r, np.array([1.73205, 1.4142]), decimal=4)
     np.testing.assert_array_almost_equal(ra, np.array([0.7854, 5.4978]), decimal=4)
     np.testing.assert_array_almost_equal(dec, np.array([0.6155, 0.0]), decimal=4)
+
+
+def test_sphere2vert():
+    rng = np.random.default_rng(1)
+    r = rng.random(100)
+    phi = 2 * np.pi * rng.random(100)
+    theta = np.pi * rng.random(100)
+    vert = sphere2vert(r, phi, theta)
+    assert vert.shape == (100, 3) and vert.flags["C_CONTIGUOUS"]
+    assert np.allclose(vert, np.column_stack(sphere2cart(r, phi, theta)))
+    out = np.empty((100, 3), dtype=np.float32)
+    assert sphere2vert(r, np.rad2deg(phi), np.rad2deg(theta), units="degs", out=out) is out
+    assert np.allclose(out, vert, atol=1e-6)
+    assert sphere2vert(r, phi, theta, dtype=np.float32).dtype == np.float32
+    with pytest.raises(AssertionError):
+        sphere2vert(r, phi + 7.0, theta)
+
+
+def test_sphere2vert_radec():
+    rng = np.random.default_rng(2)
+    r = rng.random(100)
+    ra = 360.0 * rng.random(100)
+    dec = 180.0 * rng.random(100) - 90.0
+    vert = sphere2vert_radec(r, ra, dec, units="degs")
+    assert np.allclose(vert, np.column_stack(sphere2cart_radec(r, ra, dec, units="degs")))
+
+
+def test_vert2sphere():
+    rng = np.random.default_rng(3)
+    vert = rng.random((100, 3)) - 0.5
+    sph = vert2sphere(vert, units="degs")
+    r, phi, theta = cart2sphere(vert[:, 0], vert[:, 1], vert[:, 2], units="degs")
+    assert np.allclose(sph, np.column_stack((r, phi, theta)))
+    sph = vert2sphere(vert, celestial=True)
+    r, ra, dec = cart2sphere_radec(vert[:, 0], vert[:, 1], vert[:, 2])
+    assert np.allclose(sph, np.column_stack((r, ra, dec)))
@@ -1,6 +1,7 @@
 import pytest
 import numpy as np
 from mistreeplus.coords import usphere2cart, usphere2cart_radec, cart2usphere, cart2usphere_radec, usphere_dist2ang
+from mistreeplus.coords import usphere_tiles, usphere2vert, usphere2vert_radec
 
 # Mocking sphere functions for standalone testing
 def mock_sphere2cart(r, phi, theta, units="rads"):
@@ -104,3 +105,27 @@ def test_usphere_dist2ang_scalar():
     ang = usphere_dist2ang(dist)
     expected = 2 * np.arcsin(dist / 2.0)
     assert ang == pytest.approx(expected)
+
+# usphere_tiles tests
+def test_usphere_tiles():
+    rng = np.random.default_rng(2)
+    phi = 2 * np.pi * rng.random(20000)
+    theta = np.arccos(1 - 2 * rng.random(20000))
+    tile = usphere_tiles(phi, theta, 4)
+    assert tile.min() >= 0 and tile.max() < 32
+    # equal area tiles hold roughly equal numbers of uniform points
+    counts = np.bincount(tile, minlength=32)
+    assert np.all(np.abs(counts - 20000 / 32) < 5 * np.sqrt(20000 / 32))
+    assert np.array_equal(usphere_tiles(np.rad2deg(phi), np.rad2deg(theta), 4, units="degs"), tile)
+
+# usphere2vert tests
+def test_usphere2vert():
+    rng = np.random.default_rng(4)
+    ra = 360.0 * rng.random(50)
+    dec = 180.0 * rng.random(50) - 90.0
+    vert = usphere2vert_radec(ra, dec, units="degs")
+    assert np.allclose(np.sum(vert**2, axis=1), 1.0)
+    assert np.allclose(vert, usphere2vert(ra, 90.0 - dec, units="degs"))
+    out = np.empty((50, 3), dtype=np.float32)
+    assert usphere2vert(np.deg2rad(ra), np.deg2rad(90.0 - dec), out=out) is out
+    assert np.allclose(out, vert, atol=1e-6)
@@ -38,3 +38,16 @@ def test_vert2xyz():
     assert np.array_equal(result_x, expected_x)
     assert np.array_equal(result_y, expected_y)
     assert np.array_equal(result_z, expected_z)
+
+# out buffer tests
+def test_xyz2vert_out():
+    x, y, z = np.arange(3.0), np.arange(3.0) + 3, np.arange(3.0) + 6
+    out = np.zeros((3, 3))
+    result = xyz2vert(x, y, z, out=out)
+    assert result is out
+    assert np.array_equal(out, np.column_stack((x, y, z)))
+    out = np.zeros((3, 2), dtype=np.float32)
+    assert xy2vert(x, y, out=out) is out
+    assert np.array_equal(out, np.column_stack((x, y)))
+    with pytest.raises(ValueError):
+        xyz2vert(x, y, z, out=np.zeros((3, 3))[:, ::-1])
@@ -43,3 +43,20 @@ def test_data2graph():
     # Assertions
     assert graph.shape == expected_graph.shape
     assert np.array_equal(graph.toarray(), expected_graph.toarray())
+
+
+def test_graph2data_compact_dtypes():
+    from mistreeplus import config, coords, graph, mst
+
+    rng = np.random.default_rng(3)
+    points = coords.PointSet(*rng.random((2, 300)))
+    edge_idx, weights = graph2data(mst.construct_mst(graph.construct_del(points)))
+    assert edge_idx.dtype == np.int32 and weights.dtype == np.float64
+    with config.config_context(float_dtype=np.float32):
+        knn_graph = graph.construct_knn(points, 8)
+        assert knn_graph.data.dtype == np.float32
+        _edge_idx, _weights = graph2data(mst.construct_mst(graph.construct_del(points)))
+        assert _weights.dtype == np.float32
+    order, _order = np.lexsort(edge_idx), np.lexsort(_edge_idx)
+    assert np.array_equal(_edge_idx[:, _order], edge_idx[:, order])
+    assert np.allclose(_weights[_order], weights[order], rtol=1e-6)
@@ -1,7 +1,10 @@
 import pytest
 import numpy as np
 from scipy.sparse import csr_matrix
-from mistreeplus.graph import construct_del2D, construct_del3D
+from mistreeplus.graph import construct_del2D, construct_del3D, construct_del_usphere, construct_del_usphere_cart, construct_del, graph2data
+from mistreeplus.coords import PointSet
+from mistreeplus.coords import usphere2cart
+from mistreeplus.mst import construct_mst, construct_mst_usphere
 
 # Test for construct_delaunay2D
 def test_construct_del2D():
@@ -35,3 +38,113 @@ def test_construct_del3D():
     # Check that the graph is not empty and has a proper structure
     assert del_graph.shape == (len(x), len(x))
     assert del_graph.nnz > 0  # Ensure that there are non-zero entries
+
+
+def _usphere_randoms(size, seed, costheta_min=-1.0):
+    rng = np.random.default_rng(seed)
+    phi = 2 * np.pi * rng.random(size)
+    theta = np.arccos(1 - (1 - costheta_min) * rng.random(size))
+    return phi, theta
+
+
+def test_construct_del_usphere():
+    phi, theta = _usphere_randoms(300, 1)
+    del_graph = construct_del_usphere(phi, theta)
+    assert del_graph.shape == (300, 300)
+    edge_idx, weights = graph2data(del_graph)
+    # a triangulation of the sphere has 3N - 6 edges
+    assert edge_idx.shape[1] == 3 * 300 - 6
+    assert np.all(weights > 0) and np.all(weights < np.pi)
+    x, y, z = usphere2cart(phi, theta)
+    dot = x[edge_idx[0]] * x[edge_idx[1]] + y[edge_idx[0]] * y[edge_idx[1]] + z[edge_idx[0]] * z[edge_idx[1]]
+    assert np.allclose(weights, np.arccos(dot))
+
+
+def test_construct_del_usphere_mst_is_exact():
+    phi, theta = _usphere_randoms(1000, 2)
+    _, weights = graph2data(construct_mst(construct_del_usphere(phi, theta)))
+    _, knn_weights = graph2data(construct_mst_usphere(phi, theta, 50))
+    assert np.isclose(np.sum(weights), np.sum(knn_weights))
+
+
+def test_construct_del_usphere_partial():
+    phi, theta = _usphere_randoms(500, 3, costheta_min=0.8)
+    full = construct_del_usphere(np.rad2deg(phi), np.rad2deg(theta), units="degs")
+    partial = construct_del_usphere(phi, theta, partial=True)
+    assert partial.shape == (500, 500)
+    # the hull lid spanning the footprint is removed
+    assert np.max(partial.data) < np.max(full.data)
+    assert partial.nnz < full.nnz
+    _, weights = graph2data(construct_mst(partial))
+    _, knn_weights = graph2data(construct_mst_usphere(phi, theta, 50))
+    assert len(weights) == 499
+    assert np.isclose(np.sum(weights), np.sum(knn_weights))
+
+
+def test_construct_del_usphere_partial_balanced():
+    # the unit vectors of the octahedron sum to zero
+    x = np.array([1.0, -1.0, 0.0, 0.0, 0.0, 0.0])
+    y = np.array([0.0, 0.0, 1.0, -1.0, 0.0, 0.0])
+    z = np.array([0.0, 0.0, 0.0, 0.0, 1.0, -1.0])
+    partial = construct_del_usphere_cart(x, y, z, partial=True)
+    assert partial.nnz == 12
+    assert np.allclose(partial.data, np.pi / 2.0)
+    # two antipodal caps, the added point lies in the empty band between them
+    phi, theta = _usphere_randoms(400, 7, costheta_min=0.8)
+    phi = np.concatenate([phi, phi])
+    theta = np.concatenate([theta, np.pi - theta])
+    partial = construct_del_usphere(phi, theta, partial=True)
+    _, weights = graph2data(construct_mst(partial))
+    _, full_weights = graph2data(construct_mst(construct_del_usphere(phi, theta)))
+    assert len(weights) == 799
+    assert np.isclose(np.sum(weights), np.sum(full_weights))
+
+
+def test_construct_del_pointset():
+    rng = np.random.default_rng(5)
+    x, y, z = rng.random((3, 300))
+    del_graph = construct_del(PointSet(x, y, z))
+    ref = construct_del3D(x, y, z)
+    assert np.array_equal((del_graph + del_graph.T).nnz, (ref + ref.T).nnz)
+    _, weights = graph2data(construct_mst(del_graph))
+    _, ref_weights = graph2data(construct_mst(ref))
+    assert np.isclose(np.sum(weights), np.sum(ref_weights))
+    del_graph = construct_del(PointSet(x, y))
+    _, weights = graph2data(construct_mst(del_graph))
+    _, ref_weights = graph2data(construct_mst(construct_del2D(x, y)))
+    assert np.isclose(np.sum(weights), np.sum(ref_weights))
+
+
+def test_delaunay2graph_edges():
+    from scipy.spatial import Delaunay
+    from mistreeplus.graph import delaunay2graph
+
+    rng = np.random.default_rng(4)
+    for ndim in [2, 3]:
+        vert = rng.random((500, ndim))
+        delaunay = Delaunay(vert)
+        tri = delaunay.simplices
+        pairs = [(i, j) for i in range(ndim + 1) for j in range(i + 1, ndim + 1)]
+        idx1 = np.concatenate([tri[:, i] for i, j in pairs])
+        idx2 = np.concatenate([tri[:, j] for i, j in pairs])
+        expected = set(zip(np.minimum(idx1, idx2).tolist(), np.maximum(idx1, idx2).tolist()))
+        edge_idx, weights = graph2data(delaunay2graph(delaunay))
+        assert set(zip(edge_idx[0].tolist(), edge_idx[1].tolist())) == expected
+        assert edge_idx.shape[1] == len(expected)
+        assert np.allclose(weights, np.linalg.norm(vert[edge_idx[0]] - vert[edge_idx[1]], axis=1))
+
+
+def test_construct_del_adjacency():
+    from mistreeplus.tree import get_adjacents, get_adjacents_csr
+
+    rng = np.random.default_rng(5)
+    points = PointSet(*rng.random((3, 400)))
+    del_graph, adjacency = construct_del(points, return_adjacency=True)
+    assert (adjacency != adjacency.T).nnz == 0
+    assert adjacency.nnz == 2 * del_graph.nnz
+    edge_idx, weights = graph2data(del_graph)
+    adjacents_idx, adjacents_wei = get_adjacents(edge_idx, weights, 400)
+    _adjacents_idx, _adjacents_wei = get_adjacents_csr(adjacency)
+    assert _adjacents_idx == adjacents_idx
+    assert np.allclose(np.concatenate(_adjacents_wei), np.concatenate(adjacents_wei))
+    assert get_adjacents_csr(del_graph)[0] == adjacents_idx
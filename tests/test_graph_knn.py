@@ -1,7 +1,8 @@
 import pytest
 import numpy as np
 from scipy.sparse import csr_matrix
-from mistreeplus.graph import construct_knn2D, construct_knn3D
+from mistreeplus.graph import construct_knn2D, construct_knn3D, construct_knn
+from mistreeplus.coords import PointSet
 
 
 # Test for construct_knn2D
@@ -49,3 +50,13 @@ def test_construct_knn3D():
 
     # Check that each row has exactly k non-zero entries for k-NN
     assert all(np.sum(knn_graph[i].toarray()) > 0 for i in range(len(x)))
+
+
+def test_construct_knn_pointset():
+    rng = np.random.default_rng(1)
+    x, y, z = rng.random((3, 500))
+    knn_graph = construct_knn(PointSet(x, y, z), 5)
+    assert isinstance(knn_graph, csr_matrix)
+    assert abs(knn_graph - construct_knn3D(x, y, z, 5)).max() == 0.0
+    knn_graph = construct_knn(PointSet(x, y), 5)
+    assert abs(knn_graph - construct_knn2D(x, y, 5)).max() == 0.0
@@ -1,6 +1,6 @@
 import pytest
 import numpy as np
-from mistreeplus.graph import get_edge_index, get_stat_index, get_degree
+from mistreeplus.graph import get_edge_index, get_stat_index, get_degree, compact_degree
 
 # Mock src.getgraphdegree to enable testing without the full src module
 def mock_getgraphdegree(i1, i2, nnodes):
@@ -57,3 +57,30 @@ def test_get_degree():
     expected_degree = np.array([2, 2, 2])  # Each node is connected to two others
 
     assert np.array_equal(degree, expected_degree), "get_degree did not return the correct node degrees."
+
+
+def test_get_edge_index_dtype():
+    """Test get_edge_index compacts the indices to int32 when they fit."""
+    ind1 = np.array([0, 1, 2], dtype=np.int64)
+    ind2 = np.array([1, 2, 0], dtype=np.int64)
+    assert get_edge_index(ind1, ind2).dtype == np.int32
+    assert get_edge_index(ind1, ind2, Nnodes=2**31).dtype == np.int64
+    assert get_edge_index(np.array([], dtype=int), np.array([], dtype=int)).shape == (2, 0)
+
+
+def test_compact_degree():
+    """Test compact_degree picks the smallest signed integer type."""
+    assert compact_degree(np.array([0, 1, 127])).dtype == np.int8
+    assert compact_degree(np.array([0, 128])).dtype == np.int16
+    assert compact_degree(np.array([0, 40000])).dtype == np.int32
+    assert np.array_equal(compact_degree(np.array([3, 1, 2])), [3, 1, 2])
+
+
+def test_get_degree_dtype():
+    """Test get_degree returns float64 degrees, or compact ones on request."""
+    edge_ind = np.array([[0, 1, 2], [1, 2, 0]])
+    degree = get_degree(edge_ind, 3)
+    assert degree.dtype == np.float64 and np.array_equal(degree, [2.0, 2.0, 2.0])
+    assert get_degree(edge_ind, 3, dtype=np.int32).dtype == np.int32
+    degree = get_degree(edge_ind, 3, dtype=np.float32, compact=True)
+    assert degree.dtype == np.int8 and np.array_equal(degree, [2, 2, 2])
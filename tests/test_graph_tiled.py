@@ -0,0 +1,67 @@
+import pytest
+import numpy as np
+from mistreeplus.graph import construct_del, construct_del_tiled
+from mistreeplus.graph.tiled import _unique_edges
+from mistreeplus.coords import PointSet
+
+
+def _edges(graph):
+    graph = graph.tocoo()
+    return set(zip(graph.row.tolist(), graph.col.tolist()))
+
+
+@pytest.mark.parametrize("ndim", [2, 3])
+def test_construct_del_tiled_matches_global(ndim):
+    rng = np.random.default_rng(ndim)
+    points = PointSet(*rng.random((ndim, 2000)))
+    del_graph = construct_del(points)
+    tiled_graph = construct_del_tiled(points, ntiles=3)
+    assert _edges(tiled_graph) == _edges(del_graph)
+    assert np.isclose(tiled_graph.sum(), del_graph.sum())
+
+
+def test_construct_del_tiled_retry_clustered():
+    # a tiny halo forces retries, clustered points leave tiles nearly empty
+    rng = np.random.default_rng(4)
+    vert = np.concatenate([0.5 + 0.02 * rng.normal(size=(800, 3)), rng.random((200, 3))])
+    points = PointSet(*vert.T)
+    tiled_graph = construct_del_tiled(points, ntiles=3, halo=1e-3, max_retries=10)
+    assert _edges(tiled_graph) == _edges(construct_del(points))
+
+
+def test_construct_del_tiled_processes():
+    rng = np.random.default_rng(5)
+    points = PointSet(*rng.random((3, 1000)))
+    # more tiles than workers, so tiles are submitted as slots free up
+    tiled_graph = construct_del_tiled(points, ntiles=3, nprocs=2)
+    assert _edges(tiled_graph) == _edges(construct_del(points))
+
+
+def test_unique_edges_large_indices():
+    npts = 2 * 10**8
+    idx1 = np.array([npts - 3, 5, npts - 3, npts - 3])
+    idx2 = np.array([npts - 1, npts - 2, npts - 2, npts - 1])
+    idx1, idx2 = _unique_edges(idx1, idx2, npts)
+    assert idx1.tolist() == [5, npts - 3, npts - 3]
+    assert idx2.tolist() == [npts - 2, npts - 2, npts - 1]
+
+
+def test_construct_del_tiled_invalid():
+    rng = np.random.default_rng(6)
+    points = PointSet(*rng.random((2, 500)))
+    with pytest.raises(ValueError):
+        construct_del_tiled(points, ntiles=0)
+    with pytest.raises(ValueError):
+        construct_del_tiled(points, ntiles=4, halo=1e-6, max_retries=0)
+
+
+def test_construct_del_tiled_shell():
+    # most points of a thin shell are hull vertices, only those near a tile are used
+    rng = np.random.default_rng(7)
+    vert = rng.normal(size=(1500, 3))
+    radius = (1.0 - 0.01 * rng.random(1500)) / np.linalg.norm(vert, axis=1)
+    vert *= radius[:, np.newaxis]
+    points = PointSet(*vert.T)
+    tiled_graph = construct_del_tiled(points, ntiles=3, halo=0.3)
+    assert _edges(tiled_graph) == _edges(construct_del(points))
+
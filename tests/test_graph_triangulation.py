@@ -0,0 +1,75 @@
+import pytest
+import numpy as np
+from scipy.spatial import ConvexHull
+from scipy.spatial.distance import cdist
+from mistreeplus.graph import Triangulation, construct_del
+from mistreeplus.coords import PointSet
+from mistreeplus.mst import construct_mst
+
+
+def _brute_force(vert, idx1, idx2, dist):
+    # Gabriel and RNG membership of each edge by checking every point
+    alldist = cdist(vert, vert)
+    gabriel, rng = [], []
+    for i, j, d in zip(idx1, idx2, dist):
+        mid = 0.5 * (vert[i] + vert[j])
+        dmid = np.linalg.norm(vert - mid, axis=1)
+        dlune = np.maximum(alldist[i], alldist[j])
+        dmid[[i, j]], dlune[[i, j]] = np.inf, np.inf
+        gabriel.append(np.all(dmid >= 0.5 * d * (1.0 - 1e-10)))
+        rng.append(np.all(dlune >= d * (1.0 - 1e-10)))
+    return np.array(gabriel), np.array(rng)
+
+
+@pytest.mark.parametrize("ndim", [2, 3])
+def test_triangulation_graphs(ndim):
+    rng = np.random.default_rng(ndim)
+    points = PointSet(*rng.random((ndim, 300)))
+    tri = Triangulation(points)
+    idx1, idx2, dist = tri.get_edges()
+    gabriel, rng_mask = _brute_force(points.vert, idx1, idx2, dist)
+    assert np.array_equal(tri._get_gabriel(), gabriel)
+    assert np.array_equal(tri._get_rng(), rng_mask)
+    assert tri.get_gabriel_graph().nnz == np.sum(gabriel)
+    assert tri.get_rng_graph().nnz == np.sum(rng_mask)
+    del_graph = construct_del(points)
+    assert tri.get_delaunay_graph().nnz == del_graph.nnz
+    weight = construct_mst(del_graph).sum()
+    for graph in [None, "rng", "gabriel", "delaunay"]:
+        mst = tri.get_mst(graph)
+        assert mst.nnz == len(points) - 1
+        assert np.isclose(mst.sum(), weight)
+
+
+def test_triangulation_rng_clustered():
+    # clustered points, where lunes are often blocked by non-neighbours
+    rng = np.random.default_rng(5)
+    vert = np.concatenate([0.01 * rng.normal(size=(250, 3)), rng.random((50, 3))])
+    points = PointSet(*vert.T)
+    tri = Triangulation(points)
+    gabriel, rng_mask = _brute_force(points.vert, *tri.get_edges())
+    assert np.array_equal(tri._get_gabriel(), gabriel)
+    assert np.array_equal(tri._get_rng(), rng_mask)
+
+
+def test_triangulation_mst_invalid():
+    rng = np.random.default_rng(0)
+    tri = Triangulation(PointSet(*rng.random((2, 20))))
+    with pytest.raises(ValueError):
+        tri.get_mst("knn")
+
+
+@pytest.mark.parametrize("ndim", [2, 3])
+def test_triangulation_dtfe(ndim):
+    rng = np.random.default_rng(10 + ndim)
+    vert = rng.random((500, ndim))
+    weights = rng.random(500)
+    tri = Triangulation(PointSet(*vert.T, weights=weights))
+    volume = tri.get_simplex_volumes()
+    assert np.isclose(np.sum(volume), ConvexHull(vert).volume)
+    density = tri.get_dtfe_density()
+    assert len(density) == 500 and np.all(density > 0.0)
+    # every simplex volume is shared by its D+1 points
+    assert np.isclose(np.sum(weights / density), ConvexHull(vert).volume)
+    unweighted = Triangulation(PointSet(*vert.T)).get_dtfe_density()
+    assert np.allclose(density, weights * unweighted)
@@ -0,0 +1,49 @@
+import pytest
+import numpy as np
+from scipy.sparse import csr_matrix
+from mistreeplus.coords import usphere2cart, usphere_dist2ang
+from mistreeplus.graph import construct_knn3D, construct_knn_usphere, construct_knn_usphere_radec, graph2data
+from mistreeplus.mst import construct_mst, construct_mst_usphere
+
+
+def _randoms(size, seed):
+    rng = np.random.default_rng(seed)
+    phi = 2 * np.pi * rng.random(size)
+    theta = np.arccos(1 - 2 * rng.random(size))
+    return phi, theta
+
+
+@pytest.mark.parametrize("method, nside", [("kdtree", None), ("kdtree", 3), ("balltree", None), ("balltree", 2)])
+def test_construct_knn_usphere(method, nside):
+    phi, theta = _randoms(500, 1)
+    knn_graph = construct_knn_usphere(phi, theta, 5, method=method, nside=nside)
+    assert isinstance(knn_graph, csr_matrix)
+    assert knn_graph.shape == (500, 500)
+    assert np.all(knn_graph.getnnz(axis=1) == 5)
+    assert np.all(knn_graph.diagonal() == 0)
+    # weights are angular distances of the chord kNN graph
+    x, y, z = usphere2cart(phi, theta)
+    chord = construct_knn3D(x, y, z, 5)
+    assert np.allclose(np.sort(knn_graph.data), np.sort(usphere_dist2ang(chord.data)))
+
+
+def test_construct_knn_usphere_radec():
+    phi, theta = _randoms(200, 2)
+    knn1 = construct_knn_usphere(np.rad2deg(phi), np.rad2deg(theta), 4, units="degs")
+    knn2 = construct_knn_usphere_radec(phi, np.pi / 2 - theta, 4)
+    assert np.allclose(knn1.toarray(), knn2.toarray())
+
+
+def test_construct_knn_usphere_invalid_method():
+    phi, theta = _randoms(20, 3)
+    with pytest.raises(ValueError):
+        construct_knn_usphere(phi, theta, 4, method="brute")
+
+
+def test_construct_mst_usphere():
+    phi, theta = _randoms(1000, 4)
+    edge_idx, weights = graph2data(construct_mst_usphere(phi, theta, 10, nside=4))
+    assert edge_idx.shape[1] == 999
+    x, y, z = usphere2cart(phi, theta)
+    _, chord = graph2data(construct_mst(construct_knn3D(x, y, z, 10)))
+    assert np.isclose(np.sum(weights), np.sum(usphere_dist2ang(chord)))
@@ -0,0 +1,35 @@
+import itertools
+import pytest
+import numpy as np
+from mistreeplus.index import morton_index, hilbert_index, sfc_order
+
+
+@pytest.mark.parametrize("ndim", [2, 3])
+def test_hilbert_index_adjacent(ndim):
+    # grid cell centres, consecutive cells along the curve share a face
+    cells = np.array(list(itertools.product(range(8), repeat=ndim)), dtype=float) + 0.5
+    keys = hilbert_index(cells, bits=3)
+    assert np.array_equal(np.sort(keys), np.arange(8**ndim))
+    steps = np.abs(np.diff(cells[np.argsort(keys)], axis=0)).sum(axis=1)
+    assert np.all(steps == 1.0)
+
+
+def test_morton_index():
+    vert = np.array([[0.0, 0.0], [1.0, 0.0], [0.0, 1.0], [1.0, 1.0]])
+    assert np.array_equal(morton_index(vert, bits=1), [0, 2, 1, 3])
+    vert = np.array([[0.0, 0.0, 1.0], [1.0, 1.0, 1.0], [0.0, 0.0, 0.0]])
+    assert np.array_equal(morton_index(vert, bits=1), [1, 7, 0])
+
+
+def test_sfc_order():
+    rng = np.random.default_rng(0)
+    vert = rng.random((1000, 3))
+    for curve in ["hilbert", "morton"]:
+        order = sfc_order(vert, curve=curve)
+        assert np.array_equal(np.sort(order), np.arange(1000))
+    assert len(sfc_order(np.zeros((0, 2)))) == 0
+    assert np.array_equal(sfc_order(np.ones((3, 2))), [0, 1, 2])
+    with pytest.raises(ValueError):
+        sfc_order(vert, curve="peano")
+    with pytest.raises(ValueError):
+        hilbert_index(vert, bits=22)
@@ -1,5 +1,6 @@
 import pytest
 import numpy as np
+from mistreeplus.coords import PointSet
 from mistreeplus.legacy import find_branches, get_branch_weight, get_branch_end_index, get_branch_edge_count, get_branch_shape
 
 # Sample data for testing
@@ -54,3 +55,19 @@ def test_get_branch_shape(sample_data):
     result = get_branch_shape(edge_ind, edge_deg, branch, branch_wei, mode='2D', x=x, y=y)
     expected_result = [np.sqrt(5)/branch_wei[0]]  # Adjust expected values as needed
     assert all(result == expected_result)
+
+
+# Test find_branches and get_branch_shape with a PointSet
+def test_branches_pointset(sample_data):
+    edge_ind, degree, x, y = sample_data
+    points = PointSet(x, y)
+    result, _ = find_branches(edge_ind, degree, points=points)
+    np.testing.assert_array_equal(result, [[0, 1, 2]])
+    edge_deg = np.array([degree[edge_ind[0]], degree[edge_ind[1]]])
+    branch_wei = np.array([3.0])
+    result = get_branch_shape(edge_ind, edge_deg, [[0, 1, 2]], branch_wei, points=points)
+    expected = get_branch_shape(edge_ind, edge_deg, [[0, 1, 2]], branch_wei, mode="2D", x=x, y=y)
+    assert np.array_equal(result, expected)
+    z = np.array([0.0, 0.0, 0.0, 2.0])
+    result = get_branch_shape(edge_ind, edge_deg, [[0, 1, 2]], branch_wei, points=PointSet(x, y, z))
+    assert np.isclose(result[0], 3.0 / 3.0)
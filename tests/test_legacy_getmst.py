@@ -107,3 +107,101 @@ def test_get_stats(mock_coords, mock_graph, mock_mst, mock_branches):
     mst = GetMST(x=x, y=y)
     stats = mst.get_stats()
     assert len(stats) == 4  # degree, edge_length, branch_length, branch_shape
+
+def test_define_graph_delaunay():
+    """Test the Delaunay graph option gives the same MST as the kNN graph."""
+    rng = np.random.default_rng(1)
+    ra = 360.0 * rng.random(500)
+    dec = np.rad2deg(np.arcsin(2.0 * rng.random(500) - 1.0))
+    knn_mst = GetMST(ra=ra, dec=dec, units='degs')
+    knn_mst.construct_mst()
+    del_mst = GetMST(ra=ra, dec=dec, units='degs')
+    del_mst.define_graph('delaunay')
+    del_mst.construct_mst()
+    assert np.isclose(np.sum(del_mst.edge_length), np.sum(knn_mst.edge_length))
+    x, y = rng.random(200), rng.random(200)
+    del_mst = GetMST(x=x, y=y)
+    del_mst.define_graph('delaunay')
+    del_mst.construct_mst()
+    assert del_mst.edge_index.shape[1] == 199
+    with pytest.raises(ValueError):
+        del_mst.define_graph('gabriel')
+
+def test_getmst_points():
+    """Test GetMST with a PointSet gives the same MST as separate coordinates."""
+    from mistreeplus.coords import PointSet
+    rng = np.random.default_rng(2)
+    x, y, z = rng.random((3, 300))
+    points = PointSet(x, y, z)
+    mst = GetMST(points=points)
+    assert mst._mode == '3D'
+    assert np.shares_memory(mst.x, points.vert)
+    mst.construct_mst()
+    ref = GetMST(x=x, y=y, z=z)
+    ref.construct_mst()
+    assert np.isclose(np.sum(mst.edge_length), np.sum(ref.edge_length))
+
+def test_getmst_points_reordered():
+    """Test the statistics of a reordered PointSet refer to the original points."""
+    from mistreeplus.coords import PointSet
+    rng = np.random.default_rng(2)
+    x, y = rng.random((2, 300))
+    mst = GetMST(points=PointSet(x, y, reorder='hilbert'))
+    degree, _, _, _, edge_index, branch_index = mst.get_stats(include_index=True)
+    ref = GetMST(x=x, y=y)
+    ref_degree, _, _, _, ref_edge_index, _ = ref.get_stats(include_index=True)
+    assert np.array_equal(degree, ref_degree)
+    edges = set(zip(*np.sort(edge_index, axis=0).tolist()))
+    assert edges == set(zip(*np.sort(ref_edge_index, axis=0).tolist()))
+    # edge lengths match the original coordinates of the returned indexes
+    vert = np.column_stack([x, y])
+    length = np.linalg.norm(vert[edge_index[0]] - vert[edge_index[1]], axis=1)
+    assert np.allclose(length, mst.edge_length)
+    assert sum(len(branch) for branch in branch_index) <= edge_index.shape[1]
+
+def test_getmst_profiling():
+    """Test the per stage profiling report and callback."""
+    rng = np.random.default_rng(3)
+    x, y = rng.random((2, 500))
+    records = []
+    mst = GetMST(x=x, y=y)
+    with pytest.raises(ValueError):
+        mst.get_profile()
+    mst.define_profiling(callback=records.append)
+    mst.get_stats()
+    report = mst.get_profile()
+    stages = [record['stage'] for record in report['stages']]
+    assert stages == ['knn', 'mst', 'degree', 'edge_degree', 'branches', 'branch_shape']
+    assert len(records) == 6 and records[0]['stage'] == 'knn'
+    for record in report['stages']:
+        assert record['wall_time'] >= 0.0 and record['cpu_time'] >= 0.0
+        assert np.isclose(record['run_time'], max(record['wall_time'] - record['compile_time'], 0.0))
+        assert record['peak_memory'] >= 0
+    assert np.isclose(report['total']['wall_time'], sum(r['wall_time'] for r in report['stages']))
+    assert 'branch_shape' in mst.profiler.summary()
+    # rerunning replaces the previous records
+    mst.get_stats()
+    assert len(mst.get_profile()['stages']) == 6
+    mst.define_profiling(memory=False)
+    mst.get_stats()
+    assert mst.get_profile()['stages'][0]['peak_memory'] is None
+    mst.define_profiling(False)
+    assert mst.profiler is None
+
+def test_stage_profiler_compile_time():
+    """Test numba compilation is recorded separately from the run time."""
+    from numba import njit
+    from mistreeplus.legacy import StageProfiler
+
+    @njit
+    def _add(a, b):
+        return a + b
+
+    profiler = StageProfiler(memory=False)
+    with profiler.stage('first'):
+        _add(1.0, 2.0)
+    with profiler.stage('second'):
+        _add(1.0, 2.0)
+    first, second = profiler.report()['stages']
+    assert first['compile_time'] > 0.0
+    assert second['compile_time'] == 0.0
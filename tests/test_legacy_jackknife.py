@@ -0,0 +1,73 @@
+import numpy as np
+import pytest
+from scipy.sparse.csgraph import connected_components
+from mistreeplus.graph import construct_knn2D, data2graph, graph2data
+from mistreeplus.mst import construct_mst
+from mistreeplus.legacy import JackknifeMST, get_jackknife_cov
+
+
+def test_get_jackknife_cov():
+    hists = np.array([[1.0, 2.0], [3.0, 2.0], [2.0, 5.0]])
+    mean, cov = get_jackknife_cov(hists)
+    assert np.allclose(mean, [2.0, 3.0])
+    diff = hists - mean
+    assert np.allclose(cov, (2.0 / 3.0) * diff.T @ diff)
+    assert np.allclose(cov, cov.T)
+
+
+def test_subsample_mst_matches_recompute():
+    rng = np.random.default_rng(3)
+    x, y = rng.random(800), rng.random(800)
+    regions = (x * 2).astype(int) * 2 + (y * 2).astype(int)
+    jk = JackknifeMST(regions, x=x, y=y, k_neighbours=10)
+    for label in range(4):
+        keep, edge_idx, weights = jk.get_subsample_mst(label)
+        assert np.all(regions[keep] != label)
+        assert edge_idx.shape[1] == len(keep) - 1
+        _, full_weights = graph2data(construct_mst(construct_knn2D(x[keep], y[keep], 10)))
+        assert np.isclose(np.sum(weights), np.sum(full_weights))
+
+
+def test_subsample_mst_reconnects_separated_fragments():
+    """Removing the bridge between two clusters leaves no kNN edge between them."""
+    rng = np.random.default_rng(4)
+    x = np.concatenate([rng.random(200), 5.0 + rng.random(200), np.linspace(1.0, 5.0, 40)])
+    y = np.concatenate([rng.random(200), rng.random(200), np.full(40, 0.5)])
+    regions = np.concatenate([np.zeros(400, dtype=int), np.ones(40, dtype=int)])
+    jk = JackknifeMST(regions, x=x, y=y, k_neighbours=5)
+    keep, edge_idx, weights = jk.get_subsample_mst(1)
+    assert edge_idx.shape[1] == len(keep) - 1
+    ncomp, _ = connected_components(data2graph(edge_idx, weights, len(keep)), directed=False)
+    assert ncomp == 1
+    assert np.max(weights) > 3.0
+
+
+def test_jackknife_get_stats():
+    rng = np.random.default_rng(5)
+    x, y = rng.random(600), rng.random(600)
+    regions = (x * 3).astype(int)
+    jk = JackknifeMST(regions, x=x, y=y, k_neighbours=10, nthreads=2)
+    results = jk.get_stats(nbins=10)
+    assert results["degree"].shape == (3, 6)
+    assert results["edge_length"].shape == (3, 10)
+    assert results["branch_shape"].shape == (3, 10)
+    nbins = sum(len(bins) - 1 for bins in results["bins"])
+    assert results["cov"].shape == (nbins, nbins)
+    for i, label in enumerate(results["regions"]):
+        assert np.sum(results["degree"][i]) == np.sum(regions != label)
+        assert np.sum(results["edge_length"][i]) <= np.sum(regions != label) - 1
+    serial = JackknifeMST(regions, x=x, y=y, k_neighbours=10, nthreads=1).get_stats(nbins=10)
+    for name in ["degree", "edge_length", "branch_length", "branch_shape"]:
+        assert np.array_equal(serial[name], results[name])
+
+
+def test_jackknife_usphere():
+    rng = np.random.default_rng(6)
+    phi = 2.0 * np.pi * rng.random(500)
+    theta = np.arccos(1.0 - 2.0 * rng.random(500))
+    regions = (phi / np.pi).astype(int)
+    jk = JackknifeMST(regions, phi=phi, theta=theta, units="rads", k_neighbours=10)
+    results = jk.get_stats(nbins=10)
+    assert results["edge_length"].shape == (2, 10)
+    # angular edge lengths are bounded by pi
+    assert results["bins"][1][-1] < np.pi
@@ -0,0 +1,83 @@
+import numpy as np
+import pytest
+from mistreeplus.graph import construct_knn3D, graph2data
+from mistreeplus.mst import construct_mst, construct_mst_usphere
+from mistreeplus.legacy import TomographicMST
+
+
+def _catalogue(size, seed):
+    rng = np.random.default_rng(seed)
+    ra = 360.0 * rng.random(size)
+    dec = np.rad2deg(np.arcsin(2.0 * rng.random(size) - 1.0))
+    r = 100.0 * rng.random(size)
+    return ra, dec, r
+
+
+def test_tomographic_shells_are_contiguous():
+    ra, dec, r = _catalogue(1000, 1)
+    tomo = TomographicMST(r, [10.0, 40.0, 70.0, 90.0], ra=ra, dec=dec)
+    assert np.all(np.diff(tomo.r) >= 0.0)
+    assert len(tomo.r) == np.sum((r >= 10.0) & (r < 90.0))
+    assert np.array_equal(tomo.r, r[tomo.order])
+    for i in range(3):
+        s = tomo.get_shell(i)
+        assert np.all(tomo.shell[s] == i)
+        assert np.all((tomo.r[s] >= tomo.shell_edges[i]) & (tomo.r[s] < tomo.shell_edges[i + 1]))
+        assert np.shares_memory(tomo.uvert[s], tomo.uvert)
+
+
+def test_tomographic_shell_mst_matches_per_shell():
+    ra, dec, r = _catalogue(1500, 2)
+    tomo = TomographicMST(r, [0.0, 50.0, 100.0], ra=ra, dec=dec, k_neighbours=10)
+    edge_idx, edge_length = tomo.construct_shell_mst()
+    assert edge_idx.shape[1] == len(tomo.r) - 2
+    shell = tomo.shell[edge_idx[0]]
+    assert np.array_equal(shell, tomo.shell[edge_idx[1]])
+    for i in range(2):
+        s = tomo.get_shell(i)
+        phi = np.deg2rad(ra[tomo.order][s])
+        theta = np.pi / 2.0 - np.deg2rad(dec[tomo.order][s])
+        _, weights = graph2data(construct_mst_usphere(phi, theta, 10))
+        assert np.isclose(np.sum(edge_length[shell == i]), np.sum(weights))
+
+
+def test_tomographic_get_stats():
+    ra, dec, r = _catalogue(800, 3)
+    tomo = TomographicMST(r, [0.0, 50.0, 100.0], ra=ra, dec=dec, k_neighbours=10, nthreads=2)
+    results = tomo.get_stats()
+    assert len(results["degree"]) == len(results["degree_shell"]) == 800
+    assert len(results["edge_length"]) == len(results["edge_shell"]) == 798
+    assert len(results["branch_length"]) == len(results["branch_shell"])
+    assert np.all(results["edge_length"] < np.pi)
+    assert np.all(np.bincount(results["degree_shell"]) == np.diff(tomo.shell_index))
+    assert np.sum(results["branch_length"]) <= np.sum(results["edge_length"])
+    assert np.all((results["branch_shape"] >= 0.0) & (results["branch_shape"] <= 1.0 + 1e-10))
+    _, weights = graph2data(construct_mst(construct_knn3D(*tomo.vert.T, 10)))
+    assert np.isclose(np.sum(results["3D"]["edge_length"]), np.sum(weights))
+    assert len(results["3D"]["degree"]) == 800
+
+
+def test_tomographic_phi_theta():
+    ra, dec, r = _catalogue(300, 4)
+    tomo1 = TomographicMST(r, [0.0, 100.0], ra=ra, dec=dec)
+    tomo2 = TomographicMST(r, [0.0, 100.0], phi=ra, theta=90.0 - dec)
+    assert np.allclose(tomo1.vert, tomo2.vert)
+
+
+def test_tomographic_origin_direction():
+    ra, dec, r = _catalogue(500, 5)
+    r[:3] = 0.0
+    tomo = TomographicMST(r, [0.0, 50.0, 100.0], ra=ra, dec=dec, k_neighbours=10)
+    assert np.all(np.isfinite(tomo.uvert))
+    assert np.allclose(np.sum(tomo.uvert**2.0, axis=1), 1.0)
+    assert np.allclose(tomo.vert[tomo.r == 0.0], 0.0)
+    edge_idx, edge_length = tomo.construct_shell_mst()
+    assert np.all(np.isfinite(edge_length))
+
+
+def test_tomographic_requires_angles():
+    _, _, r = _catalogue(10, 6)
+    with pytest.raises(ValueError):
+        TomographicMST(r, [0.0, 100.0])
+    with pytest.raises(ValueError):
+        TomographicMST(r, [0.0, 100.0], phi=np.zeros(10))
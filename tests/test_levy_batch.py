@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+from mistreeplus.levy import generate_user_flights, generate_levy_flights, generate_adj_levy_flights
+
+
+def test_generate_user_flights_shapes():
+    steps = np.ones((4, 3))
+    pos = generate_user_flights(steps, mode="2D", boxsize=10.0, seed=1)
+    assert pos.shape == (4, 4, 2)
+    pos = generate_user_flights(steps, mode="3D", boxsize=10.0, seed=1)
+    assert pos.shape == (4, 4, 3)
+    pos = generate_user_flights(steps, mode="usphere", seed=1)
+    assert pos.shape == (4, 4, 2)
+
+
+def test_generate_user_flights_starts():
+    steps = np.ones((2, 5))
+    starts = np.array([[1.0, 2.0], [3.0, 4.0]])
+    pos = generate_user_flights(steps, starts=starts, mode="2D", periodic=False, seed=2)
+    assert np.allclose(pos[:, 0], starts)
+    # unit steps in the plane
+    dist = np.sqrt(np.sum(np.diff(pos, axis=1) ** 2.0, axis=2))
+    assert np.allclose(dist, 1.0)
+
+
+def test_generate_levy_flights_reproducible():
+    pos1 = generate_levy_flights(5, 20, mode="3D", seed=42)
+    pos2 = generate_levy_flights(5, 20, mode="3D", seed=42)
+    pos3 = generate_levy_flights(5, 20, mode="3D", seed=43)
+    assert pos1.shape == (5, 20, 3)
+    assert np.array_equal(pos1, pos2)
+    assert not np.array_equal(pos1, pos3)
+    # walkers use independent streams
+    assert not np.array_equal(pos1[0], pos1[1])
+
+
+def test_generate_levy_flights_periodic():
+    pos = generate_levy_flights(3, 200, t0=5.0, mode="2D", boxsize=10.0, seed=3)
+    assert np.all(pos >= 0.0) and np.all(pos <= 10.0)
+
+
+def test_generate_adj_levy_flights_usphere():
+    pos = generate_adj_levy_flights(4, 30, mode="usphere", seed=5)
+    assert pos.shape == (4, 30, 2)
+    assert np.all((pos[:, :, 0] >= 0.0) & (pos[:, :, 0] <= 2.0 * np.pi))
+    assert np.all((pos[:, :, 1] >= 0.0) & (pos[:, :, 1] <= np.pi))
@@ -37,3 +37,42 @@ def test_generate_adj_levy_flight():
 
     pos = generate_adj_levy_flight(size, t0=0.4, ts=0.015, alpha=1.4, beta=0.4, gamma=1.5, mode="usphere")
     assert pos.shape == (size, 2), f"Expected shape ({size}, 2), got {pos.shape}"
+
+
+def test_generate_user_flight_start():
+    steps = np.array([1.0, 2.0, 3.0])
+    pos = generate_user_flight(steps, start=[1.0, 2.0], mode="2D", periodic=False, rng=1)
+    assert np.allclose(pos[0], [1.0, 2.0])
+    assert np.allclose(np.sqrt(np.sum(np.diff(pos, axis=0) ** 2, axis=1)), steps)
+    pos = generate_user_flight(steps, start=[1.0, 2.0, 3.0], mode="3D", periodic=False)
+    assert np.allclose(pos[0], [1.0, 2.0, 3.0])
+    pos = generate_user_flight(steps, start=[0.5, 1.0], mode="usphere")
+    assert np.allclose(pos[0], [0.5, 1.0])
+
+
+def test_generate_levy_flight_reproducible():
+    pos1 = generate_levy_flight(100, mode="3D", boxsize=5.0, rng=7)
+    pos2 = generate_levy_flight(100, mode="3D", boxsize=5.0, rng=7)
+    assert np.array_equal(pos1, pos2)
+    assert np.all((pos1 >= 0.0) & (pos1 <= 5.0))
+    pos1 = generate_adj_levy_flight(100, mode="2D", periodic=False, rng=3)
+    pos2 = generate_adj_levy_flight(100, mode="2D", periodic=False, rng=3)
+    assert np.array_equal(pos1, pos2)
+
+
+def test_generate_levy_flight_uses_generator_stream(monkeypatch):
+    from mistreeplus.levy import flight
+    pos1 = generate_levy_flight(100, mode="2D", start=[1.0, 1.0], rng=np.random.default_rng(4))
+    # the walk draws a step size and a direction per step from the generator
+    rng = np.random.default_rng(4)
+    u = rng.random((99, 2))
+    step = 0.2 * (1.0 - u[:, 0]) ** (-1.0 / 1.5)
+    expected = np.array([1.0, 1.0]) + np.cumsum(
+        step[:, None] * np.column_stack([np.cos(2 * np.pi * u[:, 1]), np.sin(2 * np.pi * u[:, 1])]),
+        axis=0,
+    )
+    assert np.allclose(pos1[1:], expected % 75.0)
+    # the randoms are drawn in blocks without changing the walk
+    monkeypatch.setattr(flight, "_CHUNK", 7)
+    pos2 = generate_levy_flight(100, mode="2D", start=[1.0, 1.0], rng=np.random.default_rng(4))
+    assert np.allclose(pos1, pos2)
@@ -42,3 +42,9 @@ def test_generate_adj_levy_steps():
     # Validate that steps above beta are calculated as expected
     steps_above_beta = steps[steps >= t0]
     assert np.all(steps_above_beta >= t0), "Expected all steps above beta to be >= t0"
+
+def test_generate_adj_levy_steps_out():
+    out = np.empty(500)
+    steps = generate_adj_levy_steps(500, 0.3, 0.01, 1.5, 0.4, 1.3, rng=3, out=out)
+    assert steps is out
+    assert np.array_equal(steps, generate_adj_levy_steps(500, 0.3, 0.01, 1.5, 0.4, 1.3, rng=3))
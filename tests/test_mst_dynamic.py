@@ -0,0 +1,110 @@
+import numpy as np
+import pytest
+from mistreeplus.graph import construct_knn2D, construct_knn3D, graph2data, get_degree
+from mistreeplus.mst import construct_mst, DynamicMST, find_changed_branches
+
+
+def _mst2D(x, y, k=10):
+    return graph2data(construct_mst(construct_knn2D(x, y, k)))
+
+
+def _mst3D(x, y, z, k=10):
+    return graph2data(construct_mst(construct_knn3D(x, y, z, k)))
+
+
+@pytest.fixture
+def points2D():
+    rng = np.random.default_rng(10)
+    return rng.random(600), rng.random(600)
+
+
+def test_insert_matches_full_recompute(points2D):
+    x, y = points2D
+    edge_idx, weights = _mst2D(x[:500], y[:500])
+    dmst = DynamicMST(edge_idx, weights, x[:500], y[:500], k_neighbours=10)
+    new_idx, report = dmst.insert(x[500:], y[500:])
+    assert np.array_equal(new_idx, np.arange(500, 600))
+    _, full_weights = _mst2D(x, y)
+    assert dmst.edge_idx.shape == (2, 599)
+    assert np.isclose(np.sum(dmst.weights), np.sum(full_weights))
+    assert len(report["added_edges"]) >= 100
+    assert np.all(report["added_edges"] < len(dmst.weights))
+
+
+def test_remove_matches_full_recompute(points2D):
+    x, y = points2D
+    edge_idx, weights = _mst2D(x, y)
+    dmst = DynamicMST(edge_idx, weights, x, y, k_neighbours=10)
+    remove = np.where((x < 0.4) & (y < 0.4))[0]
+    report = dmst.remove(remove)
+    keep = np.setdiff1d(np.arange(len(x)), remove)
+    _, full_weights = _mst2D(x[keep], y[keep])
+    assert dmst.edge_idx.shape[1] == len(keep) - 1
+    assert np.isclose(np.sum(dmst.weights), np.sum(full_weights))
+    degree = dmst.get_degree()
+    assert np.all(degree[remove] == 0.0)
+    assert np.all(degree[keep] >= 1.0)
+    assert np.all(report["old2new"][report["removed_edges"]] == -1)
+
+
+def test_report_degree_changed(points2D):
+    x, y = points2D
+    edge_idx, weights = _mst2D(x[:500], y[:500])
+    dmst = DynamicMST(edge_idx, weights, x[:500], y[:500], k_neighbours=10)
+    old_degree = np.zeros(600)
+    old_degree[:500] = dmst.get_degree()
+    _, report = dmst.insert(x[500:], y[500:])
+    new_degree = dmst.get_degree()
+    expected = np.where(old_degree != new_degree)[0]
+    assert np.array_equal(report["degree_changed"], expected)
+
+
+def test_dynamic_3D():
+    rng = np.random.default_rng(4)
+    x, y, z = rng.random(400), rng.random(400), rng.random(400)
+    edge_idx, weights = _mst3D(x[:300], y[:300], z[:300])
+    dmst = DynamicMST(edge_idx, weights, x[:300], y[:300], z[:300], k_neighbours=10)
+    dmst.insert(x[300:], y[300:], z[300:])
+    _, full_weights = _mst3D(x, y, z)
+    assert np.isclose(np.sum(dmst.weights), np.sum(full_weights))
+
+
+def test_find_changed_branches():
+    branch_ind = [[0, 1, 2], [3, 4], [5]]
+    changed = find_changed_branches(branch_ind, np.array([4]))
+    assert np.array_equal(changed, [1])
+    changed = find_changed_branches(branch_ind, np.array([0, 5]))
+    assert np.array_equal(changed, [0, 2])
+    assert len(find_changed_branches([], np.array([0]))) == 0
+
+
+def test_remove_matches_exact_mst():
+    from mistreeplus.graph import construct_del2D
+    rng = np.random.default_rng(11)
+    x, y = rng.random(600), rng.random(600)
+    edge_idx, weights = graph2data(construct_mst(construct_del2D(x, y)))
+    dmst = DynamicMST(edge_idx, weights, x, y, k_neighbours=10)
+    remove = rng.choice(600, 150, replace=False)
+    dmst.remove(remove)
+    keep = np.setdiff1d(np.arange(600), remove)
+    _, exact_weights = graph2data(construct_mst(construct_del2D(x[keep], y[keep])))
+    assert dmst.edge_idx.shape[1] == len(keep) - 1
+    assert np.isclose(np.sum(dmst.weights), np.sum(exact_weights))
+    # inserting the points back restores the tree
+    dmst.insert(x[remove], y[remove])
+    assert dmst.edge_idx.shape[1] == 599
+    assert np.isclose(np.sum(dmst.weights), np.sum(weights))
+
+
+def test_insert_isolated_cluster(points2D):
+    """Inserted points whose neighbours are all new are joined by their nearest
+    existing point."""
+    x, y = points2D
+    edge_idx, weights = _mst2D(x, y)
+    dmst = DynamicMST(edge_idx, weights, x, y, k_neighbours=5)
+    rng = np.random.default_rng(12)
+    cx, cy = 3.0 + 0.01 * rng.random(20), 3.0 + 0.01 * rng.random(20)
+    dmst.insert(cx, cy)
+    assert dmst.edge_idx.shape[1] == 619
+    _, full_weights = _mst2D(np.concatenate([x, cx]), np.concatenate([y, cy]), k=30)
+    assert np.isclose(np.sum(dmst.weights), np.sum(full_weights))
@@ -5,7 +5,7 @@ from mistreeplus.randoms import polar_r, polar_phi, polar_rphi
 @pytest.fixture
 def mock_cart1d(monkeypatch):
     """Mock the cart1d function to simplify tests."""
-    def mock_cart1d(size, xmin=0., xmax=1.):
+    def mock_cart1d(size, xmin=0., xmax=1., rng=None, out=None):
         return np.linspace(xmin, xmax, size)
     monkeypatch.setattr("mistreeplus.randoms.cart.cart1d", mock_cart1d)
 
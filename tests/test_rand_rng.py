@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+from mistreeplus.randoms import get_generator, spawn_generators
+from mistreeplus.randoms import cart1d, cart3d, polar_rphi, usphere_phitheta, sphere_rphitheta
+from mistreeplus.levy import generate_levy_steps, generate_levy_flight
+
+
+def test_get_generator():
+    rng = get_generator(1)
+    assert isinstance(rng, np.random.Generator)
+    assert isinstance(rng.bit_generator, np.random.PCG64)
+    assert get_generator(rng) is rng
+    assert np.array_equal(get_generator(1).random(5), get_generator(1).random(5))
+
+
+def test_spawn_generators():
+    rngs1 = spawn_generators(4, seed=7)
+    rngs2 = spawn_generators(4, seed=7)
+    assert len(rngs1) == 4
+    draws1 = np.array([rng.random(3) for rng in rngs1])
+    draws2 = np.array([rng.random(3) for rng in rngs2])
+    assert np.array_equal(draws1, draws2)
+    assert not np.array_equal(draws1[0], draws1[1])
+
+
+def test_randoms_seeded():
+    assert np.array_equal(cart1d(10, rng=3), cart1d(10, rng=3))
+    x1, y1, z1 = cart3d(10, rng=3)
+    x2, y2, z2 = cart3d(10, rng=3)
+    assert np.array_equal(z1, z2)
+    # the axes come from one continuing stream, not a restarted one
+    assert not np.array_equal(x1, y1)
+    p1, t1 = usphere_phitheta(10, rng=get_generator(5))
+    p2, t2 = usphere_phitheta(10, rng=get_generator(5))
+    assert np.array_equal(t1, t2)
+
+
+def test_randoms_out():
+    out = np.empty(20)
+    xrand = cart1d(20, xmin=2.0, xmax=3.0, rng=1, out=out)
+    assert xrand is out
+    assert np.all((out >= 2.0) & (out <= 3.0))
+    out = (np.empty(20), np.empty(20))
+    rrand, prand = polar_rphi(20, rng=1, out=out)
+    assert rrand is out[0] and prand is out[1]
+    out = (np.empty(20), np.empty(20), np.empty(20))
+    rrand, prand, trand = sphere_rphitheta(20, rng=1, out=out)
+    assert trand is out[2]
+    assert np.all((trand >= 0.0) & (trand <= np.pi))
+
+
+def test_randoms_legacy_global_state():
+    np.random.seed(11)
+    x1 = cart1d(5)
+    np.random.seed(11)
+    x2 = cart1d(5)
+    assert np.array_equal(x1, x2)
+
+
+def test_levy_seeded():
+    assert np.array_equal(
+        generate_levy_steps(10, 0.2, 1.5, rng=2), generate_levy_steps(10, 0.2, 1.5, rng=2)
+    )
+    pos1 = generate_levy_flight(20, mode="3D", rng=4)
+    pos2 = generate_levy_flight(20, mode="3D", rng=4)
+    assert np.array_equal(pos1, pos2)
@@ -0,0 +1,46 @@
+import numpy as np
+from mistreeplus.src import csrupperedges, csredgelengths, gabrieltest, rngtest
+
+
+def test_csrupperedges_path():
+    # path graph 0 - 1 - 2 - 3 stored in both directions
+    indptr = np.array([0, 1, 3, 5, 6], dtype=np.int32)
+    indices = np.array([1, 0, 2, 1, 3, 2], dtype=np.int32)
+    vert = np.array([[0.0, 0.0], [3.0, 4.0], [3.0, 5.0], [3.0, 7.0]])
+    idx1, idx2, dist = csrupperedges(indptr, indices, vert)
+    assert np.array_equal(idx1, [0, 1, 2]) and np.array_equal(idx2, [1, 2, 3])
+    assert idx1.dtype == np.int32
+    assert np.allclose(dist, [5.0, 1.0, 2.0])
+
+
+def test_csredgelengths_symmetric():
+    indptr = np.array([0, 1, 3, 5, 6], dtype=np.int64)
+    indices = np.array([1, 0, 2, 1, 3, 2], dtype=np.int64)
+    vert = np.array([[0.0, 0.0, 0.0], [0.0, 0.0, 2.0], [0.0, 1.0, 2.0], [1.0, 1.0, 2.0]])
+    dist = csredgelengths(indptr, indices, vert)
+    assert np.allclose(dist, [2.0, 2.0, 1.0, 1.0, 1.0, 1.0])
+
+
+def test_csrupperedges_empty():
+    indptr = np.zeros(4, dtype=np.int32)
+    indices = np.zeros(0, dtype=np.int32)
+    idx1, idx2, dist = csrupperedges(indptr, indices, np.zeros((3, 2)))
+    assert len(idx1) == 0 and len(idx2) == 0 and len(dist) == 0
+
+
+def test_gabrieltest_rngtest_square():
+    # unit square with a point just inside the diametral ball of 0-2 but outside
+    # the lune of 0-1
+    vert = np.array([[0.0, 0.0], [1.0, 0.0], [1.0, 1.0], [0.0, 1.0], [0.5, 0.45]])
+    indptr = np.array([0, 3, 6, 9, 12, 16], dtype=np.int32)
+    indices = np.array(
+        [1, 3, 4, 0, 2, 4, 1, 3, 4, 0, 2, 4, 0, 1, 2, 3], dtype=np.int32
+    )
+    idx1 = np.array([0, 0, 1], dtype=np.int32)
+    idx2 = np.array([1, 4, 4], dtype=np.int32)
+    assert np.array_equal(gabrieltest(indptr, indices, vert, idx1, idx2, 1e-10), [False, True, True])
+    assert np.array_equal(rngtest(indptr, indices, vert, idx1, idx2, 1e-10), [False, True, True])
+    idx1 = np.array([0, 2], dtype=np.int32)
+    idx2 = np.array([3, 3], dtype=np.int32)
+    assert np.array_equal(gabrieltest(indptr, indices, vert, idx1, idx2, 1e-10), [True, True])
+    assert np.array_equal(rngtest(indptr, indices, vert, idx1, idx2, 1e-10), [False, False])
@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+from mistreeplus.src import randwalkcart2d, randwalkcart3d, randwalkusphere
+from mistreeplus.src import randwalkcart2d_batch, randwalkcart3d_batch, randwalkusphere_batch
+
+
+def test_randwalkcart2d_batch_matches_serial():
+    rng = np.random.default_rng(0)
+    steps = rng.random((3, 10))
+    prand = 2.0 * np.pi * rng.random((3, 10))
+    start = 10.0 * rng.random((3, 2))
+    pos = randwalkcart2d_batch(steps, prand, 10.0, start, 1)
+    for j in range(3):
+        x, y = randwalkcart2d(steps[j], prand[j], 10.0, start[j, 0], start[j, 1], 1)
+        assert np.allclose(pos[j, :, 0], x)
+        assert np.allclose(pos[j, :, 1], y)
+
+
+def test_randwalkcart3d_batch_matches_serial():
+    rng = np.random.default_rng(1)
+    steps = rng.random((3, 10))
+    prand = 2.0 * np.pi * rng.random((3, 10))
+    trand = np.pi * rng.random((3, 10))
+    start = 10.0 * rng.random((3, 3))
+    pos = randwalkcart3d_batch(steps, prand, trand, 10.0, start, 0)
+    for j in range(3):
+        x, y, z = randwalkcart3d(
+            steps[j], prand[j], trand[j], 10.0, start[j, 0], start[j, 1], start[j, 2], 0
+        )
+        assert np.allclose(pos[j, :, 0], x)
+        assert np.allclose(pos[j, :, 1], y)
+        assert np.allclose(pos[j, :, 2], z)
+
+
+def test_randwalkusphere_batch_matches_serial():
+    rng = np.random.default_rng(2)
+    steps = 0.1 * rng.random((3, 10))
+    prand = 2.0 * np.pi * rng.random((3, 10))
+    start = np.array([[1.0, 1.0], [2.0, 0.5], [4.0, 2.5]])
+    pos = randwalkusphere_batch(steps, prand, start)
+    for j in range(3):
+        phi, theta = randwalkusphere(steps[j], prand[j], start[j, 0], start[j, 1])
+        assert np.allclose(pos[j, :, 0], phi)
+        assert np.allclose(pos[j, :, 1], theta)
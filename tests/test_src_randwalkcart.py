@@ -1,6 +1,7 @@
 import numpy as np
 import pytest
 from mistreeplus.src import periodicboundary, randwalkcart2d, randwalkcart3d
+from mistreeplus.src import randwalkcart_inplace, levywalkcart_inplace
 
 
 # Test periodicboundary
@@ -118,3 +119,42 @@ def test_randwalkcart3d_edge_cases():
     assert np.allclose(x, [5.0]), "3D random walk with no steps (x) is incorrect"
     assert np.allclose(y, [5.0]), "3D random walk with no steps (y) is incorrect"
     assert np.allclose(z, [5.0]), "3D random walk with no steps (z) is incorrect"
+
+
+def test_periodicboundary_large_steps():
+    assert np.isclose(periodicboundary(1e6 + 2.5, 10.0), 2.5)
+    assert np.isclose(periodicboundary(-1e6 - 2.5, 10.0), 7.5)
+
+
+def test_randwalkcart_inplace_2d_periodic():
+    steps = np.array([1.0, 2.0, 0.5, 30.0])
+    pos = np.zeros((len(steps) + 1, 2))
+    pos[0] = [1.0, 2.0]
+    u = np.array([[0.0], [0.25], [0.5], [0.1]])
+    randwalkcart_inplace(pos, steps, 10.0, 1, u)
+    assert np.all((pos >= 0.0) & (pos <= 10.0))
+    assert np.allclose(pos[1], [2.0, 2.0])
+    assert np.allclose(pos[2], [2.0, 4.0])
+    assert np.allclose(pos[3], [1.5, 4.0])
+
+
+def test_randwalkcart_inplace_3d_no_periodic():
+    steps = np.array([1.0, 2.0, 0.5])
+    pos = np.zeros((len(steps) + 1, 3))
+    u = np.random.default_rng(1).random((len(steps), 2))
+    randwalkcart_inplace(pos, steps, 10.0, 0, u)
+    lengths = np.sqrt(np.sum(np.diff(pos, axis=0) ** 2, axis=1))
+    assert np.allclose(lengths, steps)
+
+
+def test_levywalkcart_inplace():
+    rng = np.random.default_rng(2)
+    pos = np.zeros((1001, 2))
+    levywalkcart_inplace(pos, 0.2, 0.0, 1.5, 0.0, 0.0, 0, 1.0, 0, rng.random((1000, 2)))
+    lengths = np.sqrt(np.sum(np.diff(pos, axis=0) ** 2, axis=1))
+    assert np.all(lengths >= 0.2)
+    pos = np.zeros((1001, 3))
+    levywalkcart_inplace(pos, 0.325, 0.015, 1.5, 0.45, 1.3, 1, 1.0, 0, rng.random((1000, 3)))
+    lengths = np.sqrt(np.sum(np.diff(pos, axis=0) ** 2, axis=1))
+    assert np.all(lengths >= 0.015)
+    assert np.any(lengths < 0.325)
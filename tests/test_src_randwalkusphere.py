@@ -2,6 +2,7 @@ import numpy as np
 import pytest
 from unittest.mock import patch
 from mistreeplus.src import usphererotate, randwalkusphere
+from mistreeplus.src import uspherestep, randwalkusphere_inplace, randwalkusphere_rodrigues
 
 
 # Mock linalg functions (if not provided in the context)
@@ -118,3 +119,39 @@ def test_randwalkusphere_edge_cases():
 
     assert len(phi) == 2, "Random walk with one step crossing a pole should have two positions"
     assert np.isclose(theta[-1], np.pi / 2), "Theta crossing a pole should remain consistent"
+
+
+def _usphere2cart(phi, theta):
+    return np.array([np.cos(phi) * np.sin(theta), np.sin(phi) * np.sin(theta), np.cos(theta)])
+
+
+def test_uspherestep_unit_norm():
+    px, py, pz = uspherestep(0.6, 0.0, 0.8, 1.0, 0.3)
+    assert np.isclose(px**2 + py**2 + pz**2, 1.0)
+    # the step moves the point by the angular step size
+    assert np.isclose(np.arccos(0.6 * px + 0.8 * pz), 0.3)
+    # at the poles
+    assert np.allclose(uspherestep(0.0, 0.0, 1.0, 0.0, 0.5), [np.sin(0.5), 0.0, np.cos(0.5)])
+    assert np.allclose(uspherestep(0.0, 0.0, -1.0, 0.0, 0.5), [-np.sin(0.5), 0.0, -np.cos(0.5)])
+
+
+def test_randwalkusphere_rodrigues_matches_randwalkusphere():
+    rng = np.random.default_rng(1)
+    steps = 0.3 * rng.random(500)
+    prand = 2.0 * np.pi * rng.random(500)
+    phi1, theta1 = randwalkusphere(steps, prand, 1.0, 0.7)
+    phi2, theta2 = randwalkusphere_rodrigues(steps, prand, 1.0, 0.7)
+    assert np.allclose(_usphere2cart(phi1, theta1), _usphere2cart(phi2, theta2))
+    assert np.all((phi2 >= 0.0) & (phi2 <= 2.0 * np.pi))
+    assert np.all((theta2 >= 0.0) & (theta2 <= np.pi))
+
+
+def test_randwalkusphere_inplace():
+    pos = np.zeros((3, 2))
+    pos[0] = [np.pi / 4, np.pi / 4]
+    steps = np.array([np.pi / 4, np.pi / 6])
+    prand = np.array([np.pi / 4, np.pi / 6])
+    randwalkusphere_inplace(pos, steps, prand)
+    phi, theta = randwalkusphere(steps, prand, np.pi / 4, np.pi / 4)
+    assert np.allclose(pos[:, 0], phi)
+    assert np.allclose(pos[:, 1], theta)
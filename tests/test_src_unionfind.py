@@ -0,0 +1,23 @@
+import numpy as np
+from mistreeplus.src import uf_find, uf_union, uf_labels, unionfind_labels
+
+
+def test_uf_union_and_find():
+    parent = np.arange(4)
+    size = np.ones(4, dtype=np.int64)
+    assert uf_union(parent, size, 0, 1) >= 0
+    assert uf_union(parent, size, 2, 3) >= 0
+    assert uf_union(parent, size, 1, 0) == -1
+    assert uf_find(parent, 0) == uf_find(parent, 1)
+    assert uf_find(parent, 0) != uf_find(parent, 2)
+    root = uf_union(parent, size, 1, 3)
+    assert size[root] == 4
+    assert np.array_equal(uf_labels(parent), [0, 0, 0, 0])
+
+
+def test_unionfind_labels():
+    idx1 = np.array([0, 3, 5])
+    idx2 = np.array([2, 4, 6])
+    labels = unionfind_labels(idx1, idx2, 8)
+    assert np.array_equal(labels, [0, 1, 0, 2, 2, 3, 3, 4])
+    assert np.array_equal(unionfind_labels(np.zeros(0, dtype=int), np.zeros(0, dtype=int), 3), [0, 1, 2])
@@ -0,0 +1,26 @@
+import subprocess
+import sys
+
+import numpy as np
+import mistreeplus
+from mistreeplus.src import warmup
+
+
+def test_warmup():
+    timings = warmup(float_dtypes=(np.float32,), index_dtypes=(np.int32,))
+    for name in ["sphere2vert", "getgraphdegree", "fof_sweep", "randwalkusphere_batch"]:
+        assert name in timings and timings[name] >= 0.0
+    assert mistreeplus.warmup is warmup
+
+
+def test_lazy_import():
+    code = (
+        "import sys, mistreeplus; "
+        "assert 'mistreeplus.graph' not in sys.modules; "
+        "assert 'sklearn' not in sys.modules; "
+        "mistreeplus.mst; "
+        "assert 'mistreeplus.graph' in sys.modules; "
+        "assert 'sklearn' not in sys.modules; "
+        "assert 'tree' in dir(mistreeplus)"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
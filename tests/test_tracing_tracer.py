@@ -0,0 +1,158 @@
+import numpy as np
+import pytest
+import tracemalloc
+from mistreeplus import tracing
+from mistreeplus.legacy import StageProfiler
+from mistreeplus.graph import construct_knn2D, get_degree, graph2data
+from mistreeplus.mst import construct_mst
+from mistreeplus.tree import get_adjacents
+
+
+def _pipeline(size=300):
+    rng = np.random.default_rng(0)
+    x, y = rng.random((2, size))
+    edge_idx, edge_length = graph2data(construct_mst(construct_knn2D(x, y, 10)))
+    get_degree(edge_idx, size)
+    get_adjacents(edge_idx, edge_length, size)
+    return edge_idx
+
+
+def test_tracing_off_by_default():
+    records = []
+    tracing.register_callback(records.append)
+    try:
+        _pipeline()
+    finally:
+        tracing.unregister_callback(records.append)
+    assert not tracing.is_tracing()
+    assert records == []
+
+
+def test_tracing_records():
+    extra = []
+    with tracing.tracing(callback=extra.append) as records:
+        assert tracing.is_tracing()
+        edge_idx = _pipeline()
+    assert not tracing.is_tracing()
+    functions = [record["function"].split(".")[-1] for record in records]
+    assert functions == [
+        "construct_knn2D",
+        "construct_mst",
+        "get_edge_index",
+        "graph2data",
+        "get_degree",
+        "get_adjacents",
+    ]
+    assert extra == records
+    knn, mst, edge_index, _, degree, adjacents = records
+    assert edge_index["stack"][0].endswith("graph2data")
+    assert knn["nnodes"] == 300 and knn["nedges"] is None
+    assert mst["nnodes"] == 300 and mst["nedges"] == 3000
+    assert degree["nnodes"] == 300 and degree["nedges"] == edge_idx.shape[1]
+    assert adjacents["nedges"] == edge_idx.shape[1]
+    assert all(record["elapsed"] >= 0.0 for record in records)
+    assert all(record["allocated"] is None for record in records)
+    # the callback is only registered within the context
+    _pipeline()
+    assert len(extra) == len(records)
+
+
+def test_tracing_memory_and_stack():
+    @tracing.traced(nodes="size")
+    def outer(size):
+        a = np.ones(size)
+        return inner(size) + a.sum()
+
+    @tracing.traced(nodes="size")
+    def inner(size):
+        b = np.ones(2 * size)
+        return b.sum()
+
+    with tracing.tracing(memory=True) as records:
+        outer(100000)
+    inner_record, outer_record = records
+    assert inner_record["stack"] == (outer_record["function"], inner_record["function"])
+    assert outer_record["stack"] == (outer_record["function"],)
+    assert inner_record["nnodes"] == 100000
+    assert inner_record["allocated"] >= 2 * 100000 * 8
+    # the outer peak includes its own array and the inner array
+    assert outer_record["allocated"] >= 3 * 100000 * 8
+    assert outer_record["net_allocated"] < 100000 * 8
+    lines = tracing.folded_stacks(records)
+    assert len(lines) == 2
+    assert lines[0].startswith(outer_record["function"] + " ")
+    assert lines[1].startswith(outer_record["function"] + ";" + inner_record["function"] + " ")
+
+
+def test_measure_keeps_outer_peak():
+    @tracing.traced(nodes="size")
+    def small(size):
+        return np.ones(size).sum()
+
+    tracemalloc.start()
+    try:
+        big = np.ones(10_000_000)
+        del big
+        _, outer_peak = tracemalloc.get_traced_memory()
+        with tracing.tracing(memory=True) as records:
+            small(100000)
+        profiler = StageProfiler()
+        with profiler.stage("small"):
+            with tracing.tracing(memory=True) as stage_records:
+                small(200000)
+        _, peak = tracing.get_traced_memory()
+        _, cleared = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    # the caller's peak survives, while the calls only see their own peaks
+    assert peak >= outer_peak >= 80_000_000
+    # no allocation is made to restore the tracemalloc peak
+    assert cleared < 8_000_000
+    assert 800_000 <= records[0]["allocated"] < 8_000_000
+    assert 1_600_000 <= stage_records[0]["allocated"] < 8_000_000
+    assert profiler.records[0]["peak_memory"] < 8_000_000
+
+
+def test_measure_without_reset_peak(monkeypatch):
+    # python < 3.9 has no tracemalloc.reset_peak, the peak since tracing began is used
+    monkeypatch.setattr(tracing.tracer, "_HAS_RESET_PEAK", False)
+    monkeypatch.delattr(tracemalloc, "reset_peak")
+    tracemalloc.start()
+    try:
+        with tracing.measure(memory=True) as result:
+            a = np.ones(100000)
+        profiler = StageProfiler()
+        with profiler.stage("ones"):
+            a = np.ones(100000)
+    finally:
+        tracemalloc.stop()
+    assert result["peak"] - result["start"] >= 100000 * 8
+    assert profiler.records[0]["peak_memory"] >= 100000 * 8
+
+
+def test_tracing_exception():
+    @tracing.traced()
+    def fail():
+        raise ValueError("failed")
+
+    with tracing.tracing() as records:
+        with pytest.raises(ValueError):
+            fail()
+    assert len(records) == 1
+
+
+def test_traced_preserves_metadata():
+    assert construct_mst.__name__ == "construct_mst"
+    assert "Minimum Spanning Tree" in construct_mst.__doc__
+
+
+def test_traced_nodes_alternatives():
+    from mistreeplus.coords import PointSet
+    from mistreeplus.tree import get_centrality
+
+    edge_idx = np.array([[0, 1, 2], [1, 2, 3]])
+    points = PointSet(np.arange(4.0), np.zeros(4))
+    with tracing.tracing() as records:
+        get_centrality(edge_idx, 4)
+        get_centrality(edge_idx, points=points)
+    assert [record["nnodes"] for record in records] == [4, 4]
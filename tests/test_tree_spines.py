@@ -0,0 +1,133 @@
+import numpy as np
+import pytest
+from mistreeplus.coords import usphere_dist2ang
+from mistreeplus.graph import construct_knn2D, construct_knn3D, graph2data
+from mistreeplus.mst import construct_mst
+from mistreeplus.tree import (
+    adjacents2tree,
+    flatten_spines,
+    get_adjacents,
+    get_centrality,
+    get_edge_dict,
+    get_path_weight,
+    get_spine_end_dist,
+    get_spine_hierarchy,
+    get_spine_level_hist,
+    get_spine_shape,
+    get_spine_weight,
+    get_spines,
+    get_tree_parents,
+)
+
+
+def _spines(edge_idx, edge_length, size):
+    adjacents_idx, _ = get_adjacents(edge_idx, edge_length, size)
+    centrality = get_centrality(edge_idx, size)
+    tree = adjacents2tree(adjacents_idx, size, root=int(np.argmax(centrality)))
+    spines, slevel = get_spines(tree, centrality)
+    return tree, spines
+
+
+def _parents(edge_idx, size):
+    # the tree is rooted on the most central node, on the main spine
+    centrality = get_centrality(edge_idx, size)
+    return get_tree_parents(edge_idx, size, root=int(np.argmax(centrality)))
+
+
+@pytest.fixture(scope="module")
+def mst2D():
+    rng = np.random.default_rng(3)
+    x, y = rng.random((2, 400))
+    edge_idx, edge_length = graph2data(construct_mst(construct_knn2D(x, y, 20)))
+    tree, spines = _spines(edge_idx, edge_length, 400)
+    return x, y, edge_idx, edge_length, tree, spines
+
+
+def test_flatten_spines():
+    spine_nodes, spine_offsets = flatten_spines([[3, 1, 2], [0], [4, 5]])
+    assert np.array_equal(spine_nodes, [3, 1, 2, 0, 4, 5])
+    assert np.array_equal(spine_offsets, [0, 3, 4, 6])
+
+
+def test_get_spine_weight(mst2D):
+    x, y, edge_idx, edge_length, tree, spines = mst2D
+    edge_dict = get_edge_dict(edge_idx, edge_length)
+    expected = np.array([get_path_weight(spine, edge_dict) for spine in spines])
+    spine_weight = get_spine_weight(spines, edge_idx, edge_length)
+    assert np.allclose(spine_weight, expected)
+    assert np.isclose(np.sum(spine_weight), np.sum(edge_length) - np.sum(
+        [edge_dict[(s[0], tree[s[0]]["parent"])] for s in spines[1:]]
+    ))
+
+
+def test_get_spine_weight_large_indices():
+    # pairs of node indices this large are not exact as float keys
+    base = 200_000_000
+    edge_idx = np.array([[base, base + 1, base + 3], [base + 1, base + 2, base + 2]])
+    edge_weight = np.array([1.0, 2.0, 4.0])
+    spine_weight = get_spine_weight([[base, base + 1, base + 2], [base + 3]], edge_idx, edge_weight)
+    assert np.array_equal(spine_weight, [3.0, 0.0])
+
+
+def test_get_spine_weight_not_edge():
+    edge_idx = np.array([[0, 1], [1, 2]])
+    with pytest.raises(ValueError):
+        get_spine_weight([[0, 2]], edge_idx, np.ones(2))
+
+
+def test_get_spine_shape_2D(mst2D):
+    x, y, edge_idx, edge_length, tree, spines = mst2D
+    spine_weight = get_spine_weight(spines, edge_idx, edge_length)
+    spine_end_dist = get_spine_end_dist(spines, mode="2D", x=x, y=y)
+    expected = np.array([np.hypot(x[s[0]] - x[s[-1]], y[s[0]] - y[s[-1]]) for s in spines])
+    assert np.allclose(spine_end_dist, expected)
+    spine_shape = get_spine_shape(spine_weight, spine_end_dist)
+    assert np.all(spine_shape <= 1.0 + 1e-12)
+    assert np.all(spine_shape[spine_weight == 0.0] == 0.0)
+
+
+def test_get_spine_end_dist_3D_usphere():
+    rng = np.random.default_rng(4)
+    x, y, z = rng.normal(size=(3, 300))
+    r = np.sqrt(x**2 + y**2 + z**2)
+    x, y, z = x / r, y / r, z / r
+    edge_idx, edge_length = graph2data(construct_mst(construct_knn3D(x, y, z, 20)))
+    tree, spines = _spines(edge_idx, edge_length, 300)
+    dist = get_spine_end_dist(spines, mode="3D", x=x, y=y, z=z)
+    ends = np.array([[s[0], s[-1]] for s in spines]).T
+    expected = np.sqrt(
+        (x[ends[0]] - x[ends[1]]) ** 2 + (y[ends[0]] - y[ends[1]]) ** 2 + (z[ends[0]] - z[ends[1]]) ** 2
+    )
+    assert np.allclose(dist, expected)
+    dist = get_spine_end_dist(spines, mode="usphere", x=x, y=y, z=z)
+    assert np.allclose(dist, usphere_dist2ang(expected))
+    with pytest.raises(ValueError):
+        get_spine_end_dist(spines, mode="4D", x=x, y=y, z=z)
+
+
+def test_get_spine_hierarchy(mst2D):
+    x, y, edge_idx, edge_length, tree, spines = mst2D
+    parents = _parents(edge_idx, 400)
+    assert all(
+        parents[node] == (-1 if tree[node]["parent"] is None else tree[node]["parent"])
+        for node in range(400)
+    )
+    spine_level = get_spine_hierarchy(spines, parents)
+    node_spine = {node: i for i, spine in enumerate(spines) for node in spine}
+    assert spine_level[0] == 1
+    for i in range(1, len(spines)):
+        parent = node_spine[tree[spines[i][0]]["parent"]]
+        assert spine_level[i] == spine_level[parent] + 1
+
+
+def test_get_spine_level_hist(mst2D):
+    x, y, edge_idx, edge_length, tree, spines = mst2D
+    spine_level = get_spine_hierarchy(spines, _parents(edge_idx, 400))
+    spine_weight = get_spine_weight(spines, edge_idx, edge_length)
+    bins = np.linspace(0.0, np.max(spine_weight) + 1e-9, 11)
+    levels, hist = get_spine_level_hist(spine_level, spine_weight, bins)
+    assert np.array_equal(levels, np.arange(1, np.max(spine_level) + 1))
+    assert hist.shape == (len(levels), 10)
+    for i, level in enumerate(levels):
+        expected, _ = np.histogram(spine_weight[spine_level == level], bins=bins)
+        assert np.array_equal(hist[i], expected)